@@ -30,7 +30,6 @@ Requires: python%{python3_pkgversion}-click
 Requires: python%{python3_pkgversion}-requests
 Requires: python%{python3_pkgversion}-pyyaml
 Requires: python%{python3_pkgversion}-defusedxml
-Requires: python%{python3_pkgversion}-subresource-integrity
 Requires: python%{python3_pkgversion}-jsonschema
 Requires: python%{python3_pkgversion}-urllib3
 Requires: python%{python3_pkgversion}-semantic-version
@@ -1,3 +1,4 @@
+from charon.utils.metrics import get_metrics, SERVICE_CLOUDFRONT
 from boto3 import session
 from botocore.exceptions import ClientError
 from typing import Dict, List, Optional
@@ -134,16 +135,17 @@ class CFClient(object):
                 caller_ref, len(batch_paths)
             )
             try:
-                response = self.__client.create_invalidation(
-                    DistributionId=distr_id,
-                    InvalidationBatch={
-                        'CallerReference': caller_ref,
-                        'Paths': {
-                            'Quantity': len(batch_paths),
-                            'Items': batch_paths
+                with get_metrics().timed(SERVICE_CLOUDFRONT, "INVALIDATE", distr_id):
+                    response = self.__client.create_invalidation(
+                        DistributionId=distr_id,
+                        InvalidationBatch={
+                            'CallerReference': caller_ref,
+                            'Paths': {
+                                'Quantity': len(batch_paths),
+                                'Items': batch_paths
+                            }
                         }
-                    }
-                )
+                    )
                 if response:
                     invalidation = response.get('Invalidation', {})
                     current_invalidation = {
@@ -161,10 +163,11 @@ class CFClient(object):
 
     def check_invalidation(self, distr_id: str, invalidation_id: str) -> Optional[dict]:
         try:
-            response = self.__client.get_invalidation(
-                DistributionId=distr_id,
-                Id=invalidation_id
-            )
+            with get_metrics().timed(SERVICE_CLOUDFRONT, "GET_INVALIDATION", distr_id):
+                response = self.__client.get_invalidation(
+                    DistributionId=distr_id,
+                    Id=invalidation_id
+                )
             if response:
                 invalidation = response.get('Invalidation', {})
                 return {
@@ -186,7 +189,8 @@ class CFClient(object):
            or "npm.registry.redhat.com"
         """
         try:
-            response = self.__client.list_distributions()
+            with get_metrics().timed(SERVICE_CLOUDFRONT, "LIST_DISTRIBUTIONS"):
+                response = self.__client.list_distributions()
             if response:
                 dist_list_items = response.get("DistributionList", {}).get("Items", [])
                 for distr in dist_list_items:
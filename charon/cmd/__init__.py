@@ -21,6 +21,7 @@ from charon.cmd.cmd_checksum import init_checksum, checksum
 from charon.cmd.cmd_cache import init_cf, cf
 from charon.cmd.cmd_sign import sign
 from charon.cmd.cmd_merge import merge
+from charon.cmd.cmd_migrate import migrate
 
 
 @group()
@@ -51,3 +52,4 @@ cli.add_command(sign)
 
 # maven zips merge cmd
 cli.add_command(merge)
+cli.add_command(migrate)
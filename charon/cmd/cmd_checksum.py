@@ -20,6 +20,8 @@ from charon.pkgs.checksum_http import (
     handle_checksum_validation_http, refresh_checksum
 )
 from charon.cmd.internal import _decide_mode
+from charon.utils.metrics import report_metrics
+from charon.utils.tracing import start_profiling, finish_tracing
 from click import command, option, argument, group
 
 import traceback
@@ -100,6 +102,33 @@ logger = logging.getLogger(__name__)
     """,
     required=True
 )
+@option(
+    "--metrics-report",
+    "-M",
+    "metrics_report",
+    help="""
+    The path of the json report file of the AWS API requests sent in this
+    command. The summary of the requests will be printed in the logs anyway.
+    """,
+)
+@option(
+    "--trace",
+    "trace",
+    help="""
+    The path of the Chrome trace event json file to write the durations of
+    the phases of this command into, which can be opened in chrome://tracing.
+    """,
+)
+@option(
+    "--profile",
+    "profile",
+    is_flag=True,
+    default=False,
+    help="""
+    Profile this command with cProfile, the stats will be written to
+    charon-<command>.prof in current directory.
+    """,
+)
 @command()
 def validate(
     path: str,
@@ -109,7 +138,10 @@ def validate(
     skips: List[str],
     recursive: bool = False,
     quiet: bool = False,
-    debug: bool = False
+    debug: bool = False,
+    metrics_report: str = None,
+    trace: str = None,
+    profile: bool = False
 ):
     """
     Validate the checksum of the specified path for themaven repository.
@@ -123,6 +155,7 @@ def validate(
         "checksum-validate-{}".format(target), path.replace("/", "_"),
         is_quiet=quiet, is_debug=debug
     )
+    profiler = start_profiling() if profile else None
     try:
         (aws_bucket, prefix) = _init_cmd(target)
 
@@ -144,6 +177,9 @@ def validate(
     except Exception:
         print(traceback.format_exc())
         sys.exit(2)
+    finally:
+        report_metrics(metrics_report)
+        finish_tracing("checksum-validate", trace, profiler)
 
 
 @option(
@@ -199,6 +235,33 @@ def validate(
     $HOME/.charon/charon.yaml
     """
 )
+@option(
+    "--metrics-report",
+    "-M",
+    "metrics_report",
+    help="""
+    The path of the json report file of the AWS API requests sent in this
+    command. The summary of the requests will be printed in the logs anyway.
+    """,
+)
+@option(
+    "--trace",
+    "trace",
+    help="""
+    The path of the Chrome trace event json file to write the durations of
+    the phases of this command into, which can be opened in chrome://tracing.
+    """,
+)
+@option(
+    "--profile",
+    "profile",
+    is_flag=True,
+    default=False,
+    help="""
+    Profile this command with cProfile, the stats will be written to
+    charon-<command>.prof in current directory.
+    """,
+)
 @command()
 def refresh(
     target: str,
@@ -206,7 +269,10 @@ def refresh(
     path_file: str,
     config: str = None,
     quiet: bool = False,
-    debug: bool = False
+    debug: bool = False,
+    metrics_report: str = None,
+    trace: str = None,
+    profile: bool = False
 ):
     """
     Refresh the checksum of the specified path for the target maven repository.
@@ -238,6 +304,7 @@ def refresh(
         with open(path_file, "r", encoding="utf-8") as f:
             for line in f.readlines():
                 work_paths.append(str(line).strip())
+    profiler = start_profiling() if profile else None
     try:
         (aws_bucket, prefix) = _init_cmd(target)
 
@@ -253,6 +320,9 @@ def refresh(
     except Exception:
         print(traceback.format_exc())
         sys.exit(2)
+    finally:
+        report_metrics(metrics_report)
+        finish_tracing("checksum-refresh", trace, profiler)
 
 
 def _init_cmd(target: str) -> Tuple[str, str]:
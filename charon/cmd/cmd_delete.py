@@ -19,6 +19,8 @@ from charon.config import get_config
 from charon.utils.archive import detect_npm_archive, NpmArchiveType
 from charon.pkgs.maven import handle_maven_del
 from charon.pkgs.npm import handle_npm_del
+from charon.utils.metrics import report_metrics
+from charon.utils.tracing import start_profiling, finish_tracing
 from charon.cmd.internal import (
     _decide_mode, _validate_prod_key,
     _get_local_repo, _get_targets,
@@ -119,6 +121,39 @@ logger = logging.getLogger(__name__)
     default=False
 )
 @option("--dryrun", "-n", is_flag=True, default=False)
+@option(
+    "--metrics_report",
+    "-M",
+    help="""
+    The path of the json report file of the AWS API requests sent in this
+    command. The summary of the requests will be printed in the logs anyway.
+    """,
+)
+@option(
+    "--rebuild_metadata",
+    is_flag=True,
+    default=False,
+    help="""
+    Regenerate the maven-metadata.xml files from the listing of all poms of
+    each GA, instead of merging the changed versions into the existing ones.
+    """,
+)
+@option(
+    "--trace",
+    help="""
+    The path of the Chrome trace event json file to write the durations of
+    the phases of this command into, which can be opened in chrome://tracing.
+    """,
+)
+@option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="""
+    Profile this command with cProfile, the stats will be written to
+    charon-<command>.prof in current directory.
+    """,
+)
 @command()
 def delete(
     repo: str,
@@ -131,13 +166,18 @@ def delete(
     config: str = None,
     debug=False,
     quiet=False,
-    dryrun=False
+    dryrun=False,
+    metrics_report=None,
+    trace=None,
+    profile=False,
+    rebuild_metadata=False
 ):
     """Roll back all files in a released product REPO from
     Ronda Service. The REPO points to a product released
     tarball which is hosted in a remote url or a local path.
     """
     tmp_dir = work_dir
+    profiler = start_profiling() if profile else None
     try:
         _decide_mode(product, version, is_quiet=quiet, is_debug=debug)
         if dryrun:
@@ -175,7 +215,9 @@ def delete(
                 dir_=work_dir,
                 cf_enable=conf.is_aws_cf_enable(),
                 dry_run=dryrun,
-                manifest_bucket_name=manifest_bucket_name
+                manifest_bucket_name=manifest_bucket_name,
+                ownership_store=conf.get_ownership_store(),
+                transfer_config=conf.get_transfer_config()
             )
             if not succeeded:
                 sys.exit(1)
@@ -196,7 +238,10 @@ def delete(
                 dir_=work_dir,
                 cf_enable=conf.is_aws_cf_enable(),
                 dry_run=dryrun,
-                manifest_bucket_name=manifest_bucket_name
+                manifest_bucket_name=manifest_bucket_name,
+                ownership_store=conf.get_ownership_store(),
+                rebuild_metadata=rebuild_metadata,
+                transfer_config=conf.get_transfer_config()
             )
             if not succeeded:
                 sys.exit(1)
@@ -204,5 +249,7 @@ def delete(
         print(traceback.format_exc())
         sys.exit(2)  # distinguish between exception and bad config or bad state
     finally:
+        report_metrics(metrics_report)
+        finish_tracing("delete", trace, profiler)
         if not debug and tmp_dir:
             _safe_delete(tmp_dir)
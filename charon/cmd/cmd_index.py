@@ -16,6 +16,8 @@ limitations under the License.
 
 from charon.config import get_config
 from charon.cmd.internal import _decide_mode
+from charon.utils.metrics import report_metrics
+from charon.utils.tracing import start_profiling, finish_tracing
 from charon.pkgs.indexing import re_index
 from charon.constants import PACKAGE_TYPE_MAVEN, PACKAGE_TYPE_NPM
 from click import command, option, argument
@@ -72,6 +74,30 @@ logger = logging.getLogger(__name__)
     default=False
 )
 @option("--dryrun", "-n", is_flag=True, default=False)
+@option(
+    "--metrics_report",
+    "-M",
+    help="""
+    The path of the json report file of the AWS API requests sent in this
+    command. The summary of the requests will be printed in the logs anyway.
+    """,
+)
+@option(
+    "--trace",
+    help="""
+    The path of the Chrome trace event json file to write the durations of
+    the phases of this command into, which can be opened in chrome://tracing.
+    """,
+)
+@option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="""
+    Profile this command with cProfile, the stats will be written to
+    charon-<command>.prof in current directory.
+    """,
+)
 @command()
 def index(
     path: str,
@@ -80,7 +106,10 @@ def index(
     config: str = None,
     debug: bool = False,
     quiet: bool = False,
-    dryrun: bool = False
+    dryrun: bool = False,
+    metrics_report: str = None,
+    trace: str = None,
+    profile: bool = False
 ):
     """Generate or refresh the index.html files for the
     specified path.
@@ -89,6 +118,7 @@ def index(
         "index-{}".format(target), path.replace("/", "_"),
         is_quiet=quiet, is_debug=debug, use_log_file=False
     )
+    profiler = start_profiling() if profile else None
     try:
         conf = get_config(config)
         if not conf:
@@ -141,3 +171,6 @@ def index(
     except Exception:
         print(traceback.format_exc())
         sys.exit(2)  # distinguish between exception and bad config or bad state
+    finally:
+        report_metrics(metrics_report)
+        finish_tracing("index", trace, profiler)
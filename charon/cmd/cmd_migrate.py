@@ -0,0 +1,124 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from charon.config import get_config
+from charon.cmd.internal import _decide_mode
+from charon.pkgs.ownership import migrate_ownership
+from click import command, option
+
+import traceback
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+@option(
+    "--target",
+    "-t",
+    help="""
+    The target to do the ownership migration, which will decide
+    which s3 bucket and what root path the migration happens in.
+    """,
+    required=True
+)
+@option(
+    "--path",
+    "-p",
+    help="""
+    The sub path under the target root path to do migration.
+    Will migrate the whole target if not specified.
+    """,
+    default=""
+)
+@option(
+    "--delete_sidecars",
+    help="Delete the .prodinfo files after they are migrated",
+    is_flag=True,
+    default=False
+)
+@option(
+    "--config",
+    "-c",
+    help="""
+    The charon configuration yaml file path. Default is
+    $HOME/.charon/charon.yaml
+    """
+)
+@option(
+    "--debug",
+    "-D",
+    help="Debug mode, will print all debug logs for problem tracking.",
+    is_flag=True,
+    default=False
+)
+@option(
+    "--quiet",
+    "-q",
+    help="Quiet mode, will shrink most of the logs except warning and errors.",
+    is_flag=True,
+    default=False
+)
+@option("--dryrun", "-n", is_flag=True, default=False)
+@command()
+def migrate(
+    target: str,
+    path: str = "",
+    delete_sidecars: bool = False,
+    config: str = None,
+    debug: bool = False,
+    quiet: bool = False,
+    dryrun: bool = False
+):
+    """Migrate the product ownership from the .prodinfo sidecar files
+    to the directory ownership index files, which are used when
+    ownership_store is set as "directory" in charon configuration.
+    """
+    _decide_mode(
+        "migrate-{}".format(target), path.replace("/", "_"),
+        is_quiet=quiet, is_debug=debug, use_log_file=False
+    )
+    try:
+        conf = get_config(config)
+        if not conf:
+            sys.exit(1)
+
+        aws_profile = os.getenv("AWS_PROFILE") or conf.get_aws_profile()
+        if not aws_profile:
+            logger.error("No AWS profile specified!")
+            sys.exit(1)
+
+        tgt = conf.get_target(target)
+        if not tgt:
+            # log is recorded get_target
+            sys.exit(1)
+
+        succeeded = True
+        for b in tgt:
+            if not b.get('bucket', ''):
+                logger.error("No bucket specified for target %s!", target)
+                continue
+            failed = migrate_ownership(
+                b, path, aws_profile=aws_profile,
+                delete_sidecars=delete_sidecars, dry_run=dryrun
+            )
+            succeeded = succeeded and len(failed) == 0
+        if not succeeded:
+            sys.exit(1)
+    except Exception:
+        print(traceback.format_exc())
+        sys.exit(2)  # distinguish between exception and bad config or bad state
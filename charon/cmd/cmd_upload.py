@@ -19,6 +19,8 @@ from charon.config import get_config
 from charon.utils.archive import detect_npm_archives, NpmArchiveType
 from charon.pkgs.maven import handle_maven_uploading
 from charon.pkgs.npm import handle_npm_uploading
+from charon.utils.metrics import report_metrics
+from charon.utils.tracing import start_profiling, finish_tracing
 from charon.cmd.internal import (
     _decide_mode, _validate_prod_key,
     _get_local_repos, _get_targets,
@@ -137,6 +139,16 @@ logger = logging.getLogger(__name__)
     default=False
 )
 @option("--dryrun", "-n", is_flag=True, default=False)
+@option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="""
+    Resume an interrupted uploading of the same product, the files recorded
+    as done in the upload journal will be skipped. The journal is stored in
+    $HOME/.charon/journal, so it is kept when the work_dir is cleaned up.
+    """,
+)
 @option(
     "--sign_result_file",
     "-l",
@@ -145,6 +157,39 @@ logger = logging.getLogger(__name__)
     Upload will use the file to generate the corresponding .asc files
     """,
 )
+@option(
+    "--metrics_report",
+    "-M",
+    help="""
+    The path of the json report file of the AWS API requests sent in this
+    command. The summary of the requests will be printed in the logs anyway.
+    """,
+)
+@option(
+    "--rebuild_metadata",
+    is_flag=True,
+    default=False,
+    help="""
+    Regenerate the maven-metadata.xml files from the listing of all poms of
+    each GA, instead of merging the changed versions into the existing ones.
+    """,
+)
+@option(
+    "--trace",
+    help="""
+    The path of the Chrome trace event json file to write the durations of
+    the phases of this command into, which can be opened in chrome://tracing.
+    """,
+)
+@option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="""
+    Profile this command with cProfile, the stats will be written to
+    charon-<command>.prof in current directory.
+    """,
+)
 @command()
 def upload(
     repos: List[str],
@@ -160,7 +205,12 @@ def upload(
     debug=False,
     quiet=False,
     dryrun=False,
+    resume=False,
     sign_result_file=None,
+    metrics_report=None,
+    trace=None,
+    profile=False,
+    rebuild_metadata=False,
 ):
     """Upload all files from released product REPOs to Ronda
     Service. The REPOs point to a product released tarballs which
@@ -168,6 +218,7 @@ def upload(
     Notes: It does not support multiple repos for NPM archives
     """
     tmp_dir = work_dir
+    profiler = start_profiling() if profile else None
     try:
         _decide_mode(product, version, is_quiet=quiet, is_debug=debug)
         if dryrun:
@@ -220,7 +271,11 @@ def upload(
                 dry_run=dryrun,
                 manifest_bucket_name=manifest_bucket_name,
                 config=config,
-                sign_result_file=sign_result_file
+                sign_result_file=sign_result_file,
+                transfer_config=conf.get_transfer_config(),
+                ownership_store=conf.get_ownership_store(),
+                resume=resume,
+                rebuild_metadata=rebuild_metadata
             )
             if not succeeded:
                 sys.exit(1)
@@ -236,7 +291,10 @@ def upload(
                 cf_enable=conf.is_aws_cf_enable(),
                 key=sign_key,
                 dry_run=dryrun,
-                manifest_bucket_name=manifest_bucket_name
+                manifest_bucket_name=manifest_bucket_name,
+                transfer_config=conf.get_transfer_config(),
+                ownership_store=conf.get_ownership_store(),
+                resume=resume
             )
             if not succeeded:
                 sys.exit(1)
@@ -250,5 +308,7 @@ def upload(
         print(traceback.format_exc())
         sys.exit(2)  # distinguish between exception and bad config or bad state
     finally:
+        report_metrics(metrics_report)
+        finish_tracing("upload", trace, profiler)
         if not debug and tmp_dir:
             _safe_delete(tmp_dir)
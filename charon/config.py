@@ -138,6 +138,8 @@ class CharonConfig(object):
         self.__ignore_signature_suffix: Dict = data.get("ignore_signature_suffix", None)
         self.__signature_command: str = data.get("detach_signature_command", None)
         self.__aws_cf_enable: bool = data.get("aws_cf_enable", False)
+        self.__transfer: Dict = data.get("transfer", {})
+        self.__ownership_store: str = data.get("ownership_store", "sidecar")
         radas_config: Dict = data.get("radas", None)
         self.__radas_config: Optional[RadasConfig] = None
         if radas_config:
@@ -173,6 +175,12 @@ class CharonConfig(object):
     def is_aws_cf_enable(self) -> bool:
         return self.__aws_cf_enable
 
+    def get_transfer_config(self) -> Dict:
+        return self.__transfer
+
+    def get_ownership_store(self) -> str:
+        return self.__ownership_store
+
     def is_radas_enabled(self) -> bool:
         return self.__radas_enabled
 
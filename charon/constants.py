@@ -171,6 +171,9 @@ body {
 '''
 
 PROD_INFO_SUFFIX = ".prodinfo"
+# The product ownership index of a folder, ends with PROD_INFO_SUFFIX
+# so it will be ignored like the .prodinfo files
+OWNERSHIP_INDEX_FILE = ".ownership" + PROD_INFO_SUFFIX
 MANIFEST_SUFFIX = ".txt"
 DEFAULT_ERRORS_LOG = "errors.log"
 
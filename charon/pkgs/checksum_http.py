@@ -13,8 +13,9 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from charon.utils.files import digest, HashType, overwrite_file
+from charon.utils.files import digest, digest_multi, HashType, overwrite_file
 from charon.storage import S3Client
+from charon.utils.metrics import set_phase
 from typing import Tuple, List, Dict, Optional
 from html.parser import HTMLParser
 import tempfile
@@ -281,6 +282,7 @@ def refresh_checksum(
     """
     bucket_name = target[0]
     prefix = target[1]
+    set_phase("checksum")
     s3_client = S3Client(aws_profile=aws_profile)
     real_prefix = prefix if prefix.strip() != "/" else ""
     filetype_filter = [".prodinfo", ".sha1", ".sha256", ".md5"]
@@ -316,11 +318,14 @@ def refresh_checksum(
                     if s3_client.file_exists_in_bucket(bucket_name, s3_checksum_path):
                         existed_checksum_types.append(file_type)
                 if existed_checksum_types:
+                    correct_checksums = digest_multi(
+                        temp_f, [checksums[t] for t in existed_checksum_types]
+                    )
                     for file_type in existed_checksum_types:
                         checksum_path = path + file_type
                         s3_checksum_path = s3_path + file_type
                         hash_type = checksums[file_type]
-                        correct_checksum_c = digest(temp_f, hash_type)
+                        correct_checksum_c = correct_checksums[hash_type]
                         original_checksum_c = s3_client.read_file_content(
                             bucket_name, s3_checksum_path
                         )
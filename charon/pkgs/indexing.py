@@ -15,11 +15,14 @@ limitations under the License.
 """
 from charon.config import get_template
 from charon.storage import S3Client
+from charon.storage_snapshot import folder_prefix
 # from charon.cache import CFClient
 # from charon.pkgs.pkg_utils import invalidate_cf_paths
 from charon.constants import (INDEX_HTML_TEMPLATE, NPM_INDEX_HTML_TEMPLATE,
                               PACKAGE_TYPE_MAVEN, PACKAGE_TYPE_NPM, PROD_INFO_SUFFIX)
 from charon.utils.files import digest_content, overwrite_file
+from charon.utils.metrics import set_phase
+from charon.utils.tracing import traced
 from jinja2 import Template
 import os
 import logging
@@ -60,6 +63,7 @@ class IndexedHTML(object):
         return template.render(index=self)
 
 
+@traced("index")
 def generate_indexes(
     package_type: str,
     top_level: str,
@@ -261,6 +265,7 @@ class IndexedItemsCompareKey:
             return 0
 
 
+@traced("re_index")
 def re_index(
     target: Dict[str, str],
     path: str,
@@ -270,14 +275,42 @@ def re_index(
     dry_run: bool = False
 ):
     """Refresh the index.html for the specified folder in the bucket.
+    If recursive, the whole folder tree is listed once with partitioned listing,
+    and all the sub folders are re-indexed from that listing, which is kept in
+    the tree snapshot of the client.
     """
-    bucket_name = target.get("bucket", "")
+    set_phase("index")
+    s3_client = S3Client(aws_profile=aws_profile, dry_run=dry_run, tree_snapshot=recursive)
+    try:
+        if recursive:
+            s3_folder = __get_s3_folder(target, path)
+            logger.info("Listing all files under %s for recursive re-indexing", s3_folder)
+            s3_client.get_files(target.get("bucket", ""), folder_prefix(s3_folder))
+        __re_index(s3_client, target, path, package_type, recursive, dry_run)
+    finally:
+        s3_client.close()
+
+
+def __get_s3_folder(target: Dict[str, str], path: str) -> str:
     prefix = target.get("prefix", "")
-    s3_client = S3Client(aws_profile=aws_profile, dry_run=dry_run)
     real_prefix = prefix if prefix.strip() != "/" else ""
-    s3_folder = os.path.join(real_prefix, path)
     if path.strip() == "" or path.strip() == "/":
-        s3_folder = prefix
+        return prefix
+    return os.path.join(real_prefix, path)
+
+
+def __re_index(
+    s3_client: S3Client,
+    target: Dict[str, str],
+    path: str,
+    package_type: str,
+    recursive: bool = False,
+    dry_run: bool = False
+):
+    bucket_name = target.get("bucket", "")
+    prefix = target.get("prefix", "")
+    real_prefix = prefix if prefix.strip() != "/" else ""
+    s3_folder = __get_s3_folder(target, path)
     items: List[str] = s3_client.list_folder_content(bucket_name, s3_folder)
     contents = [i for i in items if not i.endswith(PROD_INFO_SUFFIX)]
     if PACKAGE_TYPE_NPM == package_type:
@@ -322,15 +355,10 @@ def re_index(
                     if sub_path.startswith("/"):
                         sub_path = sub_path.removeprefix("/")
                     logger.debug("subpath: %s", sub_path)
-                    args = {
-                        "target": target,
-                        "path": sub_path,
-                        "package_type": package_type,
-                        "aws_profile": aws_profile,
-                        "recursive": recursive,
-                        "dry_run": dry_run
-                    }
-                    re_index(**args)  # type: ignore
+                    __re_index(
+                        s3_client, target, sub_path, package_type,
+                        recursive=recursive, dry_run=dry_run
+                    )
     else:
         logger.warning(
             "The path %s does not contain any contents in bucket %s. "
@@ -17,34 +17,45 @@ from charon.utils.files import HashType
 import charon.pkgs.indexing as indexing
 import charon.pkgs.signature as signature
 import charon.pkgs.radas_sign as radas_signature
-from charon.utils.files import overwrite_file, digest, write_manifest
-from charon.utils.archive import extract_zip_all
+from charon.utils.files import (
+    overwrite_file, digest_multi, digest_content_multi, write_manifest
+)
+from charon.utils.archive import extract_zip_all, zip_member_path, ZipMemberReader
 from charon.utils.strings import remove_prefix
+from charon.utils.metrics import set_phase
+from charon.utils.tracing import span, traced
 from charon.storage import S3Client
 from charon.cache import CFClient
 from charon.types import TARGET_TYPE
 from charon.pkgs.pkg_utils import (
     upload_post_process,
     rollback_post_process,
-    invalidate_cf_paths
+    invalidate_cf_paths,
+    init_upload_journal,
+    close_upload_journal
 )
 from charon.config import CharonConfig, get_template, get_config
 from charon.constants import (META_FILE_GEN_KEY, META_FILE_DEL_KEY,
                               META_FILE_FAILED, MAVEN_METADATA_TEMPLATE,
                               ARCHETYPE_CATALOG_TEMPLATE, ARCHETYPE_CATALOG_FILENAME,
                               PACKAGE_TYPE_MAVEN)
-from typing import Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 from jinja2 import Template
+from functools import lru_cache
 from datetime import datetime
-from zipfile import ZipFile, BadZipFile
+from zipfile import ZipFile, ZipInfo, BadZipFile
 from tempfile import mkdtemp
-from shutil import rmtree, copy2
+from shutil import rmtree, copy2, copyfileobj
 from defusedxml import ElementTree
+from botocore.exceptions import ClientError, HTTPClientError
 
+import asyncio
 import os
 import sys
 import logging
+import queue
 import re
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +75,13 @@ ARCH_TEMPLATE = __get_mvn_template("archetype-catalog.xml.j2", ARCHETYPE_CATALOG
 MAVEN_METADATA_FILE = "maven-metadata.xml"
 MAVEN_ARCH_FILE = "archetype-catalog.xml"
 STANDARD_GENERATED_IGNORES = [MAVEN_METADATA_FILE, MAVEN_ARCH_FILE]
+# The extracted files waiting for uploading in pipeline mode, the extraction
+# will wait for the uploading if the queue is full
+PIPELINE_QUEUE_SIZE = 2000
+# The version folders whose names do not start with a number followed by
+# "." or "-", like the folders of the nested GAs named log4j2 or 3scale-lib,
+# are not trusted as versions in metadata generation until their poms are found
+VERSION_LIKE_PATTERN = re.compile(r"\d+([.-]|$)")
 
 
 class MavenMetadata(object):
@@ -75,7 +93,7 @@ class MavenMetadata(object):
         self.group_id = group_id
         self.artifact_id = artifact_id
         self.last_upd_time = datetime.now().strftime("%Y%m%d%H%M%S")
-        self.versions = sorted(set(versions), key=VersionCompareKey)
+        self.versions = sorted(set(versions), key=MavenVersionKey)
         self._latest_version = None
         self._release_version = None
 
@@ -232,27 +250,36 @@ def gen_meta_file(group_id, artifact_id: str,
     except FileNotFoundError as e:
         raise e
     if do_digest:
-        meta_files.extend(__gen_all_digest_files(final_meta_path))
+        meta_files.extend(__gen_all_digest_files(final_meta_path, content))
     return meta_files
 
 
-def __gen_all_digest_files(meta_file_path: str) -> List[str]:
-    md5_path = meta_file_path + ".md5"
-    sha1_path = meta_file_path + ".sha1"
-    sha256_path = meta_file_path + ".sha256"
+def __gen_all_digest_files(meta_file_path: str, content: Optional[str] = None) -> List[str]:
+    """Generate the .md5, .sha1 and .sha256 files for the metadata file, the
+    hashes are calculated from content if it is given, or from one read of
+    the file.
+    """
+    hash_types = {".md5": HashType.MD5, ".sha1": HashType.SHA1, ".sha256": HashType.SHA256}
+    try:
+        if content is not None:
+            checksums = digest_content_multi(content, list(hash_types.values()))
+        else:
+            checksums = digest_multi(meta_file_path, list(hash_types.values()))
+    except FileNotFoundError:
+        logger.warning("Error: Can not create digest files for %s as it is missing",
+                       meta_file_path)
+        return []
     digest_files = []
-    if __gen_digest_file(md5_path, meta_file_path, HashType.MD5):
-        digest_files.append(md5_path)
-    if __gen_digest_file(sha1_path, meta_file_path, HashType.SHA1):
-        digest_files.append(sha1_path)
-    if __gen_digest_file(sha256_path, meta_file_path, HashType.SHA256):
-        digest_files.append(sha256_path)
+    for (suffix, hash_type) in hash_types.items():
+        hash_file_path = meta_file_path + suffix
+        if __gen_digest_file(hash_file_path, meta_file_path, checksums[hash_type]):
+            digest_files.append(hash_file_path)
     return digest_files
 
 
-def __gen_digest_file(hash_file_path, meta_file_path: str, hashtype: HashType) -> bool:
+def __gen_digest_file(hash_file_path, meta_file_path: str, checksum: str) -> bool:
     try:
-        overwrite_file(hash_file_path, digest(meta_file_path, hashtype))
+        overwrite_file(hash_file_path, checksum)
     except FileNotFoundError:
         logger.warning(
             "Error: Can not create digest file %s for %s "
@@ -278,7 +305,11 @@ def handle_maven_uploading(
     dry_run=False,
     manifest_bucket_name=None,
     config=None,
-    sign_result_file=None
+    sign_result_file=None,
+    transfer_config=None,
+    ownership_store=None,
+    resume=False,
+    rebuild_metadata=False
 ) -> Tuple[str, bool]:
     """ Handle the maven product release tarball uploading process.
         * repo is the location of the tarball in filesystem
@@ -293,217 +324,305 @@ def handle_maven_uploading(
           prefix. See target definition in Charon configuration for details
         * dir_ is base dir for extracting the tarball, will use system
           tmp dir if None.
+        * transfer_config is the transfer section of Charon configuration,
+          which controls the multipart uploading of large files. If "pipeline"
+          is set in it, a single tarball will be uploaded while it is extracting,
+          and if "upload_from_archive" is set, the files of a single tarball will
+          be uploaded from it directly without extracting when no signing needed.
+        * ownership_store is the store type of product ownership, which
+          can be "sidecar" or "directory". See Charon configuration for details.
+        * resume is used to skip the work which is recorded as done in the upload
+          journal of an interrupted uploading of the same product.
+        * rebuild_metadata is used to regenerate maven-metadata.xml from the
+          listing of all poms of each GA, instead of merging the versions into
+          the existing maven-metadata.xml.
 
         Returns the directory used for archive processing and if the uploading is successful
     """
     if targets is None:
         targets = []
 
-    # 1. extract tarballs
-    tmp_root = _extract_tarballs(repos, root, prod_key, dir__=dir_)
-
-    # 2. scan for paths and filter out the ignored paths,
-    # and also collect poms for later metadata generation
-    (top_level,
-     valid_mvn_paths,
-     valid_poms,
-     valid_dirs) = _scan_paths(tmp_root, ignore_patterns, root)
+    journal = init_upload_journal(prod_key, resume=resume, dry_run=dry_run)
+    s3_client = S3Client(
+        aws_profile=aws_profile, dry_run=dry_run, transfer_config=transfer_config,
+        ownership_store=ownership_store, journal=journal
+    )
+    targets_ = [(target[1], remove_prefix(target[2], "/")) for target in targets]
 
-    # This prefix is a subdir under top-level directory in tarball
-    # or root before real GAV dir structure
-    if not os.path.isdir(top_level):
-        logger.error("Error: the extracted top-level path %s does not exist.", top_level)
-        sys.exit(1)
+    transfer_config = transfer_config if transfer_config else {}
+    from_archive = len(repos) == 1 and transfer_config.get("upload_from_archive", False)
+    if from_archive and (gen_sign or sign_result_file):
+        logger.info("The files need to be extracted for signing, will not upload "
+                    "them from the archive directly")
+        from_archive = False
+    set_phase("files")
+    if from_archive:
+        # 1-4. upload the files from the zip members directly, only the files
+        # which will be rewritten are extracted
+        (tmp_root, top_level,
+         valid_mvn_paths,
+         valid_poms,
+         valid_dirs,
+         reader) = _scan_zip(repos[0], root, prod_key, ignore_patterns, dir__=dir_)
+        (err_msgs, passed) = _validate_maven(valid_mvn_paths)
+        if not passed:
+            _handle_error(err_msgs)
+        logger.info(
+            "Start uploading files from archive to s3 buckets: %s",
+            [target[1] for target in targets]
+        )
+        failed_files = s3_client.upload_files(
+            file_paths=valid_mvn_paths,
+            targets=targets_,
+            product=prod_key,
+            root=top_level,
+            reader=reader
+        )
+    elif len(repos) == 1 and transfer_config.get("pipeline", False):
+        # 1-4. extract the tarball and upload the extracted files in a pipeline,
+        # the paths are scanned and filtered during the extraction
+        logger.info(
+            "Start extracting and uploading files to s3 buckets: %s",
+            [target[1] for target in targets]
+        )
+        (tmp_root, top_level,
+         valid_mvn_paths,
+         valid_poms,
+         valid_dirs,
+         failed_files) = _extract_and_upload(
+            repos[0], root, prod_key, ignore_patterns,
+            s3_client, targets_, dir__=dir_
+        )
+        if not os.path.isdir(top_level):
+            logger.error("Error: the extracted top-level path %s does not exist.", top_level)
+            sys.exit(1)
+        (err_msgs, passed) = _validate_maven(valid_mvn_paths)
+        if not passed:
+            _handle_error(err_msgs)
+    else:
+        # 1. extract tarballs
+        tmp_root = _extract_tarballs(repos, root, prod_key, dir__=dir_)
+
+        # 2. scan for paths and filter out the ignored paths,
+        # and also collect poms for later metadata generation
+        (top_level,
+         valid_mvn_paths,
+         valid_poms,
+         valid_dirs) = _scan_paths(tmp_root, ignore_patterns, root)
+
+        # This prefix is a subdir under top-level directory in tarball
+        # or root before real GAV dir structure
+        if not os.path.isdir(top_level):
+            logger.error("Error: the extracted top-level path %s does not exist.", top_level)
+            sys.exit(1)
 
-    # 3. do validation for the files, like product version checking
-    logger.info("Validating paths with rules.")
-    (err_msgs, passed) = _validate_maven(valid_mvn_paths)
-    if not passed:
-        _handle_error(err_msgs)
-        # Question: should we exit here?
+        # 3. do validation for the files, like product version checking
+        logger.info("Validating paths with rules.")
+        (err_msgs, passed) = _validate_maven(valid_mvn_paths)
+        if not passed:
+            _handle_error(err_msgs)
+            # Question: should we exit here?
 
-    # 4. Do uploading
-    s3_client = S3Client(aws_profile=aws_profile, dry_run=dry_run)
-    targets_ = [(target[1], remove_prefix(target[2], "/")) for target in targets]
-    logger.info(
-        "Start uploading files to s3 buckets: %s",
-        [target[1] for target in targets]
-    )
-    failed_files = s3_client.upload_files(
-        file_paths=valid_mvn_paths,
-        targets=targets_,
-        product=prod_key,
-        root=top_level
-    )
+        # 4. Do uploading
+        logger.info(
+            "Start uploading files to s3 buckets: %s",
+            [target[1] for target in targets]
+        )
+        failed_files = s3_client.upload_files(
+            file_paths=valid_mvn_paths,
+            targets=targets_,
+            product=prod_key,
+            root=top_level
+        )
     logger.info("Files uploading done\n")
     succeeded = True
     generated_signs = []
     for bucket in targets:
-        # prepare cf invalidate files
-        cf_invalidate_paths = []
-
-        # 5. Do manifest uploading
-        if not manifest_bucket_name:
-            logger.warning(
-                'Warning: No manifest bucket is provided, will ignore the process of manifest '
-                'uploading\n')
-        else:
-            logger.info("Start uploading manifest to s3 bucket %s", manifest_bucket_name)
-            manifest_folder = bucket[1]
-            manifest_name, manifest_full_path = write_manifest(valid_mvn_paths, top_level, prod_key)
-            s3_client.upload_manifest(
-                manifest_name, manifest_full_path,
-                manifest_folder, manifest_bucket_name
-            )
-            logger.info("Manifest uploading is done\n")
-
-        # 6. Use uploaded poms to scan s3 for metadata refreshment
-        bucket_name = bucket[1]
-        prefix = remove_prefix(bucket[2], "/")
-        logger.info("Start generating maven-metadata.xml files for bucket %s", bucket_name)
-        meta_files = _generate_metadatas(
-            s3=s3_client, bucket=bucket_name,
-            poms=valid_poms, root=top_level,
-            prefix=prefix
-        )
-        logger.info("maven-metadata.xml files generation done\n")
-        failed_metas = meta_files.get(META_FILE_FAILED, [])
-
-        # 7. Upload all maven-metadata.xml
-        if META_FILE_GEN_KEY in meta_files:
-            logger.info("Start updating maven-metadata.xml to s3 bucket %s", bucket_name)
-            _failed_metas = s3_client.upload_metadatas(
-                meta_file_paths=meta_files[META_FILE_GEN_KEY],
-                target=(bucket_name, prefix),
-                product=None,
-                root=top_level
-            )
-            failed_metas.extend(_failed_metas)
-            logger.info("maven-metadata.xml updating done in bucket %s\n", bucket_name)
-            # Add maven-metadata.xml to CF invalidate paths
-            if cf_enable:
-                cf_invalidate_paths.extend(meta_files.get(META_FILE_GEN_KEY, []))
+        with span("target", target=bucket[0], bucket=bucket[1]):
+            # prepare cf invalidate files
+            cf_invalidate_paths = []
 
-        # 8. Determine refreshment of archetype-catalog.xml
-        if os.path.exists(os.path.join(top_level, MAVEN_ARCH_FILE)):
-            logger.info("Start generating archetype-catalog.xml for bucket %s", bucket_name)
-            upload_archetype_file = _generate_upload_archetype_catalog(
+            # 5. Do manifest uploading
+            set_phase("manifest")
+            if not manifest_bucket_name:
+                logger.warning(
+                    'Warning: No manifest bucket is provided, will ignore the process of manifest '
+                    'uploading\n')
+            else:
+                logger.info("Start uploading manifest to s3 bucket %s", manifest_bucket_name)
+                manifest_folder = bucket[1]
+                manifest_name, manifest_full_path = write_manifest(
+                    valid_mvn_paths, top_level, prod_key
+                )
+                s3_client.upload_manifest(
+                    manifest_name, manifest_full_path,
+                    manifest_folder, manifest_bucket_name
+                )
+                logger.info("Manifest uploading is done\n")
+
+            # 6. Use uploaded poms to scan s3 for metadata refreshment
+            set_phase("metadata")
+            bucket_name = bucket[1]
+            prefix = remove_prefix(bucket[2], "/")
+            logger.info("Start generating maven-metadata.xml files for bucket %s", bucket_name)
+            meta_files = _generate_metadatas(
                 s3=s3_client, bucket=bucket_name,
-                root=top_level,
-                prefix=prefix
+                poms=valid_poms, root=top_level,
+                prefix=prefix, rebuild=rebuild_metadata
             )
-            logger.info("archetype-catalog.xml files generation done in bucket %s\n", bucket_name)
+            logger.info("maven-metadata.xml files generation done\n")
+            failed_metas = meta_files.get(META_FILE_FAILED, [])
 
-            # 9. Upload archetype-catalog.xml if it has changed
-            if upload_archetype_file:
-                archetype_files = [os.path.join(top_level, ARCHETYPE_CATALOG_FILENAME)]
-                archetype_files.extend(
-                    __hash_decorate_metadata(top_level, ARCHETYPE_CATALOG_FILENAME)
-                )
-                logger.info("Start updating archetype-catalog.xml to s3 bucket %s", bucket_name)
+            # 7. Upload all maven-metadata.xml
+            if META_FILE_GEN_KEY in meta_files:
+                logger.info("Start updating maven-metadata.xml to s3 bucket %s", bucket_name)
                 _failed_metas = s3_client.upload_metadatas(
-                    meta_file_paths=archetype_files,
+                    meta_file_paths=meta_files[META_FILE_GEN_KEY],
                     target=(bucket_name, prefix),
                     product=None,
                     root=top_level
                 )
                 failed_metas.extend(_failed_metas)
-                logger.info("archetype-catalog.xml updating done in bucket %s\n", bucket_name)
-                # Add archtype-catalog to invalidate paths
+                logger.info("maven-metadata.xml updating done in bucket %s\n", bucket_name)
+                # Add maven-metadata.xml to CF invalidate paths
                 if cf_enable:
-                    cf_invalidate_paths.extend(archetype_files)
+                    cf_invalidate_paths.extend(meta_files.get(META_FILE_GEN_KEY, []))
+
+            # 8. Determine refreshment of archetype-catalog.xml
+            set_phase("archetype")
+            if os.path.exists(os.path.join(top_level, MAVEN_ARCH_FILE)):
+                logger.info("Start generating archetype-catalog.xml for bucket %s", bucket_name)
+                upload_archetype_file = _generate_upload_archetype_catalog(
+                    s3=s3_client, bucket=bucket_name,
+                    root=top_level,
+                    prefix=prefix
+                )
+                logger.info(
+                    "archetype-catalog.xml files generation done in bucket %s\n", bucket_name
+                )
 
-        # 10. Generate signature file if radas sign is enabled,
-        # or do detached sign if contain_signature is set to True
-        conf = get_config(config)
-        if not conf:
-            sys.exit(1)
+                # 9. Upload archetype-catalog.xml if it has changed
+                if upload_archetype_file:
+                    archetype_files = [os.path.join(top_level, ARCHETYPE_CATALOG_FILENAME)]
+                    archetype_files.extend(
+                        __hash_decorate_metadata(top_level, ARCHETYPE_CATALOG_FILENAME)
+                    )
+                    logger.info("Start updating archetype-catalog.xml to s3 bucket %s", bucket_name)
+                    _failed_metas = s3_client.upload_metadatas(
+                        meta_file_paths=archetype_files,
+                        target=(bucket_name, prefix),
+                        product=None,
+                        root=top_level
+                    )
+                    failed_metas.extend(_failed_metas)
+                    logger.info("archetype-catalog.xml updating done in bucket %s\n", bucket_name)
+                    # Add archtype-catalog to invalidate paths
+                    if cf_enable:
+                        cf_invalidate_paths.extend(archetype_files)
+
+            # 10. Generate signature file if radas sign is enabled,
+            # or do detached sign if contain_signature is set to True
+            set_phase("signature")
+            conf = get_config(config)
+            if not conf:
+                sys.exit(1)
 
-        if conf.is_radas_enabled() and sign_result_file and os.path.isfile(sign_result_file):
-            logger.info("Start generating radas signature files for s3 bucket %s\n", bucket_name)
-            (_failed_metas, _generated_signs) = radas_signature.generate_radas_sign(
-                top_level=top_level, root=root, sign_result_file=sign_result_file
-            )
-            if not _generated_signs:
-                logger.error(
-                    "No sign result files were generated, "
-                    "please make sure the sign process is already done and without timeout")
-                return (tmp_root, False)
-
-            failed_metas.extend(_failed_metas)
-            generated_signs.extend(_generated_signs)
-            logger.info("Radas signature files generation done.\n")
-
-            logger.info("Start upload radas signature files to s3 bucket %s\n", bucket_name)
-            _failed_metas = s3_client.upload_signatures(
-                meta_file_paths=generated_signs,
-                target=(bucket_name, prefix),
-                product=None,
-                root=top_level
-            )
-            failed_metas.extend(_failed_metas)
-            logger.info("Radas signature files uploading done.\n")
-
-        elif gen_sign:
-            suffix_list = __get_suffix(PACKAGE_TYPE_MAVEN, conf)
-            command = conf.get_detach_signature_command()
-            artifacts = [s for s in valid_mvn_paths if not s.endswith(tuple(suffix_list))]
-            logger.info("Start generating signature for s3 bucket %s\n", bucket_name)
-            (_failed_metas, _generated_signs) = signature.generate_sign(
-                PACKAGE_TYPE_MAVEN, artifacts,
-                top_level, prefix,
-                s3_client, bucket_name,
-                key, command
-            )
-            failed_metas.extend(_failed_metas)
-            generated_signs.extend(_generated_signs)
-            logger.info("Singature generation done.\n")
+            if conf.is_radas_enabled() and sign_result_file and os.path.isfile(sign_result_file):
+                logger.info(
+                    "Start generating radas signature files for s3 bucket %s\n", bucket_name
+                )
+                (_failed_metas, _generated_signs) = radas_signature.generate_radas_sign(
+                    top_level=top_level, root=root, sign_result_file=sign_result_file
+                )
+                if not _generated_signs:
+                    logger.error(
+                        "No sign result files were generated, "
+                        "please make sure the sign process is already done and without timeout")
+                    close_upload_journal(journal, False)
+                    s3_client.close()
+                    return (tmp_root, False)
 
-            logger.info("Start upload singature files to s3 bucket %s\n", bucket_name)
-            _failed_metas = s3_client.upload_signatures(
-                meta_file_paths=generated_signs,
-                target=(bucket_name, prefix),
-                product=None,
-                root=top_level
-            )
-            failed_metas.extend(_failed_metas)
-            logger.info("Signature uploading done.\n")
-
-        # this step generates index.html for each dir and add them to file list
-        # index is similar to metadata, it will be overwritten everytime
-        if do_index:
-            logger.info("Start generating index files to s3 bucket %s", bucket_name)
-            created_indexes = indexing.generate_indexes(
-                PACKAGE_TYPE_MAVEN,
-                top_level, valid_dirs,
-                s3_client, bucket_name, prefix
-            )
-            logger.info("Index files generation done.\n")
+                failed_metas.extend(_failed_metas)
+                generated_signs.extend(_generated_signs)
+                logger.info("Radas signature files generation done.\n")
 
-            logger.info("Start updating index files to s3 bucket %s", bucket_name)
-            _failed_metas = s3_client.upload_metadatas(
-                meta_file_paths=created_indexes,
-                target=(bucket_name, prefix),
-                product=None,
-                root=top_level
-            )
-            failed_metas.extend(_failed_metas)
-            logger.info("Index files updating done\n")
-            # We will not invalidate the index files per cost consideration
-            # if cf_enable:
-            #     cf_invalidate_paths.extend(created_indexes)
-        else:
-            logger.info("Bypass indexing")
+                logger.info("Start upload radas signature files to s3 bucket %s\n", bucket_name)
+                _failed_metas = s3_client.upload_signatures(
+                    meta_file_paths=generated_signs,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=top_level
+                )
+                failed_metas.extend(_failed_metas)
+                logger.info("Radas signature files uploading done.\n")
+
+            elif gen_sign:
+                suffix_list = __get_suffix(PACKAGE_TYPE_MAVEN, conf)
+                command = conf.get_detach_signature_command()
+                artifacts = [s for s in valid_mvn_paths if not s.endswith(tuple(suffix_list))]
+                logger.info("Start generating signature for s3 bucket %s\n", bucket_name)
+                (_failed_metas, _generated_signs) = signature.generate_sign(
+                    PACKAGE_TYPE_MAVEN, artifacts,
+                    top_level, prefix,
+                    s3_client, bucket_name,
+                    key, command
+                )
+                failed_metas.extend(_failed_metas)
+                generated_signs.extend(_generated_signs)
+                logger.info("Singature generation done.\n")
 
-        # 11. Finally do the CF invalidating for metadata files
-        if cf_enable and len(cf_invalidate_paths) > 0:
-            cf_client = CFClient(aws_profile=aws_profile)
-            cf_invalidate_paths = __wildcard_metadata_paths(cf_invalidate_paths)
-            invalidate_cf_paths(cf_client, bucket, cf_invalidate_paths, top_level)
+                logger.info("Start upload singature files to s3 bucket %s\n", bucket_name)
+                _failed_metas = s3_client.upload_signatures(
+                    meta_file_paths=generated_signs,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=top_level
+                )
+                failed_metas.extend(_failed_metas)
+                logger.info("Signature uploading done.\n")
+
+            # this step generates index.html for each dir and add them to file list
+            # index is similar to metadata, it will be overwritten everytime
+            if do_index:
+                set_phase("index")
+                logger.info("Start generating index files to s3 bucket %s", bucket_name)
+                created_indexes = indexing.generate_indexes(
+                    PACKAGE_TYPE_MAVEN,
+                    top_level, valid_dirs,
+                    s3_client, bucket_name, prefix
+                )
+                logger.info("Index files generation done.\n")
 
-        upload_post_process(failed_files, failed_metas, prod_key, bucket_name)
-        succeeded = succeeded and len(failed_files) <= 0 and len(failed_metas) <= 0
+                logger.info("Start updating index files to s3 bucket %s", bucket_name)
+                _failed_metas = s3_client.upload_metadatas(
+                    meta_file_paths=created_indexes,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=top_level
+                )
+                failed_metas.extend(_failed_metas)
+                logger.info("Index files updating done\n")
+                # We will not invalidate the index files per cost consideration
+                # if cf_enable:
+                #     cf_invalidate_paths.extend(created_indexes)
+            else:
+                logger.info("Bypass indexing")
+
+            # 11. Finally do the CF invalidating for metadata files
+            if cf_enable and len(cf_invalidate_paths) > 0:
+                set_phase("cf")
+                cf_client = CFClient(aws_profile=aws_profile)
+                cf_invalidate_paths = __wildcard_metadata_paths(cf_invalidate_paths)
+                invalidate_cf_paths(cf_client, bucket, cf_invalidate_paths, top_level)
+
+            upload_post_process(
+                failed_files, failed_metas, prod_key, bucket_name,
+                retry_stats=s3_client.get_retry_stats()
+            )
+            succeeded = succeeded and len(failed_files) <= 0 and len(failed_metas) <= 0
 
+    close_upload_journal(journal, succeeded)
+    s3_client.close()
     return (tmp_root, succeeded)
 
 
@@ -518,7 +637,10 @@ def handle_maven_del(
     do_index=True,
     cf_enable=False,
     dry_run=False,
-    manifest_bucket_name=None
+    manifest_bucket_name=None,
+    ownership_store=None,
+    rebuild_metadata=False,
+    transfer_config=None
 ) -> Tuple[str, bool]:
     """ Handle the maven product release tarball deletion process.
         * repo is the location of the tarball in filesystem
@@ -533,6 +655,13 @@ def handle_maven_del(
           prefix. See target definition in Charon configuration for details
         * dir is base dir for extracting the tarball, will use system
           tmp dir if None.
+        * ownership_store is the store type of product ownership, which
+          can be "sidecar" or "directory". See Charon configuration for details.
+        * rebuild_metadata is used to regenerate maven-metadata.xml from the
+          listing of all poms of each GA, instead of merging the versions into
+          the existing maven-metadata.xml.
+        * transfer_config is the transfer section of Charon configuration,
+          which controls the retrying of the failed requests.
 
         Returns the directory used for archive processing and if the rollback is successful
     """
@@ -553,143 +682,160 @@ def handle_maven_del(
     logger.debug("Valid poms: %s", valid_poms)
     succeeded = True
     for target in targets:
-        # prepare cf invalidation paths
-        cf_invalidate_paths = []
-
-        prefix = remove_prefix(target[2], "/")
-        s3_client = S3Client(aws_profile=aws_profile, dry_run=dry_run)
-        bucket_name = target[1]
-        logger.info("Start deleting files from s3 bucket %s", bucket_name)
-        failed_files = s3_client.delete_files(
-            valid_mvn_paths,
-            target=(bucket_name, prefix),
-            product=prod_key,
-            root=top_level
-        )
-        logger.info("Files deletion done\n")
-
-        # 4. Delete related manifest from s3
-        manifest_folder = target[1]
-        logger.info(
-            "Start deleting manifest from s3 bucket %s in folder %s",
-            manifest_bucket_name, manifest_folder
-        )
-        s3_client.delete_manifest(prod_key, manifest_folder, manifest_bucket_name)
-        logger.info("Manifest deletion is done\n")
-
-        # 5. Use changed GA to scan s3 for metadata refreshment
-        logger.info(
-            "Start generating maven-metadata.xml files for all changed GAs in s3 bucket %s",
-            bucket_name
-        )
-        meta_files = _generate_metadatas(
-            s3=s3_client, bucket=bucket_name,
-            poms=valid_poms, root=top_level,
-            prefix=prefix
-        )
-
-        logger.info("maven-metadata.xml files generation done\n")
-
-        # 6. Upload all maven-metadata.xml. We need to delete metadata files
-        # firstly for all affected GA, and then replace the theirs content.
-        logger.info("Start updating maven-metadata.xml to s3 bucket %s", bucket_name)
-        all_meta_files = []
-        for _, files in meta_files.items():
-            all_meta_files.extend(files)
-        s3_client.delete_files(
-            file_paths=all_meta_files,
-            target=(bucket_name, prefix),
-            product=None,
-            root=top_level
-        )
-        failed_metas = meta_files.get(META_FILE_FAILED, [])
-        if META_FILE_GEN_KEY in meta_files:
-            _failed_metas = s3_client.upload_metadatas(
-                meta_file_paths=meta_files[META_FILE_GEN_KEY],
+        with span("target", target=target[0], bucket=target[1]):
+            # prepare cf invalidation paths
+            cf_invalidate_paths = []
+
+            prefix = remove_prefix(target[2], "/")
+            s3_client = S3Client(
+                aws_profile=aws_profile, dry_run=dry_run, transfer_config=transfer_config,
+                ownership_store=ownership_store
+            )
+            bucket_name = target[1]
+            set_phase("files")
+            logger.info("Start deleting files from s3 bucket %s", bucket_name)
+            failed_files = s3_client.delete_files(
+                valid_mvn_paths,
                 target=(bucket_name, prefix),
-                product=None,
+                product=prod_key,
                 root=top_level
             )
-            if len(_failed_metas) > 0:
-                failed_metas.extend(_failed_metas)
-        logger.info("maven-metadata.xml updating done\n")
-        if cf_enable:
-            logger.debug(
-                "Extending invalidate_paths with %s:", all_meta_files
+            logger.info("Files deletion done\n")
+
+            # 4. Delete related manifest from s3
+            set_phase("manifest")
+            manifest_folder = target[1]
+            logger.info(
+                "Start deleting manifest from s3 bucket %s in folder %s",
+                manifest_bucket_name, manifest_folder
             )
-            cf_invalidate_paths.extend(all_meta_files)
-
-        # 7. Determine refreshment of archetype-catalog.xml
-        if os.path.exists(os.path.join(top_level, MAVEN_ARCH_FILE)):
-            logger.info("Start generating archetype-catalog.xml")
-            archetype_action = _generate_rollback_archetype_catalog(
+            s3_client.delete_manifest(prod_key, manifest_folder, manifest_bucket_name)
+            logger.info("Manifest deletion is done\n")
+
+            # 5. Use changed GA to scan s3 for metadata refreshment
+            set_phase("metadata")
+            logger.info(
+                "Start generating maven-metadata.xml files for all changed GAs in s3 bucket %s",
+                bucket_name
+            )
+            meta_files = _generate_metadatas(
                 s3=s3_client, bucket=bucket_name,
-                root=top_level,
-                prefix=prefix
+                poms=valid_poms, root=top_level,
+                prefix=prefix, deleting=True, rebuild=rebuild_metadata
             )
-            logger.info("archetype-catalog.xml files generation done\n")
-
-            # 8. Upload or Delete archetype-catalog.xml if it has changed
-            archetype_files = [os.path.join(top_level, ARCHETYPE_CATALOG_FILENAME)]
-            archetype_files.extend(__hash_decorate_metadata(top_level, ARCHETYPE_CATALOG_FILENAME))
-            if archetype_action < 0:
-                logger.info("Start updating archetype-catalog.xml to s3 bucket %s", bucket_name)
-                _failed_metas = s3_client.delete_files(
-                    file_paths=archetype_files,
-                    target=(bucket_name, prefix),
-                    product=None,
-                    root=top_level
-                )
-                if len(_failed_metas) > 0:
-                    failed_metas.extend(_failed_metas)
-            elif archetype_action > 0:
+
+            logger.info("maven-metadata.xml files generation done\n")
+
+            # 6. Upload all maven-metadata.xml. We need to delete metadata files
+            # firstly for all affected GA, and then replace the theirs content.
+            logger.info("Start updating maven-metadata.xml to s3 bucket %s", bucket_name)
+            all_meta_files = []
+            for _, files in meta_files.items():
+                all_meta_files.extend(files)
+            s3_client.delete_files(
+                file_paths=all_meta_files,
+                target=(bucket_name, prefix),
+                product=None,
+                root=top_level
+            )
+            failed_metas = meta_files.get(META_FILE_FAILED, [])
+            if META_FILE_GEN_KEY in meta_files:
                 _failed_metas = s3_client.upload_metadatas(
-                    meta_file_paths=archetype_files,
+                    meta_file_paths=meta_files[META_FILE_GEN_KEY],
                     target=(bucket_name, prefix),
                     product=None,
                     root=top_level
                 )
                 if len(_failed_metas) > 0:
                     failed_metas.extend(_failed_metas)
-            logger.info("archetype-catalog.xml updating done\n")
+            logger.info("maven-metadata.xml updating done\n")
             if cf_enable:
-                cf_invalidate_paths.extend(archetype_files)
-
-        if do_index:
-            logger.info("Start generating index files for all changed entries")
-            created_indexes = indexing.generate_indexes(
-                PACKAGE_TYPE_MAVEN, top_level, valid_dirs, s3_client, bucket_name, prefix
-            )
-            logger.info("Index files generation done.\n")
+                logger.debug(
+                    "Extending invalidate_paths with %s:", all_meta_files
+                )
+                cf_invalidate_paths.extend(all_meta_files)
+
+            # 7. Determine refreshment of archetype-catalog.xml
+            set_phase("archetype")
+            if os.path.exists(os.path.join(top_level, MAVEN_ARCH_FILE)):
+                logger.info("Start generating archetype-catalog.xml")
+                archetype_action = _generate_rollback_archetype_catalog(
+                    s3=s3_client, bucket=bucket_name,
+                    root=top_level,
+                    prefix=prefix
+                )
+                logger.info("archetype-catalog.xml files generation done\n")
 
-            logger.info("Start updating index to s3 bucket %s", bucket_name)
-            _failed_index_files = s3_client.upload_metadatas(
-                meta_file_paths=created_indexes,
-                target=(bucket_name, prefix),
-                product=None,
-                root=top_level
-            )
-            if len(_failed_index_files) > 0:
-                failed_metas.extend(_failed_index_files)
-            logger.info("Index files updating done.\n")
-            # We will not invalidate the index files per cost consideration
-            # if cf_enable:
-            #     cf_invalidate_paths.extend(created_indexes)
-        else:
-            logger.info("Bypassing indexing")
+                # 8. Upload or Delete archetype-catalog.xml if it has changed
+                archetype_files = [os.path.join(top_level, ARCHETYPE_CATALOG_FILENAME)]
+                archetype_files.extend(
+                    __hash_decorate_metadata(top_level, ARCHETYPE_CATALOG_FILENAME)
+                )
+                if archetype_action < 0:
+                    logger.info("Start updating archetype-catalog.xml to s3 bucket %s", bucket_name)
+                    _failed_metas = s3_client.delete_files(
+                        file_paths=archetype_files,
+                        target=(bucket_name, prefix),
+                        product=None,
+                        root=top_level
+                    )
+                    if len(_failed_metas) > 0:
+                        failed_metas.extend(_failed_metas)
+                elif archetype_action > 0:
+                    _failed_metas = s3_client.upload_metadatas(
+                        meta_file_paths=archetype_files,
+                        target=(bucket_name, prefix),
+                        product=None,
+                        root=top_level
+                    )
+                    if len(_failed_metas) > 0:
+                        failed_metas.extend(_failed_metas)
+                logger.info("archetype-catalog.xml updating done\n")
+                if cf_enable:
+                    cf_invalidate_paths.extend(archetype_files)
 
-        # 9. Finally do the CF invalidating for metadata files
-        if cf_enable and len(cf_invalidate_paths):
-            cf_client = CFClient(aws_profile=aws_profile)
-            cf_invalidate_paths = __wildcard_metadata_paths(cf_invalidate_paths)
-            invalidate_cf_paths(cf_client, target, cf_invalidate_paths, top_level)
+            if do_index:
+                set_phase("index")
+                logger.info("Start generating index files for all changed entries")
+                created_indexes = indexing.generate_indexes(
+                    PACKAGE_TYPE_MAVEN, top_level, valid_dirs, s3_client, bucket_name, prefix
+                )
+                logger.info("Index files generation done.\n")
 
-        rollback_post_process(failed_files, failed_metas, prod_key, bucket_name)
-        succeeded = succeeded and len(failed_files) == 0 and len(failed_metas) == 0
+                logger.info("Start updating index to s3 bucket %s", bucket_name)
+                _failed_index_files = s3_client.upload_metadatas(
+                    meta_file_paths=created_indexes,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=top_level
+                )
+                if len(_failed_index_files) > 0:
+                    failed_metas.extend(_failed_index_files)
+                logger.info("Index files updating done.\n")
+                # We will not invalidate the index files per cost consideration
+                # if cf_enable:
+                #     cf_invalidate_paths.extend(created_indexes)
+            else:
+                logger.info("Bypassing indexing")
+
+            # 9. Finally do the CF invalidating for metadata files
+            if cf_enable and len(cf_invalidate_paths):
+                set_phase("cf")
+                cf_client = CFClient(aws_profile=aws_profile)
+                cf_invalidate_paths = __wildcard_metadata_paths(cf_invalidate_paths)
+                invalidate_cf_paths(cf_client, target, cf_invalidate_paths, top_level)
+
+            rollback_post_process(
+                failed_files, failed_metas, prod_key, bucket_name,
+                retry_stats=s3_client.get_retry_stats()
+            )
+            s3_client.close()
+            succeeded = succeeded and len(failed_files) == 0 and len(failed_metas) == 0
 
     return (tmp_root, succeeded)
 
 
+@traced("extract")
 def _extract_tarball(repo: str, prefix="", dir__=None) -> str:
     if os.path.exists(repo):
         try:
@@ -705,6 +851,7 @@ def _extract_tarball(repo: str, prefix="", dir__=None) -> str:
     sys.exit(1)
 
 
+@traced("extract")
 def _extract_tarballs(repos: List[str], root: str, prefix="", dir__=None) -> str:
     """ Extract multiple zip archives to a temporary directory.
         * repos are the list of repo paths to extract
@@ -787,6 +934,194 @@ def _extract_tarballs(repos: List[str], root: str, prefix="", dir__=None) -> str
     return final_tmp_root
 
 
+def _open_zip_repo(repo: str, prod_key: str, dir__=None) -> Tuple[ZipFile, str]:
+    """Open the zip archive, and create the temporary directory for it"""
+    if not os.path.exists(repo):
+        logger.error("Error: archive %s does not exist", repo)
+        sys.exit(1)
+    try:
+        repo_zip = ZipFile(repo)
+    except BadZipFile as e:
+        logger.error("Tarball extraction error for repo %s: %s", repo, e)
+        sys.exit(1)
+    return (repo_zip, mkdtemp(prefix=f"charon-{prod_key}-final-", dir=dir__))
+
+
+def _zip_top_level(zf: ZipFile, root: str, tmp_root: str) -> str:
+    """Get the top-level path of the zip archive when it is extracted to
+    tmp_root, which is the first directory named as root, the same as _scan_paths.
+    """
+    top_prefix = None
+    for name in zf.namelist():
+        parts = name.split("/")[:-1]
+        if root in parts:
+            candidate = "/".join(parts[:parts.index(root) + 1])
+            if top_prefix is None or candidate.count("/") < top_prefix.count("/"):
+                top_prefix = candidate
+    if top_prefix is None:
+        logger.warning(
+            "Warning: the root path %s does not exist in tarball,"
+            " will use empty trailing prefix for the uploading", root
+        )
+        return tmp_root
+    return os.path.join(tmp_root, top_prefix)
+
+
+class _ZipPathsCollector(object):
+    """Collect the paths of the zip members under top-level and filter out the
+    ignored paths, which is the same as _scan_paths but without walking the
+    extracted files.
+    """
+
+    def __init__(self, top_level: str, ignore_patterns: List[str]):
+        self.top_level = top_level
+        self.ignore_patterns = ignore_patterns
+        self.valid_mvn_paths: List[str] = []
+        self.valid_poms: List[str] = []
+        self.valid_dirs: Set[str] = set()
+        self.ignored_paths: List[str] = []
+
+    def collect(self, path: str, is_dir: bool) -> bool:
+        """Collect the path, and return if it is a valid file for uploading"""
+        if not path.startswith(self.top_level + os.sep):
+            return False
+        directory = path if is_dir else os.path.dirname(path)
+        while directory.startswith(self.top_level) and directory not in self.valid_dirs:
+            self.valid_dirs.add(directory)
+            directory = os.path.dirname(directory)
+        if is_dir:
+            return False
+        name = os.path.basename(path)
+        if _is_ignored(name, self.ignore_patterns):
+            self.ignored_paths.append(path)
+            return False
+        self.valid_mvn_paths.append(path)
+        if name.strip().endswith(".pom"):
+            self.valid_poms.append(path)
+        return True
+
+    def log_ignored(self):
+        if self.ignore_patterns and len(self.ignore_patterns) > 0:
+            logger.info(
+                "Ignored paths with ignore_patterns %s as below:\n%s\n",
+                self.ignore_patterns, "\n".join(self.ignored_paths)
+            )
+
+
+@traced("scan")
+def _scan_zip(
+    repo: str, root: str, prod_key: str, ignore_patterns: List[str], dir__=None
+) -> Tuple[str, str, List[str], List[str], List[str], ZipMemberReader]:
+    """ Scan the zip archive for the paths like _scan_paths without extracting it.
+        The returned paths are where the members would be extracted to, and they
+        can be read by the returned ZipMemberReader directly from the archive.
+        Only the archetype-catalog.xml is extracted, as it will be merged with
+        the remote one.
+
+        Returns the temporary directory, the top-level path, the valid maven paths,
+        poms and dirs like _scan_paths, and the reader of the archive.
+    """
+    (repo_zip, tmp_root) = _open_zip_repo(repo, prod_key, dir__)
+    top_level = _zip_top_level(repo_zip, root, tmp_root)
+    os.makedirs(top_level, exist_ok=True)
+    collector = _ZipPathsCollector(top_level, ignore_patterns)
+    for member in repo_zip.infolist():
+        path = zip_member_path(tmp_root, member.filename)
+        collector.collect(path, member.is_dir())
+        if path == os.path.join(top_level, MAVEN_ARCH_FILE):
+            _extract_member(repo_zip, member, tmp_root)
+    collector.log_ignored()
+    return (
+        tmp_root, top_level, collector.valid_mvn_paths, collector.valid_poms,
+        list(collector.valid_dirs), ZipMemberReader(repo_zip, tmp_root)
+    )
+
+
+@traced("extract_and_upload")
+def _extract_and_upload(
+    repo: str, root: str, prod_key: str, ignore_patterns: List[str],
+    s3_client: S3Client, targets: List[Tuple[str, str]], dir__=None
+) -> Tuple[str, str, List[str], List[str], List[str], List[str]]:
+    """ Extract the zip archive and upload the extracted files at the same time.
+        A producer thread extracts the zip members in order, filters them as
+        _scan_paths does, and puts the valid files into a bounded queue. The
+        s3_client uploads the files from the queue in one uploading phase as
+        soon as they are extracted, so the uploading starts before the whole
+        archive is extracted, and the product ownership is flushed only once.
+
+        Returns the temporary directory, the top-level path, the valid maven paths,
+        poms and dirs like _scan_paths, and the failed to upload files.
+    """
+    (repo_zip, tmp_root) = _open_zip_repo(repo, prod_key, dir__)
+    top_level = _zip_top_level(repo_zip, root, tmp_root)
+    collector = _ZipPathsCollector(top_level, ignore_patterns)
+    file_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    errors = []
+
+    def produce():
+        try:
+            for member in repo_zip.infolist():
+                path = _extract_member(repo_zip, member, tmp_root)
+                if collector.collect(path, member.is_dir()):
+                    file_queue.put(path)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            file_queue.put(None)
+
+    consumed = []
+
+    async def extracted():
+        # The queue is waited in the executor, so the uploading of the
+        # extracted files is not blocked by the extraction
+        loop = asyncio.get_event_loop()
+        while True:
+            path = await loop.run_in_executor(None, file_queue.get)
+            if path is None:
+                consumed.append(True)
+                return
+            yield path
+
+    producer = threading.Thread(target=produce, name="charon-extractor", daemon=True)
+    producer.start()
+    failed_files = s3_client.upload_files(
+        file_paths=extracted(), targets=targets, product=prod_key, root=top_level
+    )
+    # The uploading may be skipped without taking the files, like it is
+    # done in the journal, so the rest of files are taken here to let the
+    # extraction finish
+    while not consumed and file_queue.get() is not None:
+        pass
+    producer.join()
+    if errors:
+        logger.error("Tarball extraction error for repo %s: %s", repo, errors[0])
+        sys.exit(1)
+    logger.info("Extracted and uploaded %d files", len(collector.valid_mvn_paths))
+
+    collector.log_ignored()
+    return (
+        tmp_root, top_level, collector.valid_mvn_paths, collector.valid_poms,
+        list(collector.valid_dirs), failed_files
+    )
+
+
+def _extract_member(zf: ZipFile, member: ZipInfo, target_dir: str) -> str:
+    """Extract the zip member to the target dir, and return the extracted path.
+    The file is written to a temporary name first, so that it will never be read
+    partially, like the .sha1 files which are read for other files' checksum.
+    """
+    path = zip_member_path(target_dir, member.filename)
+    if member.is_dir():
+        os.makedirs(path, exist_ok=True)
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".charon-part"
+    with zf.open(member) as source, open(tmp_path, "wb") as target:
+        copyfileobj(source, target)
+    os.replace(tmp_path, path)
+    return path
+
+
 def _merge_directories_with_rename(src_dir: str, dest_dir: str, root: str):
     """ Recursively copy files from src_dir to dest_dir, overwriting existing files.
         * src_dir is the source directory to copy from
@@ -909,6 +1244,7 @@ def _handle_archetype_catalog_merge(src_catalog: str, dest_catalog: str):
                 raise e
 
 
+@traced("scan")
 def _scan_paths(files_root: str, ignore_patterns: List[str],
                 root: str) -> Tuple[str, List[str], List[str], List[str]]:
     # 2. scan for paths and filter out the ignored paths,
@@ -972,6 +1308,7 @@ def _scan_paths(files_root: str, ignore_patterns: List[str],
     return (top_level, valid_mvn_paths, valid_poms, valid_dirs)
 
 
+@traced("archetype")
 def _generate_rollback_archetype_catalog(
     s3: S3Client, bucket: str,
     root: str, prefix: str = None
@@ -1093,6 +1430,7 @@ def _generate_rollback_archetype_catalog(
     return 0
 
 
+@traced("archetype")
 def _generate_upload_archetype_catalog(
         s3: S3Client, bucket: str,
         root: str, prefix: str = None
@@ -1225,18 +1563,26 @@ def _parse_archetypes(source) -> List[ArchetypeRef]:
     return archetypes
 
 
+@traced("metadata")
 def _generate_metadatas(
     s3: S3Client, bucket: str,
     poms: List[str], root: str,
-    prefix: str = None
+    prefix: str = None,
+    deleting=False,
+    rebuild=False
 ) -> Dict[str, List[str]]:
     """Collect GAVs and generating maven-metadata.xml.
-       As all valid poms has been stored in s3 bucket,
+       As all valid poms has been stored in (or deleted from) s3 bucket,
        what we should do here is:
        * Scan and get the GA for the poms
-       * Search all poms in s3 based on the GA
-       * Use searched pomsto generate maven-metadata
-         to refresh
+       * Merge the versions of the poms into the existing maven-metadata.xml
+         of the GA in s3 bucket, the versions are added, or removed if
+         deleting and their poms are gone
+       * If rebuild, or the existing maven-metadata.xml of the GA can not
+         be used for merging, find the versions from the version folders
+         of the GA in s3, the GAs are listed concurrently
+       * Use found versions to generate maven-metadata
+         to refresh as soon as the versions of each GA are found
     """
     ga_dict: Dict[str, bool] = {}
     logger.debug("Valid poms: %s", poms)
@@ -1248,8 +1594,8 @@ def _generate_metadatas(
             ga_dict[os.path.join(g_path, a)] = True
     # Note: here we don't need to add original poms, because
     # they have already been uploaded to s3.
-    all_poms: List[str] = []
     meta_files: Dict[str, List[str]] = {}
+    ga_paths: Dict[str, str] = {}
     for path, _ in ga_dict.items():
         # avoid some wrong prefix, like searching org/apache
         # but got org/apache-commons
@@ -1258,8 +1604,20 @@ def _generate_metadatas(
             ga_prefix = os.path.join(prefix, path)
         if not path.endswith("/"):
             ga_prefix = ga_prefix + "/"
-        (existed_poms, success) = s3.get_files(bucket, ga_prefix, ".pom")
-        if len(existed_poms) == 0:
+        ga_paths[ga_prefix] = path
+    # The GAs may be found in more than one listing when a GA path is
+    # under another one, they only need to be generated once
+    generated_gas: Set[Tuple[str, str]] = set()
+    relist_prefixes = list(ga_paths.keys())
+    if not rebuild:
+        relist_prefixes = _merge_metadatas(
+            s3, bucket, poms, root, prefix, ga_paths, deleting,
+            meta_files, generated_gas
+        )
+
+    def handle_listing(ga_prefix: str, versions: List[str], success: bool):
+        path = ga_paths[ga_prefix]
+        if len(versions) == 0:
             if success:
                 logger.debug(
                     "No poms found in s3 bucket %s for GA path %s", bucket, path
@@ -1275,32 +1633,211 @@ def _generate_metadatas(
                 meta_failed_path.append(os.path.join(path, MAVEN_METADATA_FILE))
                 meta_failed_path.extend(__hash_decorate_metadata(path, MAVEN_METADATA_FILE))
                 meta_files[META_FILE_FAILED] = meta_failed_path
+            return
+        logger.debug(
+            "Got versions in s3 bucket %s for GA path %s: %s", bucket, path, versions
+        )
+        (g, a) = parse_ga(path)
+        if (g, a) in generated_gas:
+            return
+        generated_gas.add((g, a))
+        # Render the metadata of the GA as soon as its versions are found
+        try:
+            metas = gen_meta_file(g, a, versions, root)
+        except FileNotFoundError:
+            logger.warning("Failed to create or update metadata file for GA"
+                           " %s, please check if aligned Maven GA"
+                           " is correct in your tarball.", f'{g}:{a}')
+            return
+        logger.debug("Generated metadata file %s for %s:%s", metas, g, a)
+        meta_files.setdefault(META_FILE_GEN_KEY, []).extend(metas)
+
+    if relist_prefixes:
+        # The version folders left by deleting may have no poms in them
+        _discover_versions(
+            s3, bucket, relist_prefixes, handle_listing, validate=deleting
+        )
+    return meta_files
+
+
+def _discover_versions(
+    s3: S3Client, bucket: str, ga_prefixes: List[str],
+    handler: Callable[[str, List[str], bool], None],
+    validate=False
+):
+    """Find the versions of the GAs from their version folders in s3 bucket.
+    Only the sub folders of each GA are listed with delimiter, so the cost
+    of a GA is bounded by the number of its versions but not its files.
+        * handler is called with the GA prefix, its versions and if the
+        discovery is succeeded.
+        * A version folder is checked for its pom if validate, or if its name
+        does not start like a version, like the folder of a GA under another
+        GA. The check is a HEAD of the standard pom, then a listing of the
+        version folder if the pom is not found, like for timestamped
+        snapshots.
+        * The GAs without any folders to check are handled as soon as their
+        listings are done.
+    """
+    # GA prefix -> version -> version folder to check
+    to_check: Dict[str, Dict[str, str]] = {}
+    found: Dict[str, List[str]] = {}
+
+    def handle_listing(ga_prefix: str, contents: List[str], success: bool):
+        if not success:
+            handler(ga_prefix, [], False)
+            return
+        versions = [c[len(ga_prefix):-1] for c in contents if c.endswith("/")]
+        checks = {
+            v: ga_prefix + v + "/" for v in versions
+            if validate or not VERSION_LIKE_PATTERN.match(v)
+        }
+        if not checks:
+            handler(ga_prefix, versions, True)
+            return
+        found[ga_prefix] = [v for v in versions if v not in checks]
+        to_check[ga_prefix] = checks
+
+    s3.list_folders_concurrently(bucket, ga_prefixes, handle_listing)
+    if not to_check:
+        return
+
+    pom_keys: Dict[str, Tuple[str, str]] = {}
+    for ga_prefix, checks in to_check.items():
+        artifact = ga_prefix.rstrip("/").split("/")[-1]
+        for v, ver_prefix in checks.items():
+            pom_keys[f"{ver_prefix}{artifact}-{v}.pom"] = (ga_prefix, v)
+    failed: Set[str] = set()
+    try:
+        existed = s3.files_exist(bucket, list(pom_keys.keys()))
+    except (ClientError, HTTPClientError) as e:
+        logger.warning(
+            "Can not check the poms of the versions in bucket %s due to error: %s",
+            bucket, e
+        )
+        for ga_prefix in to_check:
+            handler(ga_prefix, [], False)
+        return
+    unsure: Dict[str, Tuple[str, str]] = {}
+    for pom_key, (ga_prefix, v) in pom_keys.items():
+        if existed.get(pom_key):
+            found[ga_prefix].append(v)
+        else:
+            unsure[to_check[ga_prefix][v]] = (ga_prefix, v)
+
+    def handle_version(ver_prefix: str, contents: List[str], success: bool):
+        (ga_prefix, v) = unsure[ver_prefix]
+        if not success:
+            failed.add(ga_prefix)
+        elif any(c.endswith(".pom") for c in contents):
+            found[ga_prefix].append(v)
+
+    if unsure:
+        s3.list_folders_concurrently(bucket, list(unsure.keys()), handle_version)
+    for ga_prefix in to_check:
+        if ga_prefix in failed:
+            handler(ga_prefix, [], False)
+        else:
+            handler(ga_prefix, sorted(found[ga_prefix]), True)
+
+
+def _merge_metadatas(
+    s3: S3Client, bucket: str,
+    poms: List[str], root: str,
+    prefix: Optional[str],
+    ga_paths: Dict[str, str],
+    deleting: bool,
+    meta_files: Dict[str, List[str]],
+    generated_gas: Set[Tuple[str, str]]
+) -> List[str]:
+    """Generate maven-metadata.xml of the GAs by merging the versions of the
+    poms into their existing maven-metadata.xml in s3 bucket, so only one
+    request is needed for each GA instead of listing all files under it.
+    The generated files are added to meta_files.
+        * When deleting, a version is removed only if its pom is gone, as
+        the pom may be kept for the other products.
+        * Return the GA prefixes which can not be merged and need a full
+        listing, like the ones without an existing or valid metadata, or
+        with no versions left after deleting.
+    """
+    slash_root = root if root.endswith("/") else root + "/"
+    # GA prefix -> pom key -> version
+    ga_poms: Dict[str, Dict[str, str]] = {}
+    for pom in poms:
+        (g, a, v) = __parse_gav(pom, root)
+        path = os.path.join("/".join(g.split(".")), a)
+        ga_prefix = (os.path.join(prefix, path) if prefix else path) + "/"
+        rel_path = pom[len(slash_root):] if pom.startswith(slash_root) else pom
+        pom_key = os.path.join(prefix, rel_path) if prefix else rel_path
+        ga_poms.setdefault(ga_prefix, {})[pom_key] = v
+
+    existed: Dict[str, bool] = {}
+    if deleting:
+        pom_keys = [k for pom_keys in ga_poms.values() for k in pom_keys]
+        try:
+            existed = s3.files_exist(bucket, pom_keys)
+        except (ClientError, HTTPClientError) as e:
+            logger.warning(
+                "Can not check the deleted poms in bucket %s due to error: %s, "
+                "will refresh maven-metadata.xml with full listing", bucket, e
+            )
+            return list(ga_paths.keys())
+
+    relist_prefixes: List[str] = []
+    meta_keys = {ga_prefix + MAVEN_METADATA_FILE: ga_prefix for ga_prefix in ga_paths}
+
+    def handle_metadata(meta_key: str, content: Optional[str], success: bool):
+        ga_prefix = meta_keys[meta_key]
+        path = ga_paths[ga_prefix]
+        versions = None
+        if content:
+            try:
+                versions = set(_parse_metadata_versions(content))
+            except ElementTree.ParseError:
+                logger.warning("Failed to parse %s in bucket %s", meta_key, bucket)
+        if not versions:
+            logger.debug("Can not merge %s, will list all poms of the GA", meta_key)
+            relist_prefixes.append(ga_prefix)
+            return
+        pom_versions = ga_poms.get(ga_prefix, {})
+        if deleting:
+            versions -= set(v for (k, v) in pom_versions.items() if not existed.get(k))
         else:
-            logger.debug(
-                "Got poms in s3 bucket %s for GA path %s: %s", bucket, path, poms
+            versions |= set(pom_versions.values())
+        if not versions:
+            # Make sure no poms are left before removing the metadata
+            relist_prefixes.append(ga_prefix)
+            return
+        (g, a) = parse_ga(path)
+        try:
+            metas = gen_meta_file(g, a, list(versions), root)
+        except FileNotFoundError:
+            logger.warning("Failed to create or update metadata file for GA"
+                           " %s, please check if aligned Maven GA"
+                           " is correct in your tarball.", f'{g}:{a}')
+            return
+        generated_gas.add((g, a))
+        logger.debug("Merged metadata file %s for %s:%s", metas, g, a)
+        meta_files.setdefault(META_FILE_GEN_KEY, []).extend(metas)
+
+    s3.read_files_concurrently(bucket, list(meta_keys.keys()), handle_metadata)
+    return relist_prefixes
+
+
+def _parse_metadata_versions(content: str) -> List[str]:
+    """Get the versions in the content of a maven-metadata.xml"""
+    tree = ElementTree.fromstring(
+        content.strip(), forbid_dtd=True,
+        forbid_entities=True, forbid_external=True
+    )
+    versions: List[str] = []
+    for element in tree.iter():
+        # The tags may be in the maven metadata namespace
+        if element.tag.split("}")[-1] == "versions":
+            versions.extend(
+                v.text.strip() for v in element
+                if v.tag.split("}")[-1] == "version" and v.text and v.text.strip()
             )
-            un_prefixed_poms = existed_poms
-            if prefix:
-                if not prefix.endswith("/"):
-                    un_prefixed_poms = [remove_prefix(pom, prefix) for pom in existed_poms]
-                else:
-                    un_prefixed_poms = [remove_prefix(pom, prefix + "/") for pom in existed_poms]
-            all_poms.extend(un_prefixed_poms)
-    gav_dict = parse_gavs(all_poms)
-    if len(gav_dict) > 0:
-        meta_files_generation = []
-        for g, avs in gav_dict.items():
-            for a, vers in avs.items():
-                try:
-                    metas = gen_meta_file(g, a, vers, root)
-                except FileNotFoundError:
-                    logger.warning("Failed to create or update metadata file for GA"
-                                   " %s, please check if aligned Maven GA"
-                                   " is correct in your tarball.", f'{g}:{a}')
-                logger.debug("Generated metadata file %s for %s:%s", meta_files, g, a)
-                meta_files_generation.extend(metas)
-        meta_files[META_FILE_GEN_KEY] = meta_files_generation
-    return meta_files
+    return versions
 
 
 def __hash_decorate_metadata(path: str, metadata: str) -> List[str]:
@@ -1356,101 +1893,244 @@ def __wildcard_metadata_paths(paths: List[str]) -> List[str]:
     return new_paths
 
 
+# The number of versions whose parsed keys are cached for sorting
+VERSION_KEY_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=VERSION_KEY_CACHE_SIZE)
+def _version_compare_items(version: str) -> Tuple[Tuple[int, Union[int, str]], ...]:
+    """Split the version into the items compared by VersionCompareKey, the
+    numeric items are greater than the string ones.
+    """
+    items = version.split(".")
+    if "-" in items[-1]:
+        items = items[:-1] + items[-1].split("-")
+    return tuple((1, int(i)) if i.isnumeric() else (0, i) for i in items)
+
+
 class VersionCompareKey:
     'Used as key function for version sorting'
+    __slots__ = ("obj", "key")
+
     def __init__(self, obj: str):
         self.obj = obj
+        self.key = _version_compare_items(obj)
 
     def __lt__(self, other):
-        return self.__compare(other) < 0
+        return self.key < other.key
 
     def __gt__(self, other):
-        return self.__compare(other) > 0
+        return self.key > other.key
 
     def __le__(self, other):
-        return self.__compare(other) <= 0
+        return self.key <= other.key
 
     def __ge__(self, other):
-        return self.__compare(other) >= 0
+        return self.key >= other.key
 
     def __eq__(self, other):
-        return self.__compare(other) == 0
+        return self.key == other.key
 
     def __hash__(self) -> int:
         return self.obj.__hash__()
 
-    def __compare(self, other) -> int:
-        xitems = self.obj.split(".")
-        if "-" in xitems[-1]:
-            xitems = xitems[:-1] + xitems[-1].split("-")
-        yitems = other.obj.split(".")
-        if "-" in yitems[-1]:
-            yitems = yitems[:-1] + yitems[-1].split("-")
-        big = max(len(xitems), len(yitems))
-        for i in range(big):
-            try:
-                xitem: Union[str, int] = xitems[i]
-            except IndexError:
-                return -1
-            try:
-                yitem: Union[str, int] = yitems[i]
-            except IndexError:
-                return 1
-            if (isinstance(xitem, str) and isinstance(yitem, str) and
-                    xitem.isnumeric() and yitem.isnumeric()):
-                xitem = int(xitem)
-                yitem = int(yitem)
-            elif (isinstance(xitem, str) and xitem.isnumeric() and
-                  (not isinstance(yitem, str) or not yitem.isnumeric())):
-                return 1
-            elif (isinstance(yitem, str) and yitem.isnumeric() and
-                  (not isinstance(xitem, str) or not xitem.isnumeric())):
-                return -1
-            # At this point, both are the same type (both int or both str)
-            if isinstance(xitem, int) and isinstance(yitem, int):
-                if xitem > yitem:
-                    return 1
-                elif xitem < yitem:
-                    return -1
-            elif isinstance(xitem, str) and isinstance(yitem, str):
-                if xitem > yitem:
-                    return 1
-                elif xitem < yitem:
-                    return -1
-            else:
-                continue
+
+# The qualifiers of maven ComparableVersion in their order, the empty one
+# is the release version
+MAVEN_QUALIFIERS = ["alpha", "beta", "milestone", "rc", "snapshot", "", "sp"]
+MAVEN_QUALIFIER_ALIASES = {"ga": "", "final": "", "release": "", "cr": "rc"}
+MAVEN_SHORT_QUALIFIERS = {"a": "alpha", "b": "beta", "m": "milestone"}
+_RELEASE_QUALIFIER = str(MAVEN_QUALIFIERS.index(""))
+
+# The parsed maven version items: the numbers are int, the qualifiers are
+# str which are comparable with each other, and the sub lists after "-"
+# or the transitions between digits and letters are tuples
+MavenVersionItems = Tuple[Union[int, str, "MavenVersionItems"], ...]
+
+
+def _maven_qualifier(value: str, followed_by_digit: bool) -> str:
+    if followed_by_digit and len(value) == 1:
+        value = MAVEN_SHORT_QUALIFIERS.get(value, value)
+    value = MAVEN_QUALIFIER_ALIASES.get(value, value)
+    if value in MAVEN_QUALIFIERS:
+        return str(MAVEN_QUALIFIERS.index(value))
+    # The unknown qualifiers are after all the known ones in lexical order
+    return f"{len(MAVEN_QUALIFIERS)}-{value}"
+
+
+def _is_null_maven_item(item: Union[int, str, list]) -> bool:
+    if isinstance(item, int):
+        return item == 0
+    if isinstance(item, str):
+        return item == _RELEASE_QUALIFIER
+    return len(item) == 0
+
+
+def _normalize_maven_items(items: list):
+    """Remove the trailing null items, like the zeros and release qualifiers"""
+    for i in range(len(items) - 1, -1, -1):
+        if _is_null_maven_item(items[i]):
+            del items[i]
+        elif not isinstance(items[i], list):
+            break
+
+
+def _freeze_maven_items(items: list) -> MavenVersionItems:
+    return tuple(_freeze_maven_items(i) if isinstance(i, list) else i for i in items)
+
+
+@lru_cache(maxsize=VERSION_KEY_CACHE_SIZE)
+def parse_maven_version(version: str) -> MavenVersionItems:
+    """Parse the version into the items of maven ComparableVersion, e.g:
+    1.0.0.redhat-00001 -> (1, 0, 0, "7-redhat", (1,))
+    The parsed items are cached, so each version is parsed only once in
+    sorting.
+    """
+    value = version.lower()
+    items: list = []
+    current = items
+    lists = [items]
+    start = 0
+    is_digit = False
+
+    def parse_item(text: str, digit: bool, followed_by_digit=False):
+        return int(text) if digit else _maven_qualifier(text, followed_by_digit)
+
+    def sub_list() -> list:
+        sub: list = []
+        current.append(sub)
+        lists.append(sub)
+        return sub
+
+    for (i, c) in enumerate(value):
+        if c in ".-":
+            current.append(parse_item(value[start:i], is_digit) if i > start else 0)
+            start = i + 1
+            if c == "-":
+                current = sub_list()
+        elif "0" <= c <= "9":
+            if not is_digit and i > start:
+                current.append(parse_item(value[start:i], False, followed_by_digit=True))
+                start = i
+                current = sub_list()
+            is_digit = True
+        else:
+            if is_digit and i > start:
+                current.append(parse_item(value[start:i], True))
+                start = i
+                current = sub_list()
+            is_digit = False
+    if len(value) > start:
+        current.append(parse_item(value[start:], is_digit))
+    # The sub lists are normalized before the lists containing them
+    for sub in reversed(lists):
+        _normalize_maven_items(sub)
+    return _freeze_maven_items(items)
+
+
+def _compare_maven_items(
+    x: Union[int, str, MavenVersionItems],
+    y: Optional[Union[int, str, MavenVersionItems]]
+) -> int:
+    """Compare the items like maven ComparableVersion, y is None when the
+    items of the other version are exhausted.
+    """
+    if isinstance(x, int):
+        if y is None:
+            return 0 if x == 0 else 1
+        if isinstance(y, int):
+            return (x > y) - (x < y)
+        return 1
+    if isinstance(x, str):
+        if y is None:
+            return (x > _RELEASE_QUALIFIER) - (x < _RELEASE_QUALIFIER)
+        if isinstance(y, str):
+            return (x > y) - (x < y)
+        return -1
+    if y is None:
+        # All the items of the list are compared with null, like MNG-6964
+        for item in x:
+            result = _compare_maven_items(item, None)
+            if result != 0:
+                return result
         return 0
+    if isinstance(y, int):
+        return -1
+    if isinstance(y, str):
+        return 1
+    for (left, right) in zip(x, y):
+        # Most versions share their leading items, skip them without comparing
+        if left != right:
+            result = _compare_maven_items(left, right)
+            if result != 0:
+                return result
+    for left in x[len(y):]:
+        result = _compare_maven_items(left, None)
+        if result != 0:
+            return result
+    for right in y[len(x):]:
+        result = _compare_maven_items(right, None)
+        if result != 0:
+            return -result
+    return 0
+
+
+class MavenVersionKey:
+    """Used as key function for version sorting in the order of maven
+    ComparableVersion, like 1.0-alpha1 < 1.0-rc1 < 1.0 = 1.0.Final <
+    1.0.SP1 < 1.0.redhat-00001 < 1.0.1
+    The order can not be encoded into natively comparable tuples, as it is
+    not transitive like in maven: 1.0.M1 < 1 < 1.SP1 but 1.0.M1 > 1.SP1,
+    since the items are compared with null only when the other version is
+    exhausted.
+    """
+    __slots__ = ("obj", "items")
+
+    def __init__(self, obj: str):
+        self.obj = obj
+        self.items = parse_maven_version(obj)
+
+    def __lt__(self, other):
+        return _compare_maven_items(self.items, other.items) < 0
+
+    def __gt__(self, other):
+        return _compare_maven_items(self.items, other.items) > 0
+
+    def __le__(self, other):
+        return _compare_maven_items(self.items, other.items) <= 0
+
+    def __ge__(self, other):
+        return _compare_maven_items(self.items, other.items) >= 0
+
+    def __eq__(self, other):
+        return _compare_maven_items(self.items, other.items) == 0
+
+    def __hash__(self) -> int:
+        # The equal versions have the same normalized items
+        return self.items.__hash__()
 
 
 class ArchetypeCompareKey:
+    __slots__ = ("gav", "key")
+
     def __init__(self, gav: ArchetypeRef):
         self.gav = gav
+        self.key = gav.group_id + ":" + gav.artifact_id
 
     def __lt__(self, other):
-        return self.__compare(other) < 0
+        return self.key < other.key
 
     def __gt__(self, other):
-        return self.__compare(other) > 0
+        return self.key > other.key
 
     def __le__(self, other):
-        return self.__compare(other) <= 0
+        return self.key <= other.key
 
     def __ge__(self, other):
-        return self.__compare(other) >= 0
+        return self.key >= other.key
 
     def __eq__(self, other):
-        return self.__compare(other) == 0
+        return self.key == other.key
 
     def __hash__(self):
         return self.gav.__hash__()
-
-    def __compare(self, other) -> int:
-        x = self.gav.group_id + ":" + self.gav.artifact_id
-        y = other.gav.group_id + ":" + other.gav.artifact_id
-
-        if x == y:
-            return 0
-        elif x < y:
-            return -1
-        else:
-            return 1
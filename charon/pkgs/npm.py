@@ -18,10 +18,12 @@ import os
 import sys
 from json import load, loads, dump, JSONDecodeError, JSONEncoder
 import tarfile
+from itertools import islice
 from tempfile import mkdtemp
 from typing import List, Set, Tuple, Dict, Optional
 
 from semantic_version import compare
+from botocore.exceptions import ClientError, HTTPClientError
 
 import charon.pkgs.indexing as indexing
 import charon.pkgs.signature as signature
@@ -34,11 +36,15 @@ from charon.utils.archive import extract_npm_tarball
 from charon.pkgs.pkg_utils import (
     upload_post_process,
     rollback_post_process,
-    invalidate_cf_paths
+    invalidate_cf_paths,
+    init_upload_journal,
+    close_upload_journal
 )
 from charon.utils.strings import remove_prefix
 from charon.utils.files import write_manifest
 from charon.utils.map import del_none, replace_field
+from charon.utils.metrics import set_phase
+from charon.utils.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +95,10 @@ def handle_npm_uploading(
         key=None,
         dry_run=False,
         manifest_bucket_name=None,
-        config=None
+        config=None,
+        transfer_config=None,
+        ownership_store=None,
+        resume=False
 ) -> Tuple[str, bool]:
     """ Handle the npm product release tarball uploading process.
         For NPM uploading, tgz file and version metadata will be relocated based
@@ -102,158 +111,180 @@ def handle_npm_uploading(
           prefix. See target definition in Charon configuration for details
         * dir_ is base dir for extracting the tarball, will use system
           tmp dir if None.
+        * transfer_config is the transfer section of Charon configuration,
+          which controls the multipart uploading of large files.
+        * ownership_store is the store type of product ownership, which
+          can be "sidecar" or "directory". See Charon configuration for details.
+        * resume is used to skip the work which is recorded as done in the upload
+          journal of an interrupted uploading of the same product.
 
         Returns the directory used for archive processing and if uploading is successful
     """
 
-    client = S3Client(aws_profile=aws_profile, dry_run=dry_run)
+    journal = init_upload_journal(product, resume=resume, dry_run=dry_run)
+    client = S3Client(
+        aws_profile=aws_profile, dry_run=dry_run, transfer_config=transfer_config,
+        ownership_store=ownership_store, journal=journal
+    )
     generated_signs = []
     succeeded = True
     root_dir = mkdtemp(prefix=f"npm-charon-{product}-", dir=dir_)
     for target in targets:
-        # prepare cf invalidate files
-        cf_invalidate_paths = []
-
-        bucket_name = target[1]
-        prefix = remove_prefix(target[2], "/")
-        registry = target[3]
-        target_dir, valid_paths, package_metadata = _scan_metadata_paths_from_archive(
-            tarball_path, registry, prod=product, dir__=dir_, pkg_root=root_path
-        )
-        if not os.path.isdir(target_dir):
-            logger.error("Error: the extracted target_dir path %s does not exist.", target_dir)
-            sys.exit(1)
-        valid_dirs = __get_path_tree(valid_paths, target_dir)
-
-        logger.info("Start uploading files to s3 buckets: %s", bucket_name)
-        failed_files = client.upload_files(
-            file_paths=[valid_paths[0]],
-            targets=[(bucket_name, prefix)],
-            product=product,
-            root=target_dir
-        )
-        logger.info("Files uploading done\n")
-
-        if not manifest_bucket_name:
-            logger.warning(
-                'Warning: No manifest bucket is provided, will ignore the process of manifest '
-                'uploading\n')
-        else:
-            logger.info("Start uploading manifest to s3 bucket %s", manifest_bucket_name)
-            manifest_folder = bucket_name
-            manifest_name, manifest_full_path = write_manifest(valid_paths, target_dir, product)
-
-            client.upload_manifest(
-                manifest_name, manifest_full_path,
-                manifest_folder, manifest_bucket_name
-            )
-            logger.info("Manifest uploading is done\n")
-
-        if package_metadata:
-            logger.info(
-                "Start generating version-level package.json for package: %s in s3 bucket %s",
-                package_metadata.name, bucket_name
-            )
-        failed_metas = []
-        _version_metadata_path = valid_paths[1]
-        _failed_metas = client.upload_metadatas(
-            meta_file_paths=[_version_metadata_path],
-            target=(bucket_name, prefix),
-            product=product,
-            root=target_dir
-        )
-        failed_metas.extend(_failed_metas)
-        logger.info("version-level package.json uploading done")
-
-        if package_metadata:
-            logger.info(
-                "Start generating package.json for package: %s in s3 bucket %s",
-                package_metadata.name, bucket_name
-            )
-        meta_files = _gen_npm_package_metadata_for_upload(
-            client, bucket_name, target_dir, package_metadata, prefix
-        )
-        logger.info("package.json generation done\n")
-        if cf_enable:
-            meta_f = meta_files.get(META_FILE_GEN_KEY, [])
-            logger.debug("Add invalidating metafiles: %s", meta_f)
-            if isinstance(meta_f, str):
-                cf_invalidate_paths.append(meta_f)
-            elif isinstance(meta_f, list):
-                cf_invalidate_paths.extend(meta_f)
-
-        if META_FILE_GEN_KEY in meta_files:
-            _failed_metas = client.upload_metadatas(
-                meta_file_paths=[meta_files[META_FILE_GEN_KEY]],
-                target=(bucket_name, prefix),
-                product=None,
-                root=target_dir
+        with span("target", target=target[0], bucket=target[1]):
+            # prepare cf invalidate files
+            cf_invalidate_paths = []
+
+            bucket_name = target[1]
+            prefix = remove_prefix(target[2], "/")
+            registry = target[3]
+            target_dir, valid_paths, package_metadata = _scan_metadata_paths_from_archive(
+                tarball_path, registry, prod=product, dir__=dir_, pkg_root=root_path
             )
-            failed_metas.extend(_failed_metas)
-            logger.info("package.json uploading done")
-
-        if gen_sign:
-            conf = get_config(config)
-            if not conf:
+            if not os.path.isdir(target_dir):
+                logger.error("Error: the extracted target_dir path %s does not exist.", target_dir)
                 sys.exit(1)
-            suffix_list = __get_suffix(PACKAGE_TYPE_NPM, conf)
-            command = conf.get_detach_signature_command()
-            artifacts = [s for s in valid_paths if not s.endswith(tuple(suffix_list))]
-            if META_FILE_GEN_KEY in meta_files:
-                artifacts.extend(meta_files[META_FILE_GEN_KEY])
-            logger.info("Start generating signature for s3 bucket %s\n", bucket_name)
-            (_failed_metas, _generated_signs) = signature.generate_sign(
-                PACKAGE_TYPE_NPM, artifacts,
-                target_dir, prefix,
-                client, bucket_name,
-                key, command
-            )
-            failed_metas.extend(_failed_metas)
-            generated_signs.extend(_generated_signs)
-            logger.info("Singature generation done.\n")
-
-            logger.info("Start upload singature files to s3 bucket %s\n", bucket_name)
-            _failed_metas = client.upload_signatures(
-                meta_file_paths=generated_signs,
-                target=(bucket_name, prefix),
-                product=None,
+            valid_dirs = __get_path_tree(valid_paths, target_dir)
+
+            set_phase("files")
+            logger.info("Start uploading files to s3 buckets: %s", bucket_name)
+            failed_files = client.upload_files(
+                file_paths=[valid_paths[0]],
+                targets=[(bucket_name, prefix)],
+                product=product,
                 root=target_dir
             )
-            failed_metas.extend(_failed_metas)
-            logger.info("Signature uploading done.\n")
-
-        # this step generates index.html for each dir and add them to file list
-        # index is similar to metadata, it will be overwritten everytime
-        if do_index:
-            logger.info("Start generating index files to s3 bucket %s", bucket_name)
-            created_indexes = indexing.generate_indexes(
-                PACKAGE_TYPE_NPM, target_dir, list(valid_dirs), client, bucket_name, prefix
-            )
-            logger.info("Index files generation done.\n")
-
-            logger.info("Start updating index files to s3 bucket %s", bucket_name)
+            logger.info("Files uploading done\n")
+
+            set_phase("manifest")
+            if not manifest_bucket_name:
+                logger.warning(
+                    'Warning: No manifest bucket is provided, will ignore the process of manifest '
+                    'uploading\n')
+            else:
+                logger.info("Start uploading manifest to s3 bucket %s", manifest_bucket_name)
+                manifest_folder = bucket_name
+                manifest_name, manifest_full_path = write_manifest(valid_paths, target_dir, product)
+
+                client.upload_manifest(
+                    manifest_name, manifest_full_path,
+                    manifest_folder, manifest_bucket_name
+                )
+                logger.info("Manifest uploading is done\n")
+
+            set_phase("metadata")
+            if package_metadata:
+                logger.info(
+                    "Start generating version-level package.json for package: %s in s3 bucket %s",
+                    package_metadata.name, bucket_name
+                )
+            failed_metas = []
+            _version_metadata_path = valid_paths[1]
             _failed_metas = client.upload_metadatas(
-                meta_file_paths=created_indexes,
+                meta_file_paths=[_version_metadata_path],
                 target=(bucket_name, prefix),
-                product=None,
+                product=product,
                 root=target_dir
             )
             failed_metas.extend(_failed_metas)
-            logger.info("Index files updating done\n")
-            # We will not invalidate the index files per cost consideration
-            # if cf_enable:
-            #     cf_invalidate_paths.extend(created_indexes)
-        else:
-            logger.info("Bypass indexing\n")
-
-        # Do CloudFront invalidating for generated metadata
-        if cf_enable and len(cf_invalidate_paths):
-            cf_client = CFClient(aws_profile=aws_profile)
-            invalidate_cf_paths(cf_client, target, cf_invalidate_paths, target_dir)
+            logger.info("version-level package.json uploading done")
+
+            if package_metadata:
+                logger.info(
+                    "Start generating package.json for package: %s in s3 bucket %s",
+                    package_metadata.name, bucket_name
+                )
+            meta_files = _gen_npm_package_metadata_for_upload(
+                client, bucket_name, target_dir, package_metadata, prefix
+            )
+            logger.info("package.json generation done\n")
+            if cf_enable:
+                meta_f = meta_files.get(META_FILE_GEN_KEY, [])
+                logger.debug("Add invalidating metafiles: %s", meta_f)
+                if isinstance(meta_f, str):
+                    cf_invalidate_paths.append(meta_f)
+                elif isinstance(meta_f, list):
+                    cf_invalidate_paths.extend(meta_f)
 
-        upload_post_process(failed_files, failed_metas, product, bucket_name)
-        succeeded = succeeded and len(failed_files) == 0 and len(failed_metas) == 0
+            if META_FILE_GEN_KEY in meta_files:
+                _failed_metas = client.upload_metadatas(
+                    meta_file_paths=[meta_files[META_FILE_GEN_KEY]],
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=target_dir
+                )
+                failed_metas.extend(_failed_metas)
+                logger.info("package.json uploading done")
+
+            if gen_sign:
+                set_phase("signature")
+                conf = get_config(config)
+                if not conf:
+                    sys.exit(1)
+                suffix_list = __get_suffix(PACKAGE_TYPE_NPM, conf)
+                command = conf.get_detach_signature_command()
+                artifacts = [s for s in valid_paths if not s.endswith(tuple(suffix_list))]
+                if META_FILE_GEN_KEY in meta_files:
+                    artifacts.extend(meta_files[META_FILE_GEN_KEY])
+                logger.info("Start generating signature for s3 bucket %s\n", bucket_name)
+                (_failed_metas, _generated_signs) = signature.generate_sign(
+                    PACKAGE_TYPE_NPM, artifacts,
+                    target_dir, prefix,
+                    client, bucket_name,
+                    key, command
+                )
+                failed_metas.extend(_failed_metas)
+                generated_signs.extend(_generated_signs)
+                logger.info("Singature generation done.\n")
+
+                logger.info("Start upload singature files to s3 bucket %s\n", bucket_name)
+                _failed_metas = client.upload_signatures(
+                    meta_file_paths=generated_signs,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=target_dir
+                )
+                failed_metas.extend(_failed_metas)
+                logger.info("Signature uploading done.\n")
+
+            # this step generates index.html for each dir and add them to file list
+            # index is similar to metadata, it will be overwritten everytime
+            if do_index:
+                set_phase("index")
+                logger.info("Start generating index files to s3 bucket %s", bucket_name)
+                created_indexes = indexing.generate_indexes(
+                    PACKAGE_TYPE_NPM, target_dir, list(valid_dirs), client, bucket_name, prefix
+                )
+                logger.info("Index files generation done.\n")
+
+                logger.info("Start updating index files to s3 bucket %s", bucket_name)
+                _failed_metas = client.upload_metadatas(
+                    meta_file_paths=created_indexes,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=target_dir
+                )
+                failed_metas.extend(_failed_metas)
+                logger.info("Index files updating done\n")
+                # We will not invalidate the index files per cost consideration
+                # if cf_enable:
+                #     cf_invalidate_paths.extend(created_indexes)
+            else:
+                logger.info("Bypass indexing\n")
+
+            # Do CloudFront invalidating for generated metadata
+            if cf_enable and len(cf_invalidate_paths):
+                set_phase("cf")
+                cf_client = CFClient(aws_profile=aws_profile)
+                invalidate_cf_paths(cf_client, target, cf_invalidate_paths, target_dir)
+
+            upload_post_process(
+                failed_files, failed_metas, product, bucket_name,
+                retry_stats=client.get_retry_stats()
+            )
+            succeeded = succeeded and len(failed_files) == 0 and len(failed_metas) == 0
 
+    close_upload_journal(journal, succeeded)
+    client.close()
     return (root_dir, succeeded)
 
 
@@ -267,7 +298,9 @@ def handle_npm_del(
         do_index=True,
         cf_enable=False,
         dry_run=False,
-        manifest_bucket_name=None
+        manifest_bucket_name=None,
+        ownership_store=None,
+        transfer_config=None
 ) -> Tuple[str, bool]:
     """ Handle the npm product release tarball deletion process.
         * tarball_path is the location of the tarball in filesystem
@@ -278,6 +311,10 @@ def handle_npm_del(
           prefix. See target definition in Charon configuration for details
         * dir is base dir for extracting the tarball, will use system
           tmp dir if None.
+        * ownership_store is the store type of product ownership, which
+          can be "sidecar" or "directory". See Charon configuration for details.
+        * transfer_config is the transfer section of Charon configuration,
+          which controls the retrying of the failed requests.
 
         Returns the directory used for archive processing and if the rollback is successful
     """
@@ -287,101 +324,114 @@ def handle_npm_del(
 
     valid_dirs = __get_path_tree(valid_paths, target_dir)
 
-    client = S3Client(aws_profile=aws_profile, dry_run=dry_run)
+    client = S3Client(
+        aws_profile=aws_profile, dry_run=dry_run, transfer_config=transfer_config,
+        ownership_store=ownership_store
+    )
     succeeded = True
     for target in targets:
-        # prepare cf invalidate files
-        cf_invalidate_paths = []
-
-        bucket_name = target[1]
-        prefix = remove_prefix(target[2], "/")
-        logger.info("Start deleting files from s3 bucket %s", bucket_name)
-        failed_files = client.delete_files(
-            file_paths=valid_paths,
-            target=(bucket_name, prefix),
-            product=product, root=target_dir
-        )
-        logger.info("Files deletion done\n")
-
-        if manifest_bucket_name:
-            manifest_folder = target[1]
-            logger.info(
-                "Start deleting manifest from s3 bucket %s in folder %s",
-                manifest_bucket_name, manifest_folder
-            )
-            client.delete_manifest(product, manifest_folder, manifest_bucket_name)
-            logger.info("Manifest deletion is done\n")
-        else:
-            logger.warning(
-                'Warning: No manifest bucket is provided, will ignore the process of manifest '
-                'deletion\n')
-
-        logger.info(
-            "Start generating package.json for package: %s in bucket %s",
-            package_name_path, bucket_name
-        )
-        meta_files = _gen_npm_package_metadata_for_del(
-            client, bucket_name, target_dir, package_name_path, prefix
-        )
-        logger.info("package.json generation done\n")
-
-        logger.info("Start uploading package.json to s3 bucket %s", bucket_name)
-        all_meta_files = []
-        for _, file in meta_files.items():
-            all_meta_files.append(file)
-        client.delete_files(
-            file_paths=all_meta_files,
-            target=(bucket_name, prefix),
-            product=None, root=target_dir
-        )
-        failed_metas = []
-        if META_FILE_GEN_KEY in meta_files:
-            _failed_metas = client.upload_metadatas(
-                meta_file_paths=[meta_files[META_FILE_GEN_KEY]],
+        with span("target", target=target[0], bucket=target[1]):
+            # prepare cf invalidate files
+            cf_invalidate_paths = []
+
+            bucket_name = target[1]
+            prefix = remove_prefix(target[2], "/")
+            set_phase("files")
+            logger.info("Start deleting files from s3 bucket %s", bucket_name)
+            failed_files = client.delete_files(
+                file_paths=valid_paths,
                 target=(bucket_name, prefix),
-                product=None,
-                root=target_dir
+                product=product, root=target_dir
             )
-            failed_metas.extend(_failed_metas)
-        logger.info("package.json uploading done")
-        if cf_enable and len(all_meta_files):
-            logger.debug("Add meta files to cf invalidate list: %s", all_meta_files)
-            cf_invalidate_paths.extend(all_meta_files)
-
-        if do_index:
+            logger.info("Files deletion done\n")
+
+            set_phase("manifest")
+            if manifest_bucket_name:
+                manifest_folder = target[1]
+                logger.info(
+                    "Start deleting manifest from s3 bucket %s in folder %s",
+                    manifest_bucket_name, manifest_folder
+                )
+                client.delete_manifest(product, manifest_folder, manifest_bucket_name)
+                logger.info("Manifest deletion is done\n")
+            else:
+                logger.warning(
+                    'Warning: No manifest bucket is provided, will ignore the process of manifest '
+                    'deletion\n')
+
+            set_phase("metadata")
             logger.info(
-                "Start generating index files for all changed entries for bucket %s",
-                bucket_name
+                "Start generating package.json for package: %s in bucket %s",
+                package_name_path, bucket_name
             )
-            created_indexes = indexing.generate_indexes(
-                PACKAGE_TYPE_NPM, target_dir, list(valid_dirs), client, bucket_name, prefix
+            meta_files = _gen_npm_package_metadata_for_del(
+                client, bucket_name, target_dir, package_name_path, prefix
             )
-            logger.info("Index files generation done.\n")
-
-            logger.info("Start updating index to s3 bucket %s", bucket_name)
-            _failed_index_files = client.upload_metadatas(
-                meta_file_paths=created_indexes,
+            logger.info("package.json generation done\n")
+
+            logger.info("Start uploading package.json to s3 bucket %s", bucket_name)
+            all_meta_files = []
+            for _, file in meta_files.items():
+                all_meta_files.append(file)
+            client.delete_files(
+                file_paths=all_meta_files,
                 target=(bucket_name, prefix),
-                product=None,
-                root=target_dir
+                product=None, root=target_dir
             )
-            failed_metas.extend(_failed_index_files)
-            logger.info("Index files updating done.\n")
-            # We will not invalidate the index files per cost consideration
-            # if cf_enable and len(created_indexes):
-            #     logger.debug("Add index files to cf invalidate list: %s", created_indexes)
-            #     cf_invalidate_paths.extend(created_indexes)
-        else:
-            logger.info("Bypassing indexing\n")
-
-        # Do CloudFront invalidating for generated metadata
-        if cf_enable and len(cf_invalidate_paths):
-            cf_client = CFClient(aws_profile=aws_profile)
-            invalidate_cf_paths(cf_client, target, cf_invalidate_paths, target_dir)
-
-        rollback_post_process(failed_files, failed_metas, product, bucket_name)
-        succeeded = succeeded and len(failed_files) <= 0 and len(failed_metas) <= 0
+            failed_metas = []
+            if META_FILE_GEN_KEY in meta_files:
+                _failed_metas = client.upload_metadatas(
+                    meta_file_paths=[meta_files[META_FILE_GEN_KEY]],
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=target_dir
+                )
+                failed_metas.extend(_failed_metas)
+            logger.info("package.json uploading done")
+            if cf_enable and len(all_meta_files):
+                logger.debug("Add meta files to cf invalidate list: %s", all_meta_files)
+                cf_invalidate_paths.extend(all_meta_files)
+
+            if do_index:
+                set_phase("index")
+                logger.info(
+                    "Start generating index files for all changed entries for bucket %s",
+                    bucket_name
+                )
+                created_indexes = indexing.generate_indexes(
+                    PACKAGE_TYPE_NPM, target_dir, list(valid_dirs), client, bucket_name, prefix
+                )
+                logger.info("Index files generation done.\n")
+
+                logger.info("Start updating index to s3 bucket %s", bucket_name)
+                _failed_index_files = client.upload_metadatas(
+                    meta_file_paths=created_indexes,
+                    target=(bucket_name, prefix),
+                    product=None,
+                    root=target_dir
+                )
+                failed_metas.extend(_failed_index_files)
+                logger.info("Index files updating done.\n")
+                # We will not invalidate the index files per cost consideration
+                # if cf_enable and len(created_indexes):
+                #     logger.debug("Add index files to cf invalidate list: %s", created_indexes)
+                #     cf_invalidate_paths.extend(created_indexes)
+            else:
+                logger.info("Bypassing indexing\n")
+
+            # Do CloudFront invalidating for generated metadata
+            if cf_enable and len(cf_invalidate_paths):
+                set_phase("cf")
+                cf_client = CFClient(aws_profile=aws_profile)
+                invalidate_cf_paths(cf_client, target, cf_invalidate_paths, target_dir)
+
+            rollback_post_process(
+                failed_files, failed_metas, product, bucket_name,
+                retry_stats=client.get_retry_stats()
+            )
+            succeeded = succeeded and len(failed_files) <= 0 and len(failed_metas) <= 0
 
+    client.close()
     return (target_dir, succeeded)
 
 
@@ -394,6 +444,7 @@ def read_package_metadata_from_content(content: str, is_version) -> Optional[NPM
     return None
 
 
+@traced("metadata")
 def _gen_npm_package_metadata_for_upload(
         client: S3Client, bucket: str,
         target_dir: str, source_package: Optional[NPMPackageMetadata],
@@ -411,12 +462,17 @@ def _gen_npm_package_metadata_for_upload(
         package_metadata_key = os.path.join(source_package.name, PACKAGE_JSON)
         if prefix and prefix != "/":
             package_metadata_key = os.path.join(prefix, package_metadata_key)
-        (package_json_files, success) = client.get_files(
-            bucket_name=bucket,
-            prefix=package_metadata_key
-        )
-        if not success:
-            logger.warning("Error to get remote metadata files for %s", package_metadata_key)
+        # Only the first matched key is needed, so stop the listing there
+        package_json_files = []
+        try:
+            package_json_files = list(islice(client.iter_files(
+                bucket_name=bucket,
+                prefix=package_metadata_key
+            ), 1))
+        except (ClientError, HTTPClientError) as e:
+            logger.warning(
+                "Error to get remote metadata files for %s: %s", package_metadata_key, e
+            )
         result = source_package
         if len(package_json_files) > 0:
             result = _merge_package_metadata(
@@ -428,6 +484,7 @@ def _gen_npm_package_metadata_for_upload(
     return meta_files
 
 
+@traced("metadata")
 def _gen_npm_package_metadata_for_del(
         client: S3Client, bucket: str,
         target_dir: str, package_path_prefix: str,
@@ -452,12 +509,16 @@ def _gen_npm_package_metadata_for_del(
     # "backstage-plugin-orchestrator-backend-dynamic"
     if not path_prefix.endswith("/"):
         path_prefix = path_prefix + "/"
-    (existed_version_metas, success) = client.get_files(
-        bucket_name=bucket, prefix=path_prefix, suffix=PACKAGE_JSON
-    )
-    if not success:
+    # The tarballs folder "-/" of the package is pruned from the listing
+    existed_version_metas = []
+    try:
+        existed_version_metas = list(client.iter_files(
+            bucket_name=bucket, prefix=path_prefix, suffix=PACKAGE_JSON,
+            prune=lambda folder: folder.endswith("/-/")
+        ))
+    except (ClientError, HTTPClientError) as e:
         logger.warning("Error to get remote metadata files "
-                       "for %s when deletion", path_prefix)
+                       "for %s when deletion: %s", path_prefix, e)
     # ensure the metas only contain version package.json
     if prefix_meta_key in existed_version_metas:
         existed_version_metas.remove(prefix_meta_key)
@@ -487,6 +548,7 @@ def _gen_npm_package_metadata_for_del(
     return meta_files
 
 
+@traced("extract")
 def _scan_metadata_paths_from_archive(
     path: str, registry: str, prod="", dir__=None, pkg_root="package"
 ) -> Tuple[str, list, Optional[NPMPackageMetadata]]:
@@ -506,6 +568,7 @@ def _scan_metadata_paths_from_archive(
         sys.exit(1)
 
 
+@traced("extract")
 def _scan_paths_from_archive(
     path: str, prod="", dir__=None, pkg_root="package"
 ) -> Tuple[str, str, list]:
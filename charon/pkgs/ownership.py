@@ -0,0 +1,56 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.storage import S3Client
+from charon.utils.strings import remove_prefix
+import os
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_ownership(
+    target: Dict[str, str],
+    path: str = None,
+    aws_profile: str = None,
+    delete_sidecars: bool = False,
+    dry_run: bool = False
+) -> List[str]:
+    """Migrate the product ownership of the files under the path in the
+    target bucket from .prodinfo sidecar files to directory ownership indexes.
+        * If delete_sidecars is True, the .prodinfo sidecar files will be
+          deleted after migrated.
+        Returns the sidecar files failed to migrate
+    """
+    bucket_name = target.get("bucket", "")
+    prefix = target.get("prefix", "")
+    real_prefix = remove_prefix(prefix, "/") if prefix.strip() != "/" else ""
+    s3_folder = real_prefix
+    if path and path.strip() != "" and path.strip() != "/":
+        s3_folder = os.path.join(real_prefix, remove_prefix(path, "/"))
+    s3_client = S3Client(aws_profile=aws_profile, dry_run=dry_run)
+    try:
+        failed = s3_client.migrate_ownership(
+            bucket_name, prefix=s3_folder, delete_sidecars=delete_sidecars
+        )
+    finally:
+        s3_client.close()
+    if failed:
+        logger.error(
+            "Failed to migrate product ownership of %d files in bucket %s: %s",
+            len(failed), bucket_name, failed
+        )
+    return failed
@@ -6,6 +6,8 @@ from charon.cache import (
     INVALIDATION_STATUS_COMPLETED
 )
 from charon.types import TARGET_TYPE
+from charon.storage_journal import UploadJournal, get_journal_path
+from charon.utils.tracing import traced
 import logging
 import os
 
@@ -28,15 +30,21 @@ def is_npm_metadata(file: str) -> bool:
 
 
 def upload_post_process(
-    failed_files: List[str], failed_metas: List[str], product_key, bucket=None
+    failed_files: List[str], failed_metas: List[str], product_key, bucket=None,
+    retry_stats: Optional[Dict[str, int]] = None
 ):
-    __post_process(failed_files, failed_metas, product_key, "uploaded to", bucket)
+    __post_process(
+        failed_files, failed_metas, product_key, "uploaded to", bucket, retry_stats
+    )
 
 
 def rollback_post_process(
-    failed_files: List[str], failed_metas: List[str], product_key, bucket=None
+    failed_files: List[str], failed_metas: List[str], product_key, bucket=None,
+    retry_stats: Optional[Dict[str, int]] = None
 ):
-    __post_process(failed_files, failed_metas, product_key, "rolled back from", bucket)
+    __post_process(
+        failed_files, failed_metas, product_key, "rolled back from", bucket, retry_stats
+    )
 
 
 def __post_process(
@@ -44,8 +52,16 @@ def __post_process(
     failed_metas: List[str],
     product_key: str,
     operation: str,
-    bucket: str = None
+    bucket: str = None,
+    retry_stats: Optional[Dict[str, int]] = None
 ):
+    if retry_stats and (retry_stats.get("retries") or retry_stats.get("redriven")):
+        logger.info(
+            "Retried %d failed requests, and re-drove %d failed files "
+            "with %d of them recovered",
+            retry_stats.get("retries", 0), retry_stats.get("redriven", 0),
+            retry_stats.get("recovered", 0)
+        )
     if len(failed_files) == 0 and len(failed_metas) == 0:
         logger.info("Product release %s is successfully %s "
                     "Ronda service in bucket %s\n",
@@ -68,6 +84,30 @@ def __post_process(
             logger.error("Failed metadata files: \n%s\n", failed_metas)
 
 
+def init_upload_journal(
+    product_key: str, resume=False, dry_run=False
+) -> Optional[UploadJournal]:
+    if dry_run:
+        return None
+    journal_path = get_journal_path(product_key)
+    logger.info("Recording uploading progress in journal %s", journal_path)
+    return UploadJournal(journal_path, resume=resume)
+
+
+def close_upload_journal(journal: Optional[UploadJournal], succeeded: bool):
+    if not journal:
+        return
+    if succeeded:
+        journal.clear()
+    else:
+        journal.close()
+        logger.info(
+            "Uploading is not fully succeeded, the progress is kept in journal %s. "
+            "Use --resume to continue the uploading from it.", journal.path()
+        )
+
+
+@traced("cf_invalidate")
 def invalidate_cf_paths(
     cf_client: CFClient,
     target: TARGET_TYPE,
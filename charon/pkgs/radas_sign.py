@@ -18,19 +18,22 @@ import logging
 import json
 import os
 import sys
-import asyncio
 import uuid
 import time
 from typing import List, Any, Tuple, Callable, Dict, Optional
 from charon.config import RadasConfig
 from charon.pkgs.oras_client import OrasClient
 from charon.utils import files
+from charon.utils.dispatcher import run_dispatch
+from charon.utils.tracing import traced
 from proton import SSLDomain, Message, Event, Sender, Connection
 from proton.handlers import MessagingHandler
 from proton.reactor import Container
 
 logger = logging.getLogger(__name__)
 
+SIGN_WORKERS = 10
+
 
 class RadasReceiver(MessagingHandler):
     """
@@ -294,6 +297,7 @@ class RadasSender(MessagingHandler):
             self.close()
 
 
+@traced("sign")
 def generate_radas_sign(
         top_level: str, root: str, sign_result_file: str
 ) -> Tuple[List[str], List[str]]:
@@ -317,49 +321,47 @@ def generate_radas_sign(
         signature: str,
         failed_paths: List[str],
         generated_signs: List[str],
-        sem: asyncio.BoundedSemaphore,
     ):
-        async with sem:
-            if not file_path or not signature:
-                logger.error("Invalid JSON entry")
-                return
+        if not file_path or not signature:
+            logger.error("Invalid JSON entry")
+            return
 
-            if "/" not in file_path:
-                logger.warning("Invalid entry: %s, skip signature file generation.", file_path)
-                return
+        if "/" not in file_path:
+            logger.warning("Invalid entry: %s, skip signature file generation.", file_path)
+            return
 
-            if root not in file_path:
-                logger.debug(
-                    "Root '%s' not found in file_path '%s', handling directly.", root, file_path
-                )
-                artifact_path = os.path.join(top_level, file_path)
-                asc_filename = f"{file_path}.asc"
-            else:
-                logger.debug(
-                    "Root '%s' found in file_path '%s', removing it as prefix.", root, file_path
-                )
-                stripped_file_path = file_path
-                parts = file_path.split(root, 1)
-                if len(parts) > 1:
-                    stripped_file_path = parts[1].lstrip("/")
-                artifact_path = os.path.join(top_level, stripped_file_path)
-                asc_filename = f"{stripped_file_path}.asc"
-
-            signature_path = os.path.join(top_level, asc_filename)
-
-            if not os.path.isfile(artifact_path):
-                logger.warning(
-                    "Artifact %s missing, skip signature file generation.",
-                    artifact_path)
-                return
+        if root not in file_path:
+            logger.debug(
+                "Root '%s' not found in file_path '%s', handling directly.", root, file_path
+            )
+            artifact_path = os.path.join(top_level, file_path)
+            asc_filename = f"{file_path}.asc"
+        else:
+            logger.debug(
+                "Root '%s' found in file_path '%s', removing it as prefix.", root, file_path
+            )
+            stripped_file_path = file_path
+            parts = file_path.split(root, 1)
+            if len(parts) > 1:
+                stripped_file_path = parts[1].lstrip("/")
+            artifact_path = os.path.join(top_level, stripped_file_path)
+            asc_filename = f"{stripped_file_path}.asc"
+
+        signature_path = os.path.join(top_level, asc_filename)
+
+        if not os.path.isfile(artifact_path):
+            logger.warning(
+                "Artifact %s missing, skip signature file generation.",
+                artifact_path)
+            return
 
-            try:
-                files.overwrite_file(signature_path, signature)
-                generated_signs.append(signature_path)
-                logger.debug("Generated .asc file: %s", signature_path)
-            except Exception as e:
-                failed_paths.append(signature_path)
-                logger.error("Failed to write .asc file for %s: %s", artifact_path, e)
+        try:
+            files.overwrite_file(signature_path, signature)
+            generated_signs.append(signature_path)
+            logger.debug("Generated .asc file: %s", signature_path)
+        except Exception as e:
+            failed_paths.append(signature_path)
+            logger.error("Failed to write .asc file for %s: %s", artifact_path, e)
 
     result = data.get("results", [])
     (_failed_metas, _generated_signs) = __do_path_cut_and(generate_single_sign_file, result)
@@ -375,19 +377,13 @@ def __do_path_cut_and(
 
     failed_paths: List[str] = []
     generated_signs: List[str] = []
-    tasks = []
-    sem = asyncio.BoundedSemaphore(10)
-    for item in data:
-        file_path = item.get("file")
-        signature = item.get("signature")
-        tasks.append(
-            asyncio.ensure_future(
-                path_handler(file_path, signature, failed_paths, generated_signs, sem)
-            )
+
+    async def handle(item: Dict[str, str]):
+        await path_handler(
+            item.get("file"), item.get("signature"), failed_paths, generated_signs
         )
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(asyncio.gather(*tasks))
+    run_dispatch(data, handle, workers=SIGN_WORKERS, name="signature files")
     return (failed_paths, generated_signs)
 
 
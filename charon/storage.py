@@ -15,22 +15,38 @@ limitations under the License.
 """
 import asyncio
 import threading
-from charon.utils.files import read_sha1
-from charon.constants import PROD_INFO_SUFFIX, MANIFEST_SUFFIX
+from charon.utils.files import read_sha1, HashType, LocalFileReader
+from charon.utils.limiter import AdaptiveLimiter, current_limiter
+from charon.utils.dispatcher import dispatch
+from charon.utils.metrics import get_metrics, SERVICE_S3
+from charon.utils.tracing import traced
+from charon.storage_backend import init_backend, BACKEND_THREADED
+from charon.storage_ownership import init_ownership_store, DirectoryOwnershipStore
+from charon.storage_snapshot import RemoteTreeSnapshot, folder_prefix
+from charon.storage_journal import (
+    UploadJournal, PHASE_FILES, PHASE_METADATA, PHASE_SIGNATURES
+)
+from charon.constants import PROD_INFO_SUFFIX, MANIFEST_SUFFIX, OWNERSHIP_INDEX_FILE
 
 from boto3 import session
 from botocore.errorfactory import ClientError
-from botocore.exceptions import HTTPClientError
+from botocore.exceptions import (
+    HTTPClientError, ReadTimeoutError, ConnectionError as BotoConnectionError
+)
 from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from contextvars import ContextVar
+from typing import (
+    Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, Iterator,
+    List, Optional, Set, Tuple, Union
+)
 import os
+import posixpath
 import logging
 import mimetypes
-import functools
-from concurrent.futures import ThreadPoolExecutor
-
-_executor = ThreadPoolExecutor(10)
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -39,50 +55,205 @@ CHECKSUM_META_KEY = "checksum"
 
 ENDPOINT_ENV = "aws_endpoint_url"
 ACCELERATION_ENABLE_ENV = "aws_enable_acceleration"
+LISTING_INDEX_ENABLE_ENV = "aws_enable_listing_index"
+BACKEND_ENV = "aws_storage_backend"
+PREFLIGHT_ENABLE_ENV = "aws_enable_preflight"
+TREE_SNAPSHOT_ENABLE_ENV = "aws_enable_tree_snapshot"
 
 DEFAULT_MIME_TYPE = "application/octet-stream"
 
 FILE_REPORT_LIMIT = 1000
 
+# The maximum number of keys S3 accepts in a single DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+# The concurrency of requests for each bucket will start from
+# DEFAULT_CONCURRENCY and adapt between 1 and con_limit
+DEFAULT_CONCURRENCY = 10
+DEFAULT_CONCURRENCY_LIMIT = 64
+# Files larger than the threshold will be uploaded with multipart upload,
+# and the parts are uploaded in parallel. Can be changed in transfer config.
+MB = 1024 * 1024
+DEFAULT_MULTIPART_THRESHOLD_MB = 64
+DEFAULT_MULTIPART_CHUNKSIZE_MB = 16
+DEFAULT_MULTIPART_CONCURRENCY = 10
+# Files are copied from the main target to the extra targets by default,
+# "upload" mode will upload the local files to the extra targets directly,
+# which is faster than CopyObject for cross-region targets
+EXTRA_TARGET_MODE_COPY = "copy"
+EXTRA_TARGET_MODE_UPLOAD = "upload"
+
+# Large listings are partitioned: the sub folders of the first PARTITION_DEPTH
+# levels are listed concurrently, and a folder level with more than one page
+# is split into key ranges at PARTITION_BOUNDARIES after its first page
+LIST_PAGE_SIZE = 1000
+PARTITION_DEPTH = 2
+PARTITION_BOUNDARIES = [
+    "0", "a", "c", "e", "g", "i", "k", "m", "o", "q", "s", "u", "w", "y"
+]
+
+# The requests which create or overwrite the key in their kwargs, which
+# will be recorded into the remote tree snapshot
+WRITE_REQUESTS = ["put_object", "upload_file", "upload_fileobj", "copy"]
+
+# The operation types of the backend requests in the request metrics
+OPERATION_TYPES = {
+    "head_object": "HEAD", "get_object_content": "GET", "get_object": "GET",
+    "put_object": "PUT", "upload_file": "PUT", "upload_fileobj": "PUT", "copy": "COPY",
+    "list_objects": "LIST", "list_objects_page": "LIST", "delete_object": "DELETE",
+    "delete_objects": "DELETE"
+}
+
+# Transient errors of the requests are retried with jittered exponential
+# backoff, and the files which still fail are re-driven once at the end of
+# each phase with 1/REDRIVE_CONCURRENCY_FACTOR of the concurrency
+DEFAULT_RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 20
+REDRIVE_CONCURRENCY_FACTOR = 4
+TRANSIENT_ERROR_CODES = [
+    "RequestTimeout", "RequestTimeoutException", "InternalError", "BadDigest"
+]
+
+THROTTLING_ERROR_CODES = [
+    "SlowDown", "503", "ServiceUnavailable", "Throttling", "ThrottlingException",
+    "RequestLimitExceeded", "TooManyRequests", "TooManyRequestsException",
+    "RequestThrottled"
+]
+
+# The file handled by the running task, to know which of the failed files
+# gave up on transient errors
+HANDLING_FILE: ContextVar[Optional[str]] = ContextVar("charon_handling_file", default=None)
+
 PATH_HANDLER_TYPE = Callable[[str, str, int, int, List[str]], Awaitable[bool]]
 
 
 class S3Client(object):
     """The S3Client is a wrapper of the original boto3 s3 client, which will provide
     some convenient methods to be used in the charon.
+        * The requests of the concurrent handlers are sent through a storage backend,
+        which is the threaded boto3 backend by default, or the asyncio aiobotocore
+        backend if "aiobotocore" is set as backend or in aws_storage_backend env.
     """
 
     def __init__(
         self,
         aws_profile=None, extra_conf=None,
-        con_limit=25, dry_run=False
+        con_limit=DEFAULT_CONCURRENCY_LIMIT, dry_run=False,
+        listing_index=False, backend: Optional[str] = None,
+        transfer_config: Optional[Dict[str, Any]] = None,
+        ownership_store: Optional[str] = None, preflight=False,
+        journal: Optional[UploadJournal] = None, tree_snapshot=False
     ) -> None:
-        self.__client = self.__init_aws_client(aws_profile, extra_conf)
+        endpoint_url = self.__get_endpoint(extra_conf)
+        config = None
+        if self.__enable_acceleration(extra_conf):
+            logger.info("[S3] S3 acceleration config enabled, "
+                        "will enable s3 use_accelerate_endpoint config")
+            config = Config(s3={"use_accelerate_endpoint": True})
+        self.__client = self.__init_aws_client(aws_profile, endpoint_url, config)
         self.__buckets: Dict[str, Any] = {}
         self.__dry_run = dry_run
-        self.__con_sem = asyncio.BoundedSemaphore(con_limit)
+        self.__con_limit = con_limit
+        self.__limiters: Dict[str, AdaptiveLimiter] = {}
+        # The backend should never be the bottleneck of the limiters, so
+        # its threads or connections are sized to the max concurrency
+        self.__backend = init_backend(
+            backend if backend else self.__get_backend_type(extra_conf),
+            self.__client, aws_profile=aws_profile, endpoint_url=endpoint_url,
+            config=config, max_concurrency=con_limit
+        )
+        self.__transfer_config = self.__init_transfer_config(transfer_config)
+        self.__direct_extra_upload = self.__enable_direct_extra_upload(transfer_config)
+        self.__ownership = init_ownership_store(
+            ownership_store, self.__backend, self.__call, self.__get_limiter
+        )
         self.__lock = threading.Lock()
+        self.__listing_index_enabled = (
+            listing_index or self.__enable_listing_index(extra_conf)
+        )
+        # bucket -> folder -> key -> (size, etag), only for folders
+        # which have been listed completely
+        self.__listing_index: Dict[str, Dict[str, Dict[str, Tuple[int, str]]]] = {}
+        self.__preflight_enabled = preflight or self.__enable_preflight(extra_conf)
+        # bucket -> keys which are verified to have the same content as the
+        # local files in the pre-flight check of current uploading
+        self.__preflight_verified: Dict[str, Set[str]] = {}
+        self.__journal = journal
+        # The listings taken in this run, which are kept up to date with the
+        # writes of this client, and shared by the metadata and index phases
+        self.__snapshot: Optional[RemoteTreeSnapshot] = None
+        if tree_snapshot or self.__enable_tree_snapshot(extra_conf):
+            self.__snapshot = RemoteTreeSnapshot()
+        self.__retry_attempts = self.__get_retry_attempts(transfer_config)
+        self.__redrive_enabled = self.__enable_redrive(transfer_config)
+        self.__retry_stats = {"retries": 0, "redriven": 0, "recovered": 0}
+        self.__transient_failed: Set[str] = set()
 
     def __init_aws_client(
-        self, aws_profile=None, extra_conf=None
+        self, aws_profile=None, endpoint_url=None, config=None
     ):
         if aws_profile:
             logger.debug("[S3] Using aws profile: %s", aws_profile)
             s3_session = session.Session(profile_name=aws_profile)
         else:
             s3_session = session.Session()
-        endpoint_url = self.__get_endpoint(extra_conf)
-        config = None
-        if self.__enable_acceleration(extra_conf):
-            logger.info("[S3] S3 acceleration config enabled, "
-                        "will enable s3 use_accelerate_endpoint config")
-            config = Config(s3={"use_accelerate_endpoint": True})
         return s3_session.resource(
             's3',
             endpoint_url=endpoint_url,
             config=config
         )
 
+    def __init_transfer_config(self, transfer_config: Optional[Dict[str, Any]]) -> TransferConfig:
+        conf = transfer_config if transfer_config else {}
+        threshold = conf.get("multipart_threshold_mb", DEFAULT_MULTIPART_THRESHOLD_MB)
+        chunksize = conf.get("multipart_chunksize_mb", DEFAULT_MULTIPART_CHUNKSIZE_MB)
+        concurrency = conf.get("max_concurrency", DEFAULT_MULTIPART_CONCURRENCY)
+        logger.debug(
+            "[S3] Files larger than %dMB will be uploaded in %dMB parts with %d threads",
+            threshold, chunksize, concurrency
+        )
+        return TransferConfig(
+            multipart_threshold=threshold * MB,
+            multipart_chunksize=chunksize * MB,
+            max_concurrency=concurrency
+        )
+
+    def __enable_direct_extra_upload(self, transfer_config: Optional[Dict[str, Any]]) -> bool:
+        mode = EXTRA_TARGET_MODE_COPY
+        if transfer_config:
+            mode = transfer_config.get("extra_target_mode", EXTRA_TARGET_MODE_COPY)
+        if mode == EXTRA_TARGET_MODE_UPLOAD:
+            logger.info("[S3] Files will be uploaded to the extra targets directly "
+                        "instead of copying from the main target")
+            return True
+        return False
+
+    def __get_retry_attempts(self, transfer_config: Optional[Dict[str, Any]]) -> int:
+        attempts = DEFAULT_RETRY_ATTEMPTS
+        if transfer_config:
+            attempts = transfer_config.get("retry_attempts", DEFAULT_RETRY_ATTEMPTS)
+        return max(0, attempts)
+
+    def __enable_redrive(self, transfer_config: Optional[Dict[str, Any]]) -> bool:
+        if transfer_config:
+            return transfer_config.get("redrive", True)
+        return True
+
+    def get_retry_stats(self) -> Dict[str, int]:
+        """Get the number of retried requests, re-driven files and the
+        re-driven files which are recovered since this client is created.
+        """
+        return dict(self.__retry_stats)
+
+    def close(self):
+        """Close the connections held by the storage backend. The backend is
+        opened when the first concurrent requests are sent, and kept opened for
+        all the phases of this client until it is closed.
+        """
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(self.__backend.close())
+
     def __get_endpoint(self, extra_conf) -> Optional[str]:
         endpoint_url = os.getenv(ENDPOINT_ENV)
         if not endpoint_url or endpoint_url.strip() == "":
@@ -106,10 +277,55 @@ class S3Client(object):
             return True
         return False
 
+    def __get_backend_type(self, extra_conf) -> str:
+        backend_type = os.getenv(BACKEND_ENV)
+        if not backend_type or backend_type.strip() == "":
+            if isinstance(extra_conf, Dict):
+                backend_type = extra_conf.get(BACKEND_ENV, BACKEND_THREADED)
+        if not backend_type:
+            return BACKEND_THREADED
+        return backend_type.strip().lower()
+
+    def __enable_listing_index(self, extra_conf) -> bool:
+        enable_idx = os.getenv(LISTING_INDEX_ENABLE_ENV)
+        if not enable_idx or enable_idx.strip() == "":
+            if isinstance(extra_conf, Dict):
+                enable_idx = extra_conf.get(LISTING_INDEX_ENABLE_ENV, "False")
+        if enable_idx and enable_idx.strip().lower() == "true":
+            logger.info("[S3] Listing index enabled, will use prefix listing "
+                        "instead of per-file HEAD for existence checking")
+            return True
+        return False
+
+    def __enable_preflight(self, extra_conf) -> bool:
+        enable_pre = os.getenv(PREFLIGHT_ENABLE_ENV)
+        if not enable_pre or enable_pre.strip() == "":
+            if isinstance(extra_conf, Dict):
+                enable_pre = extra_conf.get(PREFLIGHT_ENABLE_ENV, "False")
+        if enable_pre and enable_pre.strip().lower() == "true":
+            logger.info("[S3] Pre-flight check enabled, will check all conflicts "
+                        "before uploading")
+            return True
+        return False
+
+    def __enable_tree_snapshot(self, extra_conf) -> bool:
+        enable_snapshot = os.getenv(TREE_SNAPSHOT_ENABLE_ENV)
+        if not enable_snapshot or enable_snapshot.strip() == "":
+            if isinstance(extra_conf, Dict):
+                enable_snapshot = extra_conf.get(TREE_SNAPSHOT_ENABLE_ENV, "False")
+        if enable_snapshot and enable_snapshot.strip().lower() == "true":
+            logger.info("[S3] Remote tree snapshot enabled, the listings will be "
+                        "reused in this run, so the changes made by others "
+                        "during the run are not seen")
+            return True
+        return False
+
+    @traced("upload")
     def upload_files(
-        self, file_paths: List[str],
+        self, file_paths: Union[List[str], AsyncIterable[str]],
         targets: List[Tuple[str, str]],
-        product: str, root="/"
+        product: str, root="/",
+        reader: Optional[LocalFileReader] = None
     ) -> List[str]:
         """ Upload a list of files to s3 bucket. * Use the cut down file path as s3 key. The cut
         down way is move root from the file path if it starts with root. Example: if file_path is
@@ -126,24 +342,67 @@ class S3Client(object):
             * Every file has sha1 checksum in "checksum" metadata. When uploading existed files,
             if the checksum does not match the existed one, will not upload it and report error.
             Note that if file name match
+            * Files larger than multipart_threshold_mb of the transfer config will be
+            uploaded with multipart upload, and the checksum metadata is kept.
+            * If listing index is enabled, the folders of all files will be listed once
+            for each target before uploading, and the existence checking will be answered
+            from the listing instead of a HEAD request for each file.
+            * If pre-flight check is enabled, the existed files in all targets will be
+            compared with the local files by ETag before uploading. If any conflict
+            is found, nothing will be uploaded and all conflicting files are returned
+            as failed. The files which are not changed will not be checked again.
+            * The file is copied from the main target to all extra targets concurrently,
+            or uploaded to them directly if extra_target_mode of the transfer config
+            is "upload".
+            * If an upload journal is used, the completed files will be recorded in it,
+            and the files which are recorded with the same checksum will be skipped
+            when resuming. The whole uploading is skipped if it was finished before.
+            * The file_paths can also be an async iterable of the files which are still
+            being produced, like the extracting ones, and each file is uploaded as soon
+            as it arrives. The listing index is not used for them, and if pre-flight
+            check is enabled, all of them are collected before uploading.
+            * The content of the files is read by the reader, which reads from local
+            file system by default. See ZipMemberReader for reading from a zip archive.
             * Return all failed to upload files due to any exceptions.
         """
         main_target = targets[0]
         main_bucket_name = main_target[0]
-        main_bucket = self.__get_bucket(main_bucket_name)
         key_prefix = main_target[1]
-        extra_targets = targets[1:] if len(targets) > 1 else []
-        extra_prefixed_buckets: List[Tuple[Any, str]] = []
-        if len(extra_targets) > 0:
-            for target in extra_targets:
-                extra_prefixed_buckets.append((self.__get_bucket(target[0]), target[1]))
+        extra_prefixed_buckets = targets[1:] if len(targets) > 1 else []
+        reader = reader if reader else LocalFileReader()
+
+        if self.__journal and all(
+            self.__journal.is_phase_done(PHASE_FILES, t[0]) for t in targets
+        ):
+            logger.info("[S3] Files uploading was done in journal, skipped")
+            return []
+
+        self.__preflight_verified = {}
+        if not isinstance(file_paths, list) and self.__preflight_enabled:
+            logger.info(
+                "[S3] Pre-flight check needs all the files, will start "
+                "uploading after all of them are produced"
+            )
+            file_paths = self.__run_for_result(self.__collect(file_paths))
+        if not isinstance(file_paths, list):
+            logger.debug("[S3] The files are streamed, listing index is not used for them")
+        elif self.__listing_index_enabled or self.__preflight_enabled:
+            self.__build_listing_index(file_paths, targets, root)
+        if isinstance(file_paths, list) and self.__preflight_enabled:
+            conflicts = self.__preflight_check(file_paths, targets, reader, root)
+            if conflicts:
+                logger.error(
+                    "[S3] Pre-flight check failed, %d files conflict with the existed "
+                    "files in targets. Nothing is uploaded.", len(conflicts)
+                )
+                return conflicts
 
         async def path_upload_handler(
             full_file_path: str, path: str, index: int,
             total: int, failed: List[str]
         ):
-            async with self.__con_sem:
-                if not os.path.isfile(full_file_path):
+            async with self.__get_limiter(main_bucket_name).slot():
+                if not reader.is_file(full_file_path):
                     logger.warning(
                         '[S3] Warning: file %s does not exist during uploading. Product: %s',
                         full_file_path, product
@@ -152,54 +411,54 @@ class S3Client(object):
                     return
 
                 logger.debug(
-                    '[S3] (%d/%d) Uploading %s to bucket %s',
-                    index, total, full_file_path, main_bucket_name
+                    '[S3] (%d/%s) Uploading %s to bucket %s',
+                    index, total or "?", full_file_path, main_bucket_name
                 )
                 main_path_key = os.path.join(key_prefix, path) if key_prefix else path
-                main_file_object = main_bucket.Object(main_path_key)
-                existed = False
-                try:
-                    existed = await self.__run_async(self.__file_exists, main_file_object)
-                except (ClientError, HTTPClientError) as e:
-                    logger.error(
-                        "[S3] Error: file existence check failed due to error: %s", e
-                    )
-                    failed.append(full_file_path)
-                    return
-                sha1 = read_sha1(full_file_path)
+                sha1 = reader.read_sha1(full_file_path)
                 (content_type, _) = mimetypes.guess_type(full_file_path)
                 if not content_type:
                     content_type = DEFAULT_MIME_TYPE
-                if not existed:
-                    f_meta = {}
-                    if sha1.strip() != "":
-                        f_meta[CHECKSUM_META_KEY] = sha1
+                f_meta = {}
+                if sha1.strip() != "":
+                    f_meta[CHECKSUM_META_KEY] = sha1
+                existed = False
+                resumed = await self.__resume_done(
+                    PHASE_FILES, main_bucket_name, main_path_key, full_file_path, sha1
+                )
+                if not resumed:
+                    try:
+                        (existed, main_meta) = await self.__head_indexed(
+                            main_bucket_name, main_path_key
+                        )
+                    except (ClientError, HTTPClientError) as e:
+                        logger.error(
+                            "[S3] Error: file existence check failed due to error: %s", e
+                        )
+                        failed.append(full_file_path)
+                        return
+                if resumed:
+                    logger.debug('[S3] %s was uploaded before, skipped', path)
+                elif not existed:
                     try:
                         if not self.__dry_run:
-                            if len(f_meta) > 0:
-                                await self.__run_async(
-                                    functools.partial(
-                                        main_file_object.put,
-                                        Body=open(full_file_path, "rb"),
-                                        Metadata=f_meta,
-                                        ContentType=content_type
-                                    )
-                                )
-                            else:
-                                await self.__run_async(
-                                    functools.partial(
-                                        main_file_object.upload_file,
-                                        Filename=full_file_path,
-                                        ExtraArgs={'ContentType': content_type}
-                                    )
-                                )
+                            await self.__put_file(
+                                main_bucket_name, main_path_key,
+                                full_file_path, f_meta, content_type, reader
+                            )
+                            self.__add_to_listing_index(main_bucket_name, main_path_key)
                             if product:
                                 await self.__update_prod_info(
-                                    main_path_key, main_bucket_name, [product]
+                                    main_path_key, main_bucket_name, [product],
+                                    source=full_file_path
                                 )
+                            self.__journal_record(
+                                PHASE_FILES, main_bucket_name, main_path_key,
+                                [product] if product else None, sha1
+                            )
 
                         logger.debug('[S3] Uploaded %s to bucket %s', path, main_bucket_name)
-                    except (ClientError, HTTPClientError) as e:
+                    except (ClientError, HTTPClientError, S3UploadFailedError) as e:
                         logger.error("[S3] ERROR: file %s not uploaded to bucket"
                                      " %s due to error: %s ", full_file_path,
                                      main_bucket_name, e)
@@ -208,52 +467,97 @@ class S3Client(object):
                 else:
                     await handle_existed(
                         full_file_path, sha1, main_path_key,
-                        main_bucket_name, main_file_object
+                        main_bucket_name, main_meta
                     )
 
-                # do copy:
-                for target_ in extra_prefixed_buckets:
-                    extra_bucket = target_[0]
-                    extra_bucket_name = extra_bucket.name
-                    extra_prefix = target_[1]
-                    extra_path_key = os.path.join(extra_prefix, path) if extra_prefix else path
+            # The main bucket slot is released before the fan-out, as the
+            # extra targets may share the limiter of the main bucket
+            if extra_prefixed_buckets:
+                await asyncio.gather(*[
+                    handle_extra_target(
+                        target_, full_file_path, path, main_path_key,
+                        sha1, f_meta, content_type, failed
+                    ) for target_ in extra_prefixed_buckets
+                ])
+
+        async def handle_extra_target(
+            target_: Tuple[str, str], full_file_path: str, path: str,
+            main_path_key: str, sha1: str, f_meta: Dict[str, str],
+            content_type: str, failed: List[str]
+        ):
+            extra_bucket_name = target_[0]
+            extra_prefix = target_[1]
+            extra_path_key = os.path.join(extra_prefix, path) if extra_prefix else path
+            async with self.__get_limiter(extra_bucket_name).slot():
+                if await self.__resume_done(
+                    PHASE_FILES, extra_bucket_name, extra_path_key, full_file_path, sha1
+                ):
+                    return
+                try:
+                    (existed, extra_meta) = await self.__head_indexed(
+                        extra_bucket_name, extra_path_key
+                    )
+                except (ClientError, HTTPClientError) as e:
+                    logger.error(
+                        "[S3] Error: file existence check failed due to error: %s", e
+                    )
+                    failed.append(full_file_path)
+                    return
+                if existed:
+                    await handle_existed(
+                        full_file_path, sha1, extra_path_key,
+                        extra_bucket_name, extra_meta
+                    )
+                    return
+                if self.__dry_run:
+                    return
+                if self.__direct_extra_upload:
                     logger.debug(
-                        'Copyinging %s from bucket %s to bucket %s',
-                        full_file_path, main_bucket_name, extra_bucket
+                        '[S3] Uploading %s to bucket %s',
+                        full_file_path, extra_bucket_name
                     )
-                    file_object = extra_bucket.Object(extra_path_key)
-                    existed = await self.__run_async(self.__file_exists, file_object)
-                    if not existed:
-                        if not self.__dry_run:
-                            try:
-                                await self.__copy_between_bucket(
-                                    main_bucket_name, main_path_key,
-                                    extra_bucket, extra_path_key
-                                )
-                                if product:
-                                    await self.__update_prod_info(
-                                        extra_path_key, extra_bucket_name, [product]
-                                    )
-                            except (ClientError, HTTPClientError) as e:
-                                logger.error("[S3] ERROR: copying failure happend for file %s"
-                                             " to bucket %s due to error: %s ",
-                                             full_file_path, extra_bucket_name, e)
-                                failed.append(full_file_path)
-                    else:
-                        await handle_existed(
-                            full_file_path, sha1, extra_path_key,
-                            extra_bucket_name, file_object
+                    try:
+                        await self.__put_file(
+                            extra_bucket_name, extra_path_key,
+                            full_file_path, f_meta, content_type, reader
                         )
+                        done = True
+                    except (ClientError, HTTPClientError, S3UploadFailedError) as e:
+                        logger.error("[S3] ERROR: file %s not uploaded to bucket"
+                                     " %s due to error: %s ", full_file_path,
+                                     extra_bucket_name, e)
+                        done = False
+                else:
+                    logger.debug(
+                        '[S3] Copying %s from bucket %s to bucket %s',
+                        full_file_path, main_bucket_name, extra_bucket_name
+                    )
+                    done = await self.__copy_between_bucket(
+                        main_bucket_name, main_path_key,
+                        extra_bucket_name, extra_path_key
+                    )
+                if not done:
+                    failed.append(full_file_path)
+                    return
+                self.__add_to_listing_index(extra_bucket_name, extra_path_key)
+                if product:
+                    await self.__update_prod_info(
+                        extra_path_key, extra_bucket_name, [product],
+                        source=full_file_path
+                    )
+                self.__journal_record(
+                    PHASE_FILES, extra_bucket_name, extra_path_key,
+                    [product] if product else None, sha1
+                )
 
         async def handle_existed(
             file_path, file_sha1, path_key,
-            bucket_name, file_object
+            bucket_name, f_meta: Dict[str, str]
         ) -> bool:
             logger.debug(
                 "File %s already exists in bucket %s, check if need to update product.",
                 path_key, bucket_name
             )
-            f_meta = file_object.metadata
             checksum = (
                 f_meta[CHECKSUM_META_KEY] if CHECKSUM_META_KEY in f_meta else ""
             )
@@ -262,10 +566,7 @@ class S3Client(object):
                                'different from the one in S3 bucket %s. Product: %s',
                                path_key, bucket_name, product)
                 return False
-            (prods, no_error) = await self.__run_async(
-                self.__get_prod_info,
-                path_key, bucket_name
-            )
+            (prods, no_error) = await self.__get_prod_info(path_key, bucket_name)
             if not self.__dry_run and no_error and product not in prods:
                 logger.debug(
                     "File %s has new product, updating the product %s",
@@ -274,46 +575,104 @@ class S3Client(object):
                 )
                 prods.append(product)
                 result = await self.__update_prod_info(
-                    path_key, bucket_name, prods
+                    path_key, bucket_name, prods, source=file_path
                 )
                 if not result:
                     return False
+            if no_error:
+                self.__journal_record(PHASE_FILES, bucket_name, path_key, prods, file_sha1)
             return True
 
-        return self.__do_path_cut_and(
+        failed_files = self.__do_path_cut_and(
             file_paths=file_paths,
-            path_handler=self.__path_handler_count_wrapper(path_upload_handler),
-            root=root
+            path_handler=path_upload_handler,
+            root=root,
+            bucket_name=main_bucket_name
         )
+        failed_files = self.__flush_ownership(failed_files)
+        if not failed_files:
+            for (bucket_name, _) in targets:
+                self.__journal_finish(PHASE_FILES, bucket_name)
+        return failed_files
+
+    async def __put_file(
+        self, bucket_name: str, key: str, file_path: str,
+        meta: Dict[str, str], content_type: str,
+        reader: Optional[LocalFileReader] = None
+    ):
+        """Upload the file with its metadata. Small files are sent as a single
+        put_object from memory, and only the files larger than multipart threshold
+        go through the transfer manager for multipart uploading. The files which
+        are not on disk are streamed from the reader for multipart uploading.
+        """
+        reader = reader if reader else LocalFileReader()
+        if reader.size(file_path) >= self.__transfer_config.multipart_threshold:
+            extra_args: Dict[str, Any] = {'ContentType': content_type}
+            if len(meta) > 0:
+                extra_args['Metadata'] = meta
+            if reader.on_disk(file_path):
+                await self.__call(
+                    self.__backend.upload_file,
+                    Filename=file_path,
+                    Bucket=bucket_name,
+                    Key=key,
+                    ExtraArgs=extra_args,
+                    Config=self.__transfer_config
+                )
+            else:
+                # The stream is opened for each attempt, as a failed
+                # uploading may have consumed it
+                async def upload_fileobj(**kwargs):
+                    with reader.open(file_path) as f:
+                        return await self.__backend.upload_fileobj(Fileobj=f, **kwargs)
+
+                await self.__call(
+                    upload_fileobj,
+                    size=reader.size(file_path),
+                    Bucket=bucket_name,
+                    Key=key,
+                    ExtraArgs=extra_args,
+                    Config=self.__transfer_config
+                )
+        else:
+            content = reader.read(file_path)
+            await self.__call(
+                self.__backend.put_object,
+                Bucket=bucket_name,
+                Key=key,
+                Body=content,
+                Metadata=meta,
+                ContentType=content_type
+            )
 
     async def __copy_between_bucket(
         self, source: str, source_key: str,
-        target, target_key: str
+        target: str, target_key: str
     ) -> bool:
         logger.debug(
             "Copying file %s from bucket %s to target %s as %s",
-            source_key, source, target.name, target_key)
+            source_key, source, target, target_key)
         copy_source = {
             'Bucket': source,
             'Key': source_key
         }
         try:
-            await self.__run_async(
-                functools.partial(
-                    target.copy,
-                    CopySource=copy_source,
-                    Key=target_key
-                )
+            await self.__call(
+                self.__backend.copy,
+                CopySource=copy_source,
+                Bucket=target,
+                Key=target_key
             )
             logger.debug('Copy done')
             return True
         except (ClientError, HTTPClientError) as e:
             logger.error(
                 "ERROR: Can not copy file %s to bucket %s due to error: %s",
-                source_key, target.name, e
+                source_key, target, e
             )
             return False
 
+    @traced("upload_metadata")
     def upload_metadatas(
         self, meta_file_paths: List[str],
         target: Tuple[str, str],
@@ -326,13 +685,12 @@ class S3Client(object):
             * Return all failed to upload metadata files due to exceptions
         """
         bucket_name = target[0]
-        bucket = self.__get_bucket(bucket_name)
 
         async def path_upload_handler(
             full_file_path: str, path: str, index: int,
             total: int, failed: List[str]
         ):
-            async with self.__con_sem:
+            async with self.__get_limiter(bucket_name).slot():
                 if not os.path.isfile(full_file_path):
                     logger.warning(
                         'Warning: file %s does not exist during uploading. Product: %s',
@@ -348,10 +706,15 @@ class S3Client(object):
 
                 key_prefix = target[1]
                 path_key = os.path.join(key_prefix, path) if key_prefix else path
-                file_object = bucket.Object(path_key)
+                sha1 = read_sha1(full_file_path)
+                if await self.__resume_done(
+                    PHASE_METADATA, bucket_name, path_key, full_file_path, sha1
+                ):
+                    return
                 existed = False
                 try:
-                    existed = await self.__run_async(self.__file_exists, file_object)
+                    head = await self.__head_object(bucket_name, path_key)
+                    existed = head is not None
                 except (ClientError, HTTPClientError) as e:
                     logger.error(
                         "Error: file existence check failed due to error: %s", e
@@ -360,12 +723,11 @@ class S3Client(object):
                     return
                 f_meta = {}
                 need_overwritten = True
-                sha1 = read_sha1(full_file_path)
                 (content_type, _) = mimetypes.guess_type(full_file_path)
                 if not content_type:
                     content_type = DEFAULT_MIME_TYPE
-                if existed:
-                    f_meta = file_object.metadata
+                if head is not None:
+                    f_meta = head.get("Metadata", {})
                     need_overwritten = (
                         CHECKSUM_META_KEY not in f_meta or sha1 != f_meta[CHECKSUM_META_KEY]
                     )
@@ -374,14 +736,11 @@ class S3Client(object):
                 try:
                     if not self.__dry_run:
                         if need_overwritten:
-                            await self.__run_async(
-                                functools.partial(
-                                    file_object.put,
-                                    Body=open(full_file_path, "rb"),
-                                    Metadata=f_meta,
-                                    ContentType=content_type
-                                )
+                            await self.__put_file(
+                                bucket_name, path_key,
+                                full_file_path, f_meta, content_type
                             )
+                        prods = []
                         if product:
                             # NOTE: This should not happen for most cases, as most
                             # of the metadata file does not have product info. Just
@@ -389,8 +748,7 @@ class S3Client(object):
                             # This is now used for npm version-level package.json
                             prods = [product]
                             if existed:
-                                (prods, no_error) = await self.__run_async(
-                                    self.__get_prod_info,
+                                (prods, no_error) = await self.__get_prod_info(
                                     path_key, bucket_name
                                 )
                                 if not no_error:
@@ -399,13 +757,14 @@ class S3Client(object):
                                 if no_error and product not in prods:
                                     prods.append(product)
                             updated = await self.__update_prod_info(
-                                path_key, bucket_name, prods
+                                path_key, bucket_name, prods, source=full_file_path
                             )
                             if not updated:
                                 failed.append(full_file_path)
                                 return
+                        self.__journal_record(PHASE_METADATA, bucket_name, path_key, prods, sha1)
                     logger.debug('Updated metadata %s to bucket %s', path, bucket_name)
-                except (ClientError, HTTPClientError) as e:
+                except (ClientError, HTTPClientError, S3UploadFailedError) as e:
                     logger.error(
                         "ERROR: file %s not uploaded to bucket"
                         " %s due to error: %s ",
@@ -413,12 +772,15 @@ class S3Client(object):
                     )
                     failed.append(full_file_path)
 
-        return self.__do_path_cut_and(
+        failed_files = self.__do_path_cut_and(
             file_paths=meta_file_paths,
-            path_handler=self.__path_handler_count_wrapper(path_upload_handler),
-            root=root
+            path_handler=path_upload_handler,
+            root=root,
+            bucket_name=bucket_name
         )
+        return self.__flush_ownership(failed_files)
 
+    @traced("upload_signature")
     def upload_signatures(
         self, meta_file_paths: List[str],
         target: Tuple[str, str],
@@ -429,13 +791,12 @@ class S3Client(object):
             * The signature files will not be overwritten if existed
         """
         bucket_name = target[0]
-        bucket = self.__get_bucket(bucket_name)
 
         async def path_upload_handler(
             full_file_path: str, path: str, index: int,
             total: int, failed: List[str]
         ):
-            async with self.__con_sem:
+            async with self.__get_limiter(bucket_name).slot():
                 if not os.path.isfile(full_file_path):
                     logger.warning(
                         'Warning: file %s does not exist during uploading. Product: %s',
@@ -451,10 +812,15 @@ class S3Client(object):
 
                 key_prefix = target[1]
                 path_key = os.path.join(key_prefix, path) if key_prefix else path
-                file_object = bucket.Object(path_key)
+                # Signatures are not overwritten once existed, so the content
+                # is not compared when resuming
+                if await self.__resume_done(
+                    PHASE_SIGNATURES, bucket_name, path_key, full_file_path, None
+                ):
+                    return
                 existed = False
                 try:
-                    existed = await self.__run_async(self.__file_exists, file_object)
+                    existed = await self.__head_object(bucket_name, path_key) is not None
                 except (ClientError, HTTPClientError) as e:
                     logger.error(
                         "Error: file existence check failed due to error: %s", e
@@ -467,14 +833,11 @@ class S3Client(object):
 
                 try:
                     if not self.__dry_run:
+                        prods = []
                         if not existed:
-                            await self.__run_async(
-                                functools.partial(
-                                    file_object.put,
-                                    Body=open(full_file_path, "rb"),
-                                    Metadata={},
-                                    ContentType=content_type
-                                )
+                            await self.__put_file(
+                                bucket_name, path_key,
+                                full_file_path, {}, content_type
                             )
                         elif product:
                             # NOTE: This should not happen for most cases, as most
@@ -483,8 +846,7 @@ class S3Client(object):
                             # This is now used for npm version-level package.json
                             prods = [product]
                             if existed:
-                                (prods, no_error) = await self.__run_async(
-                                    self.__get_prod_info,
+                                (prods, no_error) = await self.__get_prod_info(
                                     path_key, bucket_name
                                 )
                                 if not no_error:
@@ -493,13 +855,14 @@ class S3Client(object):
                                 if no_error and product not in prods:
                                     prods.append(product)
                             updated = await self.__update_prod_info(
-                                path_key, bucket_name, prods
+                                path_key, bucket_name, prods, source=full_file_path
                             )
                             if not updated:
                                 failed.append(full_file_path)
                                 return
+                        self.__journal_record(PHASE_SIGNATURES, bucket_name, path_key, prods)
                     logger.debug('Updated signature %s to bucket %s', path, bucket_name)
-                except (ClientError, HTTPClientError) as e:
+                except (ClientError, HTTPClientError, S3UploadFailedError) as e:
                     logger.error(
                         "ERROR: file %s not uploaded to bucket"
                         " %s due to error: %s ",
@@ -507,12 +870,15 @@ class S3Client(object):
                     )
                     failed.append(full_file_path)
 
-        return self.__do_path_cut_and(
+        failed_files = self.__do_path_cut_and(
             file_paths=meta_file_paths,
-            path_handler=self.__path_handler_count_wrapper(path_upload_handler),
-            root=root
+            path_handler=path_upload_handler,
+            root=root,
+            bucket_name=bucket_name
         )
+        return self.__flush_ownership(failed_files)
 
+    @traced("upload_manifest")
     def upload_manifest(
             self, manifest_name: str, manifest_full_path: str, target: str,
             manifest_bucket_name: str
@@ -522,15 +888,20 @@ class S3Client(object):
         manifest_bucket = self.__get_bucket(manifest_bucket_name)
         try:
             file_object = manifest_bucket.Object(path_key)
-            file_object.upload_file(
-                Filename=manifest_full_path,
-                ExtraArgs={'ContentType': DEFAULT_MIME_TYPE}
-            )
+            with get_metrics().timed(
+                SERVICE_S3, "PUT", manifest_bucket_name,
+                sent=os.path.getsize(manifest_full_path)
+            ):
+                file_object.upload_file(
+                    Filename=manifest_full_path,
+                    ExtraArgs={'ContentType': DEFAULT_MIME_TYPE}
+                )
         except S3UploadFailedError:
             logger.warning(
                 'Warning: Manifest bucket %s does not exist in S3, will ignore uploading of '
                 'manifest file %s', manifest_bucket_name, manifest_name)
 
+    @traced("delete")
     def delete_files(
         self, file_paths: List[str], target: Tuple[str, str],
         product: Optional[str], root="/"
@@ -545,22 +916,25 @@ class S3Client(object):
             removing, if there still are extra products left in that metadata, the file will not
             really be removed from the bucket. Only when the metadata is all cleared, the file
             will be finally removed from bucket.
+            * The files to be removed and their product info files are collected first, and
+            then removed in batched DeleteObjects requests. Keys reported as errors in the
+            responses will be returned as failed files.
         """
         bucket_name = target[0]
-        bucket = self.__get_bucket(bucket_name)
+        # (path_key, full_file_path) of the files whose products are all removed
+        pending_deletes: List[Tuple[str, str]] = []
 
         async def path_delete_handler(
             full_file_path: str, path: str, index: int,
             total: int, failed: List[str]
         ):
-            async with self.__con_sem:
+            async with self.__get_limiter(bucket_name).slot():
                 key_prefix = target[1]
                 logger.debug('(%d/%d) Deleting %s from bucket %s', index, total, path, bucket_name)
                 path_key = os.path.join(key_prefix, path) if key_prefix else path
-                file_object = bucket.Object(path_key)
                 existed = False
                 try:
-                    existed = await self.__run_async(self.__file_exists, file_object)
+                    existed = await self.__head_object(bucket_name, path_key) is not None
                 except (ClientError, HTTPClientError) as e:
                     logger.error(
                         "Error: file existence check failed due to error: %s", e
@@ -574,8 +948,7 @@ class S3Client(object):
                     # the product reference counts will be used (from object metadata).
                     prods = []
                     if product:
-                        (prods, no_error) = await self.__run_async(
-                            self.__get_prod_info,
+                        (prods, no_error) = await self.__get_prod_info(
                             path_key, bucket_name
                         )
                         if not no_error:
@@ -590,7 +963,9 @@ class S3Client(object):
                                 " will remove %s from its metadata",
                                 path, product
                             )
-                            await self.__update_prod_info(path_key, bucket_name, prods)
+                            await self.__update_prod_info(
+                                path_key, bucket_name, prods, source=full_file_path
+                            )
                             logger.debug(
                                 "Removed product %s from metadata of file %s",
                                 product, path
@@ -604,30 +979,13 @@ class S3Client(object):
                             failed.append(full_file_path)
                             return
                     elif len(prods) == 0:
-                        try:
-                            if not self.__dry_run:
-                                await self.__run_async(
-                                    functools.partial(
-                                        bucket.delete_objects,
-                                        Delete={"Objects": [{"Key": path_key}]}
-                                    )
-                                )
-                                updated = await self.__update_prod_info(
-                                    path_key, bucket_name, prods
-                                )
-                                if not updated:
-                                    failed.append(full_file_path)
-                                    return
+                        # The real deletion will be done in batch after all files
+                        # are checked, together with the product info files.
+                        if not self.__dry_run:
+                            pending_deletes.append((path_key, full_file_path))
+                        else:
                             logger.info("[S3] Deleted %s from bucket %s", path, bucket_name)
-                            return
-                        except (ClientError, HTTPClientError) as e:
-                            logger.error(
-                                "ERROR: file %s failed to delete from bucket"
-                                " %s due to error: %s ",
-                                full_file_path, bucket_name, e
-                            )
-                            failed.append(full_file_path)
-                            return
+                        return
                 else:
                     logger.debug(
                         "File %s does not exist in s3 bucket %s, skip deletion.",
@@ -637,11 +995,81 @@ class S3Client(object):
 
         failed_files = self.__do_path_cut_and(
             file_paths=file_paths,
-            path_handler=self.__path_handler_count_wrapper(path_delete_handler),
-            root=root
+            path_handler=path_delete_handler,
+            root=root,
+            bucket_name=bucket_name
         )
 
-        return failed_files
+        if pending_deletes:
+            key_to_file: Dict[str, str] = {}
+            for (path_key, full_file_path) in pending_deletes:
+                for k in [path_key] + self.__ownership.removal_keys(path_key):
+                    key_to_file[k] = full_file_path
+            delete_failed = self.__batch_delete(bucket_name, key_to_file)
+            failed_files.extend(delete_failed)
+            self.__run_tasks([
+                self.__ownership.forget(bucket_name, path_key)
+                for (path_key, full_file_path) in pending_deletes
+                if full_file_path not in delete_failed
+            ])
+
+        return self.__flush_ownership(failed_files)
+
+    def __batch_delete(
+        self, bucket_name: str, key_to_file: Dict[str, str]
+    ) -> List[str]:
+        """Delete the keys with DeleteObjects requests, each request contains
+        DELETE_BATCH_SIZE keys at most. The per-key errors in the responses will
+        be reported as the failed files, which are the values of key_to_file.
+        """
+        keys = list(key_to_file.keys())
+        batches = [
+            keys[i:i + DELETE_BATCH_SIZE] for i in range(0, len(keys), DELETE_BATCH_SIZE)
+        ]
+        failed: List[str] = []
+
+        async def delete_batch(batch: List[str], index: int):
+            async with self.__get_limiter(bucket_name).slot():
+                logger.debug(
+                    "[S3] (%d/%d) Deleting %d keys from bucket %s",
+                    index, len(batches), len(batch), bucket_name
+                )
+                try:
+                    result = await self.__call(
+                        self.__backend.delete_objects,
+                        Bucket=bucket_name,
+                        Delete={
+                            "Objects": [{"Key": k} for k in batch],
+                            "Quiet": True
+                        }
+                    )
+                except (ClientError, HTTPClientError) as e:
+                    logger.error(
+                        "ERROR: %d keys failed to delete from bucket %s due to error: %s",
+                        len(batch), bucket_name, e
+                    )
+                    errors = [{"Key": k, "Message": str(e)} for k in batch]
+                else:
+                    errors = result.get("Errors", []) if result else []
+                error_keys = set()
+                for error in errors:
+                    key = error.get("Key", "")
+                    error_keys.add(key)
+                    logger.error(
+                        "ERROR: file %s failed to delete from bucket %s due to error: %s %s",
+                        key, bucket_name, error.get("Code", ""), error.get("Message", "")
+                    )
+                    file = key_to_file.get(key)
+                    if file and file not in failed:
+                        failed.append(file)
+                for key in batch:
+                    if key not in error_keys:
+                        self.__remove_from_listing_index(bucket_name, key)
+                        if not key.endswith(PROD_INFO_SUFFIX):
+                            logger.info("[S3] Deleted %s from bucket %s", key, bucket_name)
+
+        self.__run_tasks([delete_batch(b, i) for i, b in enumerate(batches, start=1)])
+        return failed
 
     def simple_delete_file(
         self, file_path: str, target: Tuple[str, str]
@@ -662,7 +1090,10 @@ class S3Client(object):
         try:
             existed = self.__file_exists(file_object)
             if existed:
-                bucket_obj.delete_objects(Delete={"Objects": [{"Key": path_key}]})
+                with get_metrics().timed(SERVICE_S3, "DELETE", bucket):
+                    bucket_obj.delete_objects(Delete={"Objects": [{"Key": path_key}]})
+                if self.__snapshot:
+                    self.__snapshot.delete(bucket, path_key)
             else:
                 logger.warning(
                     'Warning: File %s does not exist in S3 bucket %s, will ignore its deleting',
@@ -714,11 +1145,16 @@ class S3Client(object):
                 f_meta[CHECKSUM_META_KEY] = check_sum_sha1
             try:
                 if not self.__dry_run:
-                    file_object.put(
-                        Body=file_content,
-                        Metadata=f_meta,
-                        ContentType=content_type
-                    )
+                    with get_metrics().timed(
+                        SERVICE_S3, "PUT", bucket, sent=len(file_content)
+                    ):
+                        file_object.put(
+                            Body=file_content,
+                            Metadata=f_meta,
+                            ContentType=content_type
+                        )
+                    if self.__snapshot:
+                        self.__snapshot.put(bucket, path_key)
                 logger.debug('Uploaded %s to bucket %s', path_key, bucket)
             except (ClientError, HTTPClientError) as e:
                 logger.error(
@@ -730,6 +1166,7 @@ class S3Client(object):
                     f"Error: file {path_key} already exists, upload is forbiden."
                   )
 
+    @traced("delete_manifest")
     def delete_manifest(self, product_key: str, target: str, manifest_bucket_name: str):
         if not manifest_bucket_name:
             logger.warning(
@@ -751,7 +1188,8 @@ class S3Client(object):
             )
             return
         if existed:
-            manifest_bucket.delete_objects(Delete={"Objects": [{"Key": path_key}]})
+            with get_metrics().timed(SERVICE_S3, "DELETE", manifest_bucket_name):
+                manifest_bucket.delete_objects(Delete={"Objects": [{"Key": path_key}]})
         else:
             logger.warning(
                 'Warning: Manifest %s does not exist in S3 bucket %s, will ignore its deleting',
@@ -761,75 +1199,303 @@ class S3Client(object):
         """Get the file names from s3 bucket. Can use prefix and suffix to filter the
         files wanted. If some error happend, will return an empty file list and false result
         """
-        bucket = self.__get_bucket(bucket_name)
-        objs = []
-        if prefix and prefix.strip() != "":
+        has_prefix = prefix and prefix.strip() != ""
+        if self.__snapshot:
+            keys = self.__snapshot.get_files(bucket_name, prefix if has_prefix else "")
+            if keys is not None:
+                return (self.__filter_suffix(keys, suffix), True)
+        return self.__run_for_result(self.__get_files(bucket_name, prefix, suffix))
+
+    def get_files_concurrently(
+        self, bucket_name: str, prefixes: List[str],
+        handler: Callable[[str, List[str], bool], None], suffix=None
+    ):
+        """Get the file names under each of the prefixes like get_files. The
+        prefixes are listed concurrently, and the requests are bounded by the
+        limiter of the bucket.
+            * handler is called with the prefix, its files and if the listing
+            is succeeded as soon as the listing of each prefix is done, so the
+            caller can process the results while the others are still listing.
+            * The errors raised by handler will stop all the listings.
+        """
+        async def handle(prefix: str):
+            (files, success) = await self.__get_files(bucket_name, prefix, suffix)
+            handler(prefix, files, success)
+
+        self.__run_tasks([dispatch(
+            prefixes, handle, workers=self.__con_limit, name="prefixes listing"
+        )])
+
+    def list_folders_concurrently(
+        self, bucket_name: str, folders: List[str],
+        handler: Callable[[str, List[str], bool], None]
+    ):
+        """List the content of each of the folders like list_folder_content. The
+        folders are listed concurrently, and the requests are bounded by the
+        limiter of the bucket.
+            * handler is called with the folder, its content and if the listing
+            is succeeded as soon as the listing of each folder is done.
+            * The errors raised by handler will stop all the listings.
+        """
+        async def handle(folder: str):
+            contents = self.__snapshot.list_folder(bucket_name, folder) \
+                if self.__snapshot else None
+            success = True
+            if contents is None:
+                try:
+                    (files, sub_folders) = await self.__list_level(
+                        bucket_name, folder_prefix(folder), delimiter=True
+                    )
+                    contents = sub_folders + files
+                    if self.__snapshot:
+                        self.__snapshot.add_folder(bucket_name, folder_prefix(folder), contents)
+                except (ClientError, HTTPClientError) as e:
+                    logger.error("[S3] ERROR: Can not get contents of %s from bucket"
+                                 " %s due to error: %s ", folder,
+                                 bucket_name, e)
+                    contents = []
+                    success = False
+            handler(folder, contents, success)
+
+        self.__run_tasks([dispatch(
+            folders, handle, workers=self.__con_limit, name="folders listing"
+        )])
+
+    async def __get_files(
+        self, bucket_name: str, prefix: Optional[str], suffix: Optional[str]
+    ) -> Tuple[List[str], bool]:
+        prefix = prefix if prefix and prefix.strip() != "" else ""
+        keys = None
+        if self.__snapshot:
+            keys = self.__snapshot.get_files(bucket_name, prefix)
+        if keys is None:
             try:
-                objs = list(bucket.objects.filter(Prefix=prefix))
+                keys = await self.__list_tree(bucket_name, prefix, PARTITION_DEPTH)
             except (ClientError, HTTPClientError) as e:
                 logger.error("[S3] ERROR: Can not get files under %s in bucket"
                              " %s due to error: %s ", prefix,
                              bucket_name, e)
                 return ([], False)
-        else:
-            objs = list(bucket.objects.all())
-        files = []
+            if self.__snapshot:
+                self.__snapshot.add_tree(bucket_name, prefix, keys)
+        return (self.__filter_suffix(keys, suffix), True)
+
+    def __filter_suffix(self, keys: List[str], suffix: Optional[str]) -> List[str]:
         if suffix and suffix.strip() != "":
-            files = [i.key for i in objs if i.key.endswith(suffix)]
-        else:
-            files = [i.key for i in objs]
-        return (files, True)
+            return [k for k in keys if k.endswith(suffix)]
+        return keys
+
+    def iter_files(
+        self, bucket_name: str, prefix=None, suffix=None,
+        prune: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[str]:
+        """Iterate the file keys in s3 bucket page by page, so the memory will not
+        grow with the number of files, and the caller can stop at any time.
+            * Only the keys ending with suffix will be yielded if suffix is given
+            * If prune is given, the bucket will be listed folder by folder with
+            delimiter, and the sub folders (prefixes ending with "/") for which
+            prune returns True will not be listed. The keys are not in lexical
+            order in this case.
+            * The errors of listing will be raised to the caller
+        """
+        prefix = prefix if prefix and prefix.strip() != "" else ""
+        suffix = suffix if suffix and suffix.strip() != "" else None
+        if self.__snapshot:
+            cached = self.__snapshot.get_files(bucket_name, prefix)
+            if cached is not None:
+                for key in cached:
+                    if suffix and not key.endswith(suffix):
+                        continue
+                    if prune and self.__is_pruned(key, prefix, prune):
+                        continue
+                    yield key
+                return
+        paginator = self.__client.meta.client.get_paginator('list_objects_v2')
+        folders = [prefix]
+        while folders:
+            folder = folders.pop()
+            kwargs = {"Bucket": bucket_name, "Prefix": folder}
+            if prune:
+                kwargs["Delimiter"] = "/"
+            sub_folders = []
+            for page in self.__timed_pages(paginator.paginate(**kwargs), bucket_name):
+                for obj in page.get("Contents", []):
+                    key = obj.get("Key")
+                    if not suffix or key.endswith(suffix):
+                        yield key
+                for common in page.get("CommonPrefixes", []):
+                    sub_folder = common.get("Prefix")
+                    if prune and not prune(sub_folder):
+                        sub_folders.append(sub_folder)
+            # Keep the sub folders in order when listing them depth first
+            folders.extend(reversed(sub_folders))
+
+    def __timed_pages(self, pages: Iterable[Dict[str, Any]], bucket_name: str):
+        """Record each page request of the paginator in the request metrics"""
+        pages = iter(pages)
+        while True:
+            with get_metrics().timed(SERVICE_S3, "LIST", bucket_name):
+                page = next(pages, None)
+            if page is None:
+                return
+            yield page
+
+    def __is_pruned(self, key: str, prefix: str, prune: Callable[[str], bool]) -> bool:
+        index = key.find("/", len(prefix))
+        while index >= 0:
+            if prune(key[:index + 1]):
+                return True
+            index = key.find("/", index + 1)
+        return False
+
+    def migrate_ownership(
+        self, bucket_name: str, prefix: Optional[str] = None,
+        delete_sidecars=False
+    ) -> List[str]:
+        """Migrate the product ownership of the files under prefix from the .prodinfo
+        sidecar files to the directory ownership indexes. The products in the sidecar
+        files will be merged into the existed indexes.
+            * If delete_sidecars is True, the sidecar files will be removed after
+            their folder indexes are written successfully.
+            * Return all sidecar files failed to migrate.
+        """
+        (keys, succeeded) = self.get_files(bucket_name, prefix, PROD_INFO_SUFFIX)
+        if not succeeded:
+            return []
+        sidecars = [k for k in keys if posixpath.basename(k) != OWNERSHIP_INDEX_FILE]
+        logger.info(
+            "[S3] Start migrating %d product info files in bucket %s",
+            len(sidecars), bucket_name
+        )
+        store = DirectoryOwnershipStore(self.__backend, self.__call, self.__get_limiter)
+        failed: List[str] = []
+
+        async def migrate(sidecar: str):
+            key = sidecar[:-len(PROD_INFO_SUFFIX)]
+            async with self.__get_limiter(bucket_name).slot():
+                try:
+                    prods = await store.read_sidecar(bucket_name, key)
+                    await store.merge_products(bucket_name, key, prods, source=sidecar)
+                except (ClientError, HTTPClientError, ValueError) as e:
+                    logger.error(
+                        "[S3] ERROR: Can not migrate product info file %s due to error: %s",
+                        sidecar, e
+                    )
+                    failed.append(sidecar)
+
+        async def flush():
+            failed.extend(await store.flush())
+
+        self.__run_tasks([migrate(sidecar) for sidecar in sidecars])
+        if self.__dry_run:
+            logger.info("[S3] Migrated %d product info files in bucket %s",
+                        len(sidecars) - len(failed), bucket_name)
+            return failed
+        self.__run_tasks([flush()])
+        if delete_sidecars:
+            migrated = {k: k for k in sidecars if k not in failed}
+            failed.extend(self.__batch_delete(bucket_name, migrated))
+        logger.info("[S3] Migrated %d product info files in bucket %s",
+                    len(sidecars) - len(failed), bucket_name)
+        return failed
 
     def read_file_content(self, bucket_name: str, key: str) -> str:
         bucket = self.__get_bucket(bucket_name)
         file_object = bucket.Object(key)
-        return str(file_object.get()['Body'].read(), 'utf-8')
+        with get_metrics().timed(SERVICE_S3, "GET", bucket_name) as m:
+            content = file_object.get()['Body'].read()
+            m["received"] = len(content)
+        return str(content, 'utf-8')
+
+    def read_files_concurrently(
+        self, bucket_name: str, keys: List[str],
+        handler: Callable[[str, Optional[str], bool], None]
+    ):
+        """Read the contents of the keys concurrently like read_file_content,
+        and the requests are bounded by the limiter of the bucket.
+            * handler is called with the key, its content and if the reading
+            is succeeded as soon as each key is read. The content is None if
+            the key does not exist or it is failed to read.
+            * The errors raised by handler will stop all the readings.
+        """
+        async def handle(key: str):
+            content = None
+            success = True
+            try:
+                async with self.__get_limiter(bucket_name).slot():
+                    data = await self.__call(
+                        self.__backend.get_object_content, Bucket=bucket_name, Key=key
+                    )
+                content = str(data, 'utf-8')
+            except (ClientError, HTTPClientError) as e:
+                if not isinstance(e, ClientError) or \
+                        e.response["Error"]["Code"] not in ["404", "NoSuchKey"]:
+                    logger.error(
+                        "[S3] ERROR: Can not read file %s in bucket %s due to error: %s",
+                        key, bucket_name, e
+                    )
+                    success = False
+            handler(key, content, success)
+
+        self.__run_tasks([dispatch(
+            keys, handle, workers=self.__con_limit, name="files reading"
+        )])
+
+    def files_exist(self, bucket_name: str, keys: List[str]) -> Dict[str, bool]:
+        """Check the existence of the keys concurrently like file_exists_in_bucket.
+        The errors of the checking will be raised to the caller.
+        """
+        results: Dict[str, bool] = {}
+
+        async def check(key: str):
+            existed = self.__snapshot.exists(bucket_name, key) if self.__snapshot else None
+            if existed is None:
+                async with self.__get_limiter(bucket_name).slot():
+                    existed = await self.__head_object(bucket_name, key) is not None
+            results[key] = existed
+
+        self.__run_tasks([dispatch(
+            keys, check, workers=self.__con_limit, name="files checking"
+        )])
+        return results
 
     def download_file(self, bucket_name: str, key: str, file_path: str):
         bucket = self.__get_bucket(bucket_name)
-        bucket.download_file(key, file_path)
+        with get_metrics().timed(SERVICE_S3, "GET", bucket_name) as m:
+            bucket.download_file(key, file_path)
+            m["received"] = os.path.getsize(file_path)
 
     def list_folder_content(self, bucket_name: str, folder: str) -> List[str]:
         """List the content in folder in an s3 bucket. Note it's not recursive,
            which means the content only contains the items in that folder, but
            not in its subfolders.
         """
-        bucket = self.__get_bucket(bucket_name)
-
+        if self.__snapshot:
+            cached = self.__snapshot.list_folder(bucket_name, folder)
+            if cached is not None:
+                return cached
         try:
-            paginator = bucket.meta.client.get_paginator('list_objects_v2')
-            if not folder or folder.strip() == "/" or folder.strip() == "":
-                pages = paginator.paginate(
-                    Bucket=bucket.name,
-                    Delimiter='/'
-                )
-            else:
-                prefix = folder if folder.endswith("/") else folder+"/"
-                pages = paginator.paginate(
-                    Bucket=bucket.name,
-                    Prefix=prefix,
-                    Delimiter='/'
-                )
-
+            (files, folders) = self.__run_for_result(
+                self.__list_level(bucket_name, folder_prefix(folder), delimiter=True)
+            )
         except (ClientError, HTTPClientError) as e:
             logger.error("[S3] ERROR: Can not get contents of %s from bucket"
                          " %s due to error: %s ", folder,
                          bucket_name, e)
             return []
 
-        contents = []
-        for page in pages:
-            folders = page.get("CommonPrefixes")
-            if folders:
-                contents.extend([f.get("Prefix") for f in folders])
-            files = page.get("Contents")
-            if files:
-                contents.extend([f.get("Key") for f in files])
+        contents = folders + files
+        if self.__snapshot:
+            self.__snapshot.add_folder(bucket_name, folder_prefix(folder), contents)
         return contents
 
     def file_exists_in_bucket(
         self, bucket_name: str, path: str
     ) -> bool:
+        if self.__snapshot:
+            existed = self.__snapshot.exists(bucket_name, path)
+            if existed is not None:
+                return existed
         bucket = self.__get_bucket(bucket_name)
         file_object = bucket.Object(path)
         return self.__file_exists(file_object)
@@ -848,118 +1514,594 @@ class S3Client(object):
             self.__lock.release()
 
     def __file_exists(self, file_object) -> bool:
+        start = time.monotonic()
         try:
             file_object.load()
+            get_metrics().record(
+                SERVICE_S3, "HEAD", file_object.bucket_name, time.monotonic() - start
+            )
             return True
         except (ClientError, HTTPClientError) as e:
-            if isinstance(e, ClientError) and e.response["Error"]["Code"] == "404":
+            not_found = isinstance(e, ClientError) and e.response["Error"]["Code"] == "404"
+            get_metrics().record(
+                SERVICE_S3, "HEAD", file_object.bucket_name, time.monotonic() - start,
+                error=not not_found
+            )
+            if not_found:
                 return False
             else:
                 raise e
 
-    def __get_prod_info(
+    def __build_listing_index(
+        self, file_paths: List[str],
+        targets: List[Tuple[str, str]], root="/"
+    ):
+        """List all folders which will be touched by the file_paths in all targets, and
+        cache the found keys with their size and ETag. Each folder is listed only once
+        with delimiter, so sub folders will not be included in the listing.
+        """
+        slash_root = root if root.endswith("/") else root + "/"
+        folders = set()
+        for full_path in file_paths:
+            path = full_path
+            if path.startswith(slash_root):
+                path = path[len(slash_root):]
+            folder = posixpath.dirname(path)
+            # Files in the top level folder will still use HEAD for checking, as
+            # listing of top level folder may be very expensive.
+            if folder:
+                folders.add(folder)
+
+        async def index_folder(bucket_name: str, folder: str):
+            async with self.__get_limiter(bucket_name).slot():
+                try:
+                    entries = await self.__list_folder_objects(bucket_name, folder)
+                except (ClientError, HTTPClientError) as e:
+                    logger.warning(
+                        "[S3] Warning: Can not list folder %s in bucket %s for indexing, "
+                        "will use HEAD for existence checking. Error: %s",
+                        folder, bucket_name, e
+                    )
+                    return
+                bucket_index = self.__listing_index.setdefault(bucket_name, {})
+                bucket_index[folder] = entries
+
+        tasks = []
+        for (bucket_name, key_prefix) in targets:
+            bucket_index = self.__listing_index.get(bucket_name, {})
+            for folder in folders:
+                prefixed_folder = posixpath.join(key_prefix, folder) if key_prefix else folder
+                if prefixed_folder not in bucket_index:
+                    tasks.append(index_folder(bucket_name, prefixed_folder))
+        logger.info("[S3] Start listing %d folders for existence index", len(tasks))
+        self.__run_tasks(tasks)
+        logger.info("[S3] Folders listing for existence index done")
+
+    def __preflight_check(
+        self, file_paths: List[str],
+        targets: List[Tuple[str, str]],
+        reader: LocalFileReader, root="/"
+    ) -> List[str]:
+        """Compare the local files with the existed ones in the listing index of all
+        targets, and return the files which conflict with the existed ones. The ETag
+        of a single-part object is the MD5 of its content, so an equal ETag means the
+        file is not changed. Otherwise, like multipart objects, the sha1 checksum
+        metadata is used to decide the conflict.
+        """
+        slash_root = root if root.endswith("/") else root + "/"
+        conflicts: Set[str] = set()
+
+        async def check_file(full_path: str, path: str):
+            md5 = None
+            for (bucket_name, key_prefix) in targets:
+                key = posixpath.join(key_prefix, path) if key_prefix else path
+                entries = self.__listing_index.get(bucket_name, {}).get(posixpath.dirname(key))
+                if not entries or key not in entries:
+                    continue
+                etag = entries[key][1]
+                if etag and "-" not in etag:
+                    if md5 is None:
+                        md5 = reader.digest(full_path, HashType.MD5)
+                    if etag == md5:
+                        self.__preflight_verified.setdefault(bucket_name, set()).add(key)
+                        continue
+                async with self.__get_limiter(bucket_name).slot():
+                    try:
+                        head = await self.__head_object(bucket_name, key)
+                    except (ClientError, HTTPClientError) as e:
+                        logger.warning(
+                            "[S3] Warning: Can not check file %s in bucket %s in "
+                            "pre-flight check, error: %s", key, bucket_name, e
+                        )
+                        continue
+                if head is None:
+                    continue
+                checksum = head.get("Metadata", {}).get(CHECKSUM_META_KEY, "").strip()
+                if checksum != "" and checksum != reader.read_sha1(full_path):
+                    logger.error(
+                        "[S3] Conflict: the file %s is different from the one in bucket %s",
+                        key, bucket_name
+                    )
+                    conflicts.add(full_path)
+                else:
+                    self.__preflight_verified.setdefault(bucket_name, set()).add(key)
+
+        async def handle(full_path: str):
+            path = full_path
+            if path.startswith(slash_root):
+                path = path[len(slash_root):]
+            await check_file(full_path, path)
+
+        local_files = [f for f in file_paths if reader.is_file(f)]
+        logger.info("[S3] Start pre-flight check for %d files", len(local_files))
+        self.__run_tasks([dispatch(
+            local_files, handle, workers=self.__con_limit,
+            name="files", report_every=FILE_REPORT_LIMIT
+        )])
+        logger.info("[S3] Pre-flight check done, %d conflicts found", len(conflicts))
+        return sorted(conflicts)
+
+    async def __list_tree(self, bucket_name: str, prefix: str, depth: int) -> List[str]:
+        """List all keys under the prefix. If there are more than one page of keys,
+        the rest of the prefix is listed with delimiter to discover the sub folders,
+        which are listed concurrently down to depth levels. The keys are returned
+        in key order.
+        """
+        if depth <= 0:
+            return (await self.__list_level(bucket_name, prefix, delimiter=False))[0]
+        (first_keys, _, truncated, _) = await self.__list_page(
+            bucket_name, prefix, delimiter=False
+        )
+        if not truncated:
+            return first_keys
+        # The first page is kept, so the folders which are listed completely in
+        # it are not listed again. Only the folder of its last key may be listed
+        # partially, which is not always returned in the listing after the key.
+        last = first_keys[-1]
+        (keys, folders) = await self.__list_level(
+            bucket_name, prefix, delimiter=True, start_after=last
+        )
+        sub_folders = set(folders)
+        if "/" in last[len(prefix):]:
+            sub_folders.add(prefix + last[len(prefix):].split("/")[0] + "/")
+        results = await asyncio.gather(*[
+            self.__list_tree(bucket_name, folder, depth - 1)
+            for folder in sorted(sub_folders)
+        ])
+        all_keys = set(first_keys)
+        all_keys.update(keys)
+        for sub_keys in results:
+            all_keys.update(sub_keys)
+        return sorted(all_keys)
+
+    async def __list_level(
+        self, bucket_name: str, prefix: str, delimiter: bool,
+        start_after: Optional[str] = None
+    ) -> Tuple[List[str], List[str]]:
+        """List the keys and sub folders (with delimiter) under the prefix after
+        start_after. If there are more than one page, the listing continues from
+        the first page, and the rest is split into key ranges at
+        PARTITION_BOUNDARIES which are listed concurrently.
+        """
+        (keys, folders, truncated, token) = await self.__list_page(
+            bucket_name, prefix, delimiter, start_after=start_after
+        )
+        if not truncated:
+            return (keys, folders)
+        last = max(keys[-1:] + folders[-1:])
+        bounds = [prefix + b for b in PARTITION_BOUNDARIES if prefix + b > last]
+        ranges: List[Tuple[Optional[str], Optional[str], Optional[str]]] = []
+        # The first range continues with the token, as the last item may be a
+        # sub folder, whose keys are rolled up again if listing after it
+        ranges.append((None, bounds[0] if bounds else None, token))
+        for (i, bound) in enumerate(bounds):
+            ranges.append((bound, bounds[i + 1] if i + 1 < len(bounds) else None, None))
+        results = await asyncio.gather(*[
+            self.__list_range(bucket_name, prefix, delimiter, start, end, token=range_token)
+            for (start, end, range_token) in ranges
+        ])
+        all_keys = set(keys)
+        all_folders = set(folders)
+        for (range_keys, range_folders) in results:
+            all_keys.update(range_keys)
+            all_folders.update(range_folders)
+        return (sorted(all_keys), sorted(all_folders))
+
+    async def __list_range(
+        self, bucket_name: str, prefix: str, delimiter: bool,
+        start: Optional[str], end: Optional[str], token: Optional[str] = None
+    ) -> Tuple[List[str], List[str]]:
+        """List the keys and sub folders in (start, end] under the prefix, or from
+        the continuation token if it is given.
+        """
+        keys: List[str] = []
+        folders: List[str] = []
+        while True:
+            (page_keys, page_folders, truncated, token) = await self.__list_page(
+                bucket_name, prefix, delimiter, start_after=start, token=token
+            )
+            keys.extend([k for k in page_keys if end is None or k <= end])
+            folders.extend([f for f in page_folders if end is None or f <= end])
+            page_last = max(page_keys[-1:] + page_folders[-1:], default=None)
+            if not truncated or (end is not None and page_last and page_last > end):
+                return (keys, folders)
+
+    async def __list_page(
+        self, bucket_name: str, prefix: str, delimiter: bool,
+        start_after: Optional[str] = None, token: Optional[str] = None
+    ) -> Tuple[List[str], List[str], bool, Optional[str]]:
+        """Send a single listing request, and return the keys, sub folders, if
+        the listing is truncated and the token for the next page.
+        """
+        kwargs: Dict[str, Any] = {
+            "Bucket": bucket_name, "Prefix": prefix, "MaxKeys": LIST_PAGE_SIZE
+        }
+        if delimiter:
+            kwargs["Delimiter"] = "/"
+        if token:
+            kwargs["ContinuationToken"] = token
+        elif start_after:
+            kwargs["StartAfter"] = start_after
+        async with self.__get_limiter(bucket_name).slot():
+            page = await self.__call(self.__backend.list_objects_page, **kwargs)
+        keys = [c.get("Key") for c in page.get("Contents", [])]
+        folders = [c.get("Prefix") for c in page.get("CommonPrefixes", [])]
+        return (
+            keys, folders, page.get("IsTruncated", False),
+            page.get("NextContinuationToken")
+        )
+
+    async def __list_folder_objects(
+        self, bucket_name: str, folder: str
+    ) -> Dict[str, Tuple[int, str]]:
+        pages = await self.__call(
+            self.__backend.list_objects,
+            Bucket=bucket_name,
+            Prefix=folder + "/",
+            Delimiter='/'
+        )
+        entries: Dict[str, Tuple[int, str]] = {}
+        for page in pages:
+            for f in page.get("Contents", []):
+                entries[f.get("Key")] = (f.get("Size", 0), f.get("ETag", "").strip('"'))
+        return entries
+
+    def __lookup_listing_index(self, bucket_name: str, key: str) -> Optional[bool]:
+        """Check the existence of the key through listing index. Will return None
+        if the folder of the key has not been indexed.
+        """
+        entries = self.__listing_index.get(bucket_name, {}).get(posixpath.dirname(key))
+        if entries is None:
+            return None
+        return key in entries
+
+    def __add_to_listing_index(self, bucket_name: str, key: str):
+        entries = self.__listing_index.get(bucket_name, {}).get(posixpath.dirname(key))
+        if entries is not None:
+            entries[key] = (0, "")
+
+    def __remove_from_listing_index(self, bucket_name: str, key: str):
+        entries = self.__listing_index.get(bucket_name, {}).get(posixpath.dirname(key))
+        if entries is not None:
+            entries.pop(key, None)
+
+    async def __head_indexed(
+        self, bucket_name: str, key: str
+    ) -> Tuple[bool, Dict[str, str]]:
+        """Check the existence of the key, and get its metadata if it exists.
+        The listing index will be used first if the folder of the key is indexed,
+        so only the hits need a HEAD request.
+        """
+        if key in self.__preflight_verified.get(bucket_name, ()):
+            # The content is the same as the local file, no need to check checksum
+            return (True, {})
+        if self.__lookup_listing_index(bucket_name, key) is False:
+            return (False, {})
+        # The hit needs the object metadata for checksum checking, so
+        # load it and confirm the existence at the same time.
+        head = await self.__head_object(bucket_name, key)
+        if head is None:
+            return (False, {})
+        return (True, head.get("Metadata", {}))
+
+    async def __head_object(
+        self, bucket_name: str, key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get the HEAD response of the key, or None if it does not exist"""
+        try:
+            return await self.__call(
+                self.__backend.head_object, Bucket=bucket_name, Key=key
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+                return None
+            raise e
+
+    async def __resume_done(
+        self, phase: str, bucket_name: str, key: str,
+        file_path: str, checksum: Optional[str]
+    ) -> bool:
+        """Check if the key is done with the same checksum in the upload journal.
+        The recorded products are set again, as the product ownership may not
+        be flushed before the interruption.
+        """
+        if not self.__journal:
+            return False
+        entry = self.__journal.get_done(phase, bucket_name, key)
+        if entry is None or entry.get("checksum") != checksum:
+            return False
+        prods = entry.get("prods")
+        if prods and not self.__dry_run:
+            await self.__update_prod_info(key, bucket_name, prods, source=file_path)
+        return True
+
+    def __journal_record(
+        self, phase: str, bucket_name: str, key: str,
+        prods: Optional[List[str]] = None, checksum: Optional[str] = None
+    ):
+        if self.__journal and not self.__dry_run:
+            self.__journal.record(phase, bucket_name, key, prods, checksum)
+
+    def __journal_finish(self, phase: str, bucket_name: str):
+        if self.__journal and not self.__dry_run:
+            self.__journal.finish_phase(phase, bucket_name)
+
+    async def __get_prod_info(
         self, file: str, bucket_name: str
     ) -> Tuple[List[str], bool]:
-        logger.debug("[S3] Getting product infomation for file %s", file)
-        prod_info_file = file + PROD_INFO_SUFFIX
-        try:
-            info_file_content = self.read_file_content(bucket_name, prod_info_file)
-            prods = [p.strip() for p in info_file_content.split("\n")]
-            logger.debug("[S3] Got product information as below %s", prods)
-            return (prods, True)
-        except (ClientError, HTTPClientError) as e:
-            logger.warning("[S3] WARN: Can not get product info for file %s "
-                           "due to error: %s", file, e)
-            return ([], False)
+        return await self.__ownership.get_products(bucket_name, file)
 
     async def __update_prod_info(
-        self, file: str, bucket_name: str, prods: List[str]
+        self, file: str, bucket_name: str, prods: List[str],
+        source: Optional[str] = None
     ) -> bool:
-        prod_info_file = file + PROD_INFO_SUFFIX
-        bucket = self.__get_bucket(bucket_name)
-        file_obj = bucket.Object(prod_info_file)
-        content_type = "text/plain"
-        if len(prods) > 0:
-            logger.debug("[S3] Updating product infomation for file %s "
-                         "with products: %s", file, prods)
-            try:
-                await self.__run_async(
-                    functools.partial(
-                        file_obj.put,
-                        Body="\n".join(prods).encode("utf-8"),
-                        ContentType=content_type
-                    )
-                )
-                logger.debug("[S3] Updated product infomation for file %s", file)
-                return True
-            except (ClientError, HTTPClientError) as e:
-                logger.warning("[S3] WARNING: Can not update product info for file %s "
-                               "due to error: %s", file, e)
-                return False
-        else:
-            logger.debug("[S3] Removing product infomation file for file %s "
-                         "because no products left", file)
-            try:
-                result = await self.__run_async(
-                    self.__file_exists,
-                    file_obj
-                )
-                if result:
-                    await self.__run_async(
-                        functools.partial(
-                            bucket.delete_objects,
-                            Delete={"Objects": [{"Key": prod_info_file}]}
-                        )
-                    )
-                    logger.debug("[S3] Removed product infomation file for file %s", file)
-                return True
-            except (ClientError, HTTPClientError) as e:
-                logger.warning("[S3] WARNING: Can not delete product info file for file %s "
-                               "due to error: %s", file, e)
-                return False
+        return await self.__ownership.set_products(bucket_name, file, prods, source)
 
-    def __path_handler_count_wrapper(
-        self,
-        path_handler: PATH_HANDLER_TYPE
-    ) -> PATH_HANDLER_TYPE:
-        async def wrapper(
-            full_file_path: str, path: str, index: int,
-            total: int, failed: List[str]
-        ):
-            try:
-                await path_handler(full_file_path, path, index, total, failed)
-            finally:
-                if index % FILE_REPORT_LIMIT == 0:
-                    logger.info("[S3] ######### %d/%d files finished", index, total)
-        return wrapper
+    def __flush_ownership(self, failed: List[str]) -> List[str]:
+        """Persist the product ownership changes of the phase, and add the files
+        whose ownership can not be persisted to the failed files.
+        """
+        if self.__dry_run or not self.__ownership.need_flush():
+            return failed
+        flush_failed: List[str] = []
+
+        async def flush():
+            flush_failed.extend(await self.__ownership.flush())
+
+        self.__run_tasks([flush()])
+        failed.extend([f for f in flush_failed if f not in failed])
+        return failed
 
     def __do_path_cut_and(
-        self, file_paths: List[str],
+        self, file_paths: Union[List[str], AsyncIterable[str]],
         path_handler: PATH_HANDLER_TYPE,
-        root="/"
+        root="/", bucket_name: Optional[str] = None
     ) -> List[str]:
+        """Run the path_handler for each of the file_paths. If the file_paths is
+        an async iterable, the total passed to the path_handler will be 0.
+        """
         slash_root = root
         if not root.endswith("/"):
             slash_root = slash_root + "/"
         failed_paths: List[str] = []
-        index = 1
-        file_paths_count = len(file_paths)
-        tasks = []
-        for full_path in file_paths:
-            path = full_path
-            if path.startswith(slash_root):
-                path = path[len(slash_root):]
-            tasks.append(
-                asyncio.ensure_future(
-                    path_handler(full_path, path, index, file_paths_count, failed_paths)
-                )
-            )
-            index += 1
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(asyncio.gather(*tasks))
+        def run(paths: Union[List[str], AsyncIterable[str]], workers: int):
+            total = len(paths) if isinstance(paths, list) else None
+            started = 0
+
+            async def handle(full_path: str):
+                nonlocal started
+                started += 1
+                HANDLING_FILE.set(full_path)
+                path = full_path
+                if path.startswith(slash_root):
+                    path = path[len(slash_root):]
+                await path_handler(full_path, path, started, total or 0, failed_paths)
+
+            self.__run_tasks([dispatch(
+                paths, handle, workers=workers,
+                total=total, name="files", report_every=FILE_REPORT_LIMIT
+            )])
+
+        limiter = self.__get_limiter(bucket_name) if bucket_name else None
+        if limiter:
+            limiter.reset_stats()
+            logger.info(
+                "[S3] Start processing %s files with concurrency %d for bucket %s",
+                len(file_paths) if isinstance(file_paths, list) else "streamed",
+                limiter.limit, bucket_name
+            )
+        # The handlers are run by at most con_limit workers, and the limiter
+        # of the bucket adapts the real concurrency of the requests below it
+        self.__transient_failed.clear()
+        run(file_paths, self.__con_limit)
+        # Files failed with permanent errors, like AccessDenied, will
+        # fail again, so only the ones which gave up on transient errors are re-driven
+        redrive_paths = [
+            p for p in dict.fromkeys(failed_paths) if p in self.__transient_failed
+        ]
+        if redrive_paths and self.__redrive_enabled:
+            failed_paths[:] = [p for p in failed_paths if p not in self.__transient_failed]
+            permanent = len(failed_paths)
+            workers = max(1, self.__con_limit // REDRIVE_CONCURRENCY_FACTOR)
+            logger.info(
+                "[S3] Re-driving %d failed files with concurrency %d",
+                len(redrive_paths), workers
+            )
+            run(redrive_paths, workers)
+            recovered = len(redrive_paths) - len(set(failed_paths[permanent:]))
+            self.__retry_stats["redriven"] += len(redrive_paths)
+            self.__retry_stats["recovered"] += recovered
+            logger.info(
+                "[S3] Re-drive done, %d of %d files are recovered",
+                recovered, len(redrive_paths)
+            )
+        if limiter:
+            logger.info(
+                "[S3] Processing done with concurrency %d for bucket %s "
+                "(lowest: %d, highest: %d, throttled requests: %d)",
+                limiter.limit, bucket_name, limiter.lowest,
+                limiter.highest, limiter.throttled
+            )
         return failed_paths
 
-    async def __run_async(self, fn: Callable, *args) -> Any:
+    def __get_limiter(self, bucket_name: str) -> AdaptiveLimiter:
+        self.__lock.acquire()
+        try:
+            limiter = self.__limiters.get(bucket_name)
+            if not limiter:
+                limiter = AdaptiveLimiter(
+                    bucket_name,
+                    initial=min(DEFAULT_CONCURRENCY, self.__con_limit),
+                    max_limit=self.__con_limit
+                )
+                self.__limiters[bucket_name] = limiter
+            return limiter
+        finally:
+            self.__lock.release()
+
+    async def __collect(self, items: AsyncIterable[str]) -> List[str]:
+        return [item async for item in items]
+
+    def __run_for_result(self, task: Awaitable[Any]) -> Any:
+        """Run a single task like __run_tasks, and return its result"""
+        results = []
+
+        async def run():
+            results.append(await task)
+
+        self.__run_tasks([run()])
+        return results[0]
+
+    def __run_tasks(self, tasks: List[Awaitable[Any]]):
+        """Run the tasks concurrently, the backend is opened if it is not yet"""
+        async def run():
+            await self.__backend.open()
+            await asyncio.gather(*tasks)
+
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, fn, *args)
+        loop.run_until_complete(run())
+
+    async def __call(
+        self, fn: Callable[..., Awaitable[Any]], size: Optional[int] = None, **kwargs
+    ) -> Any:
+        """Send a request through the backend, and report its latency or
+        throttling to the limiter of the current task. The request is retried
+        with jittered exponential backoff if it fails with a transient error.
+        Each attempt is recorded in the request metrics, size is the number of
+        bytes sent by the request if they are not in kwargs.
+        """
+        attempt = 0
+        while True:
+            limiter = current_limiter()
+            start = time.monotonic()
+            try:
+                result = await fn(**kwargs)
+            except (
+                ClientError, HTTPClientError, BotoConnectionError, S3UploadFailedError
+            ) as e:
+                self.__record_metrics(fn, kwargs, size, None, time.monotonic() - start, True)
+                if limiter and isinstance(e, ClientError):
+                    if self.__is_throttling(e):
+                        limiter.on_throttle()
+                    else:
+                        limiter.on_success(time.monotonic() - start)
+                if not self.__is_transient(e):
+                    raise e
+                if attempt >= self.__retry_attempts:
+                    # Only the files which failed due to transient errors
+                    # are worth re-driving at the end of the phase
+                    handling = HANDLING_FILE.get()
+                    if handling:
+                        self.__transient_failed.add(handling)
+                    raise e
+                attempt += 1
+                self.__retry_stats["retries"] += 1
+                delay = random.uniform(
+                    0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt)
+                )
+                logger.warning(
+                    "[S3] Request %s failed due to error: %s, retrying (%d/%d) in %.2fs",
+                    getattr(fn, "__name__", "request"), e, attempt,
+                    self.__retry_attempts, delay
+                )
+                # The slot is not held in the backoff, or the retries would also
+                # take the concurrency reduced by the limiter
+                if limiter:
+                    await limiter.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+                continue
+            latency = time.monotonic() - start
+            if limiter:
+                limiter.on_success(latency)
+            self.__record_metrics(fn, kwargs, size, result, latency, False)
+            self.__record_write(fn, kwargs, result)
+            return result
+
+    def __record_metrics(
+        self, fn: Callable[..., Awaitable[Any]], kwargs: Dict[str, Any],
+        size: Optional[int], result: Any, latency: float, error: bool
+    ):
+        name = getattr(fn, "__name__", "request")
+        requests = 1
+        sent = 0
+        received = 0
+        if name in ("upload_file", "upload_fileobj"):
+            if size is None and "Filename" in kwargs:
+                size = os.path.getsize(kwargs["Filename"])
+            sent = size if size else 0
+            # The multipart uploading sends a request for each part, plus
+            # the creating and completing requests
+            if sent >= self.__transfer_config.multipart_threshold:
+                chunk_size = self.__transfer_config.multipart_chunksize
+                requests = -(-sent // chunk_size) + 2
+        elif name == "put_object":
+            body = kwargs.get("Body")
+            sent = len(body) if isinstance(body, (bytes, str)) else (size if size else 0)
+        elif name == "list_objects" and isinstance(result, list):
+            requests = max(1, len(result))
+        elif name == "get_object_content" and isinstance(result, (bytes, str)):
+            received = len(result)
+        elif name == "get_object" and isinstance(result, dict):
+            received = len(result.get("Body", b""))
+        get_metrics().record(
+            SERVICE_S3, OPERATION_TYPES.get(name, name.upper()), kwargs.get("Bucket"),
+            latency, requests=requests, sent=sent, received=received, error=error
+        )
+
+    def __record_write(self, fn: Callable[..., Awaitable[Any]], kwargs: Dict[str, Any], result):
+        """Keep the remote tree snapshot up to date with the succeeded writes"""
+        if not self.__snapshot:
+            return
+        name = getattr(fn, "__name__", "")
+        bucket_name = kwargs.get("Bucket", "")
+        if name in WRITE_REQUESTS:
+            self.__snapshot.put(bucket_name, kwargs.get("Key", ""))
+        elif name == "delete_object":
+            self.__snapshot.delete(bucket_name, kwargs.get("Key", ""))
+        elif name == "delete_objects":
+            errors = result.get("Errors", []) if result else []
+            error_keys = set(e.get("Key", "") for e in errors)
+            for obj in kwargs.get("Delete", {}).get("Objects", []):
+                if obj.get("Key") not in error_keys:
+                    self.__snapshot.delete(bucket_name, obj.get("Key"))
+
+    def __is_transient(self, error: BaseException) -> bool:
+        if isinstance(error, ClientError):
+            code = error.response.get("Error", {}).get("Code", "")
+            status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+            return self.__is_throttling(error) or code in TRANSIENT_ERROR_CODES \
+                or status >= 500
+        if isinstance(error, S3UploadFailedError):
+            # The transfer manager wraps the error of the failed request,
+            # like AccessDenied, which is classified by itself
+            cause = error.__cause__ or error.__context__
+            return cause is not None and self.__is_transient(cause)
+        # Connection, timeout and read errors
+        return isinstance(error, (BotoConnectionError, HTTPClientError, ReadTimeoutError))
+
+    def __is_throttling(self, error: ClientError) -> bool:
+        code = error.response.get("Error", {}).get("Code", "")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return code in THROTTLING_ERROR_CODES or status in [429, 503]
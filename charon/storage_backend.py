@@ -0,0 +1,385 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import asyncio
+import functools
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from boto3.s3.transfer import TransferConfig
+
+logger = logging.getLogger(__name__)
+
+BACKEND_THREADED = "threaded"
+BACKEND_AIOBOTOCORE = "aiobotocore"
+
+# S3 does not accept more parts than this in one multipart upload
+MAX_UPLOAD_PARTS = 10000
+
+
+class S3Backend(object):
+    """S3Backend is the transport used by S3Client to send the S3 requests
+    of the concurrent upload/delete handlers. All the request methods are
+    coroutines and accept the same keyword arguments as the boto3 S3 client.
+        * open will be called before each batch of concurrent requests, and
+        should do nothing if the backend is already opened. close will be
+        called when the S3Client is closed, so the backend can hold its
+        connections for all the requests of the client.
+    """
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def head_object(self, **kwargs) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def get_object_content(self, **kwargs) -> bytes:
+        raise NotImplementedError
+
+    async def get_object(self, **kwargs) -> Dict[str, Any]:
+        """Get the object, and return the response with its Body read as bytes"""
+        raise NotImplementedError
+
+    async def put_object(self, **kwargs) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def upload_file(
+        self, Filename: str, Bucket: str, Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None
+    ):
+        """Upload the file with multipart upload if it is larger than the
+        multipart_threshold of Config, and the parts will be uploaded in parallel.
+        """
+        raise NotImplementedError
+
+    async def upload_fileobj(
+        self, Fileobj: BinaryIO, Bucket: str, Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None
+    ):
+        """Upload the content of a file object with multipart upload. The file
+        object will be read sequentially, like the member of a zip archive.
+        """
+        raise NotImplementedError
+
+    async def copy(
+        self, CopySource: Dict[str, str], Bucket: str, Key: str
+    ):
+        raise NotImplementedError
+
+    async def delete_object(self, **kwargs) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def delete_objects(self, **kwargs) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def list_objects(self, **kwargs) -> List[Dict[str, Any]]:
+        """List objects with list_objects_v2, and return all the pages"""
+        raise NotImplementedError
+
+    async def list_objects_page(self, **kwargs) -> Dict[str, Any]:
+        """List objects with a single list_objects_v2 request, and return the page"""
+        raise NotImplementedError
+
+
+class ThreadedS3Backend(S3Backend):
+    """The S3Backend which runs the requests of a boto3 client in a thread pool.
+    This is the default backend, as it does not need any extra dependency.
+    """
+
+    def __init__(self, client, max_workers: int) -> None:
+        self.__client = client
+        self.__executor = ThreadPoolExecutor(max_workers)
+
+    async def head_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.__run(self.__client.head_object, **kwargs)
+
+    async def get_object_content(self, **kwargs) -> bytes:
+        def get_content():
+            return self.__client.get_object(**kwargs)['Body'].read()
+        return await self.__run(get_content)
+
+    async def get_object(self, **kwargs) -> Dict[str, Any]:
+        def get():
+            response = self.__client.get_object(**kwargs)
+            response['Body'] = response['Body'].read()
+            return response
+        return await self.__run(get)
+
+    async def put_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.__run(self.__client.put_object, **kwargs)
+
+    async def upload_file(
+        self, Filename: str, Bucket: str, Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None
+    ):
+        return await self.__run(
+            self.__client.upload_file,
+            Filename=Filename, Bucket=Bucket, Key=Key,
+            ExtraArgs=ExtraArgs, Config=Config
+        )
+
+    async def upload_fileobj(
+        self, Fileobj: BinaryIO, Bucket: str, Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None
+    ):
+        return await self.__run(
+            self.__client.upload_fileobj,
+            Fileobj=Fileobj, Bucket=Bucket, Key=Key,
+            ExtraArgs=ExtraArgs, Config=Config
+        )
+
+    async def copy(
+        self, CopySource: Dict[str, str], Bucket: str, Key: str
+    ):
+        return await self.__run(
+            self.__client.copy, CopySource=CopySource, Bucket=Bucket, Key=Key
+        )
+
+    async def delete_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.__run(self.__client.delete_object, **kwargs)
+
+    async def delete_objects(self, **kwargs) -> Dict[str, Any]:
+        return await self.__run(self.__client.delete_objects, **kwargs)
+
+    async def list_objects(self, **kwargs) -> List[Dict[str, Any]]:
+        def list_pages():
+            paginator = self.__client.get_paginator('list_objects_v2')
+            return list(paginator.paginate(**kwargs))
+        return await self.__run(list_pages)
+
+    async def list_objects_page(self, **kwargs) -> Dict[str, Any]:
+        return await self.__run(self.__client.list_objects_v2, **kwargs)
+
+    async def __run(self, fn, **kwargs) -> Any:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.__executor, functools.partial(fn, **kwargs)
+        )
+
+
+class AioS3Backend(S3Backend):
+    """The S3Backend which uses the native asyncio client of aiobotocore, so the
+    requests will be awaited directly instead of occupying a thread for each
+    of them. The connection pool of the client is sized to the max concurrency.
+    """
+
+    def __init__(
+        self, aws_profile=None, endpoint_url=None,
+        config=None, max_pool_connections=10
+    ) -> None:
+        from aiobotocore.config import AioConfig
+        from aiobotocore.session import get_session
+        self.__session = get_session()
+        if aws_profile:
+            self.__session.set_config_variable("profile", aws_profile)
+        s3_config = config.s3 if config else None
+        self.__config = AioConfig(
+            max_pool_connections=max_pool_connections, s3=s3_config
+        )
+        self.__endpoint_url = endpoint_url
+        self.__client_ctx = None
+        self.__client = None
+
+    async def open(self):
+        if self.__client is None:
+            self.__client_ctx = self.__session.create_client(
+                's3', endpoint_url=self.__endpoint_url, config=self.__config
+            )
+            self.__client = await self.__client_ctx.__aenter__()
+
+    async def close(self):
+        if self.__client_ctx is not None:
+            await self.__client_ctx.__aexit__(None, None, None)
+        self.__client_ctx = None
+        self.__client = None
+
+    async def head_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.__get_client().head_object(**kwargs)
+
+    async def get_object_content(self, **kwargs) -> bytes:
+        response = await self.__get_client().get_object(**kwargs)
+        async with response['Body'] as stream:
+            return await stream.read()
+
+    async def get_object(self, **kwargs) -> Dict[str, Any]:
+        response = await self.__get_client().get_object(**kwargs)
+        async with response['Body'] as stream:
+            response['Body'] = await stream.read()
+        return response
+
+    async def put_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.__get_client().put_object(**kwargs)
+
+    async def upload_file(
+        self, Filename: str, Bucket: str, Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None
+    ):
+        extra_args = ExtraArgs if ExtraArgs else {}
+        size = os.path.getsize(Filename)
+        if not Config or size < Config.multipart_threshold:
+            with open(Filename, "rb") as f:
+                return await self.__get_client().put_object(
+                    Bucket=Bucket, Key=Key, Body=f, **extra_args
+                )
+        return await self.__multipart_upload(Filename, Bucket, Key, extra_args, Config, size)
+
+    async def __multipart_upload(
+        self, filename: str, bucket: str, key: str,
+        extra_args: Dict[str, Any], config: TransferConfig, size: int
+    ):
+        client = self.__get_client()
+        chunk_size = max(config.multipart_chunksize, math.ceil(size / MAX_UPLOAD_PARTS))
+        upload = await client.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)
+        upload_id = upload["UploadId"]
+        sem = asyncio.Semaphore(config.max_concurrency)
+
+        async def upload_part(number: int, offset: int) -> Dict[str, Any]:
+            async with sem:
+                with open(filename, "rb") as f:
+                    f.seek(offset)
+                    data = f.read(chunk_size)
+                part = await client.upload_part(
+                    Bucket=bucket, Key=key, UploadId=upload_id,
+                    PartNumber=number, Body=data
+                )
+                return {"ETag": part["ETag"], "PartNumber": number}
+
+        try:
+            parts = await asyncio.gather(*[
+                upload_part(i, offset)
+                for i, offset in enumerate(range(0, size, chunk_size), start=1)
+            ])
+            return await client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
+        except Exception as e:
+            logger.warning(
+                "[S3] Warning: Multipart upload of %s failed, aborting it. Error: %s", key, e
+            )
+            await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise e
+
+    async def upload_fileobj(
+        self, Fileobj: BinaryIO, Bucket: str, Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Config: Optional[TransferConfig] = None
+    ):
+        config = Config if Config else TransferConfig()
+        client = self.__get_client()
+        extra_args = ExtraArgs if ExtraArgs else {}
+        upload = await client.create_multipart_upload(Bucket=Bucket, Key=Key, **extra_args)
+        upload_id = upload["UploadId"]
+        # The parts are read one by one, and at most max_concurrency parts
+        # are kept in memory for uploading
+        sem = asyncio.Semaphore(config.max_concurrency)
+
+        async def upload_part(number: int, data: bytes) -> Dict[str, Any]:
+            try:
+                part = await client.upload_part(
+                    Bucket=Bucket, Key=Key, UploadId=upload_id,
+                    PartNumber=number, Body=data
+                )
+                return {"ETag": part["ETag"], "PartNumber": number}
+            finally:
+                sem.release()
+
+        tasks = []
+        try:
+            while True:
+                await sem.acquire()
+                data = Fileobj.read(config.multipart_chunksize)
+                if not data:
+                    sem.release()
+                    break
+                tasks.append(asyncio.ensure_future(upload_part(len(tasks) + 1, data)))
+            parts = await asyncio.gather(*tasks)
+            return await client.complete_multipart_upload(
+                Bucket=Bucket, Key=Key, UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)}
+            )
+        except Exception as e:
+            logger.warning(
+                "[S3] Warning: Multipart upload of %s failed, aborting it. Error: %s", Key, e
+            )
+            for task in tasks:
+                task.cancel()
+            await client.abort_multipart_upload(Bucket=Bucket, Key=Key, UploadId=upload_id)
+            raise e
+
+    async def copy(
+        self, CopySource: Dict[str, str], Bucket: str, Key: str
+    ):
+        return await self.__get_client().copy_object(
+            CopySource=CopySource, Bucket=Bucket, Key=Key
+        )
+
+    async def delete_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.__get_client().delete_object(**kwargs)
+
+    async def delete_objects(self, **kwargs) -> Dict[str, Any]:
+        return await self.__get_client().delete_objects(**kwargs)
+
+    async def list_objects(self, **kwargs) -> List[Dict[str, Any]]:
+        paginator = self.__get_client().get_paginator('list_objects_v2')
+        return [page async for page in paginator.paginate(**kwargs)]
+
+    async def list_objects_page(self, **kwargs) -> Dict[str, Any]:
+        return await self.__get_client().list_objects_v2(**kwargs)
+
+    def __get_client(self):
+        if self.__client is None:
+            raise RuntimeError("The aiobotocore backend is used before opened")
+        return self.__client
+
+
+def init_backend(
+    backend_type: str, resource,
+    aws_profile=None, endpoint_url=None,
+    config=None, max_concurrency=10
+) -> S3Backend:
+    """Create the S3Backend for the backend_type. The threaded backend
+    will be used if the type is unknown or aiobotocore is not installed.
+    """
+    if backend_type == BACKEND_AIOBOTOCORE:
+        try:
+            backend = AioS3Backend(
+                aws_profile=aws_profile, endpoint_url=endpoint_url,
+                config=config, max_pool_connections=max_concurrency
+            )
+            logger.info("[S3] Using aiobotocore backend for S3 requests")
+            return backend
+        except ImportError:
+            logger.warning(
+                "[S3] Warning: aiobotocore is not installed, will fall back "
+                "to threaded backend for S3 requests"
+            )
+    elif backend_type and backend_type != BACKEND_THREADED:
+        logger.warning(
+            "[S3] Warning: Unknown S3 backend %s, will use threaded backend",
+            backend_type
+        )
+    return ThreadedS3Backend(resource.meta.client, max_concurrency)
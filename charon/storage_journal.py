@@ -0,0 +1,140 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = "journal"
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+PHASE_FILES = "files"
+PHASE_METADATA = "metadata"
+PHASE_SIGNATURES = "signatures"
+
+
+def get_journal_path(prod_key: str) -> str:
+    """The journal of a product is stored in $HOME/.charon/journal. It can not be
+    stored in the work dir or the temporary directory of the uploading, as they
+    will be removed when the uploading exits, even if it is interrupted.
+    """
+    journal_dir = os.path.join(os.getenv("HOME", ""), ".charon", JOURNAL_DIR)
+    return os.path.join(journal_dir, prod_key + JOURNAL_SUFFIX)
+
+
+class UploadJournal(object):
+    """UploadJournal records the completed work of an uploading into an
+    append-only JSONL file, so an interrupted uploading can be resumed
+    without checking all the finished files in S3 again.
+        * Each completed key is recorded with its phase, bucket, the products
+        which own it and the checksum of its content. The finished phase of a
+        bucket is recorded when all of its keys are done and the product
+        ownership is flushed.
+        * If resume is False, the existing journal will be discarded.
+    """
+
+    def __init__(self, path: str, resume=False) -> None:
+        self.__path = path
+        self.__lock = threading.Lock()
+        # (phase, bucket) -> key -> entry
+        self.__keys: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        self.__phases: Set[Tuple[str, str]] = set()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if resume:
+            self.__load()
+        elif os.path.exists(path):
+            os.remove(path)
+        self.__file = open(path, "a", encoding="utf-8")
+
+    def __load(self):
+        if not os.path.isfile(self.__path):
+            logger.info("No upload journal found in %s, will start from beginning",
+                        self.__path)
+            return
+        valid_lines: List[str] = []
+        broken = False
+        with open(self.__path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    phase = (entry["phase"], entry["bucket"])
+                    if entry.get("done"):
+                        self.__phases.add(phase)
+                    else:
+                        self.__keys.setdefault(phase, {})[entry["key"]] = entry
+                    valid_lines.append(line if line.endswith("\n") else line + "\n")
+                    broken = broken or not line.endswith("\n")
+                except (ValueError, KeyError, TypeError):
+                    # The last line may be broken if the uploading was killed
+                    logger.warning("Ignoring broken journal entry: %s", line.strip())
+                    broken = True
+        if broken:
+            # Rewrite the valid entries, or the new entries will be appended
+            # to the broken line and lost in the next resuming
+            tmp_path = self.__path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(valid_lines)
+            os.replace(tmp_path, self.__path)
+        logger.info(
+            "Resuming from upload journal %s, %d keys and %d phases are done",
+            self.__path, sum(len(v) for v in self.__keys.values()), len(self.__phases)
+        )
+
+    def path(self) -> str:
+        return self.__path
+
+    def get_done(self, phase: str, bucket_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get the entry of the key if it is done in the phase, or None if not.
+        The entry contains the "prods" and "checksum" which are recorded.
+        """
+        return self.__keys.get((phase, bucket_name), {}).get(key)
+
+    def is_phase_done(self, phase: str, bucket_name: str) -> bool:
+        return (phase, bucket_name) in self.__phases
+
+    def record(
+        self, phase: str, bucket_name: str, key: str,
+        prods: Optional[List[str]] = None, checksum: Optional[str] = None
+    ):
+        entry = {
+            "phase": phase, "bucket": bucket_name, "key": key,
+            "prods": prods if prods else [], "checksum": checksum
+        }
+        self.__keys.setdefault((phase, bucket_name), {})[key] = entry
+        self.__write(entry)
+
+    def finish_phase(self, phase: str, bucket_name: str):
+        self.__phases.add((phase, bucket_name))
+        self.__write({"phase": phase, "bucket": bucket_name, "done": True})
+
+    def __write(self, entry: Dict):
+        with self.__lock:
+            self.__file.write(json.dumps(entry) + "\n")
+            self.__file.flush()
+
+    def close(self):
+        with self.__lock:
+            if not self.__file.closed:
+                self.__file.close()
+
+    def clear(self):
+        """Remove the journal after the whole uploading is succeeded"""
+        self.close()
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
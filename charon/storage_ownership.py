@@ -0,0 +1,505 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import asyncio
+import copy
+import json
+import logging
+import posixpath
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import botocore
+from botocore.errorfactory import ClientError
+from botocore.exceptions import HTTPClientError, ParamValidationError
+
+from charon.constants import PROD_INFO_SUFFIX, OWNERSHIP_INDEX_FILE
+from charon.storage_backend import S3Backend
+from charon.utils.limiter import AdaptiveLimiter
+
+logger = logging.getLogger(__name__)
+
+OWNERSHIP_SIDECAR = "sidecar"
+OWNERSHIP_DIRECTORY = "directory"
+
+# The directory index is written again after merging the changes of others
+# at most MAX_INDEX_CONFLICTS times, if its conditional write keeps failing
+MAX_INDEX_CONFLICTS = 5
+# The first botocore which supports IfMatch of put_object and delete_object
+MIN_BOTOCORE_VERSION = "1.35.69"
+INDEX_CONFLICT_CODES = [
+    "PreconditionFailed", "412", "ConditionalRequestConflict", "409", "NoSuchKey"
+]
+
+REQUEST_TYPE = Callable[..., Awaitable[Any]]
+LIMITER_GETTER_TYPE = Callable[[str], AdaptiveLimiter]
+
+
+class OwnershipStore(object):
+    """OwnershipStore stores the products which own each file in the bucket.
+    The S3Client will use it to decide if a file can be really removed when
+    a product is deleted.
+        * request is used to send the requests through the S3 backend, like
+        request(backend.put_object, Bucket=..., Key=..., ...)
+        * Changes may be kept in memory until flush is called, which will be
+        done at the end of each uploading or deleting phase of the S3Client.
+    """
+
+    def __init__(
+        self, backend: S3Backend, request: REQUEST_TYPE,
+        limiter_getter: LIMITER_GETTER_TYPE
+    ) -> None:
+        self.backend = backend
+        self.request = request
+        self.limiter_getter = limiter_getter
+
+    async def get_products(self, bucket_name: str, key: str) -> Tuple[List[str], bool]:
+        """Get the products of the file, and if they are got without error"""
+        raise NotImplementedError
+
+    async def set_products(
+        self, bucket_name: str, key: str, prods: List[str],
+        source: Optional[str] = None
+    ) -> bool:
+        """Set the products of the file. Empty prods means the ownership of the
+        file will be removed. The source is the local file which will be
+        reported if the change fails to be flushed.
+        """
+        raise NotImplementedError
+
+    def removal_keys(self, key: str) -> List[str]:
+        """The keys which should be deleted together with the file"""
+        return []
+
+    async def forget(self, bucket_name: str, key: str):
+        """Remove the ownership of the file which has been deleted"""
+        pass
+
+    def need_flush(self) -> bool:
+        return False
+
+    async def flush(self) -> List[str]:
+        """Persist all changes, and return the sources failed to be persisted"""
+        return []
+
+    async def read_sidecar(self, bucket_name: str, key: str) -> List[str]:
+        content = await self.request(
+            self.backend.get_object_content,
+            Bucket=bucket_name, Key=key + PROD_INFO_SUFFIX
+        )
+        return [p.strip() for p in str(content, 'utf-8').split("\n") if p.strip() != ""]
+
+
+class SidecarOwnershipStore(OwnershipStore):
+    """The OwnershipStore which stores the products of each file in a
+    separate <key>.prodinfo file. This is the default store.
+    """
+
+    async def get_products(self, bucket_name: str, key: str) -> Tuple[List[str], bool]:
+        logger.debug("[S3] Getting product infomation for file %s", key)
+        try:
+            prods = await self.read_sidecar(bucket_name, key)
+            logger.debug("[S3] Got product information as below %s", prods)
+            return (prods, True)
+        except (ClientError, HTTPClientError) as e:
+            logger.warning("[S3] WARN: Can not get product info for file %s "
+                           "due to error: %s", key, e)
+            return ([], False)
+
+    async def set_products(
+        self, bucket_name: str, key: str, prods: List[str],
+        source: Optional[str] = None
+    ) -> bool:
+        prod_info_file = key + PROD_INFO_SUFFIX
+        if len(prods) > 0:
+            logger.debug("[S3] Updating product infomation for file %s "
+                         "with products: %s", key, prods)
+            try:
+                await self.request(
+                    self.backend.put_object,
+                    Bucket=bucket_name,
+                    Key=prod_info_file,
+                    Body="\n".join(prods).encode("utf-8"),
+                    ContentType="text/plain"
+                )
+                logger.debug("[S3] Updated product infomation for file %s", key)
+                return True
+            except (ClientError, HTTPClientError) as e:
+                logger.warning("[S3] WARNING: Can not update product info for file %s "
+                               "due to error: %s", key, e)
+                return False
+        else:
+            logger.debug("[S3] Removing product infomation file for file %s "
+                         "because no products left", key)
+            try:
+                existed = True
+                try:
+                    await self.request(
+                        self.backend.head_object, Bucket=bucket_name, Key=prod_info_file
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in ["404", "NoSuchKey"]:
+                        raise e
+                    existed = False
+                if existed:
+                    await self.request(
+                        self.backend.delete_objects,
+                        Bucket=bucket_name,
+                        Delete={"Objects": [{"Key": prod_info_file}]}
+                    )
+                    logger.debug("[S3] Removed product infomation file for file %s", key)
+                return True
+            except (ClientError, HTTPClientError) as e:
+                logger.warning("[S3] WARNING: Can not delete product info file for file %s "
+                               "due to error: %s", key, e)
+                return False
+
+    def removal_keys(self, key: str) -> List[str]:
+        return [key + PROD_INFO_SUFFIX]
+
+
+class CachedOwnershipStore(OwnershipStore):
+    """The OwnershipStore which wraps another store with a run-scoped cache.
+        * The products got from the wrapped store are memoized, so the same
+        file will not be read again in the same run.
+        * The updates are kept in memory, and only the final products of each
+        file will be written to the wrapped store when flushing, concurrently.
+    """
+
+    def __init__(self, store: OwnershipStore) -> None:
+        super().__init__(store.backend, store.request, store.limiter_getter)
+        self.__store = store
+        # (bucket, key) -> products
+        self.__cache: Dict[Tuple[str, str], List[str]] = {}
+        # (bucket, key) -> sources of the updates not flushed
+        self.__pending: Dict[Tuple[str, str], List[str]] = {}
+
+    async def get_products(self, bucket_name: str, key: str) -> Tuple[List[str], bool]:
+        prods = self.__cache.get((bucket_name, key))
+        if prods is not None:
+            return (list(prods), True)
+        (prods, no_error) = await self.__store.get_products(bucket_name, key)
+        if no_error:
+            self.__cache[(bucket_name, key)] = list(prods)
+        return (prods, no_error)
+
+    async def set_products(
+        self, bucket_name: str, key: str, prods: List[str],
+        source: Optional[str] = None
+    ) -> bool:
+        self.__cache[(bucket_name, key)] = list(prods)
+        sources = self.__pending.setdefault((bucket_name, key), [])
+        if source and source not in sources:
+            sources.append(source)
+        return True
+
+    def removal_keys(self, key: str) -> List[str]:
+        return self.__store.removal_keys(key)
+
+    async def forget(self, bucket_name: str, key: str):
+        self.__cache.pop((bucket_name, key), None)
+        self.__pending.pop((bucket_name, key), None)
+        await self.__store.forget(bucket_name, key)
+
+    def need_flush(self) -> bool:
+        return len(self.__pending) > 0 or self.__store.need_flush()
+
+    async def flush(self) -> List[str]:
+        pending = self.__pending
+        self.__pending = {}
+        failed: List[str] = []
+
+        async def flush_products(bucket_name: str, key: str, sources: List[str]):
+            prods = self.__cache.get((bucket_name, key), [])
+            async with self.limiter_getter(bucket_name).slot():
+                updated = await self.__store.set_products(bucket_name, key, prods)
+            if not updated:
+                self.__cache.pop((bucket_name, key), None)
+                failed.extend([s for s in sources if s not in failed])
+
+        if pending:
+            logger.info("[S3] Flushing product information of %d files", len(pending))
+        await asyncio.gather(*[
+            flush_products(bucket_name, key, sources)
+            for ((bucket_name, key), sources) in pending.items()
+        ])
+        failed.extend([s for s in await self.__store.flush() if s not in failed])
+        return failed
+
+
+class DirectoryOwnershipStore(OwnershipStore):
+    """The OwnershipStore which stores the products of all files in a folder in
+    one JSON index file, named OWNERSHIP_INDEX_FILE in that folder, like
+        {"commons-lang3-3.12.0.jar": ["prod-1.0", "prod-2.0"], ...}
+    So the ownership of a whole version folder is read with one request, and
+    all changes of the folder are written with one request when flushing.
+        * For the files which are not in the index yet, their .prodinfo files
+        will be read and merged into the index, so sidecar files which are
+        not migrated are still respected.
+        * The index of a folder is loaded once and cached with its ETag, and
+        written back conditionally on that ETag. If it has been changed by
+        another charon process in between, the latest index will be re-read,
+        the local changes of each file will be merged into it and the write
+        will be retried, so concurrent processes do not override each other.
+        * An index which is not valid JSON will not be used or overridden, and
+        the files in its folder are handled like the ones whose product info
+        can not be read.
+    """
+
+    def __init__(
+        self, backend: S3Backend, request: REQUEST_TYPE,
+        limiter_getter: LIMITER_GETTER_TYPE
+    ) -> None:
+        super().__init__(backend, request, limiter_getter)
+        # (bucket, folder) -> file name -> products
+        self.__indexes: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+        # (bucket, folder) -> the index and its ETag when it was loaded or
+        # written, the ETag is None if the index did not exist
+        self.__bases: Dict[Tuple[str, str], Tuple[Dict[str, List[str]], Optional[str]]] = {}
+        # (bucket, folder) -> sources of the changes not flushed
+        self.__dirty: Dict[Tuple[str, str], List[str]] = {}
+        self.__locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    async def get_products(self, bucket_name: str, key: str) -> Tuple[List[str], bool]:
+        logger.debug("[S3] Getting product infomation for file %s", key)
+        try:
+            index = await self.__load(bucket_name, posixpath.dirname(key))
+        except (ClientError, HTTPClientError, ValueError) as e:
+            logger.warning("[S3] WARN: Can not get product info for file %s "
+                           "due to error: %s", key, e)
+            return ([], False)
+        name = posixpath.basename(key)
+        if name in index:
+            return (list(index[name]), True)
+        try:
+            prods = await self.read_sidecar(bucket_name, key)
+        except (ClientError, HTTPClientError) as e:
+            logger.warning("[S3] WARN: Can not get product info for file %s "
+                           "due to error: %s", key, e)
+            return ([], False)
+        logger.debug("[S3] Got product information from sidecar file as below %s", prods)
+        index[name] = prods
+        self.__mark_dirty(bucket_name, posixpath.dirname(key), None)
+        return (list(prods), True)
+
+    async def set_products(
+        self, bucket_name: str, key: str, prods: List[str],
+        source: Optional[str] = None
+    ) -> bool:
+        folder = posixpath.dirname(key)
+        try:
+            index = await self.__load(bucket_name, folder)
+        except (ClientError, HTTPClientError, ValueError) as e:
+            logger.warning("[S3] WARNING: Can not update product info for file %s "
+                           "due to error: %s", key, e)
+            return False
+        name = posixpath.basename(key)
+        if len(prods) > 0:
+            index[name] = list(prods)
+        else:
+            index.pop(name, None)
+        self.__mark_dirty(bucket_name, folder, source)
+        return True
+
+    async def merge_products(
+        self, bucket_name: str, key: str, prods: List[str],
+        source: Optional[str] = None
+    ) -> bool:
+        """Add the prods to the products of the file in the index"""
+        folder = posixpath.dirname(key)
+        index = await self.__load(bucket_name, folder)
+        name = posixpath.basename(key)
+        merged = index.get(name, [])
+        merged.extend([p for p in prods if p not in merged])
+        index[name] = merged
+        self.__mark_dirty(bucket_name, folder, source)
+        return True
+
+    def removal_keys(self, key: str) -> List[str]:
+        # Also clean up the sidecar file which may be left before migration
+        return [key + PROD_INFO_SUFFIX]
+
+    async def forget(self, bucket_name: str, key: str):
+        folder = posixpath.dirname(key)
+        index = self.__indexes.get((bucket_name, folder))
+        if index is not None and posixpath.basename(key) in index:
+            index.pop(posixpath.basename(key))
+            self.__mark_dirty(bucket_name, folder, None)
+
+    def need_flush(self) -> bool:
+        return len(self.__dirty) > 0
+
+    async def flush(self) -> List[str]:
+        dirty = self.__dirty
+        self.__dirty = {}
+        failed: List[str] = []
+
+        async def flush_index(bucket_name: str, folder: str, sources: List[str]):
+            cache_key = (bucket_name, folder)
+            index_key = posixpath.join(folder, OWNERSHIP_INDEX_FILE)
+            async with self.limiter_getter(bucket_name).slot():
+                try:
+                    conflicts = 0
+                    while not await self.__write(bucket_name, folder):
+                        conflicts += 1
+                        if conflicts > MAX_INDEX_CONFLICTS:
+                            raise ValueError(
+                                "the index is still changed by others after %d retries"
+                                % MAX_INDEX_CONFLICTS
+                            )
+                        logger.info(
+                            "[S3] Product ownership index %s is changed by others, "
+                            "merging the changes and retrying", index_key
+                        )
+                        await self.__rebase(bucket_name, folder)
+                    logger.debug("[S3] Updated product ownership index %s", index_key)
+                except (ClientError, HTTPClientError, ValueError) as e:
+                    logger.error("[S3] ERROR: Can not update product ownership index %s "
+                                 "in bucket %s due to error: %s", index_key, bucket_name, e)
+                    # Drop the cache, so it can be reloaded from the bucket next time
+                    self.__indexes.pop(cache_key, None)
+                    self.__bases.pop(cache_key, None)
+                    failed.extend([s for s in sources if s not in failed])
+
+        if dirty:
+            logger.info("[S3] Flushing %d product ownership indexes", len(dirty))
+        await asyncio.gather(*[
+            flush_index(bucket_name, folder, sources)
+            for ((bucket_name, folder), sources) in dirty.items()
+        ])
+        return failed
+
+    async def __write(self, bucket_name: str, folder: str) -> bool:
+        """Write the cached index of the folder if it is not changed since it
+        was loaded, and return False if it has been changed by others.
+        """
+        cache_key = (bucket_name, folder)
+        index = self.__indexes.get(cache_key, {})
+        (_, etag) = self.__bases.get(cache_key, ({}, None))
+        index_key = posixpath.join(folder, OWNERSHIP_INDEX_FILE)
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+        try:
+            if len(index) > 0:
+                response = await self.request(
+                    self.backend.put_object,
+                    Bucket=bucket_name,
+                    Key=index_key,
+                    Body=json.dumps(index, sort_keys=True).encode("utf-8"),
+                    ContentType="application/json",
+                    **condition
+                )
+                etag = response.get("ETag")
+            elif etag:
+                await self.request(
+                    self.backend.delete_object,
+                    Bucket=bucket_name, Key=index_key, IfMatch=etag
+                )
+                etag = None
+        except ClientError as e:
+            if e.response["Error"]["Code"] in INDEX_CONFLICT_CODES:
+                return False
+            raise e
+        except ParamValidationError as e:
+            raise ValueError(
+                "conditional writes of the index are not supported by botocore %s, "
+                "botocore>=%s is needed: %s" % (botocore.__version__, MIN_BOTOCORE_VERSION, e)
+            ) from e
+        self.__bases[cache_key] = (copy.deepcopy(index), etag)
+        return True
+
+    async def __rebase(self, bucket_name: str, folder: str):
+        """Re-read the index of the folder, and apply the local changes of each
+        file since the index was loaded to it.
+        """
+        cache_key = (bucket_name, folder)
+        index = self.__indexes.get(cache_key, {})
+        (base, _) = self.__bases.get(cache_key, ({}, None))
+        (latest, etag) = await self.__fetch(bucket_name, folder)
+        merged = copy.deepcopy(latest)
+        for name in set(base) | set(index):
+            old = base.get(name, [])
+            new = index.get(name, [])
+            if old == new:
+                continue
+            prods = [p for p in merged.get(name, []) if p not in old or p in new]
+            prods.extend([p for p in new if p not in old and p not in prods])
+            if len(prods) > 0:
+                merged[name] = prods
+            else:
+                merged.pop(name, None)
+        index.clear()
+        index.update(merged)
+        self.__indexes[cache_key] = index
+        self.__bases[cache_key] = (latest, etag)
+
+    async def __load(self, bucket_name: str, folder: str) -> Dict[str, List[str]]:
+        cache_key = (bucket_name, folder)
+        index = self.__indexes.get(cache_key)
+        if index is not None:
+            return index
+        lock = self.__locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            index = self.__indexes.get(cache_key)
+            if index is not None:
+                return index
+            (index, etag) = await self.__fetch(bucket_name, folder)
+            self.__bases[cache_key] = (copy.deepcopy(index), etag)
+            self.__indexes[cache_key] = index
+            return index
+
+    async def __fetch(
+        self, bucket_name: str, folder: str
+    ) -> Tuple[Dict[str, List[str]], Optional[str]]:
+        """Read the index of the folder with its ETag. ValueError will be
+        raised if the index is corrupted.
+        """
+        index_key = posixpath.join(folder, OWNERSHIP_INDEX_FILE)
+        try:
+            response = await self.request(
+                self.backend.get_object, Bucket=bucket_name, Key=index_key
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ["404", "NoSuchKey"]:
+                raise e
+            return ({}, None)
+        try:
+            index = json.loads(str(response["Body"], 'utf-8'))
+        except ValueError as e:
+            raise ValueError(
+                "product ownership index %s is corrupted: %s" % (index_key, e)
+            ) from e
+        if not isinstance(index, dict):
+            raise ValueError(
+                "product ownership index %s is not a JSON object" % index_key
+            )
+        return (index, response.get("ETag"))
+
+    def __mark_dirty(self, bucket_name: str, folder: str, source: Optional[str]):
+        sources = self.__dirty.setdefault((bucket_name, folder), [])
+        if source and source not in sources:
+            sources.append(source)
+
+
+def init_ownership_store(
+    store_type: Optional[str], backend: S3Backend,
+    request: REQUEST_TYPE, limiter_getter: LIMITER_GETTER_TYPE
+) -> OwnershipStore:
+    if store_type == OWNERSHIP_DIRECTORY:
+        logger.info("[S3] Using directory index to store the product ownership")
+        return DirectoryOwnershipStore(backend, request, limiter_getter)
+    if store_type and store_type != OWNERSHIP_SIDECAR:
+        logger.warning(
+            "[S3] Warning: Unknown ownership store %s, will use sidecar files", store_type
+        )
+    return CachedOwnershipStore(SidecarOwnershipStore(backend, request, limiter_getter))
@@ -0,0 +1,178 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def folder_prefix(folder: Optional[str]) -> str:
+    """Get the listing prefix of a folder, which ends with "/", or is
+    empty for the root folder.
+    """
+    if not folder or folder.strip() in ("", "/"):
+        return ""
+    return folder if folder.endswith("/") else folder + "/"
+
+
+class RemoteTreeSnapshot(object):
+    """RemoteTreeSnapshot caches the listings of the bucket prefixes taken
+    during a run, and keeps them up to date with the keys which are uploaded
+    or deleted by Charon, so the same prefix will not be listed twice.
+        * A tree is a recursive listing of a prefix ending with "/", which
+        can serve the listing of any prefix or folder under it.
+        * A folder is a listing with delimiter, which contains its keys and
+        its sub folder prefixes.
+        * None is returned for the prefixes which are not in the snapshot,
+        and the caller should list them from the bucket.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        # bucket -> prefix -> keys under the prefix
+        self.__trees: Dict[str, Dict[str, Set[str]]] = {}
+        # bucket -> folder prefix -> keys and sub folder prefixes in the folder
+        self.__folders: Dict[str, Dict[str, Set[str]]] = {}
+
+    def add_tree(self, bucket_name: str, prefix: str, keys: List[str]):
+        if prefix != "" and not prefix.endswith("/"):
+            # The listing of "a/b" also contains "a/bc/", which can not be
+            # kept up to date by key, so it is not cached
+            return
+        with self.__lock:
+            self.__trees.setdefault(bucket_name, {})[prefix] = set(keys)
+
+    def add_folder(self, bucket_name: str, folder: str, items: List[str]):
+        with self.__lock:
+            self.__folders.setdefault(bucket_name, {})[folder_prefix(folder)] = set(items)
+
+    def get_files(self, bucket_name: str, prefix: str) -> Optional[List[str]]:
+        """Get the keys under the prefix, or None if the prefix is not in any tree"""
+        with self.__lock:
+            tree = self.__covering_tree(bucket_name, prefix)
+            if tree is None:
+                return None
+            return sorted(k for k in tree if k.startswith(prefix))
+
+    def list_folder(self, bucket_name: str, folder: str) -> Optional[List[str]]:
+        """Get the content of the folder like a listing with delimiter, the sub
+        folders are listed before the keys. None is returned if the folder is
+        not in the snapshot.
+        """
+        prefix = folder_prefix(folder)
+        with self.__lock:
+            items = self.__folders.get(bucket_name, {}).get(prefix)
+            if items is None:
+                tree = self.__covering_tree(bucket_name, prefix)
+                if tree is None:
+                    return None
+                items = set()
+                for key in tree:
+                    if key.startswith(prefix):
+                        rest = key[len(prefix):]
+                        if "/" in rest:
+                            items.add(prefix + rest[:rest.index("/") + 1])
+                        else:
+                            items.add(key)
+            sub_folders = sorted(i for i in items if i.endswith("/"))
+            return sub_folders + sorted(i for i in items if not i.endswith("/"))
+
+    def exists(self, bucket_name: str, key: str) -> Optional[bool]:
+        """Check if the key exists, or None if it is unknown in the snapshot"""
+        with self.__lock:
+            tree = self.__covering_tree(bucket_name, key)
+            if tree is not None:
+                return key in tree
+            items = self.__folders.get(bucket_name, {}).get(self.__parent(key))
+            if items is not None:
+                return key in items
+            return None
+
+    def put(self, bucket_name: str, key: str):
+        with self.__lock:
+            trees = self.__trees.get(bucket_name, {})
+            for prefix in self.__ancestors(key):
+                if prefix in trees:
+                    trees[prefix].add(key)
+            folders = self.__folders.get(bucket_name, {})
+            for (prefix, child) in self.__ancestor_children(key):
+                if prefix in folders:
+                    folders[prefix].add(child)
+
+    def delete(self, bucket_name: str, key: str):
+        with self.__lock:
+            trees = self.__trees.get(bucket_name, {})
+            for prefix in self.__ancestors(key):
+                if prefix in trees:
+                    trees[prefix].discard(key)
+            folders = self.__folders.get(bucket_name, {})
+            parent = self.__parent(key)
+            if parent in folders:
+                folders[parent].discard(key)
+            # The sub folders may be gone with the key, which are removed from
+            # their parent folders until a sub folder is known to be not empty.
+            # The parent listing is dropped if it can not be confirmed.
+            for (prefix, child) in self.__ancestor_children(key)[1:]:
+                empty = self.__is_empty(bucket_name, child)
+                if empty is False:
+                    break
+                if prefix in folders:
+                    if empty:
+                        folders[prefix].discard(child)
+                    else:
+                        del folders[prefix]
+
+    def __is_empty(self, bucket_name: str, prefix: str) -> Optional[bool]:
+        tree = self.__covering_tree(bucket_name, prefix)
+        if tree is not None:
+            return not any(k.startswith(prefix) for k in tree)
+        items = self.__folders.get(bucket_name, {}).get(prefix)
+        if items is not None:
+            return len(items) == 0
+        return None
+
+    def __covering_tree(self, bucket_name: str, prefix: str) -> Optional[Set[str]]:
+        trees = self.__trees.get(bucket_name, {})
+        if prefix in trees:
+            return trees[prefix]
+        for ancestor in self.__ancestors(prefix):
+            if ancestor in trees:
+                return trees[ancestor]
+        return None
+
+    def __parent(self, key: str) -> str:
+        return key[:key.rindex("/") + 1] if "/" in key else ""
+
+    def __ancestors(self, key: str) -> List[str]:
+        """Get the folder prefixes containing the key, from the nearest to the root"""
+        return [prefix for (prefix, _) in self.__ancestor_children(key)]
+
+    def __ancestor_children(self, key: str) -> List[Tuple[str, str]]:
+        """Get the folder prefixes containing the key from the nearest to the root,
+        with the item of each folder which leads to the key.
+        """
+        result = []
+        child = key
+        end = len(key.rstrip("/"))
+        while True:
+            index = key.rfind("/", 0, end)
+            prefix = key[:index + 1] if index >= 0 else ""
+            result.append((prefix, child))
+            if prefix == "":
+                return result
+            child = prefix
+            end = index
@@ -13,6 +13,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import base64
 import logging
 import os
 import sys
@@ -20,13 +21,12 @@ import tarfile
 import requests
 import tempfile
 import shutil
-import subresource_integrity
 from enum import Enum
 from json import load, JSONDecodeError, dump
-from typing import Tuple
-from zipfile import ZipFile, is_zipfile
+from typing import BinaryIO, Dict, Tuple
+from zipfile import ZipFile, ZipInfo, is_zipfile
 from charon.constants import DEFAULT_REGISTRY
-from charon.utils.files import digest, HashType
+from charon.utils.files import digest_fileobj, digest_multi, HashType, LocalFileReader
 from charon.utils.map import del_none
 
 logger = logging.getLogger(__name__)
@@ -46,6 +46,64 @@ def extract_zip_with_files(zf: ZipFile, target_dir: str, file_suffix: str, debug
     zf.extractall(target_dir, members=filtered)
 
 
+def zip_member_path(target_dir: str, member_name: str) -> str:
+    """The path of the zip member when it is extracted to target_dir, which is
+    sanitized in the same way as ZipFile.extract.
+    """
+    parts = [p for p in member_name.replace("\\", "/").split("/")
+             if p not in ("", ".", "..")]
+    return os.path.join(target_dir, *parts)
+
+
+class ZipMemberReader(LocalFileReader):
+    """ZipMemberReader reads the files from the members of the zip archive
+    without extracting them, the path of each member is the path it would be
+    extracted to under target_dir. The paths which are not members, like the
+    generated metadata files, are still read from local file system.
+    """
+
+    def __init__(self, zf: ZipFile, target_dir: str) -> None:
+        self.__zf = zf
+        self.__members: Dict[str, ZipInfo] = {}
+        for member in zf.infolist():
+            if not member.is_dir():
+                self.__members[zip_member_path(target_dir, member.filename)] = member
+
+    def members(self) -> Dict[str, ZipInfo]:
+        return self.__members
+
+    def is_file(self, path: str) -> bool:
+        return path in self.__members or super().is_file(path)
+
+    def on_disk(self, path: str) -> bool:
+        return path not in self.__members
+
+    def size(self, path: str) -> int:
+        member = self.__members.get(path)
+        return member.file_size if member else super().size(path)
+
+    def open(self, path: str) -> BinaryIO:
+        member = self.__members.get(path)
+        return self.__zf.open(member) if member else super().open(path)
+
+    def read_sha1(self, path: str) -> str:
+        if path not in self.__members:
+            return super().read_sha1(path)
+        # Same as files.read_sha1, the .sha1 file in the archive is used if existed
+        _, suffix = os.path.splitext(path)
+        if suffix not in [".md5", ".sha1", ".sha256", ".sha512"]:
+            sha1_member = self.__members.get(path + ".sha1")
+            if sha1_member:
+                return str(self.__zf.read(sha1_member), "utf-8").strip()
+        return self.digest(path)
+
+    def digest(self, path: str, hash_type=HashType.SHA1) -> str:
+        if path not in self.__members:
+            return super().digest(path, hash_type)
+        with self.open(path) as f:
+            return digest_fileobj(f, hash_type)
+
+
 def extract_npm_tarball(
     path: str, target_dir: str, is_for_upload: bool, pkg_root="package", registry=DEFAULT_REGISTRY
 ) -> Tuple[str, list]:
@@ -115,11 +173,12 @@ def __write_npm_version_dist(path: str, version_meta_extract_path: str, version_
                              tgz_relative_path: str, registry: str):
     dist = dict()
     dist["tarball"] = "".join(["https://", registry, "/", tgz_relative_path])
-    dist["shasum"] = digest(path, HashType.SHA1)
-    with open(path, "rb") as tarball:
-        tarball_data = tarball.read()
-        integrity = subresource_integrity.render(tarball_data, ['sha512'])
-        dist["integrity"] = integrity
+    checksums = digest_multi(path, [HashType.SHA1, HashType.SHA512])
+    dist["shasum"] = checksums[HashType.SHA1]
+    # Same as the subresource integrity of the tarball, without reading it into memory
+    dist["integrity"] = "sha512-" + str(
+        base64.b64encode(bytes.fromhex(checksums[HashType.SHA512])), "utf-8"
+    )
     version_data["dist"] = dist
     with open(version_meta_extract_path, mode='w', encoding='utf-8') as f:
         dump(del_none(version_data), f)
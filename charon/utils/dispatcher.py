@@ -0,0 +1,107 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import asyncio
+import logging
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 10
+# Report the progress after every REPORT_EVERY finished items
+REPORT_EVERY = 1000
+# The queue holds at most QUEUE_FACTOR items for each worker
+QUEUE_FACTOR = 2
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+async def dispatch(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    handler: Callable[[T], Awaitable[Any]],
+    workers=DEFAULT_WORKERS,
+    total: Optional[int] = None,
+    name="items",
+    report_every=REPORT_EVERY
+):
+    """Run the handler for each of the items with a fixed number of workers.
+    The items are fed lazily from the iterable into a bounded queue, so only
+    a few coroutines are alive at any time no matter how many items there are.
+        * items can also be an async iterable, like the files which are still
+        being produced, and they will be handled as soon as they arrive
+        * workers is the number of items handled concurrently
+        * total is the number of items used in the progress report, it will
+        be taken from items if it has a length
+        * name is what the items are called in the progress report
+        * If any handler raises, the other workers are cancelled and the
+        error is raised.
+    """
+    workers = max(1, workers)
+    if total is None and hasattr(items, "__len__"):
+        total = len(items)  # type: ignore
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * QUEUE_FACTOR)
+    finished = 0
+
+    async def feed():
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                await queue.put(item)
+        else:
+            for item in items:
+                await queue.put(item)
+        for _ in range(workers):
+            await queue.put(_STOP)
+
+    async def work():
+        nonlocal finished
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            await handler(item)
+            finished += 1
+            if report_every > 0 and finished % report_every == 0:
+                logger.info(
+                    "######### %d/%s %s finished",
+                    finished, total if total is not None else "?", name
+                )
+
+    tasks = [asyncio.ensure_future(feed())]
+    tasks.extend([asyncio.ensure_future(work()) for _ in range(workers)])
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def run_dispatch(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    handler: Callable[[T], Awaitable[Any]],
+    workers=DEFAULT_WORKERS,
+    total: Optional[int] = None,
+    name="items",
+    report_every=REPORT_EVERY
+):
+    """Run dispatch in the event loop until all the items are handled"""
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(dispatch(
+        items, handler, workers=workers, total=total,
+        name=name, report_every=report_every
+    ))
@@ -19,10 +19,15 @@ import hashlib
 import errno
 import tempfile
 import shutil
-from typing import List, Tuple, Optional
+from typing import BinaryIO, Dict, List, Tuple, Optional, Union
 from charon.constants import MANIFEST_SUFFIX
 
 
+# The size of each read when digesting files, the buffer is reused so the
+# large artifacts are read with few calls and no copies
+DIGEST_BUF_SIZE = 1024 * 1024
+
+
 class HashType(Enum):
     """Possible types of hash"""
 
@@ -32,6 +37,36 @@ class HashType(Enum):
     SHA512 = 3
 
 
+class LocalFileReader(object):
+    """LocalFileReader reads the content of the files to upload from local
+    file system. Subclasses can read them from other places, like the members
+    of an archive, with the same paths.
+    """
+
+    def is_file(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def on_disk(self, path: str) -> bool:
+        """If the file can be read from local file system directly"""
+        return True
+
+    def size(self, path: str) -> int:
+        return os.path.getsize(path)
+
+    def open(self, path: str) -> BinaryIO:
+        return open(path, "rb")
+
+    def read(self, path: str) -> bytes:
+        with self.open(path) as f:
+            return f.read()
+
+    def read_sha1(self, path: str) -> str:
+        return read_sha1(path)
+
+    def digest(self, path: str, hash_type=HashType.SHA1) -> str:
+        return digest(path, hash_type)
+
+
 def get_hash_type(type_str: str) -> HashType:
     """Get hash type from string"""
     type_str_low = type_str.lower()
@@ -88,27 +123,61 @@ def read_sha1(file: str) -> str:
 
 
 def digest(file: str, hash_type=HashType.SHA1) -> str:
-    hash_obj = _hash_object(hash_type)
-
-    # BUF_SIZE is totally arbitrary, change for your app!
-    BUF_SIZE = 65536  # lets read stuff in 64kb chunks!
     with open(file, "rb") as f:
-        while True:
-            data = f.read(BUF_SIZE)
-            if not data:
-                break
-            hash_obj.update(data)
+        return digest_fileobj(f, hash_type)
 
-    return hash_obj.hexdigest()
+
+def digest_fileobj(fileobj: BinaryIO, hash_type=HashType.SHA1) -> str:
+    return digest_fileobj_multi(fileobj, [hash_type])[hash_type]
+
+
+def digest_multi(
+    source: Union[str, bytes], hash_types: List[HashType]
+) -> Dict[HashType, str]:
+    """Calculate the hash values of the specified hash types for a file or
+       bytes content, the file is only read once for all of them
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        hash_objs = {t: _hash_object(t) for t in hash_types}
+        for hash_obj in hash_objs.values():
+            hash_obj.update(source)
+        return {t: h.hexdigest() for (t, h) in hash_objs.items()}
+    with open(source, "rb") as f:
+        return digest_fileobj_multi(f, hash_types)
+
+
+def digest_fileobj_multi(
+    fileobj: BinaryIO, hash_types: List[HashType]
+) -> Dict[HashType, str]:
+    hash_objs = {t: _hash_object(t) for t in hash_types}
+    buf = bytearray(DIGEST_BUF_SIZE)
+    view = memoryview(buf)
+    readinto = getattr(fileobj, "readinto", None)
+    while True:
+        if readinto:
+            size = readinto(buf)
+            data = view[:size] if size else None
+        else:
+            data = fileobj.read(DIGEST_BUF_SIZE)
+        if not data:
+            break
+        for hash_obj in hash_objs.values():
+            hash_obj.update(data)
+    return {t: h.hexdigest() for (t, h) in hash_objs.items()}
 
 
 def digest_content(content: str, hash_type=HashType.SHA1) -> str:
     """This function will caculate the hash value for the string content with the specified
        hash type
     """
-    hash_obj = _hash_object(hash_type)
-    hash_obj.update(content.encode('utf-8'))
-    return hash_obj.hexdigest()
+    return digest_content_multi(content, [hash_type])[hash_type]
+
+
+def digest_content_multi(content: str, hash_types: List[HashType]) -> Dict[HashType, str]:
+    """Calculate the hash values of the specified hash types for the string
+       content, like the generated metadata, without reading it back from file
+    """
+    return digest_multi(content.encode("utf-8"), hash_types)
 
 
 def _hash_object(hash_type: HashType):
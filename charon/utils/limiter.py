@@ -0,0 +1,186 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import asyncio
+import logging
+from collections import deque
+from contextvars import ContextVar
+from typing import Deque, Optional
+
+logger = logging.getLogger(__name__)
+
+# Latency of a window is treated as flat if it is not higher than
+# the best window latency multiplied by this factor
+LATENCY_TOLERANCE = 1.5
+# Factor for the multiplicative decrease when throttled
+DECREASE_FACTOR = 0.5
+
+_current_limiter: ContextVar[Optional["AdaptiveLimiter"]] = ContextVar(
+    "charon_current_limiter", default=None
+)
+
+
+def current_limiter() -> Optional["AdaptiveLimiter"]:
+    """Get the limiter whose slot is held by the running task, if any"""
+    return _current_limiter.get()
+
+
+class AdaptiveLimiter(object):
+    """AdaptiveLimiter is an AIMD (additive increase, multiplicative decrease)
+    concurrency limiter to be used in asyncio tasks through "async with limiter.slot()".
+        * The limit grows by 1 after each full window (limit number of finished
+        requests) as long as the average latency of the window stays flat
+        compared to the best window seen.
+        * The limit is halved when the server throttles the requests (like
+        SlowDown or 503), at most once per window.
+        * The limit is always kept between min_limit and max_limit.
+    """
+
+    def __init__(
+        self, name: str, initial=10,
+        min_limit=1, max_limit=64
+    ) -> None:
+        self.name = name
+        self.__min = max(1, min_limit)
+        self.__max = max(self.__min, max_limit)
+        self.__limit = min(max(initial, self.__min), self.__max)
+        self.__in_flight = 0
+        self.__waiters: Deque[asyncio.Future] = deque()
+        self.__window_count = 0
+        self.__window_latency = 0.0
+        self.__window_throttled = False
+        self.__best_latency: Optional[float] = None
+        self.reset_stats()
+
+    @property
+    def limit(self) -> int:
+        return self.__limit
+
+    @property
+    def lowest(self) -> int:
+        return self.__lowest
+
+    @property
+    def highest(self) -> int:
+        return self.__highest
+
+    @property
+    def throttled(self) -> int:
+        return self.__throttled
+
+    def reset_stats(self):
+        """Reset the lowest/highest levels and throttle count to the
+        current state, used to report the levels of each phase.
+        """
+        self.__lowest = self.__limit
+        self.__highest = self.__limit
+        self.__throttled = 0
+
+    async def acquire(self):
+        loop = asyncio.get_event_loop()
+        while self.__in_flight >= self.__limit:
+            waiter = loop.create_future()
+            self.__waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self.__waiters:
+                    self.__waiters.remove(waiter)
+                raise
+        self.__in_flight += 1
+
+    def release(self):
+        self.__in_flight -= 1
+        self.__wake_up()
+
+    async def pause(self, delay: float):
+        """Give back the slot held by the current task while sleeping for delay
+        seconds, like in a retry backoff, so the waiting tasks can use it. The
+        slot is taken again after the sleep.
+        """
+        self.release()
+        try:
+            await asyncio.sleep(delay)
+            await self.acquire()
+        except asyncio.CancelledError:
+            # The slot is released when leaving its context, keep it balanced
+            self.__in_flight += 1
+            raise
+
+    def on_success(self, latency: float):
+        """Record a finished request with its latency in seconds"""
+        self.__window_count += 1
+        self.__window_latency += latency
+        if self.__window_count >= self.__limit:
+            avg = self.__window_latency / self.__window_count
+            if not self.__window_throttled:
+                if self.__best_latency is None or avg < self.__best_latency:
+                    self.__best_latency = avg
+                if avg <= self.__best_latency * LATENCY_TOLERANCE:
+                    self.__set_limit(self.__limit + 1)
+            self.__new_window()
+
+    def on_throttle(self):
+        """Record a request which is throttled by the server"""
+        self.__throttled += 1
+        if not self.__window_throttled:
+            self.__set_limit(int(self.__limit * DECREASE_FACTOR))
+            logger.warning(
+                "[Limiter] Requests to %s are throttled, decreased concurrency to %d",
+                self.name, self.__limit
+            )
+            self.__new_window()
+            self.__window_throttled = True
+
+    def __new_window(self):
+        self.__window_count = 0
+        self.__window_latency = 0.0
+        self.__window_throttled = False
+
+    def __set_limit(self, limit: int):
+        self.__limit = min(max(limit, self.__min), self.__max)
+        self.__lowest = min(self.__lowest, self.__limit)
+        self.__highest = max(self.__highest, self.__limit)
+        self.__wake_up()
+
+    def __wake_up(self):
+        free = self.__limit - self.__in_flight
+        while free > 0 and self.__waiters:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def slot(self) -> "_LimiterSlot":
+        """Get an async context manager which holds a slot of this limiter, and marks
+        this limiter as the current one for the requests done inside it.
+        """
+        return _LimiterSlot(self)
+
+
+class _LimiterSlot(object):
+    def __init__(self, limiter: AdaptiveLimiter) -> None:
+        self.__limiter = limiter
+        self.__token = None
+
+    async def __aenter__(self) -> AdaptiveLimiter:
+        await self.__limiter.acquire()
+        self.__token = _current_limiter.set(self.__limiter)
+        return self.__limiter
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.__token is not None:
+            _current_limiter.reset(self.__token)
+        self.__limiter.release()
@@ -0,0 +1,239 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SERVICE_S3 = "s3"
+SERVICE_CLOUDFRONT = "cloudfront"
+
+DEFAULT_PHASE = "default"
+
+# The upper bounds in seconds of the latency histogram buckets, the
+# requests slower than the last bound are counted in the "+Inf" bucket
+LATENCY_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+MetricKey = Tuple[str, str, str, str]
+
+
+class _OperationStats(object):
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(
+        self, latency: float, requests: int, sent: int, received: int, error: bool
+    ):
+        self.requests += requests
+        self.bytes_sent += sent
+        self.bytes_received += received
+        if error:
+            self.errors += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        for (i, bound) in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[i] += 1
+                return
+        self.histogram[-1] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        calls = sum(self.histogram)
+        buckets = {str(bound): count for (bound, count) in zip(LATENCY_BUCKETS, self.histogram)}
+        buckets["+Inf"] = self.histogram[-1]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": {
+                "avg": round(self.latency_total / calls, 6) if calls else 0.0,
+                "max": round(self.latency_max, 6),
+                "histogram": buckets
+            }
+        }
+
+
+class RequestMetrics(object):
+    """RequestMetrics counts the requests sent to the AWS services during a run,
+    which are grouped by service, operation type (HEAD, GET, PUT, COPY, LIST,
+    DELETE...), bucket and the phase of the run when they are sent.
+        * Each call records its latency into a histogram, and the number of
+        requests it costs, as one call like a multipart uploading or a paginated
+        listing may send several requests.
+        * The failed calls are counted as errors, retries of a call are recorded
+        as separate calls.
+        * It is thread safe, as the sync boto3 calls may be sent from threads.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__stats: Dict[MetricKey, _OperationStats] = {}
+        self.__phase = DEFAULT_PHASE
+        self.__started = time.time()
+
+    def set_phase(self, phase: str):
+        """Set the phase for the requests recorded afterwards"""
+        with self.__lock:
+            self.__phase = phase
+
+    def get_phase(self) -> str:
+        return self.__phase
+
+    def record(
+        self, service: str, operation: str, bucket: Optional[str] = None,
+        latency: float = 0.0, requests: int = 1, sent: int = 0,
+        received: int = 0, error: bool = False
+    ):
+        with self.__lock:
+            key = (service, operation, bucket if bucket else "", self.__phase)
+            stats = self.__stats.get(key)
+            if not stats:
+                stats = _OperationStats()
+                self.__stats[key] = stats
+            stats.record(latency, requests, sent, received, error)
+
+    @contextmanager
+    def timed(
+        self, service: str, operation: str, bucket: Optional[str] = None,
+        sent: int = 0
+    ) -> Iterator[Dict[str, int]]:
+        """Record the latency of the requests sent in the with block. The
+        yielded dict can be used to set the "requests" and "received" of them.
+        """
+        result = {"requests": 1, "received": 0}
+        start = time.monotonic()
+        try:
+            yield result
+        except Exception:
+            self.record(
+                service, operation, bucket, time.monotonic() - start,
+                requests=result["requests"], sent=sent, error=True
+            )
+            raise
+        self.record(
+            service, operation, bucket, time.monotonic() - start,
+            requests=result["requests"], sent=sent, received=result["received"]
+        )
+
+    def reset(self):
+        with self.__lock:
+            self.__stats = {}
+            self.__phase = DEFAULT_PHASE
+            self.__started = time.time()
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the summary of all recorded requests, which contains the totals
+        by service and operation type, and the details of each operation type,
+        bucket and phase.
+        """
+        with self.__lock:
+            items = sorted(self.__stats.items(), key=lambda i: i[0])
+            totals: Dict[str, Dict[str, Dict[str, int]]] = {}
+            operations: List[Dict[str, Any]] = []
+            for ((service, operation, bucket, phase), stats) in items:
+                total = totals.setdefault(service, {}).setdefault(
+                    operation,
+                    {"requests": 0, "errors": 0, "bytes_sent": 0, "bytes_received": 0}
+                )
+                total["requests"] += stats.requests
+                total["errors"] += stats.errors
+                total["bytes_sent"] += stats.bytes_sent
+                total["bytes_received"] += stats.bytes_received
+                detail = {
+                    "service": service, "operation": operation,
+                    "bucket": bucket, "phase": phase
+                }
+                detail.update(stats.to_dict())
+                operations.append(detail)
+            return {
+                "duration": round(time.time() - self.__started, 3),
+                "requests": sum(s.requests for (_, s) in items),
+                "errors": sum(s.errors for (_, s) in items),
+                "bytes_sent": sum(s.bytes_sent for (_, s) in items),
+                "bytes_received": sum(s.bytes_received for (_, s) in items),
+                "totals": totals,
+                "operations": operations
+            }
+
+    def log_summary(self):
+        summary = self.summary()
+        if summary["requests"] == 0:
+            return
+        logger.info(
+            "API requests summary: %d requests (%d errors), %d bytes sent, "
+            "%d bytes received in %.1fs",
+            summary["requests"], summary["errors"], summary["bytes_sent"],
+            summary["bytes_received"], summary["duration"]
+        )
+        for (service, totals) in summary["totals"].items():
+            for (operation, total) in totals.items():
+                logger.info(
+                    "  %s %s: %d requests, %d errors", service, operation,
+                    total["requests"], total["errors"]
+                )
+        for detail in summary["operations"]:
+            logger.debug(
+                "  %s %s (bucket: %s, phase: %s): %d requests, avg %.3fs, max %.3fs",
+                detail["service"], detail["operation"], detail["bucket"],
+                detail["phase"], detail["requests"], detail["latency"]["avg"],
+                detail["latency"]["max"]
+            )
+
+    def write_report(self, report_path: str):
+        """Write the summary as a json report file"""
+        folder = os.path.dirname(report_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        logger.info("API requests report is written to %s", report_path)
+
+
+_METRICS = RequestMetrics()
+
+
+def get_metrics() -> RequestMetrics:
+    """Get the request metrics of current run"""
+    return _METRICS
+
+
+def set_phase(phase: str):
+    """Set the phase for the requests recorded afterwards in current run"""
+    _METRICS.set_phase(phase)
+
+
+def report_metrics(report_path: Optional[str] = None):
+    """Log the summary of the requests of current run, and write it as a
+    json report if report_path is given.
+    """
+    _METRICS.log_summary()
+    if report_path:
+        try:
+            _METRICS.write_report(report_path)
+        except OSError as e:
+            logger.error("Can not write API requests report %s: %s", report_path, e)
@@ -0,0 +1,156 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# The number of functions printed in the logs from the profile stats
+PROFILE_REPORT_LIMIT = 30
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Tracer(object):
+    """Tracer records the spans of a run, like the phases of an uploading,
+    and exports them as Chrome trace events, which can be opened in
+    chrome://tracing or https://ui.perfetto.dev.
+        * The spans opened in another span on the same thread are nested in
+        it, so the phases of each target are shown under its target span.
+        * The spans are recorded when they are closed, even if their block
+        raises an error.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__events: List[Dict[str, Any]] = []
+        self.__origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.__add(name, start, end, args)
+            logger.debug("Span %s finished in %.3fs", name, end - start)
+
+    def __add(self, name: str, start: float, end: float, args: Dict[str, Any]):
+        event = {
+            "name": name,
+            "cat": "charon",
+            "ph": "X",
+            "ts": round((start - self.__origin) * 1e6, 3),
+            "dur": round((end - start) * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": threading.get_ident()
+        }
+        if args:
+            event["args"] = {k: str(v) for (k, v) in args.items()}
+        with self.__lock:
+            self.__events.append(event)
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        with self.__lock:
+            return sorted(self.__events, key=lambda e: e["ts"])
+
+    def reset(self):
+        with self.__lock:
+            self.__events = []
+            self.__origin = time.perf_counter()
+
+    def write(self, trace_file: str):
+        """Write the spans as Chrome trace event json file"""
+        folder = os.path.dirname(trace_file)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self.get_events(), "displayTimeUnit": "ms"}, f
+            )
+        logger.info("Trace events are written to %s", trace_file)
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer of current run"""
+    return _TRACER
+
+
+def span(name: str, **args):
+    """Record the with block as a span of current run, args are shown as
+    the details of the span in the trace viewer.
+    """
+    return _TRACER.span(name, **args)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate the function to record each of its calls as a span"""
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _TRACER.span(name, function=fn.__qualname__):
+                return fn(*args, **kwargs)
+        return wrapper  # type: ignore
+    return decorator
+
+
+def start_profiling() -> cProfile.Profile:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_profiling(profiler: cProfile.Profile, stats_file: str):
+    """Stop the profiler and dump its stats to stats_file, which can be loaded
+    by pstats or snakeviz. The slowest functions by cumulative time are
+    printed in the logs.
+    """
+    profiler.disable()
+    profiler.dump_stats(stats_file)
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_REPORT_LIMIT)
+    logger.debug(out.getvalue())
+    logger.info("Profile stats are written to %s", stats_file)
+
+
+def finish_tracing(
+    name: str, trace_file: Optional[str] = None,
+    profiler: Optional[cProfile.Profile] = None
+):
+    """Write the trace of current run to trace_file if it is given, and stop
+    the profiler to dump its stats as charon-<name>.prof in current directory.
+    """
+    try:
+        if trace_file:
+            _TRACER.write(trace_file)
+        if profiler:
+            stop_profiling(profiler, os.path.join(os.getcwd(), f"charon-{name}.prof"))
+    except OSError as e:
+        logger.error("Can not write the trace or profile of %s: %s", name, e)
@@ -0,0 +1,2 @@
+__load_plugin_entry__("janus-idp.backstage-plugin-orchestrator",(()=>{"use strict";var h,g,e,a,t,i,l,r,n,s,_,c,u,o,d,f,y,x,b={92132:(h,g,e)=>{var a={OrchestratorPlugin:()=>Promise.all([e.e(1048),e.e(7332),e.e(4951),e.e(5478),e.e(2469),e.e(484),e.e(1942),e.e(9490),e.e(5387)]).then((()=>()=>e(87967)))},t=(h,g)=>(e.R=g,g=e.o(a,h)?a[h]():Promise.resolve().then((()=>{throw new Error('Module "'+h+'" does not exist in container.')})),e.R=void 0,g),i=(h,g)=>{if(e.S){var a="default",t=e.S[a];if(t&&t!==h)throw new Error("Container initialization failed as it has already been initialized with a different share scope");return e.S[a]=h,e.I(a,g)}};e.d(g,{get:()=>t,init:()=>i})}},p={};function m(h){var g=p[h];if(void 0!==g)return g.exports;var e=p[h]={id:h,loaded:!1,exports:{}};return b[h].call(e.exports,e,e.exports,m),e.loaded=!0,e.exports}return m.m=b,m.c=p,m.n=h=>{var g=h&&h.__esModule?()=>h.default:()=>h;return m.d(g,{a:g}),g},g=Object.getPrototypeOf?h=>Object.getPrototypeOf(h):h=>h.__proto__,m.t=function(e,a){if(1&a&&(e=this(e)),8&a)return e;if("object"==typeof e&&e){if(4&a&&e.__esModule)return e;if(16&a&&"function"==typeof e.then)return e}var t=Object.create(null);m.r(t);var i={};h=h||[null,g({}),g([]),g(g)];for(var l=2&a&&e;"object"==typeof l&&!~h.indexOf(l);l=g(l))Object.getOwnPropertyNames(l).forEach((h=>i[h]=()=>e[h]));return i.default=()=>e,m.d(t,i),t},m.d=(h,g)=>{for(var e in g)m.o(g,e)&&!m.o(h,e)&&Object.defineProperty(h,e,{enumerable:!0,get:g[e]})},m.f={},m.e=h=>Promise.all(Object.keys(m.f).reduce(((g,e)=>(m.f[e](h,g),g)),[])),m.u=h=>"static/"+({51:"react-syntax-highlighter_languages_highlight_prolog",200:"react-syntax-highlighter_languages_highlight_mel",206:"react-syntax-highlighter_languages_highlight_gml",371:"react-syntax-highlighter_languages_highlight_excel",456:"react-syntax-highlighter_languages_highlight_roboconf",460:"react-syntax-highlighter_languages_highlight_avrasm",464:"react-syntax-highlighter_languages_highlight_shell",557:"react-syntax-highlighter_languages_highlight_oneC",579:"react-syntax-highlighter_languages_highlight_vbnet",634:"react-syntax-highlighter_languages_highlight_scilab",927:"react-syntax-highlighter_languages_highlight_javascript",946:"react-syntax-highlighter_languages_highlight_clojure",985:"react-syntax-highlighter_languages_highlight_monkey",1062:"react-syntax-highlighter_languages_highlight_nim",1084:"react-syntax-highlighter_languages_highlight_aspectj",1099:"react-syntax-highlighter_languages_highlight_ebnf",1173:"react-syntax-highlighter_languages_highlight_autohotkey",1177:"react-syntax-highlighter_languages_highlight_profile",1214:"react-syntax-highlighter_languages_highlight_properties",1276:"react-syntax-highlighter_languages_highlight_phpTemplate",1325:"react-syntax-highlighter_languages_highlight_actionscript",1352:"react-syntax-highlighter_languages_highlight_fortran",1362:"react-syntax-highlighter_languages_highlight_mathematica",1418:"react-syntax-highlighter_languages_highlight_pony",1441:"react-syntax-highlighter_languages_highlight_coq",1461:"react-syntax-highlighter_languages_highlight_livescript",1489:"react-syntax-highlighter_languages_highlight_reasonml",1496:"react-syntax-highlighter_languages_highlight_lua",1522:"react-syntax-highlighter_languages_highlight_dust",1679:"react-syntax-highlighter_languages_highlight_scheme",1694:"react-syntax-highlighter_languages_highlight_accesslog",1727:"react-syntax-highlighter_languages_highlight_oxygene",1750:"react-syntax-highlighter_languages_highlight_makefile",1828:"react-syntax-highlighter_languages_highlight_dockerfile",1895:"react-syntax-highlighter_languages_highlight_pythonRepl",1956:"react-syntax-highlighter_languages_highlight_puppet",1961:"react-syntax-highlighter_languages_highlight_stan",1972:"react-syntax-highlighter_languages_highlight_fsharp",2007:"react-syntax-highlighter_languages_highlight_css",2064:"react-syntax-highlighter_languages_highlight_vhdl",2108:"react-syntax-highlighter_languages_highlight_cLike",2180:"react-syntax-highlighter_languages_highlight_sqf",2234:"react-syntax-highlighter_languages_highlight_lisp",2267:"react-syntax-highlighter_languages_highlight_maxima",2346:"react-syntax-highlighter_languages_highlight_d",2362:"react-syntax-highlighter_languages_highlight_xquery",2378:"react-syntax-highlighter_languages_highlight_parser3",2383:"react-syntax-highlighter_languages_highlight_crmsh",2438:"react-syntax-highlighter_languages_highlight_haxe",2488:"react-syntax-highlighter_languages_highlight_verilog",2496:"react-syntax-highlighter_languages_highlight_erlangRepl",2512:"react-syntax-highlighter_languages_highlight_stylus",2516:"react-syntax-highlighter_languages_highlight_apache",2665:"react-syntax-highlighter_languages_highlight_powershell",2693:"react-syntax-highlighter_languages_highlight_tap",2727:"react-syntax-highlighter_languages_highlight_q",2743:"react-syntax-highlighter_languages_highlight_asciidoc",2762:"react-syntax-highlighter_languages_highlight_haskell",2795:"react-syntax-highlighter_languages_highlight_dns",2871:"react-syntax-highlighter_languages_highlight_typescript",2882:"react-syntax-highlighter_languages_highlight_sml",2979:"react-syntax-highlighter_languages_highlight_plaintext",2981:"react-syntax-highlighter_languages_highlight_ruleslanguage",2983:"react-syntax-highlighter_languages_highlight_golo",3146:"react-syntax-highlighter_languages_highlight_purebasic",3193:"react-syntax-highlighter_languages_highlight_xml",3299:"react-syntax-highlighter_languages_highlight_fix",3357:"react-syntax-highlighter_languages_highlight_x86asm",3384:"react-syntax-highlighter_languages_highlight_ini",3418:"react-syntax-highlighter_languages_highlight_ruby",3419:"react-syntax-highlighter_languages_highlight_nix",3487:"react-syntax-highlighter_languages_highlight_mipsasm",3500:"react-syntax-highlighter_languages_highlight_autoit",3540:"react-syntax-highlighter_languages_highlight_moonscript",3562:"react-syntax-highlighter_languages_highlight_gams",3580:"react-syntax-highlighter_languages_highlight_csp",3607:"react-syntax-highlighter_languages_highlight_abnf",3623:"react-syntax-highlighter_languages_highlight_yaml",3722:"react-syntax-highlighter_languages_highlight_latex",3736:"react-syntax-highlighter_languages_highlight_json",3811:"react-syntax-highlighter_languages_highlight_erb",3885:"react-syntax-highlighter_languages_highlight_stata",3923:"react-syntax-highlighter_languages_highlight_applescript",3988:"react-syntax-highlighter_languages_highlight_vala",4014:"react-syntax-highlighter_languages_highlight_scss",4075:"react-syntax-highlighter_languages_highlight_hsp",4110:"react-syntax-highlighter_languages_highlight_tp",4135:"react-syntax-highlighter_languages_highlight_mizar",4282:"react-syntax-highlighter_languages_highlight_livecodeserver",4300:"react-syntax-highlighter_languages_highlight_r",4342:"react-syntax-highlighter_languages_highlight_php",4383:"react-syntax-highlighter_languages_highlight_dsconfig",4436:"react-syntax-highlighter_languages_highlight_zephir",4446:"react-syntax-highlighter_languages_highlight_leaf",4493:"react-syntax-highlighter_languages_highlight_gauss",4575:"react-syntax-highlighter_languages_highlight_processing",4635:"react-syntax-highlighter_languages_highlight_jbossCli",4733:"react-syntax-highlighter_languages_highlight_llvm",4835:"react-syntax-highlighter_languages_highlight_cos",4931:"react-syntax-highlighter_languages_highlight_step21",4956:"react-syntax-highlighter_languages_highlight_angelscript",4971:"react-syntax-highlighter_languages_highlight_lsl",5034:"react-syntax-highlighter_languages_highlight_ada",5051:"react-syntax-highlighter_languages_highlight_coffeescript",5099:"react-syntax-highlighter_languages_highlight_nsis",5123:"react-syntax-highlighter_languages_highlight_erlang",5189:"react-syntax-highlighter_languages_highlight_dts",5251:"react-syntax-highlighter_languages_highlight_pgsql",5253:"react-syntax-highlighter_languages_highlight_clojureRepl",5286:"react-syntax-highlighter_languages_highlight_nginx",5387:"exposed-OrchestratorPlugin",5446:"react-syntax-highlighter_languages_highlight_ocaml",5565:"react-syntax-highlighter_languages_highlight_kotlin",5613:"react-syntax-highlighter_languages_highlight_rib",5664:"react-syntax-highlighter_languages_highlight_dos",5773:"react-syntax-highlighter_languages_highlight_mojolicious",5813:"react-syntax-highlighter_languages_highlight_less",5819:"react-syntax-highlighter_languages_highlight_gradle",5868:"react-syntax-highlighter_languages_highlight_inform7",5900:"react-syntax-highlighter_languages_highlight_lasso",6057:"react-syntax-highlighter_languages_highlight_sqlMore",6152:"react-syntax-highlighter_languages_highlight_vbscriptHtml",6161:"react-syntax-highlighter_languages_highlight_clean",6177:"react-syntax-highlighter_languages_highlight_taggerscript",6195:"react-syntax-highlighter_languages_highlight_ldif",6228:"react-syntax-highlighter_languages_highlight_rust",6267:"react-syntax-highlighter_languages_highlight_swift",6354:"react-syntax-highlighter_languages_highlight_java",6501:"react-syntax-highlighter_languages_highlight_armasm",6512:"react-syntax-highlighter_languages_highlight_scala",6542:"react-syntax-highlighter_languages_highlight_vim",6555:"react-syntax-highlighter_languages_highlight_openscad",6573:"react-syntax-highlighter_languages_highlight_cpp",6780:"react-syntax-highlighter_languages_highlight_qml",6835:"react-syntax-highlighter_languages_highlight_brainfuck",6848:"react-syntax-highlighter_languages_highlight_crystal",6924:"react-syntax-highlighter_languages_highlight_isbl",6977:"react-syntax-highlighter_languages_highlight_rsl",6986:"react-syntax-highlighter_languages_highlight_capnproto",7048:"react-syntax-highlighter_languages_highlight_gherkin",7079:"react-syntax-highlighter_languages_highlight_diff",7131:"react-syntax-highlighter_languages_highlight_protobuf",7209:"react-syntax-highlighter_languages_highlight_perl",7247:"react-syntax-highlighter_languages_highlight_cmake",7254:"react-syntax-highlighter_languages_highlight_subunit",7351:"react-syntax-highlighter_languages_highlight_elixir",7401:"react-syntax-highlighter_languages_highlight_sas",7406:"react-syntax-highlighter_languages_highlight_sql",7439:"react-syntax-highlighter_languages_highlight_flix",7533:"react-syntax-highlighter_languages_highlight_awk",7572:"react-syntax-highlighter_languages_highlight_basic",7764:"react-syntax-highlighter_languages_highlight_go",7776:"react-syntax-highlighter_languages_highlight_haml",7794:"react-syntax-highlighter_languages_highlight_http",7818:"react-syntax-highlighter_languages_highlight_arduino",7879:"react-syntax-highlighter_languages_highlight_csharp",7934:"react-syntax-highlighter_languages_highlight_glsl",7959:"react-syntax-highlighter_languages_highlight_htmlbars",8001:"react-syntax-highlighter_languages_highlight_matlab",8030:"react-syntax-highlighter_languages_highlight_handlebars",8058:"react-syntax-highlighter_languages_highlight_n1ql",8078:"react-syntax-highlighter_languages_highlight_delphi",8138:"react-syntax-highlighter_languages_highlight_elm",8140:"react-syntax-highlighter_languages_highlight_pf",8216:"react-syntax-highlighter_languages_highlight_bnf",8217:"react-syntax-highlighter_languages_highlight_twig",8331:"react-syntax-highlighter_languages_highlight_thrift",8338:"react-syntax-highlighter_languages_highlight_objectivec",8549:"react-syntax-highlighter_languages_highlight_c",8595:"react-syntax-highlighter_languages_highlight_hy",8705:"react-syntax-highlighter_languages_highlight_nodeRepl",8725:"react-syntax-highlighter_languages_highlight_smalltalk",8727:"react-syntax-highlighter/lowlight-import",8753:"react-syntax-highlighter_languages_highlight_mercury",8755:"react-syntax-highlighter_languages_highlight_tcl",8763:"react-syntax-highlighter_languages_highlight_routeros",8833:"react-syntax-highlighter_languages_highlight_markdown",8874:"react-syntax-highlighter_languages_highlight_smali",8903:"react-syntax-highlighter_languages_highlight_axapta",8904:"react-syntax-highlighter_languages_highlight_python",8948:"react-syntax-highlighter_languages_highlight_groovy",9078:"react-syntax-highlighter_languages_highlight_irpf90",9118:"react-syntax-highlighter_languages_highlight_juliaRepl",9139:"react-syntax-highlighter_languages_highlight_django",9162:"react-syntax-highlighter_languages_highlight_ceylon",9175:"react-syntax-highlighter_languages_highlight_vbscript",9229:"react-syntax-highlighter_languages_highlight_julia",9265:"react-syntax-highlighter_languages_highlight_dart",9406:"react-syntax-highlighter_languages_highlight_cal",9612:"react-syntax-highlighter_languages_highlight_bash",9702:"react-syntax-highlighter_languages_highlight_gcode",9726:"react-syntax-highlighter_languages_highlight_xl",9882:"react-syntax-highlighter_languages_highlight_arcade"}[h]||h)+"."+{51:"121e660b",200:"6a50d29f",206:"60c9164c",355:"1b33823a",371:"a2d63cdc",456:"2acbe46d",460:"8740d4bc",464:"a443816e",484:"bf6c953e",557:"00fd2d1d",579:"a777cce0",634:"a67b3401",635:"3447e482",927:"9c6ecddb",946:"49c41d48",985:"5ea8d457",1048:"67149008",1062:"ed20915c",1084:"74f44155",1099:"d7208fd7",1173:"982d9807",1177:"98d42428",1214:"b509ede6",1276:"e75d1f0c",1325:"67e9fd6c",1352:"3e3bc188",1362:"4610a83f",1418:"46af2271",1441:"a75ea4f5",1461:"d27d52be",1489:"caf7dfdb",1496:"95ec4c99",1522:"aae335fb",1613:"29a29b42",1679:"241e23d5",1694:"c7cb81bf",1727:"8bf02b1a",1750:"deaf64bf",1828:"83981aac",1895:"933f5c30",1942:"98131c91",1956:"7dfb74ab",1961:"987296a9",1963:"18cdb947",1972:"4316aad5",2007:"fc50ca4e",2064:"bb4e374b",2108:"b349ccfb",2163:"df2d6785",2180:"4ee6c740",2234:"874a8c6a",2267:"e438bda8",2268:"be2c0fbd",2346:"f532c86d",2362:"541fe1c1",2378:"8b0f7f29",2383:"eda3ca9c",2438:"c9ae089b",2469:"faf48e2e",2488:"b62dde41",2496:"31f920d3",2512:"e3fb16a8",2516:"858127a6",2665:"7d8da884",2693:"9f868fa0",2727:"485a26f5",2743:"49be141c",2762:"37063e13",2795:"0226d7b2",2871:"2bc6197b",2882:"1de59a7f",2952:"7c3bbd85",2979:"d7634b05",2981:"a9bed438",2983:"0cfa4850",3144:"9c904fb8",3146:"6fd75817",3193:"a82ade59",3299:"0d58a89f",3357:"44bfc609",3384:"0407e0c9",3418:"64eccdc5",3419:"007108fb",3487:"8ccba2de",3500:"a7b64e3d",3540:"593426d2",3562:"29dbc467",3580:"448c8344",3607:"197a81fb",3623:"0978b1d5",3657:"a4f1a9d7",3722:"d575c366",3736:"dc7dd3ba",3811:"5fd1a58b",3821:"f3830742",3885:"e60c7af8",3923:"1cfa48bd",3988:"5e3704a0",4014:"1b2993a1",4041:"5a12055c",4075:"c1f982bc",4110:"1e3d7071",4135:"a6f05b3f",4218:"e6bd12a5",4282:"68f62b67",4300:"a55a9bad",4342:"18c5a10a",4383:"28c6d34e",4436:"83750d3d",4446:"fab389a0",4491:"2e04045b",4493:"961742a2",4575:"7e047496",4635:"bfad0b27",4733:"95fef63c",4835:"1f045d61",4931:"0e1c0d30",4951:"17409eb6",4956:"ab6594b9",4971:"9682b2ab",5007:"020dd80a",5034:"f7c4284e",5051:"b85df9b4",5099:"acda75fe",5123:"3f331f66",5189:"7342595b",5251:"3538058d",5253:"610e8e6c",5277:"f8d373d0",5286:"be4db73e",5387:"f51c9458",5414:"b4b92219",5446:"820c13a0",5478:"0971e2f2",5565:"c8cb66ca",5613:"e332d738",5664:"4e37ea63",5773:"b0190537",5813:"d2e07640",5819:"c2516103",5868:"0d92b4f4",5900:"b55ea25e",6057:"c5a05b08",6152:"64f476e0",6161:"bf6ebb08",6177:"c26dd277",6195:"9f3f30e7",6202:"530ad921",6228:"c2d02dba",6267:"8e388230",6322:"ff60ab76",6354:"3f9c1e68",6501:"a64bc481",6512:"a96322d8",6542:"7706c1e4",6555:"8b4986f2",6573:"f54e6365",6780:"21d6ef2d",6835:"fb3ac63b",6848:"6d1273a7",6924:"a04775f4",6977:"1996fe83",6986:"bbd8afc6",7048:"cbf7ad5b",7079:"8eeb389f",7131:"3ae1ec86",7209:"239e77f3",7247:"43ef6832",7254:"da5fbc55",7332:"33c139f8",7341:"bc337273",7351:"13db8c02",7388:"53d1004e",7401:"516fe854",7406:"b84bd27b",7439:"cfeddff0",7533:"4c31c28c",7572:"b40c72c6",7719:"23676e21",7764:"2924118d",7776:"f938ad8a",7794:"33ff0969",7818:"69b62169",7879:"2e049b0f",7934:"68a86107",7959:"92c2a37e",8001:"2a1e705a",8030:"e51bcb34",8058:"266e741a",8078:"cb7078b4",8138:"d078053c",8140:"7442f7d8",8216:"9331b4be",8217:"d6326d93",8331:"99a7f6df",8338:"579b03ce",8549:"cc46ce17",8595:"c8cafe85",8690:"fc3542ec",8705:"d6caa584",8725:"fa57bcc9",8727:"82b9e52d",8753:"aa8b7ebd",8755:"c28fc465",8763:"58bac3d6",8833:"b1929bf0",8874:"9df24b63",8903:"bf26e7d7",8904:"d58c65fc",8948:"eeee7cf7",9078:"ad8f22f9",9118:"4c7d9e49",9139:"6dd7047e",9162:"635286d3",9175:"8d50c731",9229:"b21a8d41",9265:"907c7c8c",9406:"0085a456",9490:"9d6ae3cb",9612:"84a32fe8",9702:"d89c544a",9726:"d9d1afca",9829:"60a21a54",9882:"31547906"}[h]+".chunk.js",m.miniCssF=h=>{},m.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(h){if("object"==typeof window)return window}}(),m.o=(h,g)=>Object.prototype.hasOwnProperty.call(h,g),e={},a="janus-idp.backstage-plugin-orchestrator:",m.l=(h,g,t,i)=>{if(e[h])e[h].push(g);else{var l,r;if(void 0!==t)for(var n=document.getElementsByTagName("script"),s=0;s<n.length;s++){var _=n[s];if(_.getAttribute("src")==h||_.getAttribute("data-webpack")==a+t){l=_;break}}l||(r=!0,(l=document.createElement("script")).charset="utf-8",l.timeout=120,m.nc&&l.setAttribute("nonce",m.nc),l.setAttribute("data-webpack",a+t),l.src=h),e[h]=[g];var c=(g,a)=>{l.onerror=l.onload=null,clearTimeout(u);var t=e[h];if(delete e[h],l.parentNode&&l.parentNode.removeChild(l),t&&t.forEach((h=>h(a))),g)return g(a)},u=setTimeout(c.bind(null,void 0,{type:"timeout",target:l}),12e4);l.onerror=c.bind(null,l.onerror),l.onload=c.bind(null,l.onload),r&&document.head.appendChild(l)}},m.r=h=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(h,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(h,"__esModule",{value:!0})},m.nmd=h=>(h.paths=[],h.children||(h.children=[]),h),(()=>{m.S={};var h={},g={};m.I=(e,a)=>{a||(a=[]);var t=g[e];if(t||(t=g[e]={}),!(a.indexOf(t)>=0)){if(a.push(t),h[e])return h[e];m.o(m.S,e)||(m.S[e]={});var i=m.S[e],l="janus-idp.backstage-plugin-orchestrator",r=(h,g,e,a)=>{var t=i[h]=i[h]||{},r=t[g];(!r||!r.loaded&&(!a!=!r.eager?a:l>r.from))&&(t[g]={get:e,from:l,eager:!!a})},n=[];return"default"===e&&(r("@backstage/core-plugin-api","1.9.3",(()=>Promise.all([m.e(1048),m.e(1963),m.e(5478),m.e(4218),m.e(2469)]).then((()=>()=>m(41963))))),r("@backstage/frontend-plugin-api","0.6.7",(()=>Promise.all([m.e(1048),m.e(7341),m.e(5478),m.e(4218),m.e(2469),m.e(9490)]).then((()=>()=>m(87341))))),r("@backstage/version-bridge","1.0.8",(()=>Promise.all([m.e(5478),m.e(7388)]).then((()=>()=>m(97388))))),r("@emotion/cache","11.11.0",(()=>m.e(2163).then((()=>()=>m(92163))))),r("@emotion/react","11.11.4",(()=>Promise.all([m.e(5478),m.e(6322),m.e(3821)]).then((()=>()=>m(73821))))),r("@material-ui/core/styles","4.12.4",(()=>Promise.all([m.e(7332),m.e(5478),m.e(1942),m.e(4491)]).then((()=>()=>m(64491))))),r("@material-ui/styles","4.11.5",(()=>Promise.all([m.e(5414),m.e(5478),m.e(355)]).then((()=>()=>m(15414))))),r("@mui/styled-engine","5.15.14",(()=>Promise.all([m.e(2952),m.e(5478),m.e(6322),m.e(5277),m.e(635)]).then((()=>()=>m(92952))))),r("react-dom","18.3.1",(()=>Promise.all([m.e(3144),m.e(5478)]).then((()=>()=>m(43144))))),r("react-router-dom","6.23.0",(()=>Promise.all([m.e(1613),m.e(3657),m.e(5478),m.e(484),m.e(9829)]).then((()=>()=>m(73657))))),r("react-router","6.23.0",(()=>Promise.all([m.e(1613),m.e(8690),m.e(5478)]).then((()=>()=>m(18690))))),r("react","18.3.1",(()=>m.e(4041).then((()=>()=>m(14041)))))),h[e]=n.length?Promise.all(n).then((()=>h[e]=1)):1}}})(),(()=>{var h;m.g.importScripts&&(h=m.g.location+"");var g=m.g.document;if(!h&&g&&(g.currentScript&&(h=g.currentScript.src),!h)){var e=g.getElementsByTagName("script");if(e.length)for(var a=e.length-1;a>-1&&(!h||!/^http(s?):/.test(h));)h=e[a--].src}if(!h)throw new Error("Automatic publicPath is not supported in this browser");h=h.replace(/#.*$/,"").replace(/\?.*$/,"").replace(/\/[^\/]+$/,"/"),m.p=h})(),t=h=>{var g=h=>h.split(".").map((h=>+h==h?+h:h)),e=/^([^-+]+)?(?:-([^+]+))?(?:\+(.+))?$/.exec(h),a=e[1]?g(e[1]):[];return e[2]&&(a.length++,a.push.apply(a,g(e[2]))),e[3]&&(a.push([]),a.push.apply(a,g(e[3]))),a},i=(h,g)=>{h=t(h),g=t(g);for(var e=0;;){if(e>=h.length)return e<g.length&&"u"!=(typeof g[e])[0];var a=h[e],i=(typeof a)[0];if(e>=g.length)return"u"==i;var l=g[e],r=(typeof l)[0];if(i!=r)return"o"==i&&"n"==r||"s"==r||"u"==i;if("o"!=i&&"u"!=i&&a!=l)return a<l;e++}},l=h=>{var g=h[0],e="";if(1===h.length)return"*";if(g+.5){e+=0==g?">=":-1==g?"<":1==g?"^":2==g?"~":g>0?"=":"!=";for(var a=1,t=1;t<h.length;t++)a--,e+="u"==(typeof(r=h[t]))[0]?"-":(a>0?".":"")+(a=2,r);return e}var i=[];for(t=1;t<h.length;t++){var r=h[t];i.push(0===r?"not("+n()+")":1===r?"("+n()+" || "+n()+")":2===r?i.pop()+" "+i.pop():l(r))}return n();function n(){return i.pop().replace(/^\((.+)\)$/,"$1")}},r=(h,g)=>{if(0 in h){g=t(g);var e=h[0],a=e<0;a&&(e=-e-1);for(var i=0,l=1,n=!0;;l++,i++){var s,_,c=l<h.length?(typeof h[l])[0]:"";if(i>=g.length||"o"==(_=(typeof(s=g[i]))[0]))return!n||("u"==c?l>e&&!a:""==c!=a);if("u"==_){if(!n||"u"!=c)return!1}else if(n)if(c==_)if(l<=e){if(s!=h[l])return!1}else{if(a?s>h[l]:s<h[l])return!1;s!=h[l]&&(n=!1)}else if("s"!=c&&"n"!=c){if(a||l<=e)return!1;n=!1,l--}else{if(l<=e||_<c!=a)return!1;n=!1}else"s"!=c&&"n"!=c&&(n=!1,l--)}}var u=[],o=u.pop.bind(u);for(i=1;i<h.length;i++){var d=h[i];u.push(1==d?o()|o():2==d?o()&o():d?r(d,g):!o())}return!!o()},n=(h,g)=>{var e=h[g];return Object.keys(e).reduce(((h,g)=>!h||!e[h].loaded&&i(h,g)?g:h),0)},s=(h,g,e,a)=>"Unsatisfied version "+e+" from "+(e&&h[g][e].from)+" of shared singleton module "+g+" (required "+l(a)+")",_=(h,g,e,a)=>{var t=n(h,e);return r(a,t)||c(s(h,e,t,a)),u(h[e][t])},c=h=>{"undefined"!=typeof console&&console.warn&&console.warn(h)},u=h=>(h.loaded=1,h.get()),o=(h=>function(g,e,a,t){var i=m.I(g);return i&&i.then?i.then(h.bind(h,g,m.S[g],e,a,t)):h(0,m.S[g],e,a,t)})(((h,g,e,a,t)=>g&&m.o(g,e)?_(g,0,e,a):t())),d={},f={95478:()=>o("default","react",[0],(()=>m.e(4041).then((()=>()=>m(14041))))),42469:()=>o("default","react-router-dom",[0],(()=>Promise.all([m.e(1613),m.e(3657),m.e(484),m.e(9829)]).then((()=>()=>m(73657))))),40484:()=>o("default","react-dom",[0],(()=>m.e(3144).then((()=>()=>m(43144))))),11942:()=>o("default","@material-ui/styles",[0],(()=>m.e(5414).then((()=>()=>m(15414))))),9490:()=>o("default","@backstage/core-plugin-api",[0],(()=>Promise.all([m.e(1963),m.e(4218)]).then((()=>()=>m(41963))))),64218:()=>o("default","@backstage/version-bridge",[0],(()=>m.e(5007).then((()=>()=>m(97388))))),76322:()=>o("default","@emotion/cache",[0],(()=>m.e(2163).then((()=>()=>m(92163))))),5277:()=>o("default","@emotion/react",[0],(()=>m.e(6202).then((()=>()=>m(73821))))),9829:()=>o("default","react-router",[0],(()=>m.e(8690).then((()=>()=>m(18690))))),37976:()=>o("default","@material-ui/core/styles",[0],(()=>()=>m(64491))),79096:()=>o("default","@mui/styled-engine",[0],(()=>Promise.all([m.e(2952),m.e(6322),m.e(5277)]).then((()=>()=>m(92952)))))},y={484:[40484],1942:[11942],2469:[42469],4218:[64218],5277:[5277],5478:[95478],6322:[76322],7719:[37976,79096],9490:[9490],9829:[9829]},x={},m.f.consumes=(h,g)=>{m.o(y,h)&&y[h].forEach((h=>{if(m.o(d,h))return g.push(d[h]);if(!x[h]){var e=g=>{d[h]=0,m.m[h]=e=>{delete m.c[h],e.exports=g()}};x[h]=!0;var a=g=>{delete d[h],m.m[h]=e=>{throw delete m.c[h],g}};try{var t=f[h]();t.then?g.push(d[h]=t.then(e).catch(a)):e(t)}catch(h){a(h)}}}))},(()=>{var h={5258:0};m.f.j=(g,e)=>{var a=m.o(h,g)?h[g]:void 0;if(0!==a)if(a)e.push(a[2]);else if(/^(1942|2469|4218|484|5277|5478|6322|9490|9829)$/.test(g))h[g]=0;else{var t=new Promise(((e,t)=>a=h[g]=[e,t]));e.push(a[2]=t);var i=m.p+m.u(g),l=new Error;m.l(i,(e=>{if(m.o(h,g)&&(0!==(a=h[g])&&(h[g]=void 0),a)){var t=e&&("load"===e.type?"missing":e.type),i=e&&e.target&&e.target.src;l.message="Loading chunk "+g+" failed.\n("+t+": "+i+")",l.name="ChunkLoadError",l.type=t,l.request=i,a[1](l)}}),"chunk-"+g,g)}};var g=(g,e)=>{var a,t,[i,l,r]=e,n=0;if(i.some((g=>0!==h[g]))){for(a in l)m.o(l,a)&&(m.m[a]=l[a]);r&&r(m)}for(g&&g(e);n<i.length;n++)t=i[n],m.o(h,t)&&h[t]&&h[t][0](),h[t]=0},e=self.webpackChunkjanus_idp_backstage_plugin_orchestrator=self.webpackChunkjanus_idp_backstage_plugin_orchestrator||[];e.forEach(g.bind(null,0)),e.push=g.bind(null,e.push.bind(e))})(),m(92132)})());
+//# sourceMappingURL=janus-idp.backstage-plugin-orchestrator.97b1d3d81360459f44e4.js.map
\ No newline at end of file
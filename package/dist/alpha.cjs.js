@@ -0,0 +1,103 @@
+'use strict';
+
+Object.defineProperty(exports, '__esModule', { value: true });
+
+var backendCommon = require('@backstage/backend-common');
+var backendPluginApi = require('@backstage/backend-plugin-api');
+var alpha = require('@backstage/plugin-catalog-node/alpha');
+var pluginEventsBackend = require('@backstage/plugin-events-backend');
+var index = require('./cjs/index-c967581a.cjs.js');
+require('@backstage/catalog-model');
+require('@urql/core');
+require('@severlessworkflow/sdk-typescript');
+require('js-yaml');
+require('@backstage/integration');
+require('express');
+require('express-promise-router');
+require('cloudevents');
+require('@octokit/rest');
+require('@backstage/plugin-scaffolder-backend');
+require('fs-extra');
+require('crypto');
+require('path');
+require('stream');
+require('os');
+require('child_process');
+
+const orchestratorModuleEntityProvider = backendPluginApi.createBackendModule({
+  pluginId: "catalog",
+  moduleId: "orchestrator-entity-provider",
+  register(reg) {
+    reg.registerInit({
+      deps: {
+        logger: backendPluginApi.coreServices.logger,
+        config: backendPluginApi.coreServices.rootConfig,
+        discovery: backendPluginApi.coreServices.discovery,
+        scheduler: backendPluginApi.coreServices.scheduler,
+        catalog: alpha.catalogProcessingExtensionPoint
+      },
+      async init({ logger, config, discovery, scheduler, catalog }) {
+        const isIntegrationEnabled = !!config.getOptionalBoolean(
+          "orchestrator.catalog.isEnabled"
+        );
+        if (!isIntegrationEnabled) {
+          logger.info("The integration with the Catalog plugin is disabled.");
+          return;
+        }
+        const winstonLogger = backendCommon.loggerToWinstonLogger(logger);
+        const eventBroker = new pluginEventsBackend.DefaultEventBroker(winstonLogger);
+        const provider = await index.OrchestratorEntityProvider.fromConfig({
+          config,
+          discovery,
+          logger: winstonLogger,
+          scheduler
+        });
+        eventBroker.subscribe(provider);
+        catalog.addEntityProvider(provider);
+      }
+    });
+  }
+});
+
+const orchestratorPlugin = backendPluginApi.createBackendPlugin({
+  pluginId: "orchestrator",
+  register(env) {
+    env.registerInit({
+      deps: {
+        logger: backendPluginApi.coreServices.logger,
+        config: backendPluginApi.coreServices.rootConfig,
+        discovery: backendPluginApi.coreServices.discovery,
+        httpRouter: backendPluginApi.coreServices.httpRouter,
+        urlReader: backendPluginApi.coreServices.urlReader,
+        catalogApi: alpha.catalogServiceRef
+      },
+      async init({
+        logger,
+        config,
+        discovery,
+        httpRouter,
+        catalogApi,
+        urlReader
+      }) {
+        const log = backendCommon.loggerToWinstonLogger(logger);
+        const router = await index.createRouter({
+          eventBroker: new pluginEventsBackend.DefaultEventBroker(log),
+          config,
+          logger: log,
+          discovery,
+          catalogApi,
+          urlReader
+        });
+        httpRouter.use(router);
+      }
+    });
+  }
+});
+
+const dynamicPluginInstaller = {
+  kind: "new",
+  install: () => [orchestratorPlugin(), orchestratorModuleEntityProvider()]
+};
+
+exports.dynamicPluginInstaller = dynamicPluginInstaller;
+//# sourceMappingURL=alpha.cjs.js.map
@@ -0,0 +1,8 @@
+import { createApiRef } from '@backstage/core-plugin-api';
+
+const orchestratorApiRef = createApiRef({
+  id: "plugin.orchestrator.api"
+});
+
+export { orchestratorApiRef };
+//# sourceMappingURL=api.esm.js.map
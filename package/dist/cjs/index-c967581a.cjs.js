@@ -0,0 +1,2552 @@
+'use strict';
+
+var catalogModel = require('@backstage/catalog-model');
+var core = require('@urql/core');
+var sdkTypescript = require('@severlessworkflow/sdk-typescript');
+var jsYaml = require('js-yaml');
+var backendCommon = require('@backstage/backend-common');
+var integration = require('@backstage/integration');
+var express = require('express');
+var Router = require('express-promise-router');
+var cloudevents = require('cloudevents');
+var rest = require('@octokit/rest');
+var pluginScaffolderBackend = require('@backstage/plugin-scaffolder-backend');
+var fs = require('fs-extra');
+var crypto = require('crypto');
+var path = require('path');
+var stream = require('stream');
+var os = require('os');
+var child_process = require('child_process');
+
+function _interopDefaultLegacy (e) { return e && typeof e === 'object' && 'default' in e ? e : { 'default': e }; }
+
+var express__default = /*#__PURE__*/_interopDefaultLegacy(express);
+var Router__default = /*#__PURE__*/_interopDefaultLegacy(Router);
+var fs__default = /*#__PURE__*/_interopDefaultLegacy(fs);
+var path__default = /*#__PURE__*/_interopDefaultLegacy(path);
+var os__default = /*#__PURE__*/_interopDefaultLegacy(os);
+
+var WorkflowCategory = /* @__PURE__ */ ((WorkflowCategory2) => {
+  WorkflowCategory2["ASSESSMENT"] = "assessment";
+  WorkflowCategory2["INFRASTRUCTURE"] = "infrastructure";
+  return WorkflowCategory2;
+})(WorkflowCategory || {});
+
+const ORCHESTRATOR_SERVICE_READY_TOPIC = "orchestrator-service-ready";
+const SCHEMAS_FOLDER = "schemas";
+const SPECS_FOLDER = "specs";
+const JIRA_OPEN_API_FILE = "jira-openapi.json";
+const JIRA_OPEN_API_FILE_PATH = `${SPECS_FOLDER}/${JIRA_OPEN_API_FILE}`;
+const ACTIONS_OPEN_API_FILE = "actions-openapi.json";
+const ACTIONS_OPEN_API_FILE_PATH = `${SPECS_FOLDER}/${ACTIONS_OPEN_API_FILE}`;
+const SPEC_FILES = [ACTIONS_OPEN_API_FILE_PATH, JIRA_OPEN_API_FILE_PATH];
+const WORKFLOW_TYPE = "workflow";
+const DEFAULT_SONATAFLOW_CONTAINER_IMAGE = "quay.io/kiegroup/kogito-swf-devmode-nightly:main-2024-01-08";
+const DEFAULT_SONATAFLOW_PERSISTANCE_PATH = "/home/kogito/persistence";
+const DEFAULT_CATALOG_OWNER = "orchestrator";
+const DEFAULT_CATALOG_ENVIRONMENT = "development";
+const DEFAULT_SONATAFLOW_BASE_URL = "http://localhost";
+const DEFAULT_WORKFLOWS_PATH = "workflows";
+const ASSESSMENT_WORKFLOW_TYPE = "workflow-type/assessment";
+
+function fromWorkflowSource(content) {
+  var _a;
+  const parsed = sdkTypescript.Specification.Workflow.fromSource(content);
+  const workflow = (_a = parsed.sourceModel) != null ? _a : parsed;
+  return removeProperty(workflow, "normalize");
+}
+function toWorkflowString(definition, format) {
+  switch (format) {
+    case "json":
+      return toWorkflowJson(definition);
+    case "yaml":
+      return toWorkflowYaml(definition);
+    default:
+      throw new Error(`Unsupported format ${format}`);
+  }
+}
+function toWorkflowJson(definition) {
+  return JSON.stringify(definition, null, 2);
+}
+function toWorkflowYaml(definition) {
+  return jsYaml.dump(definition);
+}
+function extractWorkflowFormatFromUri(uri) {
+  const match = RegExp(/\.sw\.(json|yaml|yml)$/).exec(uri);
+  if (match) {
+    if (match[1] === "yml" || match[1] === "yaml") {
+      return "yaml";
+    }
+    if (match[1] === "json") {
+      return "json";
+    }
+  }
+  throw new Error(`Unsupported workflow format for uri ${uri}`);
+}
+function getWorkflowCategory(definition) {
+  var _a;
+  if (definition === void 0) {
+    return WorkflowCategory.INFRASTRUCTURE;
+  }
+  return ((_a = definition == null ? void 0 : definition.annotations) == null ? void 0 : _a.find(
+    (annotation) => annotation === ASSESSMENT_WORKFLOW_TYPE
+  )) ? WorkflowCategory.ASSESSMENT : WorkflowCategory.INFRASTRUCTURE;
+}
+function removeProperty(obj, propToDelete) {
+  if (typeof obj !== "object" || obj === null) {
+    return obj;
+  }
+  if (Array.isArray(obj)) {
+    return obj.map((item) => removeProperty(item, propToDelete));
+  }
+  const newObj = {};
+  for (const key in obj) {
+    if (key !== propToDelete) {
+      newObj[key] = removeProperty(obj[key], propToDelete);
+    }
+  }
+  return newObj;
+}
+
+var __defProp$7 = Object.defineProperty;
+var __defNormalProp$7 = (obj, key, value) => key in obj ? __defProp$7(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$7 = (obj, key, value) => {
+  __defNormalProp$7(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+class OrchestratorEntityProvider {
+  constructor(args) {
+    __publicField$7(this, "connection");
+    __publicField$7(this, "scheduler");
+    __publicField$7(this, "logger");
+    __publicField$7(this, "owner");
+    __publicField$7(this, "environment");
+    __publicField$7(this, "orchestratorPluginUrl");
+    this.orchestratorPluginUrl = args.orchestratorPluginUrl;
+    this.scheduler = args.scheduler;
+    this.owner = args.owner;
+    this.logger = args.logger;
+    this.environment = args.environment;
+  }
+  static async fromConfig(args) {
+    var _a, _b;
+    const owner = (_a = args.config.getOptionalString("orchestrator.catalog.owner")) != null ? _a : DEFAULT_CATALOG_OWNER;
+    const environment = (_b = args.config.getOptionalString("orchestrator.catalog.environment")) != null ? _b : DEFAULT_CATALOG_ENVIRONMENT;
+    const orchestratorPluginUrl = await args.discovery.getBaseUrl("orchestrator");
+    return new OrchestratorEntityProvider({
+      orchestratorPluginUrl,
+      scheduler: args.scheduler,
+      logger: args.logger,
+      owner,
+      environment
+    });
+  }
+  getProviderName() {
+    return OrchestratorEntityProvider.name;
+  }
+  supportsEventTopics() {
+    return [ORCHESTRATOR_SERVICE_READY_TOPIC];
+  }
+  async connect(connection) {
+    this.connection = connection;
+    this.scheduler.scheduleTask({
+      id: `${this.getProviderName()}__task`,
+      fn: async () => {
+        await this.run();
+      },
+      frequency: { seconds: 5 },
+      timeout: { minutes: 10 }
+    });
+  }
+  async onEvent(params) {
+    if (params.topic !== ORCHESTRATOR_SERVICE_READY_TOPIC) {
+      return;
+    }
+    await this.run();
+  }
+  async run() {
+    if (!this.connection) {
+      return;
+    }
+    this.logger.info("Retrieving workflow definitions");
+    try {
+      const svcResponse = await fetch(
+        `${this.orchestratorPluginUrl}/workflows`
+      );
+      const json = await svcResponse.json();
+      const items = json.items;
+      const entities = (items == null ? void 0 : items.length) ? this.workflowToTemplateEntities(items) : [];
+      await this.connection.applyMutation({
+        type: "full",
+        entities: entities.map((entity) => ({
+          entity,
+          locationKey: `${this.getProviderName()}:${this.environment}`
+        }))
+      });
+    } catch (e) {
+      this.logger.error("Error retrieving workflow definitions", e);
+    }
+  }
+  workflowToTemplateEntities(items) {
+    return items.filter((i) => i.serviceUrl).map((i) => {
+      const sanitizedId = i.definition.id.replace(/ /g, "_");
+      const category = getWorkflowCategory(i.definition);
+      return {
+        apiVersion: "scaffolder.backstage.io/v1beta3",
+        kind: "Template",
+        metadata: {
+          name: sanitizedId,
+          title: i.definition.name,
+          description: i.definition.description,
+          tags: [category],
+          annotations: {
+            [catalogModel.ANNOTATION_LOCATION]: `url:${i.serviceUrl}`,
+            [catalogModel.ANNOTATION_ORIGIN_LOCATION]: `url:${i.serviceUrl}`,
+            [catalogModel.ANNOTATION_SOURCE_LOCATION]: `url:${i.serviceUrl}/management/processes/${sanitizedId}/source`,
+            [catalogModel.ANNOTATION_VIEW_URL]: `${i.serviceUrl}/management/processes/${sanitizedId}/source`
+          }
+        },
+        spec: {
+          owner: this.owner,
+          type: WORKFLOW_TYPE,
+          steps: []
+        }
+      };
+    });
+  }
+}
+
+const NO_DATA_INDEX_URL = "NO_DATA_INDEX_URL";
+const NO_CLIENT_PROVIDED = "NO_CLIENT_PROVIDED";
+const SWF_BACKEND_NOT_INITED = "SWF_BACKEND_NOT_INITED";
+class ErrorBuilder {
+  static NewBackendError(name, message) {
+    const e = new Error(message);
+    e.name = name;
+    return e;
+  }
+  static GET_NO_DATA_INDEX_URL_ERR() {
+    return this.NewBackendError(
+      NO_DATA_INDEX_URL,
+      "No data index url specified or found"
+    );
+  }
+  static GET_NO_CLIENT_PROVIDED_ERR() {
+    return this.NewBackendError(
+      NO_CLIENT_PROVIDED,
+      "No or null graphql client"
+    );
+  }
+  static GET_SWF_BACKEND_NOT_INITED() {
+    return this.NewBackendError(
+      SWF_BACKEND_NOT_INITED,
+      "The SonataFlow backend is not initialized, call initialize() method before trying to get the workflows."
+    );
+  }
+}
+
+var __defProp$6 = Object.defineProperty;
+var __defNormalProp$6 = (obj, key, value) => key in obj ? __defProp$6(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$6 = (obj, key, value) => {
+  __defNormalProp$6(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+class DataIndexService {
+  constructor(dataIndexUrl, logger) {
+    this.dataIndexUrl = dataIndexUrl;
+    this.logger = logger;
+    __publicField$6(this, "client");
+    if (!dataIndexUrl.length) {
+      throw ErrorBuilder.GET_NO_DATA_INDEX_URL_ERR();
+    }
+    this.client = this.getNewGraphQLClient();
+    this.logger.info("DataIndexService Initialized");
+  }
+  getNewGraphQLClient() {
+    const diURL = `${this.dataIndexUrl}/graphql`;
+    return new core.Client({
+      url: diURL,
+      exchanges: [core.fetchExchange]
+    });
+  }
+  async abortWorkflowInstance(workflowId) {
+    this.logger.info(`Aborting workflow instance ${workflowId}`);
+    const ProcessInstanceAbortMutationDocument = core.gql`
+      mutation ProcessInstanceAbortMutation($id: String) {
+        ProcessInstanceAbort(id: $id)
+      }
+    `;
+    const result = await this.client.mutation(ProcessInstanceAbortMutationDocument, { id: workflowId }).toPromise();
+    if (result.error) {
+      this.logger.error(
+        `Error aborting workflow instance ${workflowId}: ${result.error}`
+      );
+    }
+    this.logger.debug(`Successfully aborted workflow instance ${workflowId}`);
+    return result;
+  }
+  async getWorkflowDefinition(definitionId) {
+    const graphQlQuery = `{ ProcessDefinitions ( where: {id: {equal: "${definitionId}" } } ) { id, name, version, type, endpoint, serviceUrl, source } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    if (result.error) {
+      this.logger.error(`Error fetching workflow definition ${result.error}`);
+      throw result.error;
+    }
+    return result.data.ProcessDefinitions[0];
+  }
+  async getWorkflowDefinitions() {
+    const QUERY = `
+        query ProcessDefinitions {
+            ProcessDefinitions {
+                id
+                name
+                version
+                type
+                endpoint
+                serviceUrl
+            }
+        }
+      `;
+    this.logger.info(`getWorkflowDefinitions() called:  ${this.dataIndexUrl}`);
+    const result = await this.client.query(QUERY, {});
+    if (result.error) {
+      this.logger.error(
+        `Error fetching data index swf results ${result.error}`
+      );
+      throw result.error;
+    }
+    return result.data.ProcessDefinitions;
+  }
+  async fetchProcessInstances() {
+    const graphQlQuery = "{ ProcessInstances ( orderBy: { start: ASC }, where: {processId: {isNull: false} } ) { id, processName, processId, businessKey, state, start, lastUpdate, end, nodes { id }, variables, parentProcessInstance {id, processName, businessKey} } }";
+    const response = await this.client.query(graphQlQuery, {});
+    if (response.error) {
+      this.logger.error(`Error when fetching instances: ${response.error}`);
+      throw response.error;
+    }
+    const processInstancesSrc = response.data.ProcessInstances;
+    const processInstances = await Promise.all(
+      processInstancesSrc.map(async (instance) => {
+        return await this.getWorkflowDefinitionFromInstance(instance);
+      })
+    );
+    return processInstances;
+  }
+  async getWorkflowDefinitionFromInstance(instance) {
+    const workflowItem = await this.getWorkflowDefinition(
+      instance.processId
+    );
+    if (!(workflowItem == null ? void 0 : workflowItem.source)) {
+      throw new Error(
+        `Workflow defintion is required to fetch instance ${instance.id}`
+      );
+    }
+    const workflowDefinitionSrc = fromWorkflowSource(
+      workflowItem.source
+    );
+    if (workflowItem) {
+      instance.category = getWorkflowCategory(workflowDefinitionSrc);
+      instance.description = workflowItem.description;
+    }
+    return instance;
+  }
+  async fetchWorkflowSource(workflowId) {
+    const graphQlQuery = `{ ProcessDefinitions ( where: {id: {equal: "${workflowId}" } } ) { id, source } }`;
+    const response = await this.client.query(graphQlQuery, {});
+    if (response.error) {
+      this.logger.error(
+        `Error when fetching workflow source: ${response.error}`
+      );
+      return void 0;
+    }
+    return response.data.ProcessDefinitions[0].source;
+  }
+  async fetchWorkflowInstances(workflowId, limit, offset) {
+    const graphQlQuery = `{ ProcessInstances(where: {processId: {equal: "${workflowId}" } }, pagination: {limit: ${limit}, offset: ${offset}}) { processName, state, start, lastUpdate, end } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching workflow instances: ${result.error}`
+      );
+      throw result.error;
+    }
+    return result.data.ProcessInstances;
+  }
+  async fetchProcessInstanceJobs(instanceId) {
+    const graphQlQuery = `{ Jobs (where: { processInstanceId: { equal: "${instanceId}" } }) { id, processId, processInstanceId, rootProcessId, status, expirationTime, priority, callbackEndpoint, repeatInterval, repeatLimit, scheduledId, retries, lastUpdate, endpoint, nodeInstanceId, executionCounter } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    if (result.error) {
+      this.logger.error(`Error when fetching jobs instances: ${result.error}`);
+      throw result.error;
+    }
+    return result.data.Jobs;
+  }
+  async fetchProcessInstance(instanceId) {
+    const graphQlQuery = `{ ProcessInstances (where: { id: {equal: "${instanceId}" } } ) { id, processName, processId, businessKey, state, start, lastUpdate, end, nodes { id, nodeId, definitionId, type, name, enter, exit }, variables, parentProcessInstance {id, processName, businessKey}, error { nodeDefinitionId, message} } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching process instances: ${result.error}`
+      );
+      throw result.error;
+    }
+    const instance = result.data.ProcessInstances[0];
+    const workflowItem = await this.getWorkflowDefinition(
+      instance.processId
+    );
+    if (!(workflowItem == null ? void 0 : workflowItem.source)) {
+      throw new Error(
+        `Workflow defintion is required to fetch instance ${instance.id}`
+      );
+    }
+    const workflowDefinitionSrc = fromWorkflowSource(
+      workflowItem.source
+    );
+    if (workflowItem) {
+      instance.category = getWorkflowCategory(workflowDefinitionSrc);
+      instance.description = workflowDefinitionSrc.description;
+    }
+    return instance;
+  }
+}
+
+class ApiResponseBuilder {
+  static SUCCESS_RESPONSE(result, message = "success") {
+    return {
+      result,
+      message
+    };
+  }
+  static VALIDATION_ERR_RESPONSE(backEndErrCd = "backend validation error code", message = "backend validation error") {
+    return {
+      message,
+      backEndErrCd
+    };
+  }
+  static HTTP_ERR_RESPONSE(message = "Internal Server Error") {
+    return {
+      result: null,
+      message
+    };
+  }
+}
+
+class CloudEventService {
+  constructor(logger) {
+    this.logger = logger;
+  }
+  async send(args) {
+    try {
+      if (!args.endpoint) {
+        throw new Error("Endpoint is required");
+      }
+      const targetUrl = args.endpoint;
+      this.logger.info(
+        `Sending CloudEvent to ${targetUrl} with data ${JSON.stringify(
+          args.event
+        )}`
+      );
+      const emit = cloudevents.emitterFor(cloudevents.httpTransport(targetUrl));
+      await emit(args.event);
+      return { success: true };
+    } catch (e) {
+      this.logger.error(e);
+      return {
+        success: false,
+        error: e.message
+      };
+    }
+  }
+}
+
+var __defProp$5 = Object.defineProperty;
+var __defNormalProp$5 = (obj, key, value) => key in obj ? __defProp$5(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$5 = (obj, key, value) => {
+  __defNormalProp$5(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+const JSON_SCHEMA_VERSION = "http://json-schema.org/draft-04/schema#";
+const FETCH_TEMPLATE_ACTION_OPERATION_ID = "fetch:template";
+const Regex = {
+  VALUES_IN_SKELETON: /\{\{[%-]?\s*values\.(\w+)\s*[%-]?}}/gi,
+  CONDITION_IN_SKELETON: /\{%-?\s*if\s*values\.(\w+)\s*(?:%-?})?/gi,
+  GITHUB_URL: /^https:\/\/github\.com\/([^/]+)\/([^/]+)\/(?:tree|blob)\/([^/]+)\/(.+)$/,
+  GITHUB_API_URL: /^https:\/\/api\.github\.com\/repos\/([^/]+)\/([^/]+)\/contents\/(.+)\?ref=(.+)$/,
+  NAIVE_ARG_IN_JQ: /^\$\{[^}]*}$|^(\.[^\s.{]+)(?!\.)$/,
+  NON_ALPHA_NUMERIC: /[^a-zA-Z0-9]+/g,
+  SNAKE_CASE: /_([a-z])/g,
+  CAMEL_CASE: /([A-Z])/g
+};
+class DataInputSchemaService {
+  constructor(logger, githubToken) {
+    this.logger = logger;
+    __publicField$5(this, "octokit");
+    __publicField$5(this, "decoder", new TextDecoder("utf-8"));
+    this.octokit = new rest.Octokit({ auth: githubToken });
+  }
+  resolveObject(obj) {
+    return { ...obj != null ? obj : {} };
+  }
+  resolveAnyToArray(value) {
+    if (Array.isArray(value)) {
+      return this.resolveArray(value);
+    }
+    return [];
+  }
+  resolveArray(arr) {
+    return [...arr != null ? arr : []];
+  }
+  resolveObjectIfNotEmpty(obj) {
+    return Object.keys(obj != null ? obj : {}).length ? obj : void 0;
+  }
+  resolveArrayIfNotEmpty(arr) {
+    return arr.length ? arr : void 0;
+  }
+  resolveTransitionName(d) {
+    return typeof d.transition === "string" ? d.transition : d.transition.nextState;
+  }
+  resolveSingleConditionalSchema(conditionalActionSchemas) {
+    if (conditionalActionSchemas.length === 1 && this.resolveObjectIfNotEmpty(
+      conditionalActionSchemas[0].jsonSchema.properties
+    )) {
+      return conditionalActionSchemas[0];
+    }
+    return void 0;
+  }
+  async generate(args) {
+    const workflow = args.definition;
+    const actionSchemas = [];
+    const workflowArgsMap = /* @__PURE__ */ new Map();
+    const stateHandled = /* @__PURE__ */ new Set();
+    for (const state of workflow.states) {
+      if (stateHandled.has(state.name)) {
+        continue;
+      }
+      stateHandled.add(state.name);
+      if (state.type === "switch") {
+        const dataConditions = state.dataConditions;
+        const conditionalStateNames = dataConditions == null ? void 0 : dataConditions.filter((d) => d.transition).map((d) => this.resolveTransitionName(d));
+        const conditionalStates = workflow.states.filter(
+          (s) => conditionalStateNames.includes(s.name)
+        );
+        const { conditionalActionSchemas, conditionalStatesHandled } = await this.extractConditionalSchemas({
+          workflow,
+          openApi: args.openApi,
+          conditionalStates,
+          workflowArgsMap
+        });
+        conditionalStatesHandled.forEach((s) => stateHandled.add(s));
+        if (conditionalActionSchemas.length <= 1) {
+          const singleConditionalSchema = this.resolveSingleConditionalSchema(
+            conditionalActionSchemas
+          );
+          if (singleConditionalSchema) {
+            actionSchemas.push(singleConditionalSchema);
+          }
+          continue;
+        }
+        const conditionalDescriptor = this.buildActionDescriptor({
+          stateName: state.name
+        });
+        const oneOfSchema = this.buildJsonSchemaSkeleton({
+          owner: state.name,
+          workflowId: workflow.id,
+          title: conditionalDescriptor,
+          filename: this.sanitizeText({
+            text: conditionalDescriptor,
+            placeholder: "_"
+          })
+        });
+        oneOfSchema.jsonSchema.oneOf = conditionalActionSchemas.map((s) => ({
+          title: s.owner,
+          type: "object",
+          properties: {
+            [s.owner]: { type: "boolean", default: true },
+            ...s.jsonSchema.properties
+          },
+          required: [
+            s.owner,
+            ...this.resolveAnyToArray(s.jsonSchema.required)
+          ]
+        }));
+        actionSchemas.push(oneOfSchema);
+      } else {
+        const actionSchemasFromState = await this.extractSchemasFromStates({
+          workflow,
+          openApi: args.openApi,
+          state,
+          workflowArgsMap
+        });
+        actionSchemas.push(...actionSchemasFromState);
+      }
+    }
+    const variableSetSchema = this.extractAdditionalSchemaFromWorkflow({
+      workflow,
+      workflowArgsMap
+    });
+    if (variableSetSchema) {
+      actionSchemas.push(variableSetSchema);
+    }
+    if (!actionSchemas.length) {
+      return null;
+    }
+    const compositionSchema = this.buildJsonSchemaSkeleton({
+      workflowId: workflow.id,
+      title: "Data Input Schema"
+    });
+    actionSchemas.forEach((actionSchema) => {
+      compositionSchema.jsonSchema.properties = {
+        ...this.resolveObject(compositionSchema.jsonSchema.properties),
+        [`${actionSchema.fileName}`]: {
+          $ref: actionSchema.fileName,
+          type: actionSchema.jsonSchema.type,
+          description: actionSchema.jsonSchema.description
+        }
+      };
+    });
+    return { compositionSchema, actionSchemas };
+  }
+  extractAdditionalSchemaFromWorkflow(args) {
+    const workflowVariableSet = this.extractVariablesFromWorkflow(
+      args.workflow
+    );
+    if (!workflowVariableSet.size || !args.workflow.states.length) {
+      return void 0;
+    }
+    const additionalInputTitle = "Additional input data";
+    const variableSetSchema = this.buildJsonSchemaSkeleton({
+      owner: "Workflow",
+      workflowId: args.workflow.id,
+      title: additionalInputTitle,
+      filename: this.sanitizeText({
+        text: additionalInputTitle,
+        placeholder: "_"
+      })
+    });
+    Array.from(workflowVariableSet).filter((v) => !args.workflowArgsMap.get(v)).forEach((item) => {
+      variableSetSchema.jsonSchema.properties = {
+        ...this.resolveObject(variableSetSchema.jsonSchema.properties),
+        [item]: {
+          title: item,
+          type: "string",
+          description: "Extracted from the Workflow definition"
+        }
+      };
+    });
+    if (!this.resolveObjectIfNotEmpty(variableSetSchema.jsonSchema.properties)) {
+      return void 0;
+    }
+    return variableSetSchema;
+  }
+  async extractConditionalSchemas(args) {
+    const conditionalActionSchemas = [];
+    const conditionalStatesHandled = /* @__PURE__ */ new Set();
+    for (const conditionalState of args.conditionalStates) {
+      conditionalStatesHandled.add(conditionalState.name);
+      const conditionalSchemas = await this.extractConditionalSchemasFromState({
+        workflow: args.workflow,
+        openApi: args.openApi,
+        conditionalState,
+        workflowArgsMap: args.workflowArgsMap
+      });
+      conditionalActionSchemas.push(...conditionalSchemas);
+    }
+    return { conditionalActionSchemas, conditionalStatesHandled };
+  }
+  async extractConditionalSchemasFromState(args) {
+    const schemas = [];
+    const actions = this.extractActionsFromState(args.conditionalState);
+    for (const actionDescriptor of actions) {
+      const result = await this.extractSchemaFromState({
+        workflow: args.workflow,
+        openApi: args.openApi,
+        actionDescriptor,
+        workflowArgsMap: args.workflowArgsMap,
+        isConditional: true
+      });
+      if (!result) {
+        continue;
+      }
+      schemas.push(result.actionSchema);
+    }
+    return schemas;
+  }
+  async extractTemplateFromSkeletonUrl(args) {
+    const githubPath = this.convertToGitHubApiUrl(args.url);
+    if (!githubPath) {
+      return void 0;
+    }
+    const skeletonValues = await this.extractTemplateValuesFromSkeletonUrl(githubPath);
+    if (!skeletonValues && !args.isConditional) {
+      return void 0;
+    }
+    const fixedSkeletonUrl = `https://github.com/${githubPath.owner}/${githubPath.repo}/tree/${githubPath.ref}/${githubPath.path}`;
+    return {
+      values: skeletonValues,
+      url: fixedSkeletonUrl
+    };
+  }
+  async extractSchemasFromStates(args) {
+    const schemas = [];
+    for (const actionDescriptor of this.extractActionsFromState(args.state)) {
+      const result = await this.extractSchemaFromState({
+        workflow: args.workflow,
+        openApi: args.openApi,
+        actionDescriptor,
+        workflowArgsMap: args.workflowArgsMap,
+        isConditional: false
+      });
+      if (!result) {
+        continue;
+      }
+      const { actionSchema, argsMap } = result;
+      argsMap.forEach((v, k) => {
+        args.workflowArgsMap.set(k, v);
+      });
+      schemas.push(actionSchema);
+    }
+    return schemas;
+  }
+  isValidTemplateAction(workflowArgsToFilter) {
+    return workflowArgsToFilter.url && workflowArgsToFilter.values && Object.keys(workflowArgsToFilter.values).length;
+  }
+  extractFilteredArgId(args) {
+    if (args.map.has(args.key)) {
+      if (args.map.get(args.key) === args.value) {
+        return void 0;
+      }
+      return this.sanitizeText({
+        text: `${args.description} ${args.key}`,
+        placeholder: "_"
+      });
+    }
+    return args.key;
+  }
+  extractWorkflowFunction(args) {
+    const functionRef = args.actionDescriptor.action.functionRef;
+    if (!functionRef.arguments) {
+      this.logger.info(
+        `No arguments found for function ${functionRef.refName}. Skipping...`
+      );
+      return void 0;
+    }
+    const operationId = this.extractOperationIdByWorkflowFunctionName({
+      workflow: args.workflow,
+      functionName: functionRef.refName
+    });
+    if (!operationId) {
+      this.logger.info(
+        `No operation id found for function ${functionRef.refName}. Skipping...`
+      );
+      return void 0;
+    }
+    const refSchema = this.extractSchemaByOperationId({
+      openApi: args.openApi,
+      operationId
+    });
+    if (!refSchema) {
+      this.logger.info(
+        `The schema associated with ${operationId} could not be found. Skipping...`
+      );
+      return void 0;
+    }
+    return {
+      operationId,
+      ref: functionRef,
+      schema: refSchema
+    };
+  }
+  async extractSchemaFromState(args) {
+    var _a;
+    const wfFunction = this.extractWorkflowFunction({
+      workflow: args.workflow,
+      actionDescriptor: args.actionDescriptor,
+      openApi: args.openApi
+    });
+    if (!wfFunction) {
+      return void 0;
+    }
+    const schemaPropsToFilter = this.resolveObject(
+      wfFunction.schema.properties
+    );
+    const workflowArgsToFilter = {
+      ...wfFunction.ref.arguments
+    };
+    if (wfFunction.operationId === FETCH_TEMPLATE_ACTION_OPERATION_ID) {
+      if (!this.isValidTemplateAction(workflowArgsToFilter)) {
+        return void 0;
+      }
+      const template = await this.extractTemplateFromSkeletonUrl({
+        url: workflowArgsToFilter.url,
+        isConditional: args.isConditional
+      });
+      template == null ? void 0 : template.values.forEach((v) => {
+        schemaPropsToFilter[v] = {
+          title: v,
+          description: `Extracted from ${template.url}`,
+          type: "string"
+        };
+        schemaPropsToFilter[this.snakeCaseToCamelCase(v)] = {
+          title: this.snakeCaseToCamelCase(v),
+          description: `Extracted from ${template.url}`,
+          type: "string"
+        };
+        schemaPropsToFilter[this.camelCaseToSnakeCase(v)] = {
+          title: this.camelCaseToSnakeCase(v),
+          description: `Extracted from ${template.url}`,
+          type: "string"
+        };
+      });
+      Object.keys(workflowArgsToFilter.values).forEach((k) => {
+        workflowArgsToFilter[k] = workflowArgsToFilter.values[k];
+      });
+    }
+    if ((_a = wfFunction.schema.oneOf) == null ? void 0 : _a.length) {
+      const oneOfSchema = wfFunction.schema.oneOf.find(
+        (item) => Object.keys(workflowArgsToFilter).some(
+          (arg) => Object.keys(item.properties).includes(arg)
+        )
+      );
+      if (!(oneOfSchema == null ? void 0 : oneOfSchema.properties)) {
+        return void 0;
+      }
+      Object.entries(oneOfSchema.properties).forEach(([k, v]) => {
+        schemaPropsToFilter[k] = {
+          ...v
+        };
+      });
+    }
+    const requiredArgsToShow = this.extractRequiredArgsToShow(workflowArgsToFilter);
+    if (!Object.keys(requiredArgsToShow).length) {
+      return void 0;
+    }
+    const argsMap = new Map(args.workflowArgsMap);
+    const filteredProperties = {};
+    const filteredRequired = [];
+    for (const [argKey, argValue] of Object.entries(requiredArgsToShow)) {
+      if (!schemaPropsToFilter.hasOwnProperty(argKey)) {
+        continue;
+      }
+      const argId = this.extractFilteredArgId({
+        map: argsMap,
+        key: argKey,
+        value: argValue,
+        description: args.actionDescriptor.descriptor
+      });
+      if (!argId) {
+        continue;
+      }
+      argsMap.set(argId, argValue);
+      filteredProperties[argId] = {
+        ...schemaPropsToFilter[argKey]
+      };
+      filteredRequired.push(argKey);
+    }
+    const updatedSchema = {
+      properties: this.resolveObjectIfNotEmpty(filteredProperties),
+      required: this.resolveArrayIfNotEmpty(filteredRequired)
+    };
+    if (!updatedSchema.properties && !args.isConditional) {
+      return void 0;
+    }
+    const actionSchema = this.buildJsonSchemaSkeleton({
+      owner: args.actionDescriptor.owner,
+      workflowId: args.workflow.id,
+      title: args.actionDescriptor.descriptor,
+      filename: this.sanitizeText({
+        text: args.actionDescriptor.descriptor,
+        placeholder: "_"
+      })
+    });
+    actionSchema.jsonSchema = {
+      ...actionSchema.jsonSchema,
+      ...updatedSchema
+    };
+    return { actionSchema, argsMap };
+  }
+  extractRequiredArgsToShow(argsToFilter) {
+    return Object.entries(argsToFilter).reduce((obj, [k, v]) => {
+      if (typeof v === "string" && Regex.NAIVE_ARG_IN_JQ.test(String(v.trim()))) {
+        obj[k] = v;
+      }
+      return obj;
+    }, {});
+  }
+  extractSchemaByOperationId(args) {
+    var _a, _b;
+    const openApiOperation = this.extractOperationFromOpenApi({
+      openApi: args.openApi,
+      operationId: args.operationId
+    });
+    if (!(openApiOperation == null ? void 0 : openApiOperation.requestBody)) {
+      this.logger.info(
+        `The operation associated with ${args.operationId} has no requestBody.`
+      );
+      return void 0;
+    }
+    const requestBodyContent = openApiOperation.requestBody.content;
+    if (!requestBodyContent) {
+      this.logger.info(
+        `The request body associated with ${args.operationId} has no content.`
+      );
+      return void 0;
+    }
+    const bodyContent = Object.values(requestBodyContent).pop();
+    if (!(bodyContent == null ? void 0 : bodyContent.schema)) {
+      this.logger.info(
+        `The body content associated with ${args.operationId} has no schema.`
+      );
+      return void 0;
+    }
+    const $ref = bodyContent.schema.$ref;
+    if (!$ref) {
+      this.logger.info(
+        `The schema associated with ${args.operationId} has no $ref.`
+      );
+      return void 0;
+    }
+    const refParts = $ref.split("/");
+    const refKey = refParts[refParts.length - 1];
+    return (_b = (_a = args.openApi.components) == null ? void 0 : _a.schemas) == null ? void 0 : _b[refKey];
+  }
+  extractActionsFromState(state) {
+    if (state.type === "operation" || state.type === "foreach") {
+      return this.extractActionsFromOperationState({ state });
+    } else if (state.type === "parallel") {
+      return this.extractActionsFromParallelState({ state });
+    } else if (state.type === "event") {
+      return this.extractActionsFromEventState({ state });
+    } else if (state.type === "callback") {
+      return this.extractActionsFromCallbackState({ state });
+    }
+    return [];
+  }
+  buildActionDescriptor(args) {
+    const separator = " > ";
+    let descriptor = args.stateName;
+    if (args.outerItem) {
+      if (args.outerItem.kind === "Unique") {
+        descriptor += `${separator}${args.outerItem.name}`;
+      } else if (args.outerItem.array.length > 1) {
+        descriptor += `${separator}${args.outerItem.name}-${args.outerItem.idx + 1}`;
+      }
+    }
+    if (args.actionName) {
+      descriptor += `${separator}${args.actionName}`;
+    }
+    if (args.functionRefName) {
+      descriptor += `${separator}${args.functionRefName}`;
+    }
+    if (!args.actionName && args.actions && args.actions.array.length > 1) {
+      descriptor += `${separator}${args.actions.idx + 1}`;
+    }
+    return descriptor;
+  }
+  extractActionsFromOperationState(args) {
+    if (!args.state.actions) {
+      return [];
+    }
+    return args.state.actions.filter((action) => {
+      if (!action.functionRef || typeof action.functionRef === "string") {
+        return false;
+      }
+      if (!args.functionRefName) {
+        return true;
+      }
+      return action.functionRef.refName === args.functionRefName;
+    }).map((action, idx, arr) => {
+      const descriptor = this.buildActionDescriptor({
+        actionName: action.name,
+        stateName: args.state.name,
+        functionRefName: action.functionRef.refName,
+        actions: {
+          array: arr,
+          idx
+        }
+      });
+      return { owner: args.state.name, descriptor, action };
+    });
+  }
+  extractActionsFromParallelState(args) {
+    if (!args.state.branches) {
+      return [];
+    }
+    return args.state.branches.map(
+      (branch) => branch.actions.filter((action) => {
+        if (!action.functionRef || typeof action.functionRef === "string") {
+          return false;
+        }
+        if (!args.functionRefName) {
+          return true;
+        }
+        return action.functionRef.refName === args.functionRefName;
+      }).map((action, idx, arr) => {
+        const descriptor = this.buildActionDescriptor({
+          actionName: action.name,
+          outerItem: {
+            kind: "Unique",
+            name: branch.name
+          },
+          stateName: args.state.name,
+          functionRefName: action.functionRef.refName,
+          actions: {
+            array: arr,
+            idx
+          }
+        });
+        return { owner: args.state.name, descriptor, action };
+      })
+    ).flat();
+  }
+  extractActionsFromEventState(args) {
+    if (!args.state.onEvents) {
+      return [];
+    }
+    return args.state.onEvents.map((onEvent, eIdx, eArr) => {
+      if (!onEvent.actions) {
+        return [];
+      }
+      return onEvent.actions.filter((action) => {
+        if (!action.functionRef || typeof action.functionRef === "string") {
+          return false;
+        }
+        if (!args.functionRefName) {
+          return true;
+        }
+        return action.functionRef.refName === args.functionRefName;
+      }).map((action, aIdx, aArr) => {
+        const descriptor = this.buildActionDescriptor({
+          actionName: action.name,
+          stateName: args.state.name,
+          functionRefName: action.functionRef.refName,
+          actions: {
+            array: aArr,
+            idx: aIdx
+          },
+          outerItem: {
+            kind: "Array",
+            name: "onEvent",
+            array: eArr,
+            idx: eIdx
+          }
+        });
+        return { owner: args.state.name, descriptor, action };
+      });
+    }).flat();
+  }
+  extractActionsFromCallbackState(args) {
+    var _a;
+    if (!((_a = args.state.action) == null ? void 0 : _a.functionRef) || typeof args.state.action.functionRef === "string" || args.functionRefName && args.state.action.functionRef.refName !== args.functionRefName) {
+      return [];
+    }
+    const descriptor = this.buildActionDescriptor({
+      actionName: args.state.action.name,
+      stateName: args.state.name,
+      functionRefName: args.state.action.functionRef.refName
+    });
+    return [{ owner: args.state.name, descriptor, action: args.state.action }];
+  }
+  snakeCaseToCamelCase(input) {
+    return input.replace(Regex.SNAKE_CASE, (_, letter) => letter.toUpperCase());
+  }
+  camelCaseToSnakeCase(input) {
+    return input.replace(
+      Regex.CAMEL_CASE,
+      (_, letter) => `_${letter.toLowerCase()}`
+    );
+  }
+  sanitizeText(args) {
+    const parts = args.text.trim().split(Regex.NON_ALPHA_NUMERIC);
+    return parts.join(args.placeholder);
+  }
+  buildJsonSchemaSkeleton(args) {
+    var _a;
+    const fullFileName = args.owner ? `${args.workflowId}__sub_schema__${args.filename}.json` : `${args.workflowId}__main_schema.json`;
+    return {
+      owner: (_a = args.owner) != null ? _a : "Workflow",
+      fileName: fullFileName,
+      jsonSchema: {
+        title: `${args.workflowId}: ${args.title}`,
+        $schema: JSON_SCHEMA_VERSION,
+        type: "object"
+      }
+    };
+  }
+  extractOperationIdFromWorkflowFunction(workflowFunction) {
+    return workflowFunction.operation.split("#")[1];
+  }
+  extractOperationIdByWorkflowFunctionName(args) {
+    if (!Array.isArray(args.workflow.functions)) {
+      return void 0;
+    }
+    const workflowFunction = args.workflow.functions.find(
+      (f) => f.name === args.functionName
+    );
+    if (!workflowFunction) {
+      return void 0;
+    }
+    return this.extractOperationIdFromWorkflowFunction(workflowFunction);
+  }
+  extractOperationFromOpenApi(args) {
+    return Object.values(args.openApi.paths).flatMap(
+      (methods) => methods && Object.values(methods).filter(
+        (method) => method && method.operationId === args.operationId
+      )
+    ).pop();
+  }
+  removeTrailingSlash(path) {
+    if (path.endsWith("/")) {
+      return path.slice(0, -1);
+    }
+    return path;
+  }
+  removeSurroundingQuotes(inputString) {
+    const trimmed = inputString.trim();
+    if (trimmed.startsWith("'") && trimmed.endsWith("'") || trimmed.startsWith('"') && trimmed.endsWith('"')) {
+      return trimmed.slice(1, -1);
+    }
+    return trimmed;
+  }
+  convertToGitHubApiUrl(githubUrl) {
+    const sanitizedUrl = this.removeSurroundingQuotes(githubUrl);
+    const githubApiMatch = RegExp(Regex.GITHUB_API_URL).exec(sanitizedUrl);
+    if (githubApiMatch) {
+      const [, owner2, repo2, ref2, path2] = githubApiMatch;
+      return {
+        owner: owner2,
+        repo: repo2,
+        ref: ref2,
+        path: this.removeTrailingSlash(path2)
+      };
+    }
+    const githubUrlMatch = RegExp(Regex.GITHUB_URL).exec(sanitizedUrl);
+    if (!githubUrlMatch) {
+      return void 0;
+    }
+    const [, owner, repo, ref, path] = githubUrlMatch;
+    return {
+      owner,
+      repo,
+      ref,
+      path: this.removeTrailingSlash(path)
+    };
+  }
+  async fetchGitHubRepoPaths(repoInfo) {
+    const response = await this.octokit.request(
+      "GET /repos/:owner/:repo/git/trees/:ref",
+      {
+        owner: repoInfo.owner,
+        repo: repoInfo.repo,
+        ref: repoInfo.ref,
+        recursive: 1
+      }
+    );
+    return response.data.tree.filter((item) => item.type === "blob").map((item) => item.path).filter((path) => path.startsWith(`${repoInfo.path}/`));
+  }
+  async extractTemplateValuesFromSkeletonUrl(githubPath) {
+    try {
+      const filePaths = await this.fetchGitHubRepoPaths(githubPath);
+      const fileMatchPromises = [];
+      filePaths.forEach((p) => {
+        fileMatchPromises.push(
+          this.extractTemplateValuesFromGitHubFile({
+            ...githubPath,
+            path: p
+          })
+        );
+      });
+      const fileMatches = (await Promise.all(fileMatchPromises)).flat().filter((r) => r !== void 0);
+      return Array.from(new Set(fileMatches));
+    } catch (e) {
+      this.logger.error(e);
+    }
+    return [];
+  }
+  async extractTemplateValuesFromGitHubFile(githubPath) {
+    const valueMatchesInPath = githubPath.path.matchAll(
+      Regex.VALUES_IN_SKELETON
+    );
+    const conditionMatchesInPath = githubPath.path.matchAll(
+      Regex.CONDITION_IN_SKELETON
+    );
+    const valuesInPath = Array.from(valueMatchesInPath, (match) => match[1]);
+    const conditionsInPath = Array.from(
+      conditionMatchesInPath,
+      (match) => match[1]
+    );
+    try {
+      const content = await this.octokit.repos.getContent({ ...githubPath });
+      if (!content) {
+        return [];
+      }
+      const fileData = content.data;
+      const fileContent = this.decoder.decode(
+        new Uint8Array(Buffer.from(fileData.content, fileData.encoding))
+      );
+      const valueMatchesInContent = fileContent.matchAll(
+        Regex.VALUES_IN_SKELETON
+      );
+      const conditionMatchesInContent = fileContent.matchAll(
+        Regex.CONDITION_IN_SKELETON
+      );
+      const valuesInContent = Array.from(
+        valueMatchesInContent,
+        (match) => match[1] || match[2]
+      );
+      const conditionsInContent = Array.from(
+        conditionMatchesInContent,
+        (match) => match[1]
+      );
+      return [
+        ...valuesInPath,
+        ...conditionsInPath,
+        ...valuesInContent,
+        ...conditionsInContent
+      ];
+    } catch (e) {
+      this.logger.error(e);
+    }
+    return [];
+  }
+  extractVariablesFromWorkflow(workflow) {
+    const blockList = [
+      ".actionDataFilter",
+      ".stateDataFilter",
+      ".eventDataFilter"
+    ];
+    const inputVariableSet = /* @__PURE__ */ new Set();
+    const workflowVariableSet = /* @__PURE__ */ new Set();
+    function traverseValue(value, currentPath) {
+      if (typeof value === "string") {
+        handleValue(value, currentPath);
+      } else if (Array.isArray(value)) {
+        value.forEach((item, index) => {
+          traverseValue(item, `${currentPath}[${index}]`);
+        });
+      } else if (typeof value === "object") {
+        traverseObject(value, currentPath);
+      }
+    }
+    function handleValue(value, currentPath) {
+      const tokens = value.split(/\s|\${|}/);
+      let inTemplate = false;
+      tokens.forEach((token) => {
+        if (inTemplate) {
+          if (token.endsWith("}")) {
+            inTemplate = false;
+          }
+          return;
+        }
+        if (token.startsWith(".")) {
+          const variable = token.slice(1).replace(/[=!<>]{0,50}$/, "");
+          if (variable && !variable.includes(".")) {
+            addVariable({ variable, currentPath });
+          }
+        }
+        if (token.startsWith("${")) {
+          inTemplate = true;
+        }
+      });
+    }
+    function addVariable(args) {
+      if (!args.variable) {
+        return;
+      }
+      if (blockList.some((b) => args.currentPath.includes(b))) {
+        workflowVariableSet.add(args.variable);
+      } else {
+        inputVariableSet.add(args.variable);
+      }
+    }
+    function traverseObject(currentObj, currentPath) {
+      for (const key in currentObj) {
+        if (currentObj.hasOwnProperty(key)) {
+          const value = currentObj[key];
+          const newPath = currentPath ? `${currentPath}.${key}` : key;
+          traverseValue(value, newPath);
+        }
+      }
+    }
+    traverseObject(workflow, "");
+    workflow.states.forEach((state) => {
+      if (state.type === "inject" && state.data) {
+        Object.keys(state.data).forEach((k) => inputVariableSet.delete(k));
+      }
+    });
+    workflowVariableSet.forEach((v) => inputVariableSet.delete(v));
+    return inputVariableSet;
+  }
+  parseComposition(inputSchema) {
+    if (!inputSchema.properties) {
+      return [];
+    }
+    const refPaths = Object.values(inputSchema.properties).map((p) => p.$ref).filter((r) => r !== void 0);
+    if (!refPaths.length) {
+      return [inputSchema];
+    }
+    return refPaths.map((r) => this.findReferencedSchema({ rootSchema: inputSchema, ref: r })).filter((r) => r !== void 0);
+  }
+  findReferencedSchema(args) {
+    const pathParts = args.ref.split("/").filter((part) => !["#", ""].includes(part));
+    let current = args.rootSchema;
+    for (const part of pathParts) {
+      current = current == null ? void 0 : current[part];
+      if (current === void 0) {
+        return void 0;
+      }
+    }
+    if (!current.properties) {
+      return void 0;
+    }
+    return current;
+  }
+}
+
+class JiraService {
+  constructor(logger, cloudEventService) {
+    this.logger = logger;
+    this.cloudEventService = cloudEventService;
+  }
+  async handleEvent(jiraEvent) {
+    var _a;
+    if (!jiraEvent) {
+      this.logger.warn("Received empty event");
+      return;
+    }
+    if (jiraEvent.issue_event_type_name === "issue_resolved") {
+      const newStatus = (_a = jiraEvent.changelog.items.find(
+        (item) => item.field === "status"
+      )) == null ? void 0 : _a.toString;
+      const label = jiraEvent.issue.fields.labels.find(
+        (l) => l.includes("workflowId")
+      );
+      if (!label) {
+        this.logger.warn("Received event without JIRA label");
+        return;
+      }
+      const workflowInstanceId = label.slice(label.indexOf("=") + 1);
+      if (newStatus === "Done" || newStatus === "Resolved") {
+        const response = await this.cloudEventService.send({
+          event: new cloudevents.CloudEvent({
+            type: "jira_webhook_callback",
+            // same defined in the workflow
+            source: "jira",
+            kogitoprocrefid: workflowInstanceId,
+            // correlation
+            data: jiraEvent
+          })
+        });
+        if (!response.success) {
+          this.logger.error(`Failed to send cloud event: ${response.error}`);
+        }
+      }
+    }
+  }
+}
+
+var openapi = "3.0.1";
+var info = {
+	title: "Workflow Actions for BS API",
+	description: "Workflow Actions BS API",
+	version: "0.0.1"
+};
+var servers = [
+	{
+		url: "http://host.docker.internal:7007/api/orchestrator"
+	}
+];
+var paths = {
+	"/actions/catalog:fetch": {
+		post: {
+			operationId: "catalog:fetch",
+			parameters: [
+			],
+			requestBody: {
+				description: "Input parameters for the action in BS",
+				required: true,
+				content: {
+					"application/json;charset=utf-8": {
+						schema: {
+							$ref: "#/components/schemas/catalogFetch"
+						}
+					}
+				}
+			},
+			responses: {
+				"default": {
+					description: "catalog:fetch action response",
+					content: {
+						"application/json;charset=utf-8": {
+							schema: {
+								type: "object"
+							}
+						}
+					}
+				}
+			}
+		}
+	}
+};
+var components = {
+	schemas: {
+		catalogFetch: {
+			title: "catalog:fetch",
+			type: "object",
+			properties: {
+				entityRef: {
+					type: "string",
+					description: "Entity reference of the entity to get"
+				},
+				entityRefs: {
+					type: "array",
+					items: {
+						type: "string"
+					},
+					description: "Entity references of the entities to get"
+				},
+				optional: {
+					type: "boolean",
+					description: "Allow the entity or entities to optionally exist. Default: false"
+				},
+				defaultKind: {
+					type: "string",
+					description: "The default kind"
+				},
+				defaultNamespace: {
+					type: "string",
+					description: "The default namespace"
+				}
+			},
+			required: [
+				"entityRef"
+			],
+			additionalProperties: false
+		}
+	}
+};
+var openApiTemplate = {
+	openapi: openapi,
+	info: info,
+	servers: servers,
+	paths: paths,
+	components: components
+};
+
+var __defProp$4 = Object.defineProperty;
+var __defNormalProp$4 = (obj, key, value) => key in obj ? __defProp$4(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$4 = (obj, key, value) => {
+  __defNormalProp$4(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+class OpenApiService {
+  constructor(logger, discovery) {
+    __publicField$4(this, "logger");
+    __publicField$4(this, "discovery");
+    this.logger = logger;
+    this.discovery = discovery;
+  }
+  async fetchScaffolderActions() {
+    const scaffolderUrl = await this.discovery.getBaseUrl("scaffolder");
+    return fetch(`${scaffolderUrl}/v2/actions`).then((res) => {
+      return res.json();
+    });
+  }
+  async generateOpenApi() {
+    const template = { ...openApiTemplate };
+    return this.fetchScaffolderActions().then((actions) => {
+      template.paths = this.mapPaths(actions);
+      return actions;
+    }).then((actions) => this.mapSchemas(actions)).then((schemas) => {
+      template.components.schemas = schemas;
+      return template;
+    }).catch((err) => {
+      this.logger.error(err);
+    });
+  }
+  mapPaths(actions) {
+    const paths = {};
+    for (const action of actions) {
+      const actionId = action.id;
+      const description = action.description;
+      const schemaName = this.generateSchemaName(actionId);
+      const path = `/actions/${actionId}`;
+      paths[path] = {
+        post: {
+          operationId: actionId,
+          description,
+          requestBody: {
+            description: `Input parameters for the action ${actionId} in BS`,
+            required: true,
+            content: {
+              "application/json": {
+                schema: {
+                  $ref: `#/components/schemas/${schemaName}`
+                }
+              }
+            }
+          },
+          responses: {
+            default: {
+              description: `Action ${actionId} response`,
+              content: {
+                "application/json": {
+                  schema: {
+                    type: "object"
+                  }
+                }
+              }
+            }
+          }
+        }
+      };
+    }
+    return paths;
+  }
+  deleteInvalidPropertiesDfs(object) {
+    if (!object || Object.prototype.toString.call(object) !== "[object Object]") {
+      return;
+    }
+    Object.entries(object).forEach(([k, v]) => {
+      const invalidConstProperty = k === "const" && v === "*";
+      const invalidTypeArray = k === "type" && v === "array" && !object.items;
+      if (invalidConstProperty) {
+        delete object[k];
+      } else if (invalidTypeArray) {
+        object[k] = "string";
+      } else {
+        this.deleteInvalidPropertiesDfs(object[k]);
+      }
+    });
+  }
+  mapSchemas(actions) {
+    const schemas = {};
+    for (const action of actions) {
+      const actionId = action.id;
+      const schema = action.schema;
+      const input = schema.input;
+      const schemaName = this.generateSchemaName(actionId);
+      delete input.$schema;
+      this.deleteInvalidPropertiesDfs(input);
+      if (input.properties) {
+        Object.keys(input.properties).forEach((key) => {
+          const prop = input.properties[key];
+          if (prop && Array.isArray(prop.type)) {
+            prop.type = prop.type.pop();
+          }
+        });
+      }
+      schemas[schemaName] = input;
+    }
+    return schemas;
+  }
+  generateSchemaName(actionId) {
+    var _a;
+    return (_a = actionId == null ? void 0 : actionId.replaceAll(":", "_")) != null ? _a : actionId;
+  }
+}
+
+async function getWorkingDirectory(config, logger) {
+  if (!config.has("backend.workingDirectory")) {
+    return os__default["default"].tmpdir();
+  }
+  const workingDirectory = config.getString("backend.workingDirectory");
+  try {
+    await fs__default["default"].access(workingDirectory, fs__default["default"].constants.F_OK | fs__default["default"].constants.W_OK);
+    logger.info(`using working directory: ${workingDirectory}`);
+  } catch (err) {
+    logger.error(
+      `working directory ${workingDirectory} ${err.code === "ENOENT" ? "does not exist" : "is not writable"}`
+    );
+    throw err;
+  }
+  return workingDirectory;
+}
+async function executeWithRetry(action, maxErrors = 15) {
+  let response;
+  let errorCount = 0;
+  const backoff = 5e3;
+  while (errorCount < maxErrors) {
+    try {
+      response = await action();
+      if (response.status >= 400) {
+        errorCount++;
+        await delay(backoff);
+      } else {
+        return response;
+      }
+    } catch (e) {
+      errorCount++;
+      await delay(backoff);
+    }
+  }
+  throw new Error("Unable to execute query.");
+}
+function delay(time) {
+  return new Promise((r) => setTimeout(r, time));
+}
+
+var __defProp$3 = Object.defineProperty;
+var __defNormalProp$3 = (obj, key, value) => key in obj ? __defProp$3(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$3 = (obj, key, value) => {
+  __defNormalProp$3(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+class ScaffolderService {
+  constructor(logger, config, catalogApi, urlReader) {
+    this.logger = logger;
+    this.config = config;
+    this.catalogApi = catalogApi;
+    this.urlReader = urlReader;
+    __publicField$3(this, "actionRegistry");
+    __publicField$3(this, "streamLogger", new stream.PassThrough());
+    this.actionRegistry = new pluginScaffolderBackend.TemplateActionRegistry();
+  }
+  loadActions() {
+    const actions = [
+      ...pluginScaffolderBackend.createBuiltinActions({
+        integrations: integration.ScmIntegrations.fromConfig(this.config),
+        catalogClient: this.catalogApi,
+        reader: this.urlReader,
+        config: this.config
+      })
+    ];
+    actions.forEach((a) => this.actionRegistry.register(a));
+  }
+  getAction(id) {
+    return this.actionRegistry.get(id);
+  }
+  async executeAction(actionExecutionContext) {
+    var _a;
+    if (this.actionRegistry.list().length === 0) {
+      this.loadActions();
+    }
+    const action = this.getAction(
+      actionExecutionContext.actionId
+    );
+    const stepOutput = {};
+    let workspacePath;
+    try {
+      const workingDirectory = await getWorkingDirectory(
+        this.config,
+        this.logger
+      );
+      workspacePath = path__default["default"].join(
+        workingDirectory,
+        (_a = actionExecutionContext.instanceId) != null ? _a : crypto.randomUUID()
+      );
+    } catch (err) {
+      this.logger.error(
+        `Error getting workingDirecotury to execute action ${actionExecutionContext.actionId}`,
+        err
+      );
+      throw err;
+    }
+    const mockContext = {
+      input: actionExecutionContext.input,
+      workspacePath,
+      logger: this.logger,
+      logStream: this.streamLogger,
+      createTemporaryDirectory: async () => await fs__default["default"].mkdtemp(`${workspacePath}_step-${0}-`),
+      output(name, value) {
+        stepOutput[name] = value;
+      }
+    };
+    await action.handler(mockContext);
+    return stepOutput;
+  }
+}
+
+var __defProp$2 = Object.defineProperty;
+var __defNormalProp$2 = (obj, key, value) => key in obj ? __defProp$2(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$2 = (obj, key, value) => {
+  __defNormalProp$2(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+class GitService {
+  constructor(logger, config) {
+    __publicField$2(this, "git");
+    __publicField$2(this, "logger");
+    __publicField$2(this, "authenticated");
+    __publicField$2(this, "author", {
+      name: "backstage-orchestrator",
+      email: "orchestrator@backstage.io"
+    });
+    __publicField$2(this, "committer", {
+      name: "backstage-orchestrator",
+      email: "orchestrator@backstage.io"
+    });
+    this.logger = logger;
+    const githubIntegration = integration.ScmIntegrations.fromConfig(config).github.list().pop();
+    this.git = backendCommon.Git.fromAuth({
+      username: "x-access-token",
+      password: githubIntegration == null ? void 0 : githubIntegration.config.token
+    });
+    this.authenticated = !!(githubIntegration == null ? void 0 : githubIntegration.config.token);
+  }
+  async clone(repoURL, localPath) {
+    this.logger.info(`cloning repo ${repoURL} into ${localPath}`);
+    return this.git.clone({
+      url: repoURL,
+      dir: localPath,
+      depth: 1
+    }).then(() => this.git.checkout({ dir: localPath, ref: "main" }));
+  }
+  async push(dir, message) {
+    if (!this.authenticated) {
+      this.logger.warn(
+        "Git integration is required to be configured for push, with the token or credentials"
+      );
+      return;
+    }
+    const branch = "main";
+    const force = true;
+    const remote = "origin";
+    const filepath = ".";
+    this.git.fetch({ remote, dir }).then(() => this.git.checkout({ dir, ref: branch })).then(() => this.git.add({ dir, filepath })).then(
+      () => this.git.commit({
+        dir,
+        message,
+        author: this.author,
+        committer: this.committer
+      })
+    ).then(() => this.git.push({ dir, remote, remoteRef: branch, force })).finally(() => this.logger.info("push completed")).catch((ex) => this.logger.error(ex));
+  }
+  async pull(localPath) {
+    const remoteBranch = "origin/main";
+    const localBranch = "main";
+    const remote = "origin";
+    this.git.fetch({ remote, dir: localPath }).then(() => this.git.checkout({ dir: localPath, ref: localBranch })).then(
+      () => this.git.merge({
+        dir: localPath,
+        ours: localBranch,
+        theirs: remoteBranch,
+        author: this.author,
+        committer: this.committer
+      })
+    ).finally(() => this.logger.info("merge completed")).catch((ex) => this.logger.error(ex));
+  }
+}
+
+var __defProp$1 = Object.defineProperty;
+var __defNormalProp$1 = (obj, key, value) => key in obj ? __defProp$1(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$1 = (obj, key, value) => {
+  __defNormalProp$1(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+class WorkflowService {
+  constructor(openApiService, dataInputSchemaService, sonataFlowService, config, logger) {
+    __publicField$1(this, "openApiService");
+    __publicField$1(this, "dataInputSchemaService");
+    __publicField$1(this, "sonataFlowService");
+    __publicField$1(this, "logger");
+    __publicField$1(this, "githubService");
+    __publicField$1(this, "repoURL");
+    __publicField$1(this, "autoPush");
+    var _a, _b;
+    this.openApiService = openApiService;
+    this.dataInputSchemaService = dataInputSchemaService;
+    this.sonataFlowService = sonataFlowService;
+    this.logger = logger;
+    this.githubService = new GitService(logger, config);
+    this.repoURL = (_a = config.getOptionalString(
+      "orchestrator.sonataFlowService.workflowsSource.gitRepositoryUrl"
+    )) != null ? _a : "";
+    this.autoPush = (_b = config.getOptionalBoolean(
+      "orchestrator.sonataFlowService.workflowsSource.autoPush"
+    )) != null ? _b : false;
+  }
+  async saveWorkflowDefinition(item) {
+    var _a;
+    const workflowFormat = extractWorkflowFormatFromUri(item.uri);
+    const definitionsPath = this.resolveResourcePath(
+      `${(_a = item.definition) == null ? void 0 : _a.id}.sw.${workflowFormat}`
+    );
+    const dataInputSchemaPath = await this.saveDataInputSchema(item);
+    if (dataInputSchemaPath && item.definition) {
+      item.definition.dataInputSchema = dataInputSchemaPath;
+    }
+    await this.saveFile(definitionsPath, item.definition);
+    if (this.autoPush) {
+      await this.githubService.push(
+        this.sonataFlowService.resourcesPath,
+        `new workflow changes ${definitionsPath}`
+      );
+    }
+    return item;
+  }
+  async saveFile(path$1, data) {
+    this.logger.info(`Saving file ${path$1}`);
+    const fileExtension = path.extname(path$1);
+    const isWorkflow = /\.sw\.(json|yaml|yml)$/.test(path$1);
+    let contentToSave;
+    if (isWorkflow) {
+      contentToSave = toWorkflowString(
+        data,
+        fileExtension === ".json" ? "json" : "yaml"
+      );
+    } else if (fileExtension === ".json") {
+      contentToSave = JSON.stringify(data, null, 2);
+    } else {
+      contentToSave = data;
+    }
+    await fs__default["default"].writeFile(path$1, contentToSave, "utf8");
+  }
+  async saveWorkflowDefinitionFromUrl(url) {
+    const workflow = await this.fetchWorkflowDefinitionFromUrl(url);
+    await this.saveWorkflowDefinition(workflow);
+    return workflow;
+  }
+  async fetchWorkflowDefinitionFromUrl(url) {
+    const response = await fetch(url);
+    const content = await response.text();
+    const definition = fromWorkflowSource(content);
+    const urlParts = url.split("/");
+    const fileName = urlParts[urlParts.length - 1];
+    return {
+      uri: fileName,
+      definition
+    };
+  }
+  async saveOpenApi() {
+    const path = this.resolveResourcePath(ACTIONS_OPEN_API_FILE_PATH);
+    const openApi = await this.openApiService.generateOpenApi();
+    if (!openApi) {
+      return;
+    }
+    await this.saveFile(path, openApi);
+    if (this.autoPush) {
+      await this.githubService.push(
+        this.sonataFlowService.resourcesPath,
+        `new openapi changes ${path}`
+      );
+    }
+  }
+  async saveDataInputSchema(workflowItem) {
+    if (!workflowItem.definition) {
+      return void 0;
+    }
+    const openApi = await this.openApiService.generateOpenApi();
+    const dataInputSchema = await this.dataInputSchemaService.generate({
+      definition: workflowItem.definition,
+      openApi
+    });
+    if (!dataInputSchema) {
+      return void 0;
+    }
+    const workflowDataInputSchemaPath = path.join(
+      SCHEMAS_FOLDER,
+      dataInputSchema.compositionSchema.fileName
+    );
+    dataInputSchema.compositionSchema.jsonSchema = {
+      $id: `classpath:/${workflowDataInputSchemaPath}`,
+      ...dataInputSchema.compositionSchema.jsonSchema
+    };
+    dataInputSchema.actionSchemas.forEach((actionSchema) => {
+      actionSchema.jsonSchema = {
+        $id: `classpath:/${SCHEMAS_FOLDER}/${actionSchema.fileName}`,
+        ...actionSchema.jsonSchema
+      };
+    });
+    const schemaFiles = [
+      dataInputSchema.compositionSchema,
+      ...dataInputSchema.actionSchemas
+    ];
+    const saveSchemaPromises = schemaFiles.map((schemaFile) => {
+      const path$1 = this.resolveResourcePath(
+        path.join(SCHEMAS_FOLDER, schemaFile.fileName)
+      );
+      return this.saveFile(path$1, schemaFile.jsonSchema);
+    });
+    await Promise.all(saveSchemaPromises);
+    return workflowDataInputSchemaPath;
+  }
+  async deleteWorkflowDefinitionById(uri) {
+    const definitionsPath = this.resolveResourcePath(uri);
+    await fs__default["default"].rm(definitionsPath, { force: true });
+  }
+  async listStoredSpecs() {
+    const specs = [];
+    for (const relativePath of SPEC_FILES) {
+      const path = this.resolveResourcePath(relativePath);
+      if (!await fs__default["default"].pathExists(path)) {
+        continue;
+      }
+      const buffer = await fs__default["default"].readFile(path);
+      const content = JSON.parse(buffer.toString("utf8"));
+      specs.push({ path, content });
+    }
+    return specs;
+  }
+  resolveResourcePath(relativePath) {
+    return path.resolve(
+      path.join(
+        this.sonataFlowService.resourcesPath,
+        DEFAULT_WORKFLOWS_PATH,
+        relativePath
+      )
+    );
+  }
+  async reloadWorkflows() {
+    if (!this.repoURL) {
+      this.logger.info("No Git repository configured. Skipping reload.");
+      return;
+    }
+    this.logger.info("Reloading workflows from Git");
+    const localPath = this.sonataFlowService.resourcesPath;
+    if (await fs__default["default"].pathExists(localPath)) {
+      this.logger.info(`Path ${localPath} already exists. Skipping clone.`);
+      return;
+    }
+    await fs__default["default"].remove(localPath);
+    await this.githubService.clone(this.repoURL, localPath);
+  }
+}
+
+async function createBackendRouter(args) {
+  const { eventBroker, config, logger, discovery, catalogApi, urlReader } = args;
+  const router = Router__default["default"]();
+  router.use(express__default["default"].json());
+  router.use("/workflows", express__default["default"].text());
+  router.get("/health", (_, response) => {
+    logger.info("PONG!");
+    response.json({ status: "ok" });
+  });
+  const githubIntegration = integration.ScmIntegrations.fromConfig(config).github.list().pop();
+  const githubToken = githubIntegration == null ? void 0 : githubIntegration.config.token;
+  if (!githubToken) {
+    logger.warn(
+      "No GitHub token found. Some features may not work as expected."
+    );
+  }
+  const cloudEventService = new CloudEventService(logger);
+  const jiraService = new JiraService(logger, cloudEventService);
+  const openApiService = new OpenApiService(logger, discovery);
+  const dataInputSchemaService = new DataInputSchemaService(
+    logger,
+    githubToken
+  );
+  const workflowService = new WorkflowService(
+    openApiService,
+    dataInputSchemaService,
+    args.sonataFlowService,
+    config,
+    logger
+  );
+  const scaffolderService = new ScaffolderService(
+    logger,
+    config,
+    catalogApi,
+    urlReader
+  );
+  await workflowService.reloadWorkflows();
+  setupInternalRoutes(
+    router,
+    args.sonataFlowService,
+    workflowService,
+    openApiService,
+    jiraService,
+    args.dataIndexService,
+    dataInputSchemaService
+  );
+  setupExternalRoutes(router, discovery, scaffolderService);
+  await eventBroker.publish({
+    topic: ORCHESTRATOR_SERVICE_READY_TOPIC,
+    eventPayload: {}
+  });
+  router.use(backendCommon.errorHandler());
+  return router;
+}
+function setupInternalRoutes(router, sonataFlowService, workflowService, openApiService, jiraService, dataIndexService, dataInputSchemaService) {
+  router.get("/workflows/definitions", async (_, response) => {
+    const swfs = await dataIndexService.getWorkflowDefinitions();
+    response.json(ApiResponseBuilder.SUCCESS_RESPONSE(swfs));
+  });
+  router.get("/workflows/overview", async (_, res) => {
+    var _a;
+    const overviews = await sonataFlowService.fetchWorkflowOverviews();
+    if (!overviews) {
+      res.status(500).send("Couldn't fetch workflow overviews");
+      return;
+    }
+    const result = {
+      items: overviews,
+      limit: 0,
+      offset: 0,
+      totalCount: (_a = overviews == null ? void 0 : overviews.length) != null ? _a : 0
+    };
+    res.status(200).json(result);
+  });
+  router.get("/workflows", async (_, res) => {
+    var _a;
+    const definitions = await dataIndexService.getWorkflowDefinitions();
+    const items = await Promise.all(
+      definitions.map(async (info) => {
+        const uri = await sonataFlowService.fetchWorkflowUri(info.id);
+        if (!uri) {
+          throw new Error(`Uri is required for workflow ${info.id}`);
+        }
+        const item = {
+          definition: info,
+          serviceUrl: info.serviceUrl,
+          uri
+        };
+        return item;
+      })
+    );
+    if (!items) {
+      res.status(500).send("Couldn't fetch workflows");
+      return;
+    }
+    const result = {
+      items,
+      limit: 0,
+      offset: 0,
+      totalCount: (_a = items == null ? void 0 : items.length) != null ? _a : 0
+    };
+    res.status(200).json(result);
+  });
+  router.get("/workflows/:workflowId", async (req, res) => {
+    const {
+      params: { workflowId }
+    } = req;
+    const definition = await sonataFlowService.fetchWorkflowDefinition(workflowId);
+    if (!definition) {
+      res.status(500).send(`Couldn't fetch workflow definition for ${workflowId}`);
+      return;
+    }
+    const uri = await sonataFlowService.fetchWorkflowUri(workflowId);
+    if (!uri) {
+      res.status(500).send(`Couldn't fetch workflow uri for ${workflowId}`);
+      return;
+    }
+    res.status(200).json({
+      uri,
+      definition
+    });
+  });
+  router.delete("/workflows/:workflowId/abort", async (req, res) => {
+    const {
+      params: { workflowId }
+    } = req;
+    const result = await dataIndexService.abortWorkflowInstance(workflowId);
+    if (result.error) {
+      res.status(500).json(result.error);
+      return;
+    }
+    res.status(200).json(result.data);
+  });
+  router.post("/workflows/:workflowId/execute", async (req, res) => {
+    const {
+      params: { workflowId }
+    } = req;
+    const definition = await dataIndexService.getWorkflowDefinition(workflowId);
+    const serviceUrl = definition.serviceUrl;
+    if (!serviceUrl) {
+      throw new Error(`ServiceURL is not defined for workflow ${workflowId}`);
+    }
+    const executionResponse = await sonataFlowService.executeWorkflow({
+      workflowId,
+      inputData: req.body,
+      endpoint: serviceUrl
+    });
+    if (!executionResponse) {
+      res.status(500).send(`Couldn't execute workflow ${workflowId}`);
+      return;
+    }
+    res.status(200).json(executionResponse);
+  });
+  router.get("/workflows/:workflowId/overview", async (req, res) => {
+    const {
+      params: { workflowId }
+    } = req;
+    const overviewObj = await sonataFlowService.fetchWorkflowOverview(workflowId);
+    if (!overviewObj) {
+      res.status(500).send(`Couldn't fetch workflow overview for ${workflowId}`);
+      return;
+    }
+    res.status(200).json(overviewObj);
+  });
+  router.get("/instances", async (_, res) => {
+    const instances = await dataIndexService.fetchProcessInstances();
+    if (!instances) {
+      res.status(500).send("Couldn't fetch process instances");
+      return;
+    }
+    res.status(200).json(instances);
+  });
+  router.get("/instances/:instanceId", async (req, res) => {
+    const {
+      params: { instanceId }
+    } = req;
+    const instance = await dataIndexService.fetchProcessInstance(instanceId);
+    if (!instance) {
+      res.status(500).send(`Couldn't fetch process instance ${instanceId}`);
+      return;
+    }
+    res.status(200).json(instance);
+  });
+  router.get("/instances/:instanceId/jobs", async (req, res) => {
+    const {
+      params: { instanceId }
+    } = req;
+    const jobs = await dataIndexService.fetchProcessInstanceJobs(instanceId);
+    if (!jobs) {
+      res.status(500).send(`Couldn't fetch jobs for instance ${instanceId}`);
+      return;
+    }
+    res.status(200).json(jobs);
+  });
+  router.get("/workflows/:workflowId/inputSchema", async (req, res) => {
+    const {
+      params: { workflowId }
+    } = req;
+    const workflowDefinition = await dataIndexService.getWorkflowDefinition(workflowId);
+    const serviceUrl = workflowDefinition.serviceUrl;
+    if (!serviceUrl) {
+      throw new Error(`ServiceUrl is not defined for workflow ${workflowId}`);
+    }
+    const definition = await sonataFlowService.fetchWorkflowDefinition(workflowId);
+    if (!definition) {
+      res.status(500).send(`Couldn't fetch workflow definition ${workflowId}`);
+      return;
+    }
+    const uri = await sonataFlowService.fetchWorkflowUri(workflowId);
+    if (!uri) {
+      res.status(500).send(`Couldn't fetch workflow uri ${workflowId}`);
+      return;
+    }
+    const workflowItem = { uri, definition };
+    let schemas = [];
+    if (definition.dataInputSchema) {
+      const workflowInfo = await sonataFlowService.fetchWorkflowInfo(
+        workflowId,
+        serviceUrl
+      );
+      if (!workflowInfo) {
+        res.status(500).send(`Couldn't fetch workflow info ${workflowId}`);
+        return;
+      }
+      if (!workflowInfo.inputSchema) {
+        res.status(500).send(`Couldn't fetch workflow input schema ${workflowId}`);
+        return;
+      }
+      schemas = dataInputSchemaService.parseComposition(
+        workflowInfo.inputSchema
+      );
+    }
+    const response = {
+      workflowItem,
+      schemas
+    };
+    res.status(200).json(response);
+  });
+  router.delete("/workflows/:workflowId", async (req, res) => {
+    const workflowId = req.params.workflowId;
+    const uri = await sonataFlowService.fetchWorkflowUri(workflowId);
+    if (!uri) {
+      res.status(500).send(`Couldn't fetch workflow uri ${workflowId}`);
+      return;
+    }
+    await workflowService.deleteWorkflowDefinitionById(uri);
+    res.status(200).send();
+  });
+  router.post("/workflows", async (req, res) => {
+    const uri = req.query.uri;
+    const workflowItem = (uri == null ? void 0 : uri.startsWith("http")) ? await workflowService.saveWorkflowDefinitionFromUrl(uri) : await workflowService.saveWorkflowDefinition({
+      uri,
+      definition: fromWorkflowSource(req.body)
+    });
+    res.status(201).json(workflowItem).send();
+  });
+  router.get("/actions/schema", async (_, res) => {
+    const openApi = await openApiService.generateOpenApi();
+    res.json(openApi).status(200).send();
+  });
+  router.put("/actions/schema", async (_, res) => {
+    const openApi = await workflowService.saveOpenApi();
+    res.json(openApi).status(200).send();
+  });
+  router.post("/webhook/jira", async (req, res) => {
+    const event = req.body;
+    await jiraService.handleEvent(event);
+    res.status(200).send();
+  });
+  router.get("/specs", async (_, res) => {
+    const specs = await workflowService.listStoredSpecs();
+    res.status(200).json(specs);
+  });
+}
+function setupExternalRoutes(router, discovery, scaffolderService) {
+  router.get("/actions", async (_, res) => {
+    const scaffolderUrl = await discovery.getBaseUrl("scaffolder");
+    const response = await fetch(`${scaffolderUrl}/v2/actions`);
+    const json = await response.json();
+    res.status(response.status).json(json);
+  });
+  router.post("/actions/:actionId", async (req, res) => {
+    const { actionId } = req.params;
+    const instanceId = req.header("kogitoprocinstanceid");
+    const body = await req.body;
+    const result = await scaffolderService.executeAction({
+      actionId,
+      instanceId,
+      input: body
+    });
+    res.status(200).json(result);
+  });
+}
+
+var __defProp = Object.defineProperty;
+var __defNormalProp = (obj, key, value) => key in obj ? __defProp(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField = (obj, key, value) => {
+  __defNormalProp(obj, typeof key !== "symbol" ? key + "" : key, value);
+  return value;
+};
+const SONATA_FLOW_RESOURCES_PATH = "/home/kogito/serverless-workflow-project/src/main/resources";
+class SonataFlowService {
+  constructor(config, dataIndexService, logger) {
+    this.logger = logger;
+    __publicField(this, "connection");
+    __publicField(this, "dataIndex");
+    this.connection = this.extractConnectionConfig(config);
+    this.dataIndex = dataIndexService;
+  }
+  get autoStart() {
+    return this.connection.autoStart;
+  }
+  get resourcesPath() {
+    return this.connection.resourcesPath;
+  }
+  async connect() {
+    if (!this.connection.autoStart) {
+      return true;
+    }
+    const isAlreadyUp = await this.isSonataFlowUp(false, this.devmodeUrl);
+    if (isAlreadyUp) {
+      return true;
+    }
+    this.launchSonataFlow();
+    return await this.isSonataFlowUp(true, this.devmodeUrl);
+  }
+  get devmodeUrl() {
+    if (!this.connection.port) {
+      return this.connection.host;
+    }
+    return `${this.connection.host}:${this.connection.port}`;
+  }
+  async fetchWorkflowUri(workflowId) {
+    var _a, _b;
+    try {
+      const endpoint = (_a = (await this.dataIndex.getWorkflowDefinition(workflowId)).serviceUrl) != null ? _a : "";
+      const urlToFetch = `${endpoint}/management/processes/${workflowId}/sources`;
+      const response = await executeWithRetry(() => fetch(urlToFetch));
+      if (response.ok) {
+        const json = await response.json();
+        return (_b = json.pop()) == null ? void 0 : _b.uri;
+      }
+      const responseStr = JSON.stringify(response);
+      this.logger.error(
+        `Response was NOT okay when fetch(${urlToFetch}). Received response: ${responseStr}`
+      );
+    } catch (error) {
+      this.logger.error(`Error when fetching workflow uri: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflowInfo(workflowId, endpoint) {
+    try {
+      const urlToFetch = `${endpoint}/management/processes/${workflowId}`;
+      const response = await executeWithRetry(() => fetch(urlToFetch));
+      if (response.ok) {
+        return await response.json();
+      }
+      const responseStr = JSON.stringify(response);
+      this.logger.error(
+        `Response was NOT okay when fetch(${urlToFetch}). Received response: ${responseStr}`
+      );
+    } catch (error) {
+      this.logger.error(`Error when fetching workflow info: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflowDefinition(workflowId) {
+    try {
+      const source = await this.dataIndex.fetchWorkflowSource(workflowId);
+      if (source) {
+        return fromWorkflowSource(source);
+      }
+    } catch (error) {
+      this.logger.error(`Error when fetching workflow definition: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchOpenApi(endpoint) {
+    try {
+      const urlToFetch = `${endpoint}/q/openapi.json`;
+      const response = await executeWithRetry(() => fetch(urlToFetch));
+      if (response.ok) {
+        return await response.json();
+      }
+      const responseStr = JSON.stringify(response);
+      this.logger.error(
+        `Response was NOT okay when fetch(${urlToFetch}). Received response: ${responseStr}`
+      );
+    } catch (error) {
+      this.logger.error(`Error when fetching openapi: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflows(endpoint) {
+    try {
+      const urlToFetch = `${endpoint}/management/processes`;
+      const response = await executeWithRetry(() => fetch(urlToFetch));
+      if (response.ok) {
+        const workflowIds = await response.json();
+        if (!(workflowIds == null ? void 0 : workflowIds.length)) {
+          return [];
+        }
+        const items = await Promise.all(
+          workflowIds.map(async (workflowId) => {
+            var _a;
+            const definition = await this.fetchWorkflowDefinition(workflowId);
+            if (!definition) {
+              return void 0;
+            }
+            const uri = await this.fetchWorkflowUri(workflowId);
+            if (!uri) {
+              return void 0;
+            }
+            return {
+              uri,
+              definition: {
+                ...definition,
+                description: (_a = definition.description) != null ? _a : definition.name
+              }
+            };
+          })
+        );
+        return items.filter((item) => !!item);
+      }
+      const responseStr = JSON.stringify(response);
+      this.logger.error(
+        `Response was NOT okay when fetch(${urlToFetch}). Received response: ${responseStr}`
+      );
+    } catch (error) {
+      this.logger.error(`Error when fetching workflows: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflowOverviews() {
+    try {
+      const workflowDefinitions = await this.dataIndex.getWorkflowDefinitions();
+      if (!(workflowDefinitions == null ? void 0 : workflowDefinitions.length)) {
+        return [];
+      }
+      const items = await Promise.all(
+        workflowDefinitions.filter((def) => def.id).map(async (def) => this.fetchWorkflowOverview(def.id))
+      );
+      return items.filter((item) => !!item);
+    } catch (error) {
+      this.logger.error(
+        `Error when fetching workflows for workflowOverview: ${error}`
+      );
+    }
+    return void 0;
+  }
+  async executeWorkflow(args) {
+    var _a;
+    try {
+      const workflowEndpoint = ((_a = args.inputData) == null ? void 0 : _a.businessKey) ? `${args.endpoint}/${args.workflowId}?businessKey=${args.inputData.businessKey}` : `${args.endpoint}/${args.workflowId}`;
+      const response = await fetch(workflowEndpoint, {
+        method: "POST",
+        body: JSON.stringify(args.inputData),
+        headers: { "content-type": "application/json" }
+      });
+      return response.json();
+    } catch (error) {
+      this.logger.error(`Error when executing workflow: ${error}`);
+    }
+    return void 0;
+  }
+  launchSonataFlow() {
+    const launcherCmd = this.createLauncherCommand();
+    this.logger.info(
+      `Auto starting SonataFlow through: ${launcherCmd.command} ${launcherCmd.args.join(" ")}`
+    );
+    const process = child_process.spawn(launcherCmd.command, launcherCmd.args, {
+      shell: false
+    });
+    process.on("close", (code) => {
+      this.logger.info(`SonataFlow process exited with code ${code}`);
+    });
+    process.on("exit", (code) => {
+      this.logger.info(`SonataFlow process exited with code ${code}`);
+    });
+    process.on("error", (error) => {
+      this.logger.error(`SonataFlow process error: ${error}`);
+    });
+  }
+  async isSonataFlowUp(withRetry, endpoint) {
+    const healthUrl = `${endpoint}/q/health`;
+    this.logger.info(`Checking SonataFlow health at: ${healthUrl}`);
+    try {
+      const response = await executeWithRetry(
+        () => fetch(healthUrl),
+        withRetry ? 15 : 1
+      );
+      if (response.ok) {
+        this.logger.info("SonataFlow is up and running");
+        return true;
+      }
+    } catch (e) {
+      this.logger.error(`Error when checking SonataFlow health: ${e}`);
+    }
+    return false;
+  }
+  createLauncherCommand() {
+    const resourcesAbsPath = path.resolve(
+      path.join(this.connection.resourcesPath, DEFAULT_WORKFLOWS_PATH)
+    );
+    const launcherArgs = [
+      "run",
+      "--add-host",
+      "host.docker.internal:host-gateway"
+    ];
+    if (this.connection.jira) {
+      launcherArgs.push(`--add-host`, `jira.test:${this.connection.jira.host}`);
+    }
+    launcherArgs.push("--rm");
+    launcherArgs.push("-e", `QUARKUS_HTTP_PORT=${this.connection.port}`);
+    launcherArgs.push("-p", `${this.connection.port}:${this.connection.port}`);
+    launcherArgs.push("-e", `KOGITO_SERVICE_URL=${this.devmodeUrl}`);
+    launcherArgs.push(
+      "-v",
+      `${resourcesAbsPath}:${SONATA_FLOW_RESOURCES_PATH}`
+    );
+    launcherArgs.push("-e", "KOGITO.CODEGEN.PROCESS.FAILONERROR=false");
+    launcherArgs.push(
+      "-e",
+      `QUARKUS_EMBEDDED_POSTGRESQL_DATA_DIR=${this.connection.persistencePath}`
+    );
+    if (this.connection.jira) {
+      launcherArgs.push(
+        "-e",
+        "QUARKUS_REST_CLIENT_JIRA_OPENAPI_JSON_URL=http://jira.test:8080 -e "
+      );
+      launcherArgs.push(`JIRABEARERTOKEN=${this.connection.jira.bearerToken}`);
+    }
+    launcherArgs.push(this.connection.containerImage);
+    return {
+      command: "docker",
+      args: launcherArgs
+    };
+  }
+  extractConnectionConfig(config) {
+    var _a, _b, _c, _d, _e;
+    const autoStart = (_a = config.getOptionalBoolean("orchestrator.sonataFlowService.autoStart")) != null ? _a : false;
+    const host = (_b = config.getOptionalString("orchestrator.sonataFlowService.baseUrl")) != null ? _b : DEFAULT_SONATAFLOW_BASE_URL;
+    const port = config.getOptionalNumber(
+      "orchestrator.sonataFlowService.port"
+    );
+    const resourcesPath = (_c = config.getOptionalString(
+      "orchestrator.sonataFlowService.workflowsSource.localPath"
+    )) != null ? _c : "";
+    const containerImage = (_d = config.getOptionalString("orchestrator.sonataFlowService.container")) != null ? _d : DEFAULT_SONATAFLOW_CONTAINER_IMAGE;
+    const persistencePath = (_e = config.getOptionalString(
+      "orchestrator.sonataFlowService.persistence.path"
+    )) != null ? _e : DEFAULT_SONATAFLOW_PERSISTANCE_PATH;
+    const jiraHost = config.getOptionalString("orchestrator.jira.host");
+    const jiraBearerToken = config.getOptionalString(
+      "orchestrator.jira.bearerToken"
+    );
+    const jiraConfig = jiraHost && jiraBearerToken ? {
+      host: jiraHost,
+      bearerToken: jiraBearerToken
+    } : void 0;
+    return {
+      autoStart,
+      host,
+      port,
+      containerImage,
+      resourcesPath,
+      persistencePath,
+      jira: jiraConfig
+    };
+  }
+  async fetchWorkflowOverview(workflowId) {
+    const definition = await this.fetchWorkflowDefinition(workflowId);
+    if (!definition) {
+      this.logger.debug(`Workflow definition not found: ${workflowId}`);
+      return void 0;
+    }
+    let processInstances = [];
+    const limit = 10;
+    let offset = 0;
+    let lastTriggered = /* @__PURE__ */ new Date(0);
+    let lastRunStatus;
+    let counter = 0;
+    let totalDuration = 0;
+    do {
+      processInstances = await this.dataIndex.fetchWorkflowInstances(
+        definition.id,
+        limit,
+        offset
+      );
+      for (const pInstance of processInstances) {
+        if (new Date(pInstance.start) > lastTriggered) {
+          lastTriggered = new Date(pInstance.start);
+          lastRunStatus = pInstance.state;
+        }
+        if (pInstance.start && pInstance.end) {
+          const start = new Date(pInstance.start);
+          const end = new Date(pInstance.end);
+          totalDuration += end.valueOf() - start.valueOf();
+          counter++;
+        }
+      }
+      offset += limit;
+    } while (processInstances.length > 0);
+    return {
+      workflowId: definition.id,
+      name: definition.name,
+      uri: await this.fetchWorkflowUri(workflowId),
+      lastTriggeredMs: lastTriggered.getTime(),
+      lastRunStatus,
+      category: getWorkflowCategory(definition),
+      avgDurationMs: counter ? totalDuration / counter : void 0,
+      description: definition.description
+    };
+  }
+}
+
+async function createRouter(args) {
+  const dataIndexService = initDataIndexService(args.logger, args.config);
+  const sonataFlowService = new SonataFlowService(
+    args.config,
+    dataIndexService,
+    args.logger
+  );
+  const router = await createBackendRouter({
+    eventBroker: args.eventBroker,
+    config: args.config,
+    logger: args.logger,
+    discovery: args.discovery,
+    catalogApi: args.catalogApi,
+    urlReader: args.urlReader,
+    sonataFlowService,
+    dataIndexService
+  });
+  const isSonataFlowUp = await sonataFlowService.connect();
+  if (!isSonataFlowUp) {
+    args.logger.error("SonataFlow is not up. Check your configuration.");
+  }
+  return router;
+}
+function initDataIndexService(logger, config) {
+  const dataIndexUrl = config.getString("orchestrator.dataIndexService.url");
+  return new DataIndexService(dataIndexUrl, logger);
+}
+
+exports.OrchestratorEntityProvider = OrchestratorEntityProvider;
+exports.createRouter = createRouter;
+//# sourceMappingURL=index-c967581a.cjs.js.map
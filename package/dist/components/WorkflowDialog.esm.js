@@ -0,0 +1,40 @@
+import React, { forwardRef } from 'react';
+import { makeStyles, Dialog, DialogTitle, Box, Typography, IconButton, DialogContent } from '@material-ui/core';
+import CloseIcon from '@material-ui/icons/Close';
+import { WorkflowEditor } from './WorkflowEditor/WorkflowEditor.esm.js';
+
+const useStyles = makeStyles((_theme) => ({
+  editor: {
+    height: "600px",
+    marginBottom: 20
+  },
+  closeBtn: {
+    position: "absolute",
+    right: 8,
+    top: 8
+  }
+}));
+const RefForwardingWorkflowDialog = (props, forwardedRef) => {
+  const { workflowId, title, open, close } = props;
+  const classes = useStyles();
+  return /* @__PURE__ */ React.createElement(Dialog, { fullWidth: true, maxWidth: "lg", onClose: (_) => close(), open }, /* @__PURE__ */ React.createElement(DialogTitle, null, /* @__PURE__ */ React.createElement(Box, null, /* @__PURE__ */ React.createElement(Typography, { variant: "h5" }, title), /* @__PURE__ */ React.createElement(
+    IconButton,
+    {
+      className: classes.closeBtn,
+      "aria-label": "close",
+      onClick: close
+    },
+    /* @__PURE__ */ React.createElement(CloseIcon, null)
+  ))), /* @__PURE__ */ React.createElement(DialogContent, null, /* @__PURE__ */ React.createElement(Box, { className: classes.editor }, /* @__PURE__ */ React.createElement(
+    WorkflowEditor,
+    {
+      ...props,
+      workflowId,
+      ref: forwardedRef
+    }
+  ))), props.dialogActions);
+};
+const WorkflowDialog = forwardRef(RefForwardingWorkflowDialog);
+
+export { RefForwardingWorkflowDialog, WorkflowDialog };
+//# sourceMappingURL=WorkflowDialog.esm.js.map
@@ -0,0 +1,60 @@
+import { getFileLanguageOrThrow, FileLanguage } from '@kie-tools/serverless-workflow-language-service/dist/api';
+import { SwfYamlLanguageService, SwfJsonLanguageService } from '@kie-tools/serverless-workflow-language-service/dist/channel';
+
+class WorkflowEditorLanguageService {
+  constructor(services = []) {
+    this.services = services;
+  }
+  getLs(relativePath) {
+    const lsArgs = this.getDefaultLsArgs({});
+    const fileLanguage = getFileLanguageOrThrow(relativePath);
+    if (fileLanguage === FileLanguage.YAML) {
+      return new SwfYamlLanguageService(lsArgs);
+    } else if (fileLanguage === FileLanguage.JSON) {
+      return new SwfJsonLanguageService(lsArgs);
+    }
+    throw new Error(`Could not determine LS for ${relativePath}`);
+  }
+  getDefaultLsArgs(configOverrides) {
+    return {
+      fs: {},
+      serviceCatalog: {
+        global: {
+          getServices: async () => []
+        },
+        relative: {
+          getServices: async (_textDocument) => this.services
+        },
+        getServiceFileNameFromSwfServiceCatalogServiceId: async (registryName, serviceCatalogServiceId) => `${registryName}__${serviceCatalogServiceId}__latest.yaml`
+      },
+      config: {
+        shouldDisplayServiceRegistriesIntegration: async () => false,
+        shouldIncludeJsonSchemaDiagnostics: async () => true,
+        shouldReferenceServiceRegistryFunctionsWithUrls: async () => true,
+        getSpecsDirPosixPaths: async (_textDocument) => ({
+          specsDirRelativePosixPath: "specs",
+          specsDirAbsolutePosixPath: "specs"
+        }),
+        getRoutesDirPosixPaths: async (_textDocument) => ({
+          routesDirRelativePosixPath: "",
+          routesDirAbsolutePosixPath: ""
+        }),
+        shouldConfigureServiceRegistries: () => false,
+        shouldServiceRegistriesLogIn: () => false,
+        canRefreshServices: () => false,
+        ...configOverrides
+      },
+      jqCompletions: {
+        remote: {
+          getJqAutocompleteProperties: (_args) => Promise.resolve([])
+        },
+        relative: {
+          getJqAutocompleteProperties: (_args) => Promise.resolve([])
+        }
+      }
+    };
+  }
+}
+
+export { WorkflowEditorLanguageService };
+//# sourceMappingURL=WorkflowEditorLanguageService.esm.js.map
@@ -0,0 +1,7 @@
+const VALUE_UNAVAILABLE = "---";
+const SHORT_REFRESH_INTERVAL = 5e3;
+const LONG_REFRESH_INTERVAL = 15e3;
+const DEFAULT_TABLE_PAGE_SIZE = 20;
+
+export { DEFAULT_TABLE_PAGE_SIZE, LONG_REFRESH_INTERVAL, SHORT_REFRESH_INTERVAL, VALUE_UNAVAILABLE };
+//# sourceMappingURL=constants.esm.js.map
@@ -0,0 +1,2665 @@
+'use strict';
+
+Object.defineProperty(exports, '__esModule', { value: true });
+
+var backendPluginApi = require('@backstage/backend-plugin-api');
+var alpha = require('@backstage/plugin-catalog-node/alpha');
+var fs = require('fs-extra');
+var child_process = require('child_process');
+var path = require('path');
+var integration = require('@backstage/integration');
+var git = require('isomorphic-git');
+var http = require('isomorphic-git/http/node');
+var os = require('os');
+var rootHttpRouter = require('@backstage/backend-defaults/rootHttpRouter');
+var pluginPermissionCommon = require('@backstage/plugin-permission-common');
+var pluginPermissionNode = require('@backstage/plugin-permission-node');
+var formats = require('ajv-formats/dist/formats');
+var express = require('express');
+var openapiBackend = require('openapi-backend');
+var backstagePluginAuditLogNode = require('@janus-idp/backstage-plugin-audit-log-node');
+var backstagePluginRbacCommon = require('@janus-idp/backstage-plugin-rbac-common');
+var moment = require('moment');
+var sdkTypescript = require('@severlessworkflow/sdk-typescript');
+require('js-yaml');
+var core = require('@urql/core');
+require('axios');
+var backendCommon = require('@backstage/backend-common');
+var pluginScaffolderBackend = require('@backstage/plugin-scaffolder-backend');
+var crypto = require('crypto');
+var stream = require('stream');
+
+function _interopDefaultLegacy (e) { return e && typeof e === 'object' && 'default' in e ? e : { 'default': e }; }
+
+var fs__default = /*#__PURE__*/_interopDefaultLegacy(fs);
+var path__default = /*#__PURE__*/_interopDefaultLegacy(path);
+var git__default = /*#__PURE__*/_interopDefaultLegacy(git);
+var http__default = /*#__PURE__*/_interopDefaultLegacy(http);
+var os__default = /*#__PURE__*/_interopDefaultLegacy(os);
+var express__default = /*#__PURE__*/_interopDefaultLegacy(express);
+var moment__default = /*#__PURE__*/_interopDefaultLegacy(moment);
+
+var WorkflowCategory = /* @__PURE__ */ ((WorkflowCategory2) => {
+  WorkflowCategory2["ASSESSMENT"] = "assessment";
+  WorkflowCategory2["INFRASTRUCTURE"] = "infrastructure";
+  return WorkflowCategory2;
+})(WorkflowCategory || {});
+
+const OPENAPI = `{"openapi":"3.1.0","info":{"title":"Orchestratorplugin","description":"APItointeractwithorchestratorplugin","license":{"name":"Apache2.0","url":"http://www.apache.org/licenses/LICENSE-2.0.html"},"version":"0.0.1"},"servers":[{"url":"/"}],"paths":{"/v2/workflows/overview":{"post":{"operationId":"getWorkflowsOverview","description":"Returnsthekeyfieldsoftheworkflowincludingdataonthelastruninstance","requestBody":{"required":false,"description":"Paginationandfilters","content":{"application/json":{"schema":{"$ref":"#/components/schemas/SearchRequest"}}}},"responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"$ref":"#/components/schemas/WorkflowOverviewListResultDTO"}}}},"500":{"description":"Errorfetchingworkflowoverviews","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/{workflowId}/overview":{"get":{"operationId":"getWorkflowOverviewById","description":"Returnsthekeyfieldsoftheworkflowincludingdataonthelastruninstance","parameters":[{"name":"workflowId","in":"path","required":true,"description":"Uniqueidentifieroftheworkflow","schema":{"type":"string"}}],"responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"$ref":"#/components/schemas/WorkflowOverviewDTO"}}}},"500":{"description":"Errorfetchingworkflowoverview","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/{workflowId}":{"get":{"operationId":"getWorkflowById","description":"Getfullworkflowinfo","parameters":[{"name":"workflowId","in":"path","description":"IDoftheworkflowtofetch","required":true,"schema":{"type":"string"}}],"responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"$ref":"#/components/schemas/WorkflowDTO"}}}},"500":{"description":"Errorfetchingworkflowbyid","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/{workflowId}/source":{"get":{"operationId":"getWorkflowSourceById","description":"Gettheworkflow'sdefinition","parameters":[{"name":"workflowId","in":"path","description":"IDoftheworkflowtofetch","required":true,"schema":{"type":"string"}}],"responses":{"200":{"description":"Success","content":{"text/plain":{"schema":{"type":"string"}}}},"500":{"description":"Errorfetchingworkflowsourcebyid","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/{workflowId}/inputSchema":{"get":{"operationId":"getWorkflowInputSchemaById","description":"Gettheworkflowinputschema.Itdefinestheinputfieldsoftheworkflow","parameters":[{"name":"workflowId","in":"path","description":"IDoftheworkflowtofetch","required":true,"schema":{"type":"string"}},{"name":"instanceId","in":"query","description":"IDofinstance","schema":{"type":"string"}}],"responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"$ref":"#/components/schemas/InputSchemaResponseDTO"}}}},"500":{"description":"Errorfetchingworkflowinputschemabyid","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/instances":{"post":{"operationId":"getInstances","summary":"Getinstances","description":"Retrieveanarrayofworkflowexecutions(instances)","requestBody":{"required":false,"description":"Parametersforretrievinginstances","content":{"application/json":{"schema":{"$ref":"#/components/schemas/GetInstancesRequest"}}}},"responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ProcessInstanceListResultDTO"}}}},"500":{"description":"Errorfetchinginstances","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/{workflowId}/instances":{"post":{"operationId":"getWorkflowInstances","summary":"Getinstancesforaspecificworkflow","description":"Retrieveanarrayofworkflowexecutions(instances)forthegivenworkflow","parameters":[{"name":"workflowId","in":"path","required":true,"description":"IDoftheworkflow","schema":{"type":"string"}}],"requestBody":{"required":false,"description":"Parametersforretrievingworkflowinstances","content":{"application/json":{"schema":{"$ref":"#/components/schemas/SearchRequest"}}}},"responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ProcessInstanceListResultDTO"}}}},"500":{"description":"Errorfetchinginstances","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/instances/{instanceId}":{"get":{"summary":"GetWorkflowInstancebyID","description":"Getaworkflowexecution/run(instance)","operationId":"getInstanceById","parameters":[{"name":"instanceId","in":"path","required":true,"description":"IDoftheworkflowinstance","schema":{"type":"string"}},{"name":"includeAssessment","in":"query","required":false,"description":"Whethertoincludeassessment","schema":{"type":"boolean","default":false}}],"responses":{"200":{"description":"Successfulresponse","content":{"application/json":{"schema":{"$ref":"#/components/schemas/AssessedProcessInstanceDTO"}}}},"500":{"description":"Errorfetchinginstance","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/instances/statuses":{"get":{"operationId":"getWorkflowStatuses","summary":"Getworkflowstatuslist","description":"Retrievearraywiththestatusofallinstances","responses":{"200":{"description":"Success","content":{"application/json":{"schema":{"type":"array","items":{"$ref":"#/components/schemas/WorkflowRunStatusDTO"}}}}},"500":{"description":"Errorfetchingworkflowstatuses","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/{workflowId}/execute":{"post":{"summary":"Executeaworkflow","description":"Executeaworkflow","operationId":"executeWorkflow","parameters":[{"name":"workflowId","in":"path","description":"IDoftheworkflowtoexecute","required":true,"schema":{"type":"string"}}],"requestBody":{"required":true,"content":{"application/json":{"schema":{"$ref":"#/components/schemas/ExecuteWorkflowRequestDTO"}}}},"responses":{"200":{"description":"Successfulexecution","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ExecuteWorkflowResponseDTO"}}}},"500":{"description":"InternalServerError","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}},"/v2/workflows/instances/{instanceId}/abort":{"delete":{"summary":"Abortaworkflowinstance","operationId":"abortWorkflow","description":"AbortsaworkflowinstanceidentifiedbytheprovidedinstanceId.","parameters":[{"name":"instanceId","in":"path","required":true,"description":"Theidentifieroftheworkflowinstancetoabort.","schema":{"type":"string"}}],"responses":{"200":{"description":"Successfuloperation","content":{"text/plain":{"schema":{"type":"string"}}}},"500":{"description":"Errorabortingworkflow","content":{"application/json":{"schema":{"$ref":"#/components/schemas/ErrorResponse"}}}}}}}},"components":{"schemas":{"ErrorResponse":{"description":"TheErrorResponseobjectrepresentsacommonstructureforhandlingerrorsinAPIresponses.Itincludesessentialinformationabouttheerror,suchastheerrormessageandadditionaloptionaldetails.","type":"object","properties":{"message":{"description":"Astringprovidingaconciseandhuman-readabledescriptionoftheencounterederror.ThisfieldisrequiredintheErrorResponseobject.","type":"string","default":"internalservererror"},"additionalInfo":{"description":"Anoptionalfieldthatcancontainadditionalinformationorcontextabouttheerror.Itprovidesflexibilityforincludingextradetailsbasedonspecificerrorscenarios.","type":"string"}},"required":["message"]},"GetInstancesRequest":{"type":"object","properties":{"paginationInfo":{"$ref":"#/components/schemas/PaginationInfoDTO"},"filters":{"$ref":"#/components/schemas/SearchRequest"}}},"GetOverviewsRequestParams":{"type":"object","properties":{"paginationInfo":{"$ref":"#/components/schemas/PaginationInfoDTO"},"filters":{"$ref":"#/components/schemas/SearchRequest"}}},"WorkflowOverviewListResultDTO":{"type":"object","properties":{"overviews":{"type":"array","items":{"$ref":"#/components/schemas/WorkflowOverviewDTO"},"minItems":0},"paginationInfo":{"$ref":"#/components/schemas/PaginationInfoDTO"}}},"WorkflowOverviewDTO":{"type":"object","properties":{"workflowId":{"type":"string","description":"Workflowuniqueidentifier","minLength":1},"name":{"type":"string","description":"Workflowname","minLength":1},"format":{"$ref":"#/components/schemas/WorkflowFormatDTO"},"lastRunId":{"type":"string"},"lastTriggeredMs":{"type":"number","minimum":0},"lastRunStatus":{"$ref":"#/components/schemas/ProcessInstanceStatusDTO"},"category":{"$ref":"#/components/schemas/WorkflowCategoryDTO"},"avgDurationMs":{"type":"number","minimum":0},"description":{"type":"string"}},"required":["workflowId","format"]},"PaginationInfoDTO":{"type":"object","properties":{"pageSize":{"type":"number"},"offset":{"type":"number"},"totalCount":{"type":"number"},"orderDirection":{"enum":["ASC","DESC"]},"orderBy":{"type":"string"}},"additionalProperties":false},"WorkflowFormatDTO":{"type":"string","description":"Formatoftheworkflowdefinition","enum":["yaml","json"]},"WorkflowCategoryDTO":{"type":"string","description":"Categoryoftheworkflow","enum":["assessment","infrastructure"]},"WorkflowListResultDTO":{"type":"object","properties":{"items":{"type":"array","items":{"$ref":"#/components/schemas/WorkflowDTO"}},"paginationInfo":{"$ref":"#/components/schemas/PaginationInfoDTO"}},"required":["items","paginationInfo"]},"WorkflowDTO":{"type":"object","properties":{"id":{"type":"string","description":"Workflowuniqueidentifier","minLength":1},"name":{"type":"string","description":"Workflowname","minLength":1},"format":{"$ref":"#/components/schemas/WorkflowFormatDTO"},"category":{"$ref":"#/components/schemas/WorkflowCategoryDTO"},"description":{"type":"string","description":"Descriptionoftheworkflow"},"annotations":{"type":"array","items":{"type":"string"}}},"required":["id","category","format"]},"ProcessInstanceListResultDTO":{"type":"object","properties":{"items":{"type":"array","items":{"$ref":"#/components/schemas/ProcessInstanceDTO"}},"paginationInfo":{"$ref":"#/components/schemas/PaginationInfoDTO"}}},"AssessedProcessInstanceDTO":{"type":"object","properties":{"instance":{"$ref":"#/components/schemas/ProcessInstanceDTO"},"assessedBy":{"$ref":"#/components/schemas/ProcessInstanceDTO"}},"required":["instance"]},"ProcessInstanceDTO":{"type":"object","properties":{"id":{"type":"string"},"processId":{"type":"string"},"processName":{"type":"string"},"status":{"$ref":"#/components/schemas/ProcessInstanceStatusDTO"},"endpoint":{"type":"string"},"serviceUrl":{"type":"string"},"start":{"type":"string"},"end":{"type":"string"},"duration":{"type":"string"},"category":{"$ref":"#/components/schemas/WorkflowCategoryDTO"},"description":{"type":"string"},"workflowdata":{"$ref":"#/components/schemas/WorkflowDataDTO"},"businessKey":{"type":"string"},"nodes":{"type":"array","items":{"$ref":"#/components/schemas/NodeInstanceDTO"}},"error":{"$ref":"#/components/schemas/ProcessInstanceErrorDTO"}},"required":["id","processId","nodes"]},"WorkflowDataDTO":{"type":"object","properties":{"result":{"$ref":"#/components/schemas/WorkflowResultDTO"}},"additionalProperties":true},"WorkflowResultDTO":{"description":"Resultofaworkflowexecution","type":"object","properties":{"completedWith":{"description":"Thestateofworkflowcompletion.","type":"string","enum":["error","success"]},"message":{"description":"High-levelsummaryofthecurrentstatus,free-formtext,humanreadable.","type":"string"},"nextWorkflows":{"description":"Listofworkflowssuggestedtorunnext.Itemsatlowerindexesareofhigherpriority.","type":"array","items":{"type":"object","properties":{"id":{"description":"Workflowidentifier","type":"string"},"name":{"description":"Humanreadabletitledescribingtheworkflow.","type":"string"}},"required":["id","name"]}},"outputs":{"description":"Additionalstructuredoutputofworkflowprocessing.Thiscancontainidentifiersofcreatedresources,linkstoresources,logsorotheroutput.","type":"array","items":{"type":"object","properties":{"key":{"description":"Uniqueidentifieroftheoption.Preferablyhuman-readable.","type":"string"},"value":{"description":"Freeformvalueoftheoption.","anyOf":[{"type":"string"},{"type":"number"}]},"format":{"description":"Moredetailedtypeofthe'value'property.Defaultsto'text'.","enum":["text","number","link"]}},"required":["key","value"]}}}},"ProcessInstanceStatusDTO":{"type":"string","description":"Statusoftheworkflowrun","enum":["Active","Error","Completed","Aborted","Suspended","Pending"]},"WorkflowRunStatusDTO":{"type":"object","properties":{"key":{"type":"string"},"value":{"type":"string"}}},"ExecuteWorkflowRequestDTO":{"type":"object","properties":{"inputData":{"type":"object","additionalProperties":true}},"required":["inputData"]},"ExecuteWorkflowResponseDTO":{"type":"object","properties":{"id":{"type":"string"}},"required":["id"]},"WorkflowProgressDTO":{"allOf":[{"$ref":"#/components/schemas/NodeInstanceDTO"},{"type":"object","properties":{"status":{"$ref":"#/components/schemas/ProcessInstanceStatusDTO"},"error":{"$ref":"#/components/schemas/ProcessInstanceErrorDTO"}}}]},"NodeInstanceDTO":{"type":"object","properties":{"__typename":{"type":"string","default":"NodeInstance","description":"Typename"},"id":{"type":"string","description":"NodeinstanceID"},"name":{"type":"string","description":"Nodename"},"type":{"type":"string","description":"Nodetype"},"enter":{"type":"string","description":"Datewhenthenodewasentered"},"exit":{"type":"string","description":"Datewhenthenodewasexited(optional)"},"definitionId":{"type":"string","description":"DefinitionID"},"nodeId":{"type":"string","description":"NodeID"}},"required":["id"]},"ProcessInstanceErrorDTO":{"type":"object","properties":{"__typename":{"type":"string","default":"ProcessInstanceError","description":"Typename"},"nodeDefinitionId":{"type":"string","description":"NodedefinitionID"},"message":{"type":"string","description":"Errormessage(optional)"}},"required":["nodeDefinitionId"]},"SearchRequest":{"type":"object","properties":{"filters":{"$ref":"#/components/schemas/Filter"},"paginationInfo":{"$ref":"#/components/schemas/PaginationInfoDTO"}}},"Filter":{"oneOf":[{"$ref":"#/components/schemas/LogicalFilter"},{"$ref":"#/components/schemas/FieldFilter"}]},"LogicalFilter":{"type":"object","required":["operator","filters"],"properties":{"operator":{"type":"string","enum":["AND","OR","NOT"]},"filters":{"type":"array","items":{"$ref":"#/components/schemas/Filter"}}}},"FieldFilter":{"type":"object","required":["field","operator","value"],"properties":{"field":{"type":"string"},"operator":{"type":"string","enum":["EQ","GT","GTE","LT","LTE","IN","IS_NULL","CONTAINS","CONTAINS_ALL","CONTAINS_ANY","LIKE","BETWEEN"]},"value":{"oneOf":[{"type":"string"},{"type":"number"},{"type":"boolean"},{"type":"array","items":{"oneOf":[{"type":"string"},{"type":"number"},{"type":"boolean"}]}}]}}},"InputSchemaResponseDTO":{"type":"object","properties":{"inputSchema":{"type":"object"},"data":{"type":"object"}}}}}}`;
+const openApiDocument = JSON.parse(OPENAPI);
+
+const FieldFilterOperatorEnum = {
+  Eq: "EQ",
+  Gt: "GT",
+  Gte: "GTE",
+  Lt: "LT",
+  Lte: "LTE",
+  In: "IN",
+  IsNull: "IS_NULL",
+  Contains: "CONTAINS",
+  ContainsAll: "CONTAINS_ALL",
+  ContainsAny: "CONTAINS_ANY",
+  Like: "LIKE",
+  Between: "BETWEEN"
+};
+
+const DEFAULT_SONATAFLOW_CONTAINER_IMAGE = "docker.io/apache/incubator-kie-sonataflow-devmode:latest";
+const DEFAULT_SONATAFLOW_PERSISTENCE_PATH = "/home/kogito/persistence";
+const DEFAULT_SONATAFLOW_BASE_URL = "http://localhost";
+const DEFAULT_WORKFLOWS_PATH = "workflows";
+const ASSESSMENT_WORKFLOW_TYPE = "workflow-type/assessment";
+
+var ProcessInstanceState = /* @__PURE__ */ ((ProcessInstanceState2) => {
+  ProcessInstanceState2["Active"] = "ACTIVE";
+  ProcessInstanceState2["Completed"] = "COMPLETED";
+  ProcessInstanceState2["Aborted"] = "ABORTED";
+  ProcessInstanceState2["Suspended"] = "SUSPENDED";
+  ProcessInstanceState2["Error"] = "ERROR";
+  ProcessInstanceState2["Pending"] = "PENDING";
+  return ProcessInstanceState2;
+})(ProcessInstanceState || {});
+var TypeName = /* @__PURE__ */ ((TypeName2) => {
+  TypeName2["Id"] = "IdArgument";
+  TypeName2["String"] = "StringArgument";
+  TypeName2["StringArray"] = "StringArrayArgument";
+  TypeName2["Date"] = "DateArgument";
+  return TypeName2;
+})(TypeName || {});
+
+function fromWorkflowSource(content) {
+  var _a;
+  const parsed = sdkTypescript.Specification.Workflow.fromSource(content);
+  const workflow = (_a = parsed.sourceModel) != null ? _a : parsed;
+  return removeProperty(workflow, "normalize");
+}
+function getWorkflowCategory(definition) {
+  var _a;
+  if (definition === void 0) {
+    return WorkflowCategory.INFRASTRUCTURE;
+  }
+  return ((_a = definition == null ? void 0 : definition.annotations) == null ? void 0 : _a.find(
+    (annotation) => annotation === ASSESSMENT_WORKFLOW_TYPE
+  )) ? WorkflowCategory.ASSESSMENT : WorkflowCategory.INFRASTRUCTURE;
+}
+function removeProperty(obj, propToDelete) {
+  if (typeof obj !== "object" || obj === null) {
+    return obj;
+  }
+  if (Array.isArray(obj)) {
+    return obj.map((item) => removeProperty(item, propToDelete));
+  }
+  const newObj = {};
+  for (const key in obj) {
+    if (key !== propToDelete) {
+      newObj[key] = removeProperty(obj[key], propToDelete);
+    }
+  }
+  return newObj;
+}
+function parseWorkflowVariables(variables) {
+  if (variables === void 0) {
+    return void 0;
+  }
+  if (typeof variables === "string") {
+    try {
+      return JSON.parse(variables);
+    } catch {
+      throw new Error(
+        `Error when parsing process instance variables: ${variables}`
+      );
+    }
+  }
+  return variables;
+}
+function extractWorkflowFormat(source) {
+  try {
+    JSON.parse(source);
+    return "json";
+  } catch (_) {
+    return "yaml";
+  }
+}
+
+const QUERY_PARAM_BUSINESS_KEY = "businessKey";
+const QUERY_PARAM_INCLUDE_ASSESSMENT = "includeAssessment";
+
+const capitalize = (text) => text[0].toUpperCase() + text.slice(1).toLowerCase();
+
+const orchestratorWorkflowInstancesReadPermission = pluginPermissionCommon.createPermission({
+  name: "orchestrator.workflowInstances.read",
+  attributes: {
+    action: "read"
+  }
+});
+const orchestratorWorkflowInstanceReadPermission = pluginPermissionCommon.createPermission({
+  name: "orchestrator.workflowInstance.read",
+  attributes: {
+    action: "read"
+  }
+});
+const orchestratorWorkflowReadPermission = pluginPermissionCommon.createPermission({
+  name: "orchestrator.workflow.read",
+  attributes: {
+    action: "read"
+  }
+});
+const orchestratorWorkflowExecutePermission = pluginPermissionCommon.createPermission({
+  name: "orchestrator.workflow.execute",
+  attributes: {}
+});
+const orchestratorWorkflowInstanceAbortPermission = pluginPermissionCommon.createPermission({
+  name: "orchestrator.workflowInstance.abort",
+  attributes: {}
+});
+const orchestratorPermissions = [
+  orchestratorWorkflowReadPermission,
+  orchestratorWorkflowExecutePermission,
+  orchestratorWorkflowInstancesReadPermission,
+  orchestratorWorkflowInstanceReadPermission,
+  orchestratorWorkflowInstanceAbortPermission
+];
+
+var __defProp$5 = Object.defineProperty;
+var __defNormalProp$5 = (obj, key, value) => key in obj ? __defProp$5(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$5 = (obj, key, value) => __defNormalProp$5(obj, typeof key !== "symbol" ? key + "" : key, value);
+function isAuthCallbackOptions(options) {
+  return "onAuth" in options;
+}
+const _Git = class _Git {
+  constructor(config) {
+    this.config = config;
+    __publicField$5(this, "headers");
+    __publicField$5(this, "onAuth");
+    __publicField$5(this, "onProgressHandler", () => {
+      let currentPhase = "";
+      return (event) => {
+        var _a, _b;
+        if (currentPhase !== event.phase) {
+          currentPhase = event.phase;
+          (_a = this.config.logger) == null ? void 0 : _a.info(event.phase);
+        }
+        const total = event.total ? `${Math.round(event.loaded / event.total * 100)}%` : event.loaded;
+        (_b = this.config.logger) == null ? void 0 : _b.debug(`status={${event.phase},total={${total}}}`);
+      };
+    });
+    this.onAuth = config.onAuth;
+    this.headers = {
+      "user-agent": "git/@isomorphic-git",
+      ...config.token ? { Authorization: `Bearer ${config.token}` } : {}
+    };
+  }
+  async add(options) {
+    var _a;
+    const { dir, filepath } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(`Adding file {dir=${dir},filepath=${filepath}}`);
+    return git__default["default"].add({ fs: fs__default["default"], dir, filepath });
+  }
+  async addRemote(options) {
+    var _a;
+    const { dir, url, remote, force } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(
+      `Creating new remote {dir=${dir},remote=${remote},url=${url}}`
+    );
+    return git__default["default"].addRemote({ fs: fs__default["default"], dir, remote, url, force });
+  }
+  async deleteRemote(options) {
+    var _a;
+    const { dir, remote } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(`Deleting remote {dir=${dir},remote=${remote}}`);
+    return git__default["default"].deleteRemote({ fs: fs__default["default"], dir, remote });
+  }
+  async checkout(options) {
+    var _a;
+    const { dir, ref } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(`Checking out branch {dir=${dir},ref=${ref}}`);
+    return git__default["default"].checkout({ fs: fs__default["default"], dir, ref });
+  }
+  async branch(options) {
+    var _a;
+    const { dir, ref } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(`Creating branch {dir=${dir},ref=${ref}`);
+    return git__default["default"].branch({ fs: fs__default["default"], dir, ref });
+  }
+  async commit(options) {
+    var _a;
+    const { dir, message, author, committer } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(
+      `Committing file to repo {dir=${dir},message=${message}}`
+    );
+    return git__default["default"].commit({ fs: fs__default["default"], dir, message, author, committer });
+  }
+  /** https://isomorphic-git.org/docs/en/clone */
+  async clone(options) {
+    var _a, _b;
+    const { url, dir, ref, depth, noCheckout } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(`Cloning repo {dir=${dir},url=${url}}`);
+    try {
+      return await git__default["default"].clone({
+        fs: fs__default["default"],
+        http: http__default["default"],
+        url,
+        dir,
+        ref,
+        singleBranch: true,
+        depth: depth != null ? depth : 1,
+        noCheckout,
+        onProgress: this.onProgressHandler(),
+        headers: this.headers,
+        onAuth: this.onAuth
+      });
+    } catch (ex) {
+      (_b = this.config.logger) == null ? void 0 : _b.error(`Failed to clone repo {dir=${dir},url=${url}}`);
+      if (ex.data) {
+        throw new Error(`${ex.message} {data=${JSON.stringify(ex.data)}}`);
+      }
+      throw ex;
+    }
+  }
+  /** https://isomorphic-git.org/docs/en/currentBranch */
+  async currentBranch(options) {
+    const { dir, fullName = false } = options;
+    return git__default["default"].currentBranch({ fs: fs__default["default"], dir, fullname: fullName });
+  }
+  /** https://isomorphic-git.org/docs/en/fetch */
+  async fetch(options) {
+    var _a, _b;
+    const { dir, remote = "origin", tags = false } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(
+      `Fetching remote=${remote} for repository {dir=${dir}}`
+    );
+    try {
+      await git__default["default"].fetch({
+        fs: fs__default["default"],
+        http: http__default["default"],
+        dir,
+        remote,
+        tags,
+        onProgress: this.onProgressHandler(),
+        headers: this.headers,
+        onAuth: this.onAuth
+      });
+    } catch (ex) {
+      (_b = this.config.logger) == null ? void 0 : _b.error(
+        `Failed to fetch repo {dir=${dir},remote=${remote}}`
+      );
+      if (ex.data) {
+        throw new Error(`${ex.message} {data=${JSON.stringify(ex.data)}}`);
+      }
+      throw ex;
+    }
+  }
+  async init(options) {
+    var _a;
+    const { dir, defaultBranch = "master" } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(`Init git repository {dir=${dir}}`);
+    return git__default["default"].init({
+      fs: fs__default["default"],
+      dir,
+      defaultBranch
+    });
+  }
+  /** https://isomorphic-git.org/docs/en/merge */
+  async merge(options) {
+    var _a;
+    const { dir, theirs, ours, author, committer } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(
+      `Merging branch '${theirs}' into '${ours}' for repository {dir=${dir}}`
+    );
+    return git__default["default"].merge({
+      fs: fs__default["default"],
+      dir,
+      ours,
+      theirs,
+      author,
+      committer
+    });
+  }
+  async push(options) {
+    var _a, _b;
+    const { dir, remote, remoteRef, force } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(
+      `Pushing directory to remote {dir=${dir},remote=${remote}}`
+    );
+    try {
+      return await git__default["default"].push({
+        fs: fs__default["default"],
+        dir,
+        http: http__default["default"],
+        onProgress: this.onProgressHandler(),
+        remoteRef,
+        force,
+        headers: this.headers,
+        remote,
+        onAuth: this.onAuth
+      });
+    } catch (ex) {
+      (_b = this.config.logger) == null ? void 0 : _b.error(
+        `Failed to push to repo {dir=${dir}, remote=${remote}}`
+      );
+      if (ex.data) {
+        throw new Error(`${ex.message} {data=${JSON.stringify(ex.data)}}`);
+      }
+      throw ex;
+    }
+  }
+  /** https://isomorphic-git.org/docs/en/readCommit */
+  async readCommit(options) {
+    const { dir, sha } = options;
+    return git__default["default"].readCommit({ fs: fs__default["default"], dir, oid: sha });
+  }
+  /** https://isomorphic-git.org/docs/en/remove */
+  async remove(options) {
+    var _a;
+    const { dir, filepath } = options;
+    (_a = this.config.logger) == null ? void 0 : _a.info(
+      `Removing file from git index {dir=${dir},filepath=${filepath}}`
+    );
+    return git__default["default"].remove({ fs: fs__default["default"], dir, filepath });
+  }
+  /** https://isomorphic-git.org/docs/en/resolveRef */
+  async resolveRef(options) {
+    const { dir, ref } = options;
+    return git__default["default"].resolveRef({ fs: fs__default["default"], dir, ref });
+  }
+  /** https://isomorphic-git.org/docs/en/log */
+  async log(options) {
+    const { dir, ref } = options;
+    return git__default["default"].log({
+      fs: fs__default["default"],
+      dir,
+      ref: ref != null ? ref : "HEAD"
+    });
+  }
+};
+__publicField$5(_Git, "fromAuth", (options) => {
+  if (isAuthCallbackOptions(options)) {
+    const { onAuth, logger: logger2 } = options;
+    return new _Git({ onAuth, logger: logger2 });
+  }
+  const { username, password, token, logger } = options;
+  return new _Git({ onAuth: () => ({ username, password }), token, logger });
+});
+let Git = _Git;
+
+var __defProp$4 = Object.defineProperty;
+var __defNormalProp$4 = (obj, key, value) => key in obj ? __defProp$4(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$4 = (obj, key, value) => __defNormalProp$4(obj, typeof key !== "symbol" ? key + "" : key, value);
+class GitService {
+  constructor(logger, config) {
+    __publicField$4(this, "git");
+    __publicField$4(this, "logger");
+    __publicField$4(this, "authenticated");
+    __publicField$4(this, "author", {
+      name: "backstage-orchestrator",
+      email: "orchestrator@backstage.io"
+    });
+    __publicField$4(this, "committer", {
+      name: "backstage-orchestrator",
+      email: "orchestrator@backstage.io"
+    });
+    this.logger = logger;
+    const githubIntegration = integration.ScmIntegrations.fromConfig(config).github.list().pop();
+    this.git = Git.fromAuth({
+      username: "x-access-token",
+      password: githubIntegration == null ? void 0 : githubIntegration.config.token
+    });
+    this.authenticated = !!(githubIntegration == null ? void 0 : githubIntegration.config.token);
+  }
+  async clone(repoURL, localPath) {
+    this.logger.info(`cloning repo ${repoURL} into ${localPath}`);
+    return this.git.clone({
+      url: repoURL,
+      dir: localPath,
+      depth: 1
+    }).then(() => this.git.checkout({ dir: localPath, ref: "main" }));
+  }
+  async push(dir, message) {
+    if (!this.authenticated) {
+      this.logger.warn(
+        "Git integration is required to be configured for push, with the token or credentials"
+      );
+      return;
+    }
+    const branch = "main";
+    const force = true;
+    const remote = "origin";
+    const filepath = ".";
+    this.git.fetch({ remote, dir }).then(() => this.git.checkout({ dir, ref: branch })).then(() => this.git.add({ dir, filepath })).then(
+      () => this.git.commit({
+        dir,
+        message,
+        author: this.author,
+        committer: this.committer
+      })
+    ).then(() => this.git.push({ dir, remote, remoteRef: branch, force })).finally(() => this.logger.info("push completed")).catch((ex) => this.logger.error(ex));
+  }
+  async pull(localPath) {
+    const remoteBranch = "origin/main";
+    const localBranch = "main";
+    const remote = "origin";
+    this.git.fetch({ remote, dir: localPath }).then(() => this.git.checkout({ dir: localPath, ref: localBranch })).then(
+      () => this.git.merge({
+        dir: localPath,
+        ours: localBranch,
+        theirs: remoteBranch,
+        author: this.author,
+        committer: this.committer
+      })
+    ).finally(() => this.logger.info("merge completed")).catch((ex) => this.logger.error(ex));
+  }
+}
+
+async function retryAsyncFunction(args) {
+  let result;
+  for (let i = 0; i < args.maxAttempts; i++) {
+    result = await args.asyncFn();
+    if (result !== void 0) {
+      return result;
+    }
+    await new Promise((resolve) => setTimeout(resolve, args.delayMs));
+  }
+  throw new Error("Exceeded maximum number of retries for async function");
+}
+async function getWorkingDirectory(config, logger) {
+  if (!config.has("backend.workingDirectory")) {
+    return os__default["default"].tmpdir();
+  }
+  const workingDirectory = config.getString("backend.workingDirectory");
+  try {
+    await fs__default["default"].access(workingDirectory, fs__default["default"].constants.F_OK | fs__default["default"].constants.W_OK);
+    logger.info(`using working directory: ${workingDirectory}`);
+  } catch (err) {
+    logger.error(
+      `working directory ${workingDirectory} ${err.code === "ENOENT" ? "does not exist" : "is not writable"}`
+    );
+    throw err;
+  }
+  return workingDirectory;
+}
+async function executeWithRetry(action, maxErrors = 15) {
+  let response;
+  let errorCount = 0;
+  const backoff = 5e3;
+  while (errorCount < maxErrors) {
+    try {
+      response = await action();
+      if (response.status >= 400) {
+        errorCount++;
+        await delay(backoff);
+      } else {
+        return response;
+      }
+    } catch (e) {
+      errorCount++;
+      await delay(backoff);
+    }
+  }
+  throw new Error("Unable to execute query.");
+}
+function delay(time) {
+  return new Promise((r) => setTimeout(r, time));
+}
+
+var __defProp$3 = Object.defineProperty;
+var __defNormalProp$3 = (obj, key, value) => key in obj ? __defProp$3(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$3 = (obj, key, value) => __defNormalProp$3(obj, typeof key !== "symbol" ? key + "" : key, value);
+const SONATA_FLOW_RESOURCES_PATH = "/home/kogito/serverless-workflow-project/src/main/resources";
+class DevModeService {
+  constructor(config, logger) {
+    this.logger = logger;
+    __publicField$3(this, "connection");
+    __publicField$3(this, "gitService");
+    this.connection = this.extractConnectionConfig(config);
+    this.gitService = new GitService(logger, config);
+  }
+  get devModeUrl() {
+    if (!this.connection.port) {
+      return this.connection.host;
+    }
+    return `${this.connection.host}:${this.connection.port}`;
+  }
+  async launchDevMode() {
+    await this.loadDevWorkflows();
+    const isAlreadyUp = await this.isSonataFlowUp(false, this.devModeUrl);
+    if (isAlreadyUp) {
+      return true;
+    }
+    this.launchSonataFlow();
+    return await this.isSonataFlowUp(true, this.devModeUrl);
+  }
+  async isSonataFlowUp(withRetry, endpoint) {
+    const healthUrl = `${endpoint}/q/health`;
+    this.logger.info(`Checking SonataFlow health at: ${healthUrl}`);
+    try {
+      const response = await executeWithRetry(
+        () => fetch(healthUrl),
+        withRetry ? 15 : 1
+      );
+      if (response.ok) {
+        this.logger.info("SonataFlow is up and running");
+        return true;
+      }
+    } catch (e) {
+      this.logger.error(`Error when checking SonataFlow health: ${e}`);
+    }
+    return false;
+  }
+  launchSonataFlow() {
+    const launcherCmd = this.createLauncherCommand();
+    this.logger.info(
+      `Auto starting SonataFlow through: ${launcherCmd.command} ${launcherCmd.args.join(" ")}`
+    );
+    const process = child_process.spawn(launcherCmd.command, launcherCmd.args, {
+      shell: false
+    });
+    process.on("close", (code) => {
+      this.logger.info(`SonataFlow process exited with code ${code}`);
+    });
+    process.on("exit", (code) => {
+      this.logger.info(`SonataFlow process exited with code ${code}`);
+    });
+    process.on("error", (error) => {
+      this.logger.error(`SonataFlow process error: ${error}`);
+    });
+  }
+  createLauncherCommand() {
+    const resourcesAbsPath = path.resolve(
+      path.join(this.connection.resourcesPath, DEFAULT_WORKFLOWS_PATH)
+    );
+    const launcherArgs = [
+      "run",
+      "--name",
+      "backstage-internal-sonataflow",
+      "--add-host",
+      "host.docker.internal:host-gateway"
+    ];
+    launcherArgs.push("-e", `QUARKUS_HTTP_PORT=${this.connection.port}`);
+    launcherArgs.push("-p", `${this.connection.port}:${this.connection.port}`);
+    launcherArgs.push("-e", `KOGITO_SERVICE_URL=${this.devModeUrl}`);
+    launcherArgs.push(
+      "-v",
+      `${resourcesAbsPath}:${SONATA_FLOW_RESOURCES_PATH}:Z`
+    );
+    launcherArgs.push("-e", "KOGITO.CODEGEN.PROCESS.FAILONERROR=false");
+    launcherArgs.push(
+      "-e",
+      `QUARKUS_EMBEDDED_POSTGRESQL_DATA_DIR=${this.connection.persistencePath}`
+    );
+    launcherArgs.push(this.connection.containerImage);
+    return {
+      command: "docker",
+      args: launcherArgs
+    };
+  }
+  extractConnectionConfig(config) {
+    var _a, _b, _c, _d, _e;
+    const host = (_a = config.getOptionalString("orchestrator.sonataFlowService.baseUrl")) != null ? _a : DEFAULT_SONATAFLOW_BASE_URL;
+    const port = config.getOptionalNumber(
+      "orchestrator.sonataFlowService.port"
+    );
+    const resourcesPath = (_b = config.getOptionalString(
+      "orchestrator.sonataFlowService.workflowsSource.localPath"
+    )) != null ? _b : "";
+    const containerImage = (_c = config.getOptionalString("orchestrator.sonataFlowService.container")) != null ? _c : DEFAULT_SONATAFLOW_CONTAINER_IMAGE;
+    const persistencePath = (_d = config.getOptionalString(
+      "orchestrator.sonataFlowService.persistence.path"
+    )) != null ? _d : DEFAULT_SONATAFLOW_PERSISTENCE_PATH;
+    const repoUrl = (_e = config.getOptionalString(
+      "orchestrator.sonataFlowService.workflowsSource.gitRepositoryUrl"
+    )) != null ? _e : "";
+    return {
+      host,
+      port,
+      containerImage,
+      resourcesPath,
+      persistencePath,
+      repoUrl
+    };
+  }
+  async loadDevWorkflows() {
+    if (!this.connection.repoUrl) {
+      this.logger.info(
+        "No Git repository configured. Skipping dev workflows loading."
+      );
+      return;
+    }
+    this.logger.info(`Loading dev workflows from ${this.connection.repoUrl}`);
+    const localPath = this.connection.resourcesPath;
+    if (await fs__default["default"].pathExists(localPath)) {
+      this.logger.info(`Path ${localPath} already exists. Skipping clone.`);
+      return;
+    }
+    await this.gitService.clone(this.connection.repoUrl, localPath);
+  }
+}
+
+var name = "@janus-idp/backstage-plugin-orchestrator-backend";
+
+function buildPagination(req) {
+  var _a;
+  const pagination = {
+    limit: void 0,
+    offset: void 0,
+    order: void 0,
+    sortField: void 0
+  };
+  if (!((_a = req.body) == null ? void 0 : _a.paginationInfo)) {
+    return pagination;
+  }
+  const { offset, pageSize, orderBy, orderDirection } = req.body.paginationInfo;
+  if (!isNaN(Number(offset))) {
+    pagination.offset = Number(offset);
+  }
+  if (!isNaN(Number(pageSize))) {
+    pagination.limit = Number(pageSize);
+  }
+  if (orderBy) {
+    pagination.sortField = String(orderBy);
+  }
+  if (orderDirection) {
+    pagination.order = String(orderDirection).toUpperCase();
+  }
+  return pagination;
+}
+
+function mapToWorkflowOverviewDTO(overview) {
+  return {
+    name: overview.name,
+    format: overview.format,
+    workflowId: overview.workflowId,
+    avgDurationMs: overview.avgDurationMs,
+    description: overview.description,
+    lastRunId: overview.lastRunId,
+    lastRunStatus: overview.lastRunStatus ? getProcessInstancesDTOFromString(overview.lastRunStatus) : void 0,
+    lastTriggeredMs: overview.lastTriggeredMs,
+    category: mapWorkflowCategoryDTOFromString(overview.category)
+  };
+}
+function mapWorkflowCategoryDTOFromString(category) {
+  return (category == null ? void 0 : category.toLocaleLowerCase()) === "assessment" ? "assessment" : "infrastructure";
+}
+function getWorkflowCategoryDTO(definition) {
+  return getWorkflowCategory(definition);
+}
+function getWorkflowFormatDTO(source) {
+  return extractWorkflowFormat(source);
+}
+function mapToWorkflowDTO(source) {
+  const definition = fromWorkflowSource(source);
+  return {
+    annotations: definition.annotations,
+    category: getWorkflowCategoryDTO(definition),
+    description: definition.description,
+    name: definition.name,
+    format: getWorkflowFormatDTO(source),
+    id: definition.id
+  };
+}
+function mapWorkflowCategoryDTO(category) {
+  if (category === WorkflowCategory.ASSESSMENT) {
+    return "assessment";
+  }
+  return "infrastructure";
+}
+function getProcessInstancesDTOFromString(state) {
+  switch (state) {
+    case ProcessInstanceState.Active.valueOf():
+      return "Active";
+    case ProcessInstanceState.Error.valueOf():
+      return "Error";
+    case ProcessInstanceState.Completed.valueOf():
+      return "Completed";
+    case ProcessInstanceState.Aborted.valueOf():
+      return "Aborted";
+    case ProcessInstanceState.Suspended.valueOf():
+      return "Suspended";
+    case ProcessInstanceState.Pending.valueOf():
+      return "Pending";
+    default:
+      throw new Error(
+        `state ${state} is not one of the values of type ProcessInstanceStatusDTO`
+      );
+  }
+}
+function mapToProcessInstanceDTO(processInstance) {
+  const start = moment__default["default"](processInstance.start);
+  const end = moment__default["default"](processInstance.end);
+  const duration = processInstance.end ? moment__default["default"].duration(start.diff(end)).humanize() : void 0;
+  let variables;
+  if (typeof (processInstance == null ? void 0 : processInstance.variables) === "string") {
+    variables = JSON.parse(processInstance == null ? void 0 : processInstance.variables);
+  } else {
+    variables = processInstance == null ? void 0 : processInstance.variables;
+  }
+  return {
+    id: processInstance.id,
+    processId: processInstance.processId,
+    processName: processInstance.processName,
+    description: processInstance.description,
+    serviceUrl: processInstance.serviceUrl,
+    businessKey: processInstance.businessKey,
+    endpoint: processInstance.endpoint,
+    error: processInstance.error,
+    category: mapWorkflowCategoryDTO(processInstance.category),
+    start: processInstance.start,
+    end: processInstance.end,
+    duration,
+    // @ts-ignore
+    workflowdata: variables == null ? void 0 : variables.workflowdata,
+    status: getProcessInstancesDTOFromString(processInstance.state),
+    nodes: processInstance.nodes.map(mapToNodeInstanceDTO)
+  };
+}
+function mapToNodeInstanceDTO(nodeInstance) {
+  return { ...nodeInstance, __typename: "NodeInstance" };
+}
+function mapToExecuteWorkflowResponseDTO(workflowId, workflowExecutionResponse) {
+  if (!(workflowExecutionResponse == null ? void 0 : workflowExecutionResponse.id)) {
+    throw new Error(
+      `Error while mapping ExecuteWorkflowResponse to ExecuteWorkflowResponseDTO for workflow with id ${workflowId}`
+    );
+  }
+  return {
+    id: workflowExecutionResponse.id
+  };
+}
+function mapToWorkflowRunStatusDTO(status) {
+  return {
+    key: capitalize(status),
+    value: status
+  };
+}
+
+const FETCH_INSTANCE_MAX_ATTEMPTS = 10;
+const FETCH_INSTANCE_RETRY_DELAY_MS = 1e3;
+class V2 {
+  constructor(orchestratorService) {
+    this.orchestratorService = orchestratorService;
+  }
+  async getWorkflowsOverview(pagination, filter) {
+    const overviews = await this.orchestratorService.fetchWorkflowOverviews({
+      pagination,
+      filter
+    });
+    if (!overviews) {
+      throw new Error("Couldn't fetch workflow overviews");
+    }
+    const result = {
+      overviews: overviews.map((item) => mapToWorkflowOverviewDTO(item)),
+      paginationInfo: {
+        pageSize: pagination.limit,
+        offset: pagination.offset,
+        totalCount: overviews.length
+      }
+    };
+    return result;
+  }
+  async getWorkflowOverviewById(workflowId) {
+    const overview = await this.orchestratorService.fetchWorkflowOverview({
+      definitionId: workflowId,
+      cacheHandler: "throw"
+    });
+    if (!overview) {
+      throw new Error(`Couldn't fetch workflow overview for ${workflowId}`);
+    }
+    return mapToWorkflowOverviewDTO(overview);
+  }
+  async getWorkflowById(workflowId) {
+    const resultV1 = await this.getWorkflowSourceById(workflowId);
+    return mapToWorkflowDTO(resultV1);
+  }
+  async getWorkflowSourceById(workflowId) {
+    const source = await this.orchestratorService.fetchWorkflowSource({
+      definitionId: workflowId,
+      cacheHandler: "throw"
+    });
+    if (!source) {
+      throw new Error(`Couldn't fetch workflow source for ${workflowId}`);
+    }
+    return source;
+  }
+  async getInstances(pagination, filter, workflowId) {
+    const instances = await this.orchestratorService.fetchInstances({
+      pagination,
+      filter,
+      workflowId
+    });
+    const totalCount = await this.orchestratorService.fetchInstancesTotalCount(
+      workflowId,
+      filter
+    );
+    const result = {
+      items: instances == null ? void 0 : instances.map(mapToProcessInstanceDTO),
+      paginationInfo: {
+        pageSize: pagination == null ? void 0 : pagination.limit,
+        offset: pagination == null ? void 0 : pagination.offset,
+        totalCount
+      }
+    };
+    return result;
+  }
+  async getInstanceById(instanceId, includeAssessment = false) {
+    const instance = await this.orchestratorService.fetchInstance({
+      instanceId,
+      cacheHandler: "throw"
+    });
+    if (!instance) {
+      throw new Error(`Couldn't fetch process instance ${instanceId}`);
+    }
+    let assessedByInstance;
+    if (includeAssessment && instance.businessKey) {
+      assessedByInstance = await this.orchestratorService.fetchInstance({
+        instanceId: instance.businessKey,
+        cacheHandler: "throw"
+      });
+    }
+    return {
+      instance: mapToProcessInstanceDTO(instance),
+      assessedBy: assessedByInstance ? mapToProcessInstanceDTO(assessedByInstance) : void 0
+    };
+  }
+  async executeWorkflow(executeWorkflowRequestDTO, workflowId, businessKey) {
+    if (Object.keys(executeWorkflowRequestDTO == null ? void 0 : executeWorkflowRequestDTO.inputData).length === 0) {
+      throw new Error(
+        `ExecuteWorkflowRequestDTO.inputData is required for executing workflow with id ${workflowId}`
+      );
+    }
+    const definition = await this.orchestratorService.fetchWorkflowInfo({
+      definitionId: workflowId,
+      cacheHandler: "throw"
+    });
+    if (!definition) {
+      throw new Error(`Couldn't fetch workflow definition for ${workflowId}`);
+    }
+    if (!definition.serviceUrl) {
+      throw new Error(`ServiceURL is not defined for workflow ${workflowId}`);
+    }
+    const executionResponse = await this.orchestratorService.executeWorkflow({
+      definitionId: workflowId,
+      inputData: executeWorkflowRequestDTO == null ? void 0 : executeWorkflowRequestDTO.inputData,
+      serviceUrl: definition.serviceUrl,
+      businessKey,
+      cacheHandler: "throw"
+    });
+    if (!executionResponse) {
+      throw new Error(`Couldn't execute workflow ${workflowId}`);
+    }
+    await retryAsyncFunction({
+      asyncFn: () => this.orchestratorService.fetchInstance({
+        instanceId: executionResponse.id,
+        cacheHandler: "throw"
+      }),
+      maxAttempts: FETCH_INSTANCE_MAX_ATTEMPTS,
+      delayMs: FETCH_INSTANCE_RETRY_DELAY_MS
+    });
+    if (!executionResponse) {
+      throw new Error("Error executing workflow with id ${workflowId}");
+    }
+    return mapToExecuteWorkflowResponseDTO(workflowId, executionResponse);
+  }
+  async abortWorkflow(instanceId) {
+    await this.orchestratorService.abortWorkflowInstance({
+      instanceId,
+      cacheHandler: "throw"
+    });
+    return `Workflow instance ${instanceId} successfully aborted`;
+  }
+  async getWorkflowStatuses() {
+    return [
+      ProcessInstanceState.Active,
+      ProcessInstanceState.Error,
+      ProcessInstanceState.Completed,
+      ProcessInstanceState.Aborted,
+      ProcessInstanceState.Suspended,
+      ProcessInstanceState.Pending
+    ].map((status) => mapToWorkflowRunStatusDTO(status));
+  }
+  async getWorkflowInputSchemaById(workflowId, serviceUrl) {
+    return this.orchestratorService.fetchWorkflowInfoOnService({
+      definitionId: workflowId,
+      serviceUrl,
+      cacheHandler: "throw"
+    });
+  }
+  extractQueryParam(req, key) {
+    return req.query[key];
+  }
+}
+
+const WORKFLOW_DATA_KEY = "workflowdata";
+const INTERNAL_SERVER_ERROR_MESSAGE = "internal server error";
+const FETCH_PROCESS_INSTANCES_SORT_FIELD = "start";
+
+const NO_DATA_INDEX_URL = "NO_DATA_INDEX_URL";
+const NO_CLIENT_PROVIDED = "NO_CLIENT_PROVIDED";
+const SWF_BACKEND_NOT_INITED = "SWF_BACKEND_NOT_INITED";
+class ErrorBuilder {
+  static NewBackendError(name, message) {
+    const e = new Error(message);
+    e.name = name;
+    return e;
+  }
+  static GET_NO_DATA_INDEX_URL_ERR() {
+    return this.NewBackendError(
+      NO_DATA_INDEX_URL,
+      "No data index url specified or found"
+    );
+  }
+  static GET_NO_CLIENT_PROVIDED_ERR() {
+    return this.NewBackendError(
+      NO_CLIENT_PROVIDED,
+      "No or null graphql client"
+    );
+  }
+  static GET_SWF_BACKEND_NOT_INITED() {
+    return this.NewBackendError(
+      SWF_BACKEND_NOT_INITED,
+      "The SonataFlow backend is not initialized, call initialize() method before trying to get the workflows."
+    );
+  }
+}
+
+function isLogicalFilter(filter) {
+  return filter.filters !== void 0;
+}
+function handleLogicalFilter(introspection, filter) {
+  if (!filter.operator) return "";
+  const subClauses = filter.filters.map(
+    (f) => buildFilterCondition(introspection, f)
+  );
+  return `${filter.operator.toLowerCase()}: {${subClauses.join(", ")}}`;
+}
+function handleBetweenOperator(filter) {
+  if (!Array.isArray(filter.value) || filter.value.length !== 2) {
+    throw new Error("Between operator requires an array of two elements");
+  }
+  return `${filter.field}: {${getGraphQLOperator(FieldFilterOperatorEnum.Between)}: {from: "${filter.value[0]}", to: "${filter.value[1]}"}}`;
+}
+function handleIsNullOperator(filter) {
+  return `${filter.field}: {${getGraphQLOperator(FieldFilterOperatorEnum.IsNull)}: ${convertToBoolean(filter.value)}}`;
+}
+function handleBinaryOperator(binaryFilter, fieldDef) {
+  const formattedValue = Array.isArray(binaryFilter.value) ? `[${binaryFilter.value.map((v) => formatValue(binaryFilter.field, v, fieldDef)).join(", ")}]` : formatValue(binaryFilter.field, binaryFilter.value, fieldDef);
+  return `${binaryFilter.field}: {${getGraphQLOperator(binaryFilter.operator)}: ${formattedValue}}`;
+}
+function buildFilterCondition(introspection, filters) {
+  if (!filters) {
+    return "";
+  }
+  if (isLogicalFilter(filters)) {
+    return handleLogicalFilter(introspection, filters);
+  }
+  if (!isOperatorSupported(filters.operator)) {
+    throw new Error(`Unsopported operator ${filters.operator}`);
+  }
+  const fieldDef = introspection.find((f) => f.name === filters.field);
+  if (!fieldDef) {
+    throw new Error(`Can't find field "${filters.field}" definition`);
+  }
+  if (!isOperatorAllowedForField(filters.operator, fieldDef)) {
+    throw new Error(`Unsupported field type ${fieldDef.type.name}`);
+  }
+  switch (filters.operator) {
+    case FieldFilterOperatorEnum.IsNull:
+      return handleIsNullOperator(filters);
+    case FieldFilterOperatorEnum.Between:
+      return handleBetweenOperator(filters);
+    case FieldFilterOperatorEnum.Eq:
+    case FieldFilterOperatorEnum.Like:
+    case FieldFilterOperatorEnum.In:
+    case FieldFilterOperatorEnum.Gt:
+    case FieldFilterOperatorEnum.Gte:
+    case FieldFilterOperatorEnum.Lt:
+    case FieldFilterOperatorEnum.Lte:
+      return handleBinaryOperator(filters, fieldDef);
+    default:
+      throw new Error(`Can't build filter condition`);
+  }
+}
+function isOperatorSupported(operator) {
+  return operator === FieldFilterOperatorEnum.Eq || operator === FieldFilterOperatorEnum.Like || operator === FieldFilterOperatorEnum.In || operator === FieldFilterOperatorEnum.IsNull || operator === FieldFilterOperatorEnum.Gt || operator === FieldFilterOperatorEnum.Gte || operator === FieldFilterOperatorEnum.Lt || operator === FieldFilterOperatorEnum.Lte || operator === FieldFilterOperatorEnum.Between;
+}
+function isFieldFilterSupported(fieldDef) {
+  return (fieldDef == null ? void 0 : fieldDef.type.name) === TypeName.String;
+}
+function isOperatorAllowedForField(operator, fieldDef) {
+  const allowedOperators = {
+    [TypeName.String]: [
+      FieldFilterOperatorEnum.In,
+      FieldFilterOperatorEnum.Like,
+      FieldFilterOperatorEnum.IsNull,
+      FieldFilterOperatorEnum.Eq
+    ],
+    [TypeName.Id]: [
+      FieldFilterOperatorEnum.In,
+      FieldFilterOperatorEnum.IsNull,
+      FieldFilterOperatorEnum.Eq
+    ],
+    [TypeName.Date]: [
+      FieldFilterOperatorEnum.IsNull,
+      FieldFilterOperatorEnum.Eq,
+      FieldFilterOperatorEnum.Gt,
+      FieldFilterOperatorEnum.Gte,
+      FieldFilterOperatorEnum.Lt,
+      FieldFilterOperatorEnum.Lte,
+      FieldFilterOperatorEnum.Between
+    ],
+    [TypeName.StringArray]: []
+  };
+  const allowedForType = allowedOperators[fieldDef.type.name];
+  return allowedForType ? allowedForType.includes(operator) : false;
+}
+function convertToBoolean(value) {
+  if (typeof value === "boolean") {
+    return value;
+  }
+  if (typeof value === "string") {
+    return value.toLowerCase() === "true";
+  }
+  if (typeof value === "number") {
+    return value === 1;
+  }
+  return false;
+}
+function formatValue(fieldName, fieldValue, fieldDef) {
+  if (!isFieldFilterSupported) {
+    throw new Error(`Unsupported field type ${fieldDef.type.name}`);
+  }
+  if (fieldDef.type.name === TypeName.String || fieldDef.type.name === TypeName.Id || fieldDef.type.name === TypeName.Date) {
+    return `"${fieldValue}"`;
+  }
+  throw new Error(
+    `Failed to format value for ${fieldName} ${fieldValue} with type ${fieldDef.type.name}`
+  );
+}
+function getGraphQLOperator(operator) {
+  switch (operator) {
+    case "EQ":
+      return "equal";
+    case "LIKE":
+      return "like";
+    case "IN":
+      return "in";
+    case "IS_NULL":
+      return "isNull";
+    case "GT":
+      return "greaterThan";
+    case "GTE":
+      return "greaterThanEqual";
+    case "LT":
+      return "lessThan";
+    case "LTE":
+      return "lessThanEqual";
+    case "BETWEEN":
+      return "between";
+    default:
+      throw new Error(`Operation "${operator}" not supported`);
+  }
+}
+
+function buildGraphQlQuery(args) {
+  let query = `{${args.type}`;
+  const whereClause = buildWhereClause(args.whereClause);
+  const paginationClause = buildPaginationClause(args.pagination);
+  if (whereClause || paginationClause) {
+    query += " (";
+    query += [whereClause, paginationClause].filter(Boolean).join(", ");
+    query += ") ";
+  }
+  query += ` {${args.queryBody} } }`;
+  return query.replace(/\s+/g, " ").trim();
+}
+function buildWhereClause(whereClause) {
+  return whereClause ? `where: {${whereClause}}` : "";
+}
+function buildPaginationClause(pagination) {
+  var _a;
+  if (!pagination) return "";
+  const parts = [];
+  if (pagination.sortField !== void 0) {
+    parts.push(
+      `orderBy: {${pagination.sortField}: ${pagination.order !== void 0 ? (_a = pagination.order) == null ? void 0 : _a.toUpperCase() : "ASC"}}`
+    );
+  }
+  const paginationParts = [];
+  if (pagination.limit !== void 0) {
+    paginationParts.push(`limit: ${pagination.limit}`);
+  }
+  if (pagination.offset !== void 0) {
+    paginationParts.push(`offset: ${pagination.offset}`);
+  }
+  if (paginationParts.length) {
+    parts.push(`pagination: {${paginationParts.join(", ")}}`);
+  }
+  return parts.join(", ");
+}
+
+var __defProp$2 = Object.defineProperty;
+var __defNormalProp$2 = (obj, key, value) => key in obj ? __defProp$2(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$2 = (obj, key, value) => __defNormalProp$2(obj, typeof key !== "symbol" ? key + "" : key, value);
+class DataIndexService {
+  constructor(dataIndexUrl, logger) {
+    this.dataIndexUrl = dataIndexUrl;
+    this.logger = logger;
+    __publicField$2(this, "client");
+    __publicField$2(this, "processDefinitionArguments", []);
+    __publicField$2(this, "processInstanceArguments", []);
+    if (!dataIndexUrl.length) {
+      throw ErrorBuilder.GET_NO_DATA_INDEX_URL_ERR();
+    }
+    this.client = this.getNewGraphQLClient();
+  }
+  getNewGraphQLClient() {
+    const diURL = `${this.dataIndexUrl}/graphql`;
+    return new core.Client({
+      url: diURL,
+      exchanges: [core.fetchExchange]
+    });
+  }
+  async initInputProcessDefinitionArgs() {
+    if (this.processDefinitionArguments.length === 0) {
+      this.processDefinitionArguments = await this.inspectInputArgument("ProcessDefinition");
+    }
+    return this.processDefinitionArguments;
+  }
+  graphQLArgumentQuery(type) {
+    return `query ${type}Argument {
+        __type(name: "${type}Argument") {
+          kind
+          name
+          inputFields {
+            name
+            type {
+              kind
+              name
+              ofType {
+                kind
+                name
+                ofType {
+                  kind
+                  name
+                  ofType {
+                    kind
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }
+      }`;
+  }
+  async inspectInputArgument(type) {
+    var _a, _b;
+    const result = await this.client.query(this.graphQLArgumentQuery(type), {});
+    this.logger.debug(`Introspection query result: ${JSON.stringify(result)}`);
+    if (result == null ? void 0 : result.error) {
+      this.logger.error(`Error executing introspection query ${result.error}`);
+      throw result.error;
+    }
+    const pairs = [];
+    if ((_b = (_a = result == null ? void 0 : result.data) == null ? void 0 : _a.__type) == null ? void 0 : _b.inputFields) {
+      for (const field of result.data.__type.inputFields) {
+        if (field.name !== "and" && field.name !== "or" && field.name !== "not") {
+          pairs.push({
+            name: field.name,
+            type: {
+              name: field.type.name,
+              kind: field.type.kind,
+              ofType: field.type.ofType
+            }
+          });
+        }
+      }
+    }
+    return pairs;
+  }
+  async getSchemaTypes(type) {
+    const graphQlQuery = `query IntrospectionQuery {
+  __type(name: "${type}") {
+    name
+    kind
+    description
+    fields {
+      name
+      type {
+        kind
+        name
+        ofType {
+          kind
+          name
+          ofType {
+            kind
+            name
+          }
+        }
+      }
+    }
+  }
+}
+`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(`Introspection query result: ${JSON.stringify(result)}`);
+    if (result.error) {
+      this.logger.error(`Error executing introspection query ${result.error}`);
+      throw result.error;
+    }
+    return result;
+  }
+  async abortWorkflowInstance(instanceId) {
+    this.logger.info(`Aborting workflow instance ${instanceId}`);
+    const ProcessInstanceAbortMutationDocument = core.gql`
+      mutation ProcessInstanceAbortMutation($id: String) {
+        ProcessInstanceAbort(id: $id)
+      }
+    `;
+    const result = await this.client.mutation(
+      ProcessInstanceAbortMutationDocument,
+      { id: instanceId }
+    );
+    this.logger.debug(
+      `Abort workflow instance result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      throw new Error(
+        `Error aborting workflow instance ${instanceId}: ${result.error}`
+      );
+    }
+    this.logger.debug(`Successfully aborted workflow instance ${instanceId}`);
+  }
+  async fetchWorkflowInfo(definitionId) {
+    const graphQlQuery = `{ ProcessDefinitions ( where: {id: {equal: "${definitionId}" } } ) { id, name, version, type, endpoint, serviceUrl, source } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Get workflow definition result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(`Error fetching workflow definition ${result.error}`);
+      throw result.error;
+    }
+    const processDefinitions = result.data.ProcessDefinitions;
+    if (processDefinitions.length === 0) {
+      this.logger.info(`No workflow definition found for ${definitionId}`);
+      return void 0;
+    }
+    return processDefinitions[0];
+  }
+  async fetchWorkflowServiceUrls() {
+    const graphQlQuery = `{ ProcessDefinitions { id, serviceUrl } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Get workflow service urls result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(`Error fetching workflow service urls ${result.error}`);
+      throw result.error;
+    }
+    const processDefinitions = result.data.ProcessDefinitions;
+    return processDefinitions.filter((definition) => definition.serviceUrl).map((definition) => ({ [definition.id]: definition.serviceUrl })).reduce((acc, curr) => ({ ...acc, ...curr }), {});
+  }
+  async fetchWorkflowInfos(args) {
+    this.logger.info(`fetchWorkflowInfos() called: ${this.dataIndexUrl}`);
+    const { definitionIds, pagination, filter } = args;
+    const definitionIdsCondition = definitionIds !== void 0 && definitionIds.length > 0 ? `id: {in: ${JSON.stringify(definitionIds)}}` : void 0;
+    const filterCondition = filter ? buildFilterCondition(
+      await this.initInputProcessDefinitionArgs(),
+      filter
+    ) : void 0;
+    let whereClause;
+    if (definitionIds && filter) {
+      whereClause = `and: [{${definitionIdsCondition}}, {${filterCondition}}]`;
+    } else if (definitionIdsCondition || filterCondition) {
+      whereClause = definitionIdsCondition != null ? definitionIdsCondition : filterCondition;
+    } else {
+      whereClause = void 0;
+    }
+    const graphQlQuery = buildGraphQlQuery({
+      type: "ProcessDefinitions",
+      queryBody: "id, name, version, type, endpoint, serviceUrl, source",
+      whereClause,
+      pagination
+    });
+    this.logger.debug(`GraphQL query: ${graphQlQuery}`);
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Get workflow definitions result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(
+        `Error fetching data index swf results ${result.error}`
+      );
+      throw result.error;
+    }
+    return result.data.ProcessDefinitions;
+  }
+  async fetchInstances(args) {
+    var _a;
+    const { pagination, definitionIds, filter } = args;
+    if (pagination) (_a = pagination.sortField) != null ? _a : pagination.sortField = FETCH_PROCESS_INSTANCES_SORT_FIELD;
+    const processIdNotNullCondition = "processId: {isNull: false}";
+    const definitionIdsCondition = definitionIds ? `processId: {in: ${JSON.stringify(definitionIds)}}` : void 0;
+    const filterCondition = filter ? buildFilterCondition(
+      await this.inspectInputArgument("ProcessInstance"),
+      filter
+    ) : "";
+    let whereClause = "";
+    const conditions = [];
+    {
+      conditions.push(`{${processIdNotNullCondition}}`);
+    }
+    if (definitionIdsCondition) {
+      conditions.push(`{${definitionIdsCondition}}`);
+    }
+    if (filter) {
+      conditions.push(`{${filterCondition}}`);
+    }
+    if (conditions.length === 0) {
+      whereClause = processIdNotNullCondition;
+    } else if (conditions.length === 1) {
+      whereClause = conditions[0].slice(1, -1);
+    } else if (conditions.length > 1) {
+      whereClause = `and: [${conditions.join(", ")}]`;
+    }
+    const graphQlQuery = buildGraphQlQuery({
+      type: "ProcessInstances",
+      queryBody: "id, processName, processId, businessKey, state, start, end, nodes { id }, variables, parentProcessInstance {id, processName, businessKey}",
+      whereClause,
+      pagination
+    });
+    this.logger.debug(`GraphQL query: ${graphQlQuery}`);
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Fetch process instances result: ${JSON.stringify(result)}`
+    );
+    const processInstancesSrc = result.data.ProcessInstances;
+    const processInstances = await Promise.all(
+      processInstancesSrc.map(async (instance) => {
+        return await this.getWorkflowDefinitionFromInstance(instance);
+      })
+    );
+    return processInstances;
+  }
+  async fetchInstancesTotalCount(definitionIds, filter) {
+    const definitionIdsCondition = definitionIds ? `processId: {in: ${JSON.stringify(definitionIds)}}` : void 0;
+    this.initInputProcessDefinitionArgs();
+    const filterCondition = filter ? buildFilterCondition(
+      await this.inspectInputArgument("ProcessInstance"),
+      filter
+    ) : "";
+    let whereClause;
+    if (definitionIds && filter) {
+      whereClause = `and: [{${definitionIdsCondition}}, {${filterCondition}}]`;
+    } else if (definitionIdsCondition || filterCondition) {
+      whereClause = definitionIdsCondition != null ? definitionIdsCondition : filterCondition;
+    }
+    const graphQlQuery = buildGraphQlQuery({
+      type: "ProcessInstances",
+      queryBody: "id",
+      whereClause
+    });
+    this.logger.debug(`GraphQL query: ${graphQlQuery}`);
+    const result = await this.client.query(graphQlQuery, {});
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching instances total count: ${result.error}`
+      );
+      throw result.error;
+    }
+    const idArr = result.data.ProcessInstances;
+    return idArr.length;
+  }
+  async getWorkflowDefinitionFromInstance(instance) {
+    const workflowInfo = await this.fetchWorkflowInfo(instance.processId);
+    if (!(workflowInfo == null ? void 0 : workflowInfo.source)) {
+      throw new Error(
+        `Workflow defintion is required to fetch instance ${instance.id}`
+      );
+    }
+    const workflowDefinitionSrc = fromWorkflowSource(
+      workflowInfo.source
+    );
+    if (workflowInfo) {
+      instance.category = getWorkflowCategory(workflowDefinitionSrc);
+      instance.description = workflowInfo.description;
+    }
+    return instance;
+  }
+  async fetchWorkflowSource(definitionId) {
+    const graphQlQuery = `{ ProcessDefinitions ( where: {id: {equal: "${definitionId}" } } ) { id, source } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Fetch workflow source result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(`Error when fetching workflow source: ${result.error}`);
+      return void 0;
+    }
+    const processDefinitions = result.data.ProcessDefinitions;
+    if (processDefinitions.length === 0) {
+      this.logger.info(`No workflow source found for ${definitionId}`);
+      return void 0;
+    }
+    return processDefinitions[0].source;
+  }
+  async fetchInstancesByDefinitionId(args) {
+    const graphQlQuery = `{ ProcessInstances(where: {processId: {equal: "${args.definitionId}" } }, pagination: {limit: ${args.limit}, offset: ${args.offset}}) { id, processName, state, start, end } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Fetch workflow instances result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching workflow instances: ${result.error}`
+      );
+      throw result.error;
+    }
+    return result.data.ProcessInstances;
+  }
+  async fetchInstanceVariables(instanceId) {
+    const graphQlQuery = `{ ProcessInstances (where: { id: {equal: "${instanceId}" } } ) { variables } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Fetch process instance variables result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching process instance variables: ${result.error}`
+      );
+      throw result.error;
+    }
+    const processInstances = result.data.ProcessInstances;
+    if (processInstances.length === 0) {
+      return void 0;
+    }
+    return parseWorkflowVariables(processInstances[0].variables);
+  }
+  async fetchDefinitionIdByInstanceId(instanceId) {
+    const graphQlQuery = `{ ProcessInstances (where: { id: {equal: "${instanceId}" } } ) { processId } }`;
+    const result = await this.client.query(graphQlQuery, {});
+    this.logger.debug(
+      `Fetch process id from instance result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching process id from instance: ${result.error}`
+      );
+      throw result.error;
+    }
+    const processInstances = result.data.ProcessInstances;
+    if (processInstances.length === 0) {
+      return void 0;
+    }
+    return processInstances[0].processId;
+  }
+  async fetchInstance(instanceId) {
+    const FindProcessInstanceQuery = core.gql`
+      query FindProcessInstanceQuery($instanceId: String!) {
+        ProcessInstances(where: { id: { equal: $instanceId } }) {
+          id
+          processName
+          processId
+          serviceUrl
+          businessKey
+          state
+          start
+          end
+          nodes {
+            id
+            nodeId
+            definitionId
+            type
+            name
+            enter
+            exit
+          }
+          variables
+          parentProcessInstance {
+            id
+            processName
+            businessKey
+          }
+          error {
+            nodeDefinitionId
+            message
+          }
+        }
+      }
+    `;
+    const result = await this.client.query(FindProcessInstanceQuery, {
+      instanceId
+    });
+    this.logger.debug(
+      `Fetch process instance result: ${JSON.stringify(result)}`
+    );
+    if (result.error) {
+      this.logger.error(
+        `Error when fetching process instances: ${result.error}`
+      );
+      throw result.error;
+    }
+    const processInstances = result.data.ProcessInstances;
+    if (processInstances.length === 0) {
+      return void 0;
+    }
+    const instance = processInstances[0];
+    const workflowInfo = await this.fetchWorkflowInfo(instance.processId);
+    if (!(workflowInfo == null ? void 0 : workflowInfo.source)) {
+      throw new Error(
+        `Workflow defintion is required to fetch instance ${instance.id}`
+      );
+    }
+    const workflowDefinitionSrc = fromWorkflowSource(
+      workflowInfo.source
+    );
+    if (workflowInfo) {
+      instance.category = getWorkflowCategory(workflowDefinitionSrc);
+      instance.description = workflowDefinitionSrc.description;
+    }
+    return instance;
+  }
+}
+
+class DataInputSchemaService {
+  extractWorkflowData(variables) {
+    return variables && WORKFLOW_DATA_KEY in variables ? variables[WORKFLOW_DATA_KEY] : void 0;
+  }
+}
+
+class OrchestratorService {
+  constructor(sonataFlowService, dataIndexService, workflowCacheService) {
+    this.sonataFlowService = sonataFlowService;
+    this.dataIndexService = dataIndexService;
+    this.workflowCacheService = workflowCacheService;
+  }
+  // Data Index Service Wrapper
+  async abortWorkflowInstance(args) {
+    const { instanceId, cacheHandler } = args;
+    const definitionId = await this.dataIndexService.fetchDefinitionIdByInstanceId(instanceId);
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.dataIndexService.abortWorkflowInstance(instanceId) : void 0;
+  }
+  async fetchWorkflowInfo(args) {
+    const { definitionId, cacheHandler } = args;
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.dataIndexService.fetchWorkflowInfo(definitionId) : void 0;
+  }
+  async fetchInstances(args) {
+    const definitionIds = args.workflowId ? [args.workflowId] : this.workflowCacheService.definitionIds;
+    return await this.dataIndexService.fetchInstances({
+      definitionIds,
+      pagination: args.pagination,
+      filter: args.filter
+    });
+  }
+  async fetchInstancesTotalCount(workflowId, filter) {
+    const definitionIds = workflowId ? [workflowId] : this.workflowCacheService.definitionIds;
+    return await this.dataIndexService.fetchInstancesTotalCount(
+      definitionIds,
+      filter
+    );
+  }
+  async fetchWorkflowSource(args) {
+    const { definitionId, cacheHandler } = args;
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.dataIndexService.fetchWorkflowSource(definitionId) : void 0;
+  }
+  async fetchInstanceVariables(args) {
+    const { instanceId, cacheHandler } = args;
+    const definitionId = await this.dataIndexService.fetchDefinitionIdByInstanceId(instanceId);
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.dataIndexService.fetchInstanceVariables(instanceId) : void 0;
+  }
+  async fetchInstance(args) {
+    const { instanceId, cacheHandler } = args;
+    const instance = await this.dataIndexService.fetchInstance(instanceId);
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      instance == null ? void 0 : instance.processId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? instance : void 0;
+  }
+  // SonataFlow Service Wrapper
+  async fetchWorkflowInfoOnService(args) {
+    const { definitionId, cacheHandler } = args;
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.sonataFlowService.fetchWorkflowInfoOnService(args) : void 0;
+  }
+  async fetchWorkflowDefinition(args) {
+    const { definitionId, cacheHandler } = args;
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.sonataFlowService.fetchWorkflowDefinition(definitionId) : void 0;
+  }
+  async fetchWorkflowOverviews(args) {
+    return await this.sonataFlowService.fetchWorkflowOverviews({
+      definitionIds: this.workflowCacheService.definitionIds,
+      pagination: args.pagination,
+      filter: args.filter
+    });
+  }
+  async executeWorkflow(args) {
+    const { definitionId, cacheHandler } = args;
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.sonataFlowService.executeWorkflow(args) : void 0;
+  }
+  async fetchWorkflowOverview(args) {
+    const { definitionId, cacheHandler } = args;
+    const isWorkflowAvailable = this.workflowCacheService.isAvailable(
+      definitionId,
+      cacheHandler
+    );
+    return isWorkflowAvailable ? await this.sonataFlowService.fetchWorkflowOverview(definitionId) : void 0;
+  }
+}
+
+var __defProp$1 = Object.defineProperty;
+var __defNormalProp$1 = (obj, key, value) => key in obj ? __defProp$1(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField$1 = (obj, key, value) => __defNormalProp$1(obj, typeof key !== "symbol" ? key + "" : key, value);
+class ScaffolderService {
+  constructor(logger, config, catalogApi, urlReader) {
+    this.logger = logger;
+    this.config = config;
+    this.catalogApi = catalogApi;
+    this.urlReader = urlReader;
+    __publicField$1(this, "actionRegistry");
+    __publicField$1(this, "streamLogger", new stream.PassThrough());
+    this.actionRegistry = new pluginScaffolderBackend.TemplateActionRegistry();
+  }
+  loadActions() {
+    const actions = [
+      ...pluginScaffolderBackend.createBuiltinActions({
+        integrations: integration.ScmIntegrations.fromConfig(this.config),
+        catalogClient: this.catalogApi,
+        reader: this.urlReader,
+        config: this.config
+      })
+    ];
+    actions.forEach((a) => this.actionRegistry.register(a));
+  }
+  getAction(id) {
+    return this.actionRegistry.get(id);
+  }
+  async executeAction(actionExecutionContext) {
+    var _a;
+    if (this.actionRegistry.list().length === 0) {
+      this.loadActions();
+    }
+    const action = this.getAction(
+      actionExecutionContext.actionId
+    );
+    const stepOutput = {};
+    let workspacePath;
+    try {
+      const workingDirectory = await getWorkingDirectory(
+        this.config,
+        this.logger
+      );
+      workspacePath = path__default["default"].join(
+        workingDirectory,
+        (_a = actionExecutionContext.instanceId) != null ? _a : crypto.randomUUID()
+      );
+    } catch (err) {
+      this.logger.error(
+        `Error getting working directory to execute action ${actionExecutionContext.actionId}`,
+        err
+      );
+      throw err;
+    }
+    const actionContext = {
+      input: actionExecutionContext.input,
+      workspacePath,
+      // TODO: Move this to LoggerService after scaffolder-node moves to LoggerService
+      // https://github.com/backstage/backstage/issues/26933
+      logger: backendCommon.loggerToWinstonLogger(this.logger),
+      logStream: this.streamLogger,
+      createTemporaryDirectory: async () => await fs__default["default"].mkdtemp(`${workspacePath}_step-${0}-`),
+      output(name, value) {
+        stepOutput[name] = value;
+      },
+      getInitiatorCredentials: async () => {
+        return {
+          $$type: "@backstage/BackstageCredentials",
+          principal: "mock-principal"
+        };
+      },
+      checkpoint: async (key, fn) => {
+        this.logger.info(`Orchestrator ScaffolderService checkpoint ${key}`);
+        return fn();
+      }
+    };
+    await action.handler(actionContext);
+    return stepOutput;
+  }
+}
+
+class SonataFlowService {
+  constructor(dataIndexService, logger) {
+    this.dataIndexService = dataIndexService;
+    this.logger = logger;
+  }
+  async fetchWorkflowInfoOnService(args) {
+    try {
+      const urlToFetch = `${args.serviceUrl}/management/processes/${args.definitionId}`;
+      const response = await fetch(urlToFetch);
+      if (response.ok) {
+        const json = await response.json();
+        this.logger.debug(
+          `Fetch workflow info result: ${JSON.stringify(json)}`
+        );
+        return json;
+      }
+      throw new Error(
+        await this.createPrefixFetchErrorMessage(urlToFetch, response)
+      );
+    } catch (error) {
+      this.logger.error(`Error when fetching workflow info: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflowDefinition(definitionId) {
+    try {
+      const source = await this.dataIndexService.fetchWorkflowSource(definitionId);
+      if (source) {
+        return fromWorkflowSource(source);
+      }
+    } catch (error) {
+      this.logger.error(`Error when fetching workflow definition: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflowOverviews(args) {
+    const { definitionIds, pagination, filter } = args;
+    try {
+      const workflowInfos = await this.dataIndexService.fetchWorkflowInfos({
+        definitionIds,
+        pagination,
+        filter
+      });
+      if (!(workflowInfos == null ? void 0 : workflowInfos.length)) {
+        return [];
+      }
+      const items = await Promise.all(
+        workflowInfos.filter((info) => info.source).map((info) => this.fetchWorkflowOverviewBySource(info.source))
+      );
+      return items.filter((item) => !!item);
+    } catch (error) {
+      this.logger.error(
+        `Error when fetching workflows for workflowOverview: ${error}`
+      );
+    }
+    return void 0;
+  }
+  async executeWorkflow(args) {
+    try {
+      const urlToFetch = args.businessKey ? `${args.serviceUrl}/${args.definitionId}?businessKey=${args.businessKey}` : `${args.serviceUrl}/${args.definitionId}`;
+      const response = await fetch(urlToFetch, {
+        method: "POST",
+        body: JSON.stringify(args.inputData),
+        headers: { "content-type": "application/json" }
+      });
+      if (response.ok) {
+        const json = await response.json();
+        this.logger.debug(`Execute workflow result: ${JSON.stringify(json)}`);
+        return json;
+      }
+      throw new Error(
+        `${await this.createPrefixFetchErrorMessage(urlToFetch, response, "POST")}`
+      );
+    } catch (error) {
+      this.logger.error(`Error when executing workflow: ${error}`);
+    }
+    return void 0;
+  }
+  async fetchWorkflowOverview(definitionId) {
+    const source = await this.dataIndexService.fetchWorkflowSource(definitionId);
+    if (!source) {
+      this.logger.debug(`Workflow source not found: ${definitionId}`);
+      return void 0;
+    }
+    return await this.fetchWorkflowOverviewBySource(source);
+  }
+  async fetchWorkflowOverviewBySource(source) {
+    let processInstances = [];
+    const limit = 10;
+    let offset = 0;
+    let lastTriggered = /* @__PURE__ */ new Date(0);
+    let lastRunStatus;
+    let lastRunId;
+    let counter = 0;
+    let totalDuration = 0;
+    const definition = fromWorkflowSource(source);
+    do {
+      processInstances = await this.dataIndexService.fetchInstancesByDefinitionId({
+        definitionId: definition.id,
+        limit,
+        offset
+      });
+      for (const pInstance of processInstances) {
+        if (!pInstance.start) {
+          continue;
+        }
+        if (new Date(pInstance.start) > lastTriggered) {
+          lastRunId = pInstance.id;
+          lastTriggered = new Date(pInstance.start);
+          lastRunStatus = pInstance.state;
+        }
+        if (pInstance.end) {
+          const start = new Date(pInstance.start);
+          const end = new Date(pInstance.end);
+          totalDuration += end.valueOf() - start.valueOf();
+          counter++;
+        }
+      }
+      offset += limit;
+    } while (processInstances.length > 0);
+    return {
+      workflowId: definition.id,
+      name: definition.name,
+      format: extractWorkflowFormat(source),
+      lastRunId,
+      lastTriggeredMs: lastTriggered.getTime(),
+      lastRunStatus,
+      category: getWorkflowCategory(definition),
+      avgDurationMs: counter ? totalDuration / counter : void 0,
+      description: definition.description
+    };
+  }
+  async pingWorkflowService(args) {
+    try {
+      const urlToFetch = `${args.serviceUrl}/management/processes/${args.definitionId}`;
+      const response = await fetch(urlToFetch);
+      return response.ok;
+    } catch (error) {
+      this.logger.debug(`Error when pinging workflow service: ${error}`);
+    }
+    return false;
+  }
+  async updateInstanceInputData(args) {
+    const { definitionId, serviceUrl, instanceId, inputData } = args;
+    try {
+      const urlToFetch = `${serviceUrl}/${definitionId}/${instanceId}`;
+      const response = await fetch(urlToFetch, {
+        method: "PATCH",
+        body: JSON.stringify(inputData),
+        headers: { "content-type": "application/json" }
+      });
+      return response.ok;
+    } catch (error) {
+      this.logger.error(`Error when updating instance input data: ${error}`);
+    }
+    return false;
+  }
+  async createPrefixFetchErrorMessage(urlToFetch, response, httpMethod = "GET") {
+    const res = await response.json();
+    const errorInfo = [];
+    let errorMsg = `Request ${httpMethod} ${urlToFetch} failed with: StatusCode: ${response.status}`;
+    if (response.statusText) {
+      errorInfo.push(`StatusText: ${response.statusText}`);
+    }
+    if (res == null ? void 0 : res.details) {
+      errorInfo.push(`Details: ${res == null ? void 0 : res.details}`);
+    }
+    if (res == null ? void 0 : res.stack) {
+      errorInfo.push(`Stack: ${res == null ? void 0 : res.stack}`);
+    }
+    if (errorInfo.length > 0) {
+      errorMsg += ` ${errorInfo.join(", ")}`;
+    } else {
+      errorMsg += " Unexpected error";
+    }
+    return errorMsg;
+  }
+}
+
+var __defProp = Object.defineProperty;
+var __defNormalProp = (obj, key, value) => key in obj ? __defProp(obj, key, { enumerable: true, configurable: true, writable: true, value }) : obj[key] = value;
+var __publicField = (obj, key, value) => __defNormalProp(obj, typeof key !== "symbol" ? key + "" : key, value);
+class WorkflowCacheService {
+  constructor(logger, dataIndexService, sonataFlowService) {
+    this.logger = logger;
+    this.dataIndexService = dataIndexService;
+    this.sonataFlowService = sonataFlowService;
+    __publicField(this, "TASK_ID", "task__Orchestrator__WorkflowCacheService");
+    __publicField(this, "DEFAULT_FREQUENCY_IN_SECONDS", 5);
+    __publicField(this, "DEFAULT_TIMEOUT_IN_MINUTES", 10);
+    __publicField(this, "definitionIdCache", /* @__PURE__ */ new Set());
+  }
+  get definitionIds() {
+    return Array.from(this.definitionIdCache);
+  }
+  isEmpty() {
+    return this.definitionIdCache.size === 0;
+  }
+  isAvailable(definitionId, cacheHandler = "skip") {
+    if (!definitionId) {
+      return false;
+    }
+    const isAvailable = this.definitionIdCache.has(definitionId);
+    if (!isAvailable && cacheHandler === "throw") {
+      throw new Error(
+        `Workflow service "${definitionId}" not available at the moment`
+      );
+    }
+    return isAvailable;
+  }
+  schedule(args) {
+    const {
+      scheduler,
+      frequencyInSeconds = this.DEFAULT_FREQUENCY_IN_SECONDS,
+      timeoutInMinutes = this.DEFAULT_TIMEOUT_IN_MINUTES
+    } = args;
+    scheduler.scheduleTask({
+      id: this.TASK_ID,
+      frequency: { seconds: frequencyInSeconds },
+      timeout: { minutes: timeoutInMinutes },
+      fn: async () => {
+        await this.runTask();
+      }
+    });
+  }
+  async runTask() {
+    try {
+      const idUrlMap = await this.dataIndexService.fetchWorkflowServiceUrls();
+      this.definitionIdCache.forEach((definitionId) => {
+        if (!idUrlMap[definitionId]) {
+          this.definitionIdCache.delete(definitionId);
+        }
+      });
+      await Promise.all(
+        Object.entries(idUrlMap).map(async ([definitionId, serviceUrl]) => {
+          const isServiceUp = await this.sonataFlowService.pingWorkflowService({
+            definitionId,
+            serviceUrl
+          });
+          if (isServiceUp) {
+            this.definitionIdCache.add(definitionId);
+          } else if (this.definitionIdCache.has(definitionId)) {
+            this.logger.error(
+              `Failed to ping service for workflow ${definitionId} at ${serviceUrl}`
+            );
+            this.definitionIdCache.delete(definitionId);
+          }
+        })
+      );
+      const workflowDefinitionIds = this.isEmpty() ? "empty cache" : Array.from(this.definitionIdCache).join(", ");
+      this.logger.debug(
+        `${this.TASK_ID} updated the workflow definition ID cache to: ${workflowDefinitionIds}`
+      );
+    } catch (error) {
+      this.logger.error(`Error running ${this.TASK_ID}: ${error}`);
+      return;
+    }
+  }
+}
+
+const authorize = async (request, permission, permissionsSvc, httpAuth) => {
+  const decision = (await permissionsSvc.authorize([{ permission }], {
+    credentials: await httpAuth.credentials(request)
+  }))[0];
+  return decision;
+};
+async function createBackendRouter(options) {
+  const {
+    config,
+    logger,
+    discovery,
+    catalogApi,
+    urlReader,
+    scheduler,
+    permissions,
+    auth,
+    httpAuth
+  } = options;
+  const publicServices = initPublicServices(logger, config, scheduler);
+  const routerApi = await initRouterApi(publicServices.orchestratorService);
+  const auditLogger = new backstagePluginAuditLogNode.DefaultAuditLogger({
+    logger,
+    authService: auth,
+    httpAuthService: httpAuth
+  });
+  const router = express.Router();
+  const permissionsIntegrationRouter = pluginPermissionNode.createPermissionIntegrationRouter({
+    permissions: orchestratorPermissions
+  });
+  router.use(express__default["default"].json());
+  router.use(permissionsIntegrationRouter);
+  router.use("/workflows", express__default["default"].text());
+  router.use("/static", express__default["default"].static(backendPluginApi.resolvePackagePath(name, "static")));
+  router.get("/health", (_, response) => {
+    logger.info("PONG!");
+    response.json({ status: "ok" });
+  });
+  const scaffolderService = new ScaffolderService(
+    logger,
+    config,
+    catalogApi,
+    urlReader
+  );
+  setupInternalRoutes(
+    publicServices,
+    routerApi,
+    permissions,
+    httpAuth,
+    auditLogger
+  );
+  setupExternalRoutes(router, discovery, scaffolderService, auditLogger);
+  router.use((req, res, next) => {
+    if (!next) {
+      throw new Error("next is undefined");
+    }
+    routerApi.openApiBackend.handleRequest(req, req, res, next);
+  });
+  const middleware = rootHttpRouter.MiddlewareFactory.create({ logger, config });
+  router.use(middleware.error());
+  return router;
+}
+function initPublicServices(logger, config, scheduler) {
+  const dataIndexUrl = config.getString("orchestrator.dataIndexService.url");
+  const dataIndexService = new DataIndexService(dataIndexUrl, logger);
+  const sonataFlowService = new SonataFlowService(dataIndexService, logger);
+  const workflowCacheService = new WorkflowCacheService(
+    logger,
+    dataIndexService,
+    sonataFlowService
+  );
+  workflowCacheService.schedule({ scheduler });
+  const orchestratorService = new OrchestratorService(
+    sonataFlowService,
+    dataIndexService,
+    workflowCacheService
+  );
+  const dataInputSchemaService = new DataInputSchemaService();
+  return {
+    orchestratorService,
+    dataInputSchemaService
+  };
+}
+async function initRouterApi(orchestratorService) {
+  const openApiBackend = new openapiBackend.OpenAPIBackend({
+    definition: openApiDocument,
+    strict: false,
+    ajvOpts: {
+      strict: false,
+      strictSchema: false,
+      verbose: true,
+      addUsedSchema: false,
+      formats: formats.fullFormats
+      // open issue: https://github.com/openapistack/openapi-backend/issues/280
+    },
+    handlers: {
+      validationFail: async (c, _req, res) => {
+        console.log("validationFail", c.operation);
+        res.status(400).json({ err: c.validation.errors });
+      },
+      notFound: async (_c, req, res) => {
+        res.status(404).json({ err: `${req.path} path not found` });
+      },
+      notImplemented: async (_c, req, res) => res.status(500).json({ err: `${req.path} not implemented` })
+    }
+  });
+  await openApiBackend.init();
+  const v2 = new V2(orchestratorService);
+  return { v2, openApiBackend };
+}
+function setupInternalRoutes(services, routerApi, permissions, httpAuth, auditLogger) {
+  function manageDenyAuthorization(endpointName, endpoint, req) {
+    const error = new backstagePluginRbacCommon.UnauthorizedError();
+    auditLogger.auditLog({
+      eventName: `${endpointName}EndpointHit`,
+      stage: "authorization",
+      status: "failed",
+      level: "error",
+      request: req,
+      response: {
+        status: 403,
+        body: {
+          errors: [
+            {
+              name: error.name,
+              message: error.message
+            }
+          ]
+        }
+      },
+      errors: [error],
+      message: `Not authorize to request the ${endpoint} endpoint`
+    });
+    throw error;
+  }
+  function auditLogRequestError(error, endpointName, endpoint, req) {
+    auditLogger.auditLog({
+      eventName: `${endpointName}EndpointHit`,
+      stage: "completion",
+      status: "failed",
+      level: "error",
+      request: req,
+      response: {
+        status: 500,
+        body: {
+          errors: [
+            {
+              name: error.name,
+              message: error.message || INTERNAL_SERVER_ERROR_MESSAGE
+            }
+          ]
+        }
+      },
+      errors: [error],
+      message: `Error occured while requesting the '${endpoint}' endpoint`
+    });
+  }
+  routerApi.openApiBackend.register(
+    "getWorkflowsOverview",
+    async (_c, req, res, next) => {
+      const endpointName = "getWorkflowsOverview";
+      const endpoint = "/v2/workflows/overview";
+      auditLogger.auditLog({
+        eventName: "getWorkflowsOverview",
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        req,
+        orchestratorWorkflowInstancesReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, req);
+      }
+      await routerApi.v2.getWorkflowsOverview(buildPagination(req), getRequestFilters(req)).then((result) => res.json(result)).catch((error) => {
+        auditLogRequestError(error, endpointName, endpoint, req);
+        res.status(500).json({ message: error.message || INTERNAL_SERVER_ERROR_MESSAGE });
+        next();
+      });
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getWorkflowSourceById",
+    async (c, _req, res, next) => {
+      const workflowId = c.request.params.workflowId;
+      const endpointName = "getWorkflowSourceById";
+      const endpoint = `/v2/workflows/${workflowId}/source`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: _req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        _req,
+        orchestratorWorkflowReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, _req);
+      }
+      try {
+        const result = await routerApi.v2.getWorkflowSourceById(workflowId);
+        res.status(200).contentType("text/plain").send(result);
+      } catch (error) {
+        auditLogRequestError(error, endpointName, endpoint, _req);
+        res.status(500).contentType("text/plain").send((error == null ? void 0 : error.message) || INTERNAL_SERVER_ERROR_MESSAGE);
+        next();
+      }
+    }
+  );
+  routerApi.openApiBackend.register(
+    "executeWorkflow",
+    async (c, req, res) => {
+      const workflowId = c.request.params.workflowId;
+      const endpointName = "executeWorkflow";
+      const endpoint = `/v2/workflows/${workflowId}/execute`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        req,
+        orchestratorWorkflowExecutePermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, req);
+      }
+      const businessKey = routerApi.v2.extractQueryParam(
+        c.request,
+        QUERY_PARAM_BUSINESS_KEY
+      );
+      const executeWorkflowRequestDTO = req.body;
+      await routerApi.v2.executeWorkflow(executeWorkflowRequestDTO, workflowId, businessKey).then((result) => res.status(200).json(result)).catch((error) => {
+        auditLogRequestError(error, endpointName, endpoint, req);
+        res.status(500).json({ message: error.message || INTERNAL_SERVER_ERROR_MESSAGE });
+      });
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getWorkflowOverviewById",
+    async (c, _req, res, next) => {
+      const workflowId = c.request.params.workflowId;
+      const endpointName = "getWorkflowOverviewById";
+      const endpoint = `/v2/workflows/${workflowId}/overview`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: _req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        _req,
+        orchestratorWorkflowReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, _req);
+      }
+      await routerApi.v2.getWorkflowOverviewById(workflowId).then((result) => res.json(result)).catch(next);
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getWorkflowStatuses",
+    async (_c, _req, res) => {
+      const endpointName = "getWorkflowStatuses";
+      const endpoint = "/v2/workflows/instances/statuses";
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: _req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        _req,
+        orchestratorWorkflowInstanceReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, _req);
+      }
+      await routerApi.v2.getWorkflowStatuses().then((result) => res.status(200).json(result)).catch((error) => {
+        auditLogRequestError(error, endpointName, endpoint, _req);
+        res.status(500).json({ message: error.message || INTERNAL_SERVER_ERROR_MESSAGE });
+      });
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getWorkflowInputSchemaById",
+    async (c, req, res) => {
+      const workflowId = c.request.params.workflowId;
+      const instanceId = c.request.query.instanceId;
+      const endpointName = "getWorkflowInputSchemaById";
+      const endpoint = `/v2/workflows/${workflowId}/inputSchema`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        req,
+        orchestratorWorkflowInstanceReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, req);
+      }
+      const workflowDefinition = await services.orchestratorService.fetchWorkflowInfo({
+        definitionId: workflowId,
+        cacheHandler: "throw"
+      });
+      if (!workflowDefinition) {
+        auditLogRequestError(
+          new Error(`Couldn't fetch workflow definition ${workflowId}`),
+          endpointName,
+          endpoint,
+          req
+        );
+        res.status(500).send(`Couldn't fetch workflow definition ${workflowId}`);
+        return;
+      }
+      const serviceUrl = workflowDefinition.serviceUrl;
+      if (!serviceUrl) {
+        auditLogRequestError(
+          new Error(`Service URL is not defined for workflow ${workflowId}`),
+          endpointName,
+          endpoint,
+          req
+        );
+        res.status(500).send(`Service URL is not defined for workflow ${workflowId}`);
+        return;
+      }
+      const definition = await services.orchestratorService.fetchWorkflowDefinition({
+        definitionId: workflowId,
+        cacheHandler: "throw"
+      });
+      if (!definition) {
+        auditLogRequestError(
+          new Error(
+            `Couldn't fetch workflow definition of workflow source ${workflowId}`
+          ),
+          endpointName,
+          endpoint,
+          req
+        );
+        res.status(500).send(
+          `Couldn't fetch workflow definition of workflow source ${workflowId}`
+        );
+        return;
+      }
+      if (!definition.dataInputSchema) {
+        res.status(200).json({});
+        return;
+      }
+      const instanceVariables = instanceId ? await services.orchestratorService.fetchInstanceVariables({
+        instanceId,
+        cacheHandler: "throw"
+      }) : void 0;
+      const workflowData = instanceVariables ? services.dataInputSchemaService.extractWorkflowData(instanceVariables) : void 0;
+      const workflowInfo = await routerApi.v2.getWorkflowInputSchemaById(workflowId, serviceUrl).catch((error) => {
+        auditLogRequestError(error, endpointName, endpoint, req);
+        res.status(500).json({ message: error.message || INTERNAL_SERVER_ERROR_MESSAGE });
+      });
+      if (!workflowInfo || !workflowInfo.inputSchema || !workflowInfo.inputSchema.properties) {
+        res.status(200).json({});
+        return;
+      }
+      const inputSchemaProps = workflowInfo.inputSchema.properties;
+      let inputData;
+      if (workflowData) {
+        inputData = Object.keys(inputSchemaProps).filter((k) => k in workflowData).reduce((result, k) => {
+          if (!workflowData[k]) {
+            return result;
+          }
+          result[k] = workflowData[k];
+          return result;
+        }, {});
+      }
+      res.status(200).json({
+        inputSchema: workflowInfo.inputSchema,
+        data: inputData
+      });
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getWorkflowInstances",
+    async (c, req, res, next) => {
+      const endpointName = "getWorkflowInstances";
+      const workflowId = c.request.params.workflowId;
+      const endpoint = `/v2/workflows/${workflowId}/instances`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        req,
+        orchestratorWorkflowInstancesReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, req);
+      }
+      await routerApi.v2.getInstances(buildPagination(req), getRequestFilters(req), workflowId).then((result) => res.json(result)).catch(next);
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getInstances",
+    async (_c, req, res, next) => {
+      const endpointName = "getInstances";
+      const endpoint = `/v2/workflows/instances`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        req,
+        orchestratorWorkflowInstancesReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, req);
+      }
+      await routerApi.v2.getInstances(buildPagination(req), getRequestFilters(req)).then((result) => res.json(result)).catch(next);
+    }
+  );
+  routerApi.openApiBackend.register(
+    "getInstanceById",
+    async (c, _req, res, next) => {
+      const instanceId = c.request.params.instanceId;
+      const endpointName = "getInstanceById";
+      const endpoint = `/v2/workflows/instances/${instanceId}`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: _req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        _req,
+        orchestratorWorkflowInstanceReadPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, _req);
+      }
+      const includeAssessment = routerApi.v2.extractQueryParam(
+        c.request,
+        QUERY_PARAM_INCLUDE_ASSESSMENT
+      );
+      await routerApi.v2.getInstanceById(instanceId, !!includeAssessment).then((result) => res.status(200).json(result)).catch((error) => {
+        auditLogRequestError(error, endpointName, endpoint, _req);
+        res.status(500).json({ message: error.message || INTERNAL_SERVER_ERROR_MESSAGE });
+        next();
+      });
+    }
+  );
+  routerApi.openApiBackend.register(
+    "abortWorkflow",
+    async (c, _req, res, next) => {
+      const instanceId = c.request.params.instanceId;
+      const endpointName = "abortWorkflow";
+      const endpoint = `/v2/workflows/instances/${instanceId}/abort`;
+      auditLogger.auditLog({
+        eventName: endpointName,
+        stage: "start",
+        status: "succeeded",
+        level: "debug",
+        request: _req,
+        message: `Received request to '${endpoint}' endpoint`
+      });
+      const decision = await authorize(
+        _req,
+        orchestratorWorkflowInstanceAbortPermission,
+        permissions,
+        httpAuth
+      );
+      if (decision.result === pluginPermissionCommon.AuthorizeResult.DENY) {
+        manageDenyAuthorization(endpointName, endpoint, _req);
+      }
+      await routerApi.v2.abortWorkflow(instanceId).then((result) => res.json(result)).catch((error) => {
+        auditLogRequestError(error, endpointName, endpoint, _req);
+        res.status(500).json({ message: error.message || INTERNAL_SERVER_ERROR_MESSAGE });
+        next();
+      });
+    }
+  );
+}
+function setupExternalRoutes(router, discovery, scaffolderService, auditLogger) {
+  router.get("/actions", async (req, res) => {
+    auditLogger.auditLog({
+      eventName: "ActionsEndpointHit",
+      stage: "start",
+      status: "succeeded",
+      level: "debug",
+      request: req,
+      message: `Received request to '/actions' endpoint`
+    });
+    const scaffolderUrl = await discovery.getBaseUrl("scaffolder");
+    const response = await fetch(`${scaffolderUrl}/v2/actions`);
+    const json = await response.json();
+    res.status(response.status).json(json);
+  });
+  router.post("/actions/:actionId", async (req, res) => {
+    const { actionId } = req.params;
+    auditLogger.auditLog({
+      eventName: "ActionsActionIdEndpointHit",
+      stage: "start",
+      status: "succeeded",
+      level: "debug",
+      request: req,
+      message: `Received request to '/actions/${actionId}' endpoint`
+    });
+    const instanceId = req.header("kogitoprocinstanceid");
+    const body = await req.body;
+    const filteredBody = Object.fromEntries(
+      Object.entries(body).filter(
+        ([, value]) => value !== void 0 && value !== null
+      )
+    );
+    const result = await scaffolderService.executeAction({
+      actionId,
+      instanceId,
+      input: filteredBody
+    });
+    res.status(200).json(result);
+  });
+}
+function getRequestFilters(req) {
+  return req.body.filters ? req.body.filters : void 0;
+}
+
+async function createRouter(args) {
+  var _a;
+  const autoStartDevMode = (_a = args.config.getOptionalBoolean(
+    "orchestrator.sonataFlowService.autoStart"
+  )) != null ? _a : false;
+  if (autoStartDevMode) {
+    const devModeService = new DevModeService(args.config, args.logger);
+    const isSonataFlowUp = await devModeService.launchDevMode();
+    if (!isSonataFlowUp) {
+      args.logger.error("SonataFlow is not up. Check your configuration.");
+    }
+  }
+  return await createBackendRouter({
+    config: args.config,
+    logger: args.logger,
+    discovery: args.discovery,
+    catalogApi: args.catalogApi,
+    urlReader: args.urlReader,
+    scheduler: args.scheduler,
+    permissions: args.permissions,
+    httpAuth: args.httpAuth,
+    auth: args.auth
+  });
+}
+
+const orchestratorPlugin = backendPluginApi.createBackendPlugin({
+  pluginId: "orchestrator",
+  register(env) {
+    env.registerInit({
+      deps: {
+        logger: backendPluginApi.coreServices.logger,
+        config: backendPluginApi.coreServices.rootConfig,
+        discovery: backendPluginApi.coreServices.discovery,
+        catalogApi: alpha.catalogServiceRef,
+        urlReader: backendPluginApi.coreServices.urlReader,
+        permissions: backendPluginApi.coreServices.permissions,
+        scheduler: backendPluginApi.coreServices.scheduler,
+        auth: backendPluginApi.coreServices.auth,
+        httpAuth: backendPluginApi.coreServices.httpAuth,
+        http: backendPluginApi.coreServices.httpRouter
+      },
+      async init(props) {
+        const { http } = props;
+        const router = await createRouter(props);
+        http.use(router);
+        http.addAuthPolicy({
+          path: "/health",
+          allow: "unauthenticated"
+        });
+        http.addAuthPolicy({
+          path: "/static",
+          allow: "unauthenticated"
+        });
+        http.addAuthPolicy({
+          path: "/docs",
+          allow: "unauthenticated"
+        });
+      }
+    });
+  }
+});
+
+exports["default"] = orchestratorPlugin;
+//# sourceMappingURL=index.cjs.js.map
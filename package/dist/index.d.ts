@@ -0,0 +1,100 @@
+/// <reference types="react" />
+import * as React from 'react';
+import React__default from 'react';
+import * as _backstage_core_plugin_api from '@backstage/core-plugin-api';
+import { DiscoveryApi, IdentityApi } from '@backstage/core-plugin-api';
+import { JsonObject } from '@backstage/types';
+import { AxiosResponse, AxiosInstance } from 'axios';
+import { ExecuteWorkflowResponseDTO, WorkflowDefinition, AssessedProcessInstanceDTO, InputSchemaResponseDTO, WorkflowOverviewDTO, WorkflowOverviewListResultDTO, GetInstancesRequest, ProcessInstanceListResultDTO, DefaultApi, PaginationInfoDTO, Filter, ProcessInstance } from '@janus-idp/backstage-plugin-orchestrator-common';
+import { Notification } from '@kie-tools-core/notifications/dist/api';
+import { SvgIconProps } from '@material-ui/core';
+
+declare const orchestratorPlugin: _backstage_core_plugin_api.BackstagePlugin<{
+    root: _backstage_core_plugin_api.RouteRef<undefined>;
+}, {}, {}>;
+declare const OrchestratorPage: () => React.JSX.Element;
+
+interface OrchestratorApi {
+    abortWorkflowInstance(instanceId: string): Promise<AxiosResponse<string>>;
+    executeWorkflow(args: {
+        workflowId: string;
+        parameters: JsonObject;
+        businessKey?: string;
+    }): Promise<AxiosResponse<ExecuteWorkflowResponseDTO>>;
+    getWorkflowDefinition(workflowId: string): Promise<WorkflowDefinition>;
+    getWorkflowSource(workflowId: string): Promise<AxiosResponse<string>>;
+    getInstance(instanceId: string, includeAssessment: boolean): Promise<AxiosResponse<AssessedProcessInstanceDTO>>;
+    getWorkflowDataInputSchema(workflowId: string, instanceId?: string): Promise<AxiosResponse<InputSchemaResponseDTO>>;
+    getWorkflowOverview(workflowId: string): Promise<AxiosResponse<WorkflowOverviewDTO>>;
+    listWorkflowOverviews(): Promise<AxiosResponse<WorkflowOverviewListResultDTO>>;
+    listInstances(args?: GetInstancesRequest): Promise<AxiosResponse<ProcessInstanceListResultDTO>>;
+}
+declare const orchestratorApiRef: _backstage_core_plugin_api.ApiRef<OrchestratorApi>;
+
+interface OrchestratorClientOptions {
+    discoveryApi: DiscoveryApi;
+    identityApi: IdentityApi;
+    axiosInstance?: AxiosInstance;
+}
+declare class OrchestratorClient implements OrchestratorApi {
+    private readonly discoveryApi;
+    private readonly identityApi;
+    private axiosInstance?;
+    private baseUrl;
+    constructor(options: OrchestratorClientOptions);
+    getDefaultAPI(): Promise<DefaultApi>;
+    private getBaseUrl;
+    executeWorkflow(args: {
+        workflowId: string;
+        parameters: JsonObject;
+        businessKey?: string;
+    }): Promise<AxiosResponse<ExecuteWorkflowResponseDTO>>;
+    abortWorkflowInstance(instanceId: string): Promise<AxiosResponse<string>>;
+    getWorkflowDefinition(workflowId: string): Promise<WorkflowDefinition>;
+    getWorkflowSource(workflowId: string): Promise<AxiosResponse<string>>;
+    listWorkflowOverviews(paginationInfo?: PaginationInfoDTO, filters?: Filter): Promise<AxiosResponse<WorkflowOverviewListResultDTO>>;
+    listInstances(args: GetInstancesRequest): Promise<AxiosResponse<ProcessInstanceListResultDTO>>;
+    getInstance(instanceId: string, includeAssessment?: boolean): Promise<AxiosResponse<AssessedProcessInstanceDTO>>;
+    getWorkflowDataInputSchema(workflowId: string, instanceId?: string): Promise<AxiosResponse<InputSchemaResponseDTO>>;
+    getWorkflowOverview(workflowId: string): Promise<AxiosResponse<WorkflowOverviewDTO>>;
+    /** fetcher is convenience fetch wrapper that includes authentication
+     * and other necessary headers **/
+    private fetcher;
+    private getDefaultReqConfig;
+}
+
+declare enum EditorViewKind {
+    DIAGRAM_VIEWER = "DIAGRAM_VIEWER",
+    EXTENDED_DIAGRAM_VIEWER = "EXTENDED_DIAGRAM_VIEWER",
+    RUNTIME = "RUNTIME"
+}
+interface WorkflowEditorRef {
+    validate: () => Promise<Notification[]>;
+    getContent: () => Promise<string | undefined>;
+    workflowDefinition: WorkflowDefinition | undefined;
+    isReady: boolean;
+}
+type WorkflowEditorView = {
+    kind: EditorViewKind.DIAGRAM_VIEWER;
+} | {
+    kind: EditorViewKind.EXTENDED_DIAGRAM_VIEWER;
+} | {
+    kind: EditorViewKind.RUNTIME;
+    processInstance: ProcessInstance;
+};
+
+type OrchestratorWorkflowDialogProps = {
+    workflowId: string;
+    title: string;
+    open: boolean;
+    close: () => void;
+    dialogActions?: React__default.ReactNode;
+} & WorkflowEditorView;
+declare const WorkflowDialog: React__default.ForwardRefExoticComponent<OrchestratorWorkflowDialogProps & React__default.RefAttributes<WorkflowEditorRef>>;
+
+declare const workflowInstancesRouteRef: _backstage_core_plugin_api.SubRouteRef<undefined>;
+declare const workflowInstanceRouteRef: _backstage_core_plugin_api.SubRouteRef<_backstage_core_plugin_api.PathParams<"/instances/:instanceId">>;
+
+declare const OrchestratorIcon: (props: SvgIconProps) => React__default.JSX.Element;
+
+export { EditorViewKind, OrchestratorClient, type OrchestratorClientOptions, OrchestratorIcon, OrchestratorPage, WorkflowDialog, orchestratorApiRef, orchestratorPlugin, workflowInstanceRouteRef, workflowInstancesRouteRef };
@@ -0,0 +1,8 @@
+export { OrchestratorPage, orchestratorPlugin } from './plugin.esm.js';
+export { OrchestratorClient } from './api/OrchestratorClient.esm.js';
+export { WorkflowDialog } from './components/WorkflowDialog.esm.js';
+export { EditorViewKind } from './components/WorkflowEditor/WorkflowEditor.esm.js';
+export { orchestratorApiRef } from './api/api.esm.js';
+export { workflowInstanceRouteRef, workflowInstancesRouteRef } from './routes.esm.js';
+export { default as OrchestratorIcon } from './components/OrchestratorIcon.esm.js';
+//# sourceMappingURL=index.esm.js.map
@@ -0,0 +1,4 @@
+const isNonNullable = (value) => value !== null && typeof value !== "undefined";
+
+export { isNonNullable };
+//# sourceMappingURL=TypeGuards.esm.js.map
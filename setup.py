@@ -43,15 +43,17 @@ setup(
     entry_points={
         "console_scripts": ["charon = charon.cmd:cli"],
     },
+    extras_require={
+        "aio": ["aiobotocore>=2.16.0"],
+    },
     # install_requires=[
     #     "Jinja2>=3.1.3",
-    #     "boto3>=1.18.35",
-    #     "botocore>=1.21.35",
+    #     "boto3>=1.35.69",
+    #     "botocore>=1.35.69",
     #     "click>=8.1.3",
     #     "requests>=2.25.0",
     #     "PyYAML>=5.4.1",
     #     "defusedxml>=0.7.1",
-    #     "subresource-integrity>=0.2",
     #     "jsonschema>=4.9.1",
     #     "urllib3>=1.25.10",
     #     "semantic-version>=2.10.0"
@@ -0,0 +1,65 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Microbenchmark of the version sort keys used in maven-metadata.xml
+generation, which is not collected by pytest. Run it from the repo root:
+
+    python -m tests.benchmarks.bench_version_sort [count]
+"""
+import random
+import sys
+import time
+
+import charon.pkgs.maven as mvn
+
+QUALIFIERS = [
+    "", "-SNAPSHOT", "-alpha{n}", "-beta{n}", "-rc{n}", ".Final", ".SP{n}",
+    ".redhat-{n:05d}", ".Final-redhat-{n:05d}"
+]
+
+
+def generate_versions(count: int, seed=42) -> list:
+    rand = random.Random(seed)
+    versions = []
+    for _ in range(count):
+        qualifier = rand.choice(QUALIFIERS).format(n=rand.randint(1, 20))
+        versions.append(
+            f"{rand.randint(0, 9)}.{rand.randint(0, 30)}.{rand.randint(0, 50)}{qualifier}"
+        )
+    return versions
+
+
+def bench(name: str, versions: list, key):
+    start = time.perf_counter()
+    sorted(versions, key=key)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    sorted(versions, key=key)
+    warm = time.perf_counter() - start
+    print(f"{name:<20} cold: {cold:.3f}s  warm: {warm:.3f}s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    versions = generate_versions(count)
+    print(f"Sorting {count} versions ({len(set(versions))} distinct)")
+    mvn._version_compare_items.cache_clear()
+    mvn.parse_maven_version.cache_clear()
+    bench("VersionCompareKey", versions, mvn.VersionCompareKey)
+    bench("MavenVersionKey", versions, mvn.MavenVersionKey)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.storage import S3Client, ENDPOINT_ENV, BACKEND_ENV
+from charon.storage_backend import AioS3Backend, BACKEND_AIOBOTOCORE
+from charon.constants import PROD_INFO_SUFFIX
+from tests.base import BaseTest
+from tests.commons import TEST_BUCKET
+from boto3.s3.transfer import TransferConfig
+from unittest import mock
+import asyncio
+import boto3
+import io
+import os
+import unittest
+
+# The aiobotocore client can not be intercepted by mock_aws, so the backend
+# is tested against moto in server mode, which needs the moto[server] extra
+try:
+    import aiobotocore.session
+    from moto.server import ThreadedMotoServer
+except ImportError:
+    ThreadedMotoServer = None
+
+MB = 1024 * 1024
+# Larger than the multipart threshold, and will be uploaded in 3 parts
+MULTIPART_SIZE = 11 * MB
+MULTIPART_CONFIG = TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB)
+
+
+@unittest.skipIf(ThreadedMotoServer is None, "aiobotocore or moto[server] is not installed")
+class AioS3BackendTest(BaseTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+        cls.server.start()
+        (host, port) = cls.server.get_host_and_port()
+        cls.endpoint = f"http://{host}:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        super().setUp()
+        os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+        os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+        os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+        self.s3 = boto3.resource("s3", endpoint_url=self.endpoint)
+        self.s3.create_bucket(Bucket=TEST_BUCKET)
+        self.test_bucket = self.s3.Bucket(TEST_BUCKET)
+        self.backend = AioS3Backend(endpoint_url=self.endpoint)
+        self.__run(self.backend.open())
+
+    def tearDown(self):
+        self.__run(self.backend.close())
+        self.test_bucket.objects.all().delete()
+        self.test_bucket.delete()
+        super().tearDown()
+
+    def test_object_requests(self):
+        key = "org/foo/bar/1.0/foo-bar-1.0.pom"
+        self.__run(self.backend.put_object(Bucket=TEST_BUCKET, Key=key, Body=b"pom"))
+        head = self.__run(self.backend.head_object(Bucket=TEST_BUCKET, Key=key))
+        self.assertEqual(3, head["ContentLength"])
+        self.assertEqual(
+            b"pom", self.__run(self.backend.get_object_content(Bucket=TEST_BUCKET, Key=key))
+        )
+        response = self.__run(self.backend.get_object(Bucket=TEST_BUCKET, Key=key))
+        self.assertEqual(b"pom", response["Body"])
+        self.assertEqual(head["ETag"], response["ETag"])
+
+        copied = "org/foo/bar/1.1/foo-bar-1.1.pom"
+        self.__run(self.backend.copy(
+            CopySource={"Bucket": TEST_BUCKET, "Key": key}, Bucket=TEST_BUCKET, Key=copied
+        ))
+        pages = self.__run(self.backend.list_objects(
+            Bucket=TEST_BUCKET, Prefix="org/foo/bar/", PaginationConfig={"PageSize": 1}
+        ))
+        self.assertEqual(2, len(pages))
+        self.assertEqual([key], [o["Key"] for o in pages[0]["Contents"]])
+        page = self.__run(self.backend.list_objects_page(
+            Bucket=TEST_BUCKET, Prefix="org/foo/bar/", Delimiter="/"
+        ))
+        self.assertEqual(
+            ["org/foo/bar/1.0/", "org/foo/bar/1.1/"],
+            [p["Prefix"] for p in page["CommonPrefixes"]]
+        )
+
+        self.__run(self.backend.delete_object(Bucket=TEST_BUCKET, Key=key))
+        self.__run(self.backend.delete_objects(
+            Bucket=TEST_BUCKET, Delete={"Objects": [{"Key": copied}]}
+        ))
+        self.assertEqual([], list(self.test_bucket.objects.all()))
+
+    def test_upload_file(self):
+        small = os.path.join(self.tempdir, "small.jar")
+        large = os.path.join(self.tempdir, "large.jar")
+        with open(small, "wb") as f:
+            f.write(b"small")
+        content = os.urandom(MULTIPART_SIZE)
+        with open(large, "wb") as f:
+            f.write(content)
+
+        for (path, key) in [(small, "small.jar"), (large, "large.jar")]:
+            self.__run(self.backend.upload_file(
+                Filename=path, Bucket=TEST_BUCKET, Key=key,
+                ExtraArgs={"Metadata": {"rh-products": "p1"}}, Config=MULTIPART_CONFIG
+            ))
+        self.assertEqual(b"small", self.__read("small.jar"))
+        self.assertEqual(content, self.__read("large.jar"))
+        large_obj = self.test_bucket.Object("large.jar")
+        self.assertEqual({"rh-products": "p1"}, large_obj.metadata)
+        # The ETag of multipart upload ends with the number of parts
+        self.assertTrue(large_obj.e_tag.strip('"').endswith("-3"))
+
+    def test_upload_fileobj(self):
+        content = os.urandom(MULTIPART_SIZE)
+        self.__run(self.backend.upload_fileobj(
+            Fileobj=io.BytesIO(content), Bucket=TEST_BUCKET, Key="large.jar",
+            Config=MULTIPART_CONFIG
+        ))
+        self.assertEqual(content, self.__read("large.jar"))
+        self.assertTrue(self.test_bucket.Object("large.jar").e_tag.strip('"').endswith("-3"))
+
+    def test_client_keeps_backend_opened(self):
+        root = os.path.join(self.tempdir, "repo")
+        paths = []
+        for version in ["1.0", "1.1"]:
+            folder = os.path.join(root, "org", "foo", "bar", version)
+            os.makedirs(folder)
+            path = os.path.join(folder, f"bar-{version}.jar")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(version)
+            paths.append(path)
+        client = S3Client(extra_conf={
+            ENDPOINT_ENV: self.endpoint, BACKEND_ENV: BACKEND_AIOBOTOCORE
+        })
+        backend = client._S3Client__backend
+        self.assertIsInstance(backend, AioS3Backend)
+
+        create_client = aiobotocore.session.AioSession.create_client
+        with mock.patch.object(
+            aiobotocore.session.AioSession, "create_client",
+            autospec=True, side_effect=create_client
+        ) as created:
+            self.assertEqual([], client.upload_files(
+                paths, targets=[(TEST_BUCKET, "")], product="p1", root=root
+            ))
+            self.assertEqual(
+                ["org/foo/bar/1.0/", "org/foo/bar/1.1/"],
+                client.list_folder_content(TEST_BUCKET, "org/foo/bar")
+            )
+            # All the phases of the client are sent with the same aiobotocore client
+            self.assertEqual(1, created.call_count)
+        client.close()
+        self.assertIsNone(backend._AioS3Backend__client)
+
+        keys = [o.key for o in self.test_bucket.objects.all()]
+        for version in ["1.0", "1.1"]:
+            key = f"org/foo/bar/{version}/bar-{version}.jar"
+            self.assertIn(key, keys)
+            self.assertIn(key + PROD_INFO_SUFFIX, keys)
+
+    def __read(self, key: str) -> bytes:
+        return self.test_bucket.Object(key).get()["Body"].read()
+
+    def __run(self, task):
+        return asyncio.get_event_loop().run_until_complete(task)
@@ -155,6 +155,35 @@ targets:
         self.assertFalse(self.__is_ignored("abcxyz.pom", conf.get_ignore_patterns()))
         self.assertFalse(self.__is_ignored("abcxyz.jar.md5", conf.get_ignore_patterns()))
 
+    def test_transfer_config(self):
+        content_transfer = """
+targets:
+    ga:
+    - bucket: charon-test
+
+transfer:
+    multipart_threshold_mb: 100
+    multipart_chunksize_mb: 20
+        """
+        self.__change_config_content(content_transfer)
+        conf = config.get_config()
+        self.assertEqual(
+            {"multipart_threshold_mb": 100, "multipart_chunksize_mb": 20},
+            conf.get_transfer_config()
+        )
+
+        content_small_part = """
+targets:
+    ga:
+    - bucket: charon-test
+
+transfer:
+    multipart_chunksize_mb: 1
+        """
+        self.__base.prepare_config(self.__base.get_config_base(), content_small_part)
+        with pytest.raises(ValidationError):
+            config.get_config()
+
     def __change_config_content(self, content: str):
         self.__base.change_home()
         config_base = self.__base.get_config_base()
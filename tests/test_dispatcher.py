@@ -0,0 +1,76 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.utils.dispatcher import run_dispatch, QUEUE_FACTOR
+import asyncio
+import unittest
+
+
+class DispatcherTest(unittest.TestCase):
+    def test_bounded_workers(self):
+        workers = 4
+        fed = []
+        running = [0, 0]
+        handled = []
+
+        def items():
+            for i in range(100):
+                fed.append(i)
+                # Items are fed lazily, never far ahead of the handled ones
+                self.assertLessEqual(
+                    len(fed) - len(handled), workers * (QUEUE_FACTOR + 1) + 1
+                )
+                yield i
+
+        async def handle(item: int):
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            await asyncio.sleep(0.001)
+            handled.append(item)
+            running[0] -= 1
+
+        run_dispatch(items(), handle, workers=workers, report_every=10)
+        self.assertEqual(list(range(100)), sorted(handled))
+        self.assertEqual(workers, running[1])
+
+    def test_async_items(self):
+        handled = []
+
+        async def items():
+            for i in range(20):
+                # The items arrive slowly, and are handled while others are coming
+                await asyncio.sleep(0.001)
+                self.assertGreaterEqual(len(handled), i - 2 * QUEUE_FACTOR - 2)
+                yield i
+
+        async def handle(item: int):
+            handled.append(item)
+            await asyncio.sleep(0)
+
+        run_dispatch(items(), handle, workers=2)
+        self.assertEqual(list(range(20)), sorted(handled))
+
+    def test_error_raised(self):
+        handled = []
+
+        async def handle(item: int):
+            if item == 5:
+                raise ValueError("bad item")
+            handled.append(item)
+            await asyncio.sleep(0)
+
+        with self.assertRaises(ValueError):
+            run_dispatch(iter(range(1000)), handle, workers=2)
+        self.assertLess(len(handled), 1000)
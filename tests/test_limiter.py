@@ -0,0 +1,105 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.utils.limiter import AdaptiveLimiter, current_limiter
+import asyncio
+import unittest
+
+
+class AdaptiveLimiterTest(unittest.TestCase):
+    def test_increase_and_throttle(self):
+        limiter = AdaptiveLimiter("test", initial=4, max_limit=6)
+        for _ in range(4):
+            limiter.on_success(0.1)
+        self.assertEqual(5, limiter.limit)
+        for _ in range(20):
+            limiter.on_success(0.1)
+        self.assertEqual(6, limiter.limit)
+        # Only one decrease for throttling in the same window
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(3, limiter.limit)
+        self.assertEqual(2, limiter.throttled)
+        self.assertEqual(3, limiter.lowest)
+        self.assertEqual(6, limiter.highest)
+        limiter.reset_stats()
+        self.assertEqual(3, limiter.lowest)
+        self.assertEqual(0, limiter.throttled)
+
+    def test_no_increase_on_latency_growth(self):
+        limiter = AdaptiveLimiter("test", initial=2)
+        for _ in range(2):
+            limiter.on_success(0.1)
+        self.assertEqual(3, limiter.limit)
+        for _ in range(3):
+            limiter.on_success(1.0)
+        self.assertEqual(3, limiter.limit)
+
+    def test_slot_concurrency(self):
+        limiter = AdaptiveLimiter("test", initial=2)
+        running = []
+        peak = []
+
+        async def task():
+            async with limiter.slot():
+                self.assertIs(limiter, current_limiter())
+                running.append(1)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.pop()
+
+        async def run_all():
+            await asyncio.gather(*[task() for _ in range(6)])
+
+        asyncio.get_event_loop().run_until_complete(run_all())
+        self.assertEqual(2, max(peak))
+        self.assertIsNone(current_limiter())
+
+    def test_pause(self):
+        limiter = AdaptiveLimiter("test", initial=1)
+        events = []
+
+        async def backoff():
+            async with limiter.slot():
+                events.append("backoff start")
+                await limiter.pause(0.05)
+                events.append("backoff end")
+
+        async def other():
+            await asyncio.sleep(0.01)
+            async with limiter.slot():
+                events.append("other")
+
+        async def cancelled():
+            async with limiter.slot():
+                await limiter.pause(10)
+
+        async def run_all():
+            await asyncio.gather(backoff(), other())
+            # The slot is kept balanced if the task is cancelled in the pause
+            task = asyncio.ensure_future(cancelled())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            async with limiter.slot():
+                events.append("after cancel")
+            self.assertEqual(0, limiter._AdaptiveLimiter__in_flight)
+
+        asyncio.get_event_loop().run_until_complete(
+            asyncio.wait_for(run_all(), timeout=5)
+        )
+        # The waiting task gets the slot during the backoff
+        self.assertEqual(["backoff start", "other", "backoff end", "after cancel"], events)
@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from charon.pkgs.maven import handle_maven_uploading, handle_maven_del
-from charon.storage import PRODUCT_META_KEY, CHECKSUM_META_KEY
+from charon.storage import S3Client, PRODUCT_META_KEY, CHECKSUM_META_KEY
 from charon.utils.strings import remove_prefix
 from charon.constants import PROD_INFO_SUFFIX
 from tests.base import LONG_TEST_PREFIX, SHORT_TEST_PREFIX, PackageBaseTest
@@ -25,6 +25,7 @@ from tests.commons import (
     COMMONS_CLIENT_META_NUM
 )
 from moto import mock_aws
+from flexmock import flexmock
 import os
 
 from tests.constants import INPUTS
@@ -44,6 +45,39 @@ class MavenDeleteTest(PackageBaseTest):
     def test_root_prefix_deletion(self):
         self.__test_prefix_deletion("/")
 
+    def test_incremental_metadata_deletion(self):
+        self.__prepare_content()
+        # All GAs still have versions left, so no listing is needed
+        flexmock(S3Client).should_receive("list_folders_concurrently").never()
+        handle_maven_del(
+            os.path.join(INPUTS, "commons-client-4.5.6.zip"), "commons-client-4.5.6",
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False
+        )
+        test_bucket = self.mock_s3.Bucket(TEST_BUCKET)
+        meta_content_client = str(
+            test_bucket.Object(COMMONS_CLIENT_METAS[0]).get()["Body"].read(), "utf-8"
+        )
+        self.assertNotIn("<version>4.5.6</version>", meta_content_client)
+        self.assertIn("<version>4.5.9</version>", meta_content_client)
+        # The pom of commons-logging is kept for commons-client-4.5.9
+        meta_content_logging = str(
+            test_bucket.Object(COMMONS_LOGGING_METAS[0]).get()["Body"].read(), "utf-8"
+        )
+        self.assertIn("<version>1.2</version>", meta_content_logging)
+
+    def test_del_with_transfer_config(self):
+        self.__prepare_content()
+        transfer_config = {"retry_attempts": 1, "redrive": False}
+        flexmock(S3Client).should_call("_S3Client__get_retry_attempts").with_args(
+            transfer_config
+        ).at_least().once()
+        handle_maven_del(
+            os.path.join(INPUTS, "commons-client-4.5.6.zip"), "commons-client-4.5.6",
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False, transfer_config=transfer_config
+        )
+
     def test_ignore_del(self):
         self.__prepare_content()
         product_456 = "commons-client-4.5.6"
@@ -16,7 +16,8 @@ limitations under the License.
 from charon.constants import PROD_INFO_SUFFIX
 from charon.pkgs.maven import handle_maven_uploading, handle_maven_del
 from charon.pkgs.indexing import re_index
-from charon.storage import CHECKSUM_META_KEY
+from charon.storage import CHECKSUM_META_KEY, S3Client
+from charon.storage_backend import ThreadedS3Backend
 from charon.utils.strings import remove_prefix
 from tests.base import LONG_TEST_PREFIX, SHORT_TEST_PREFIX, PackageBaseTest
 from tests.commons import (
@@ -25,6 +26,7 @@ from tests.commons import (
     COMMONS_LOGGING_INDEX, COMMONS_ROOT_INDEX
 )
 from moto import mock_aws
+from unittest import mock
 import os
 
 from tests.constants import INPUTS
@@ -208,6 +210,43 @@ class MavenFileIndexTest(PackageBaseTest):
         self.assertIn("<a href=\"4.5.7/\" title=\"4.5.7/\">4.5.7/</a>", index_content)
         self.assertNotIn(PROD_INFO_SUFFIX, index_content)
 
+    def test_recursive_re_index_lists_once(self):
+        test_zip = os.path.join(INPUTS, "commons-client-4.5.6.zip")
+        handle_maven_uploading(
+            [test_zip], "commons-client-4.5.6",
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir
+        )
+        commons_client_root = "org/apache/httpcomponents/"
+        self.mock_s3.Bucket(TEST_BUCKET).Object(COMMONS_CLIENT_456_INDEX).delete()
+
+        def count_listings(fn) -> int:
+            calls = []
+
+            def record(name):
+                original = getattr(ThreadedS3Backend, name)
+
+                async def listing(backend, **kwargs):
+                    calls.append(kwargs.get("Prefix"))
+                    return await original(backend, **kwargs)
+                return mock.patch.object(ThreadedS3Backend, name, listing)
+
+            with record("list_objects"), record("list_objects_page"):
+                fn()
+            return len(calls)
+
+        # All the folders are re-indexed from the listing of the whole tree,
+        # so nothing more than that listing is sent
+        tree_listings = count_listings(
+            lambda: S3Client().get_files(TEST_BUCKET, commons_client_root)
+        )
+        self.assertEqual(tree_listings, count_listings(lambda: re_index(
+            {"bucket": TEST_BUCKET, "prefix": ""},
+            commons_client_root, "maven", recursive=True
+        )))
+        objs = [o.key for o in self.mock_s3.Bucket(TEST_BUCKET).objects.all()]
+        self.assertIn(COMMONS_CLIENT_456_INDEX, objs)
+
     def test_upload_index_with_short_prefix(self):
         self.__test_upload_index_with_prefix(SHORT_TEST_PREFIX)
 
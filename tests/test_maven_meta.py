@@ -108,3 +108,39 @@ class MavenMetadataTest(BaseTest):
         self.assertGreater(comp_class('1.0.1'), comp_class('1.0-m2'))
         self.assertGreater(comp_class('1.0.2-alpha'), comp_class('1.0.1-m2'))
         self.assertGreater(comp_class('1.0.2-alpha'), comp_class('1.0.1-alpha'))
+
+    def test_maven_ver_cmp_key(self):
+        comp_class = mvn.MavenVersionKey
+        self.assertLess(comp_class('1.0.0'), comp_class('1.0.1'))
+        self.assertGreater(comp_class('1.10.0'), comp_class('1.9.1'))
+        self.assertEqual(comp_class('1'), comp_class('1.0.0'))
+        self.assertEqual(comp_class('1.0.Final'), comp_class('1.0'))
+        self.assertEqual(comp_class('1.0-m1'), comp_class('1.0-milestone-1'))
+        self.assertEqual(comp_class('1.0-CR1'), comp_class('1.0-rc1'))
+        self.assertEqual(
+            {comp_class('1'), comp_class('1.0.0'), comp_class('1.0.Final')},
+            {comp_class('1.0')}
+        )
+        # All the items after "-" are compared when the other version is exhausted
+        self.assertGreater(comp_class('1-0.1'), comp_class('1'))
+        self.assertLess(comp_class('1-0.alpha'), comp_class('1'))
+
+        # Qualifiers are ordered like maven ComparableVersion
+        versions = [
+            '1.0.1', '1.0.0.redhat-00002', '1.0.0.redhat-00001', '1.0.SP1',
+            '1.0.Final', '1.0-SNAPSHOT', '1.0-rc1', '1.0-beta10', '1.0-beta2',
+            '1.0-alpha1'
+        ]
+        self.assertEqual(
+            [
+                '1.0-alpha1', '1.0-beta2', '1.0-beta10', '1.0-rc1', '1.0-SNAPSHOT',
+                '1.0.Final', '1.0.SP1', '1.0.0.redhat-00001', '1.0.0.redhat-00002',
+                '1.0.1'
+            ],
+            sorted(versions, key=comp_class)
+        )
+        self.assertEqual(
+            (1, 0, 0, '7-redhat', (1,)), mvn.parse_maven_version('1.0.0.redhat-00001')
+        )
+        meta = mvn.MavenMetadata('org.foo', 'bar', ['1.0.redhat-00001', '1.0', '1.0-rc1'])
+        self.assertEqual('1.0.redhat-00001', meta.latest_version)
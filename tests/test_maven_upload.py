@@ -14,6 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from charon.pkgs.maven import handle_maven_uploading
+from charon.storage import S3Client, PREFLIGHT_ENABLE_ENV
+from charon.storage_ownership import CachedOwnershipStore
+import charon.pkgs.maven as maven
+from charon.utils.tracing import get_tracer
 from charon.utils.strings import remove_prefix
 from tests.base import SHORT_TEST_PREFIX, LONG_TEST_PREFIX, PackageBaseTest
 from tests.commons import (
@@ -24,6 +28,7 @@ from tests.commons import (
     COMMONS_CLIENT_META_NUM
 )
 from moto import mock_aws
+from flexmock import flexmock
 import os
 
 from tests.constants import INPUTS
@@ -43,6 +48,60 @@ class MavenUploadTest(PackageBaseTest):
     def test_root_prefix_upload(self):
         self.__test_prefix_upload("/")
 
+    def test_pipeline_upload(self):
+        self.__test_prefix_upload(SHORT_TEST_PREFIX, transfer_config={"pipeline": True})
+
+    def test_pipeline_upload_streamed(self):
+        # The extraction waits when the small queue is full, so the uploading
+        # must take the files while the archive is still being extracted
+        flexmock(maven, PIPELINE_QUEUE_SIZE=5)
+        flexmock(S3Client).should_call("upload_files").once()
+        flexmock(CachedOwnershipStore).should_call("flush").once()
+        self.__test_prefix_upload("", transfer_config={"pipeline": True})
+
+    def test_pipeline_upload_with_preflight(self):
+        # All files are taken from the queue before the pre-flight check
+        os.environ[PREFLIGHT_ENABLE_ENV] = "True"
+        flexmock(maven, PIPELINE_QUEUE_SIZE=5)
+        self.__test_prefix_upload("", transfer_config={"pipeline": True})
+
+    def test_pipeline_upload_skipped(self):
+        # The extraction still finishes if the uploading takes no files
+        flexmock(maven, PIPELINE_QUEUE_SIZE=5)
+        flexmock(S3Client).should_receive("upload_files").and_return([]).once()
+        test_zip = os.path.join(INPUTS, "commons-client-4.5.6.zip")
+        (_, _, valid_mvn_paths, _, _, failed_files) = maven._extract_and_upload(
+            test_zip, "maven-repository", "commons-client-4.5.6", [],
+            S3Client(), [(TEST_BUCKET, "")], dir__=self.tempdir
+        )
+        self.assertEqual([], failed_files)
+        self.assertEqual(COMMONS_CLIENT_456_MVN_NUM, len(valid_mvn_paths))
+
+    def test_upload_trace(self):
+        tracer = get_tracer()
+        tracer.reset()
+        self.__test_prefix_upload("")
+        events = tracer.get_events()
+        names = [e["name"] for e in events]
+        for name in ["extract", "scan", "upload", "target", "metadata", "upload_metadata"]:
+            self.assertIn(name, names)
+        # The phases of the target are nested in its span
+        target = events[names.index("target")]
+        self.assertEqual(TEST_BUCKET, target["args"]["bucket"])
+        metadata = events[names.index("metadata")]
+        self.assertTrue(target["ts"] <= metadata["ts"])
+        self.assertTrue(
+            metadata["ts"] + metadata["dur"] <= target["ts"] + target["dur"]
+        )
+        tracer.reset()
+
+    def test_upload_from_archive(self):
+        # Only the archetype-catalog.xml is extracted for merging
+        flexmock(maven).should_call("_extract_member").once()
+        self.__test_prefix_upload(
+            SHORT_TEST_PREFIX, transfer_config={"upload_from_archive": True}
+        )
+
     def test_overlap_upload(self):
         test_zip = os.path.join(INPUTS, "commons-client-4.5.6.zip")
         product_456 = "commons-client-4.5.6"
@@ -110,6 +169,77 @@ class MavenUploadTest(PackageBaseTest):
         self.assertIn("<artifactId>httpclient</artifactId>", cat_content)
         self.assertIn("<groupId>org.apache.httpcomponents</groupId>", cat_content)
 
+    def test_incremental_metadata_merge(self):
+        self.__prepare_metadata_merge()
+        handle_maven_uploading(
+            [os.path.join(INPUTS, "commons-client-4.5.9.zip")], "commons-client-4.5.9",
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False
+        )
+        # The versions are merged into the existing metadata without listing
+        meta_content_client = self.__read(COMMONS_CLIENT_METAS[0])
+        for v in ["4.5.1", "4.5.6", "4.5.9"]:
+            self.assertIn(f"<version>{v}</version>", meta_content_client)
+        self.assertIn("<latest>4.5.9</latest>", meta_content_client)
+        # The invalid metadata is regenerated from the listing
+        meta_content_logging = self.__read(COMMONS_LOGGING_METAS[0])
+        self.assertIn("<version>1.2</version>", meta_content_logging)
+
+    def test_rebuild_metadata(self):
+        self.__prepare_metadata_merge()
+        handle_maven_uploading(
+            [os.path.join(INPUTS, "commons-client-4.5.9.zip")], "commons-client-4.5.9",
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False, rebuild_metadata=True
+        )
+        meta_content_client = self.__read(COMMONS_CLIENT_METAS[0])
+        self.assertNotIn("<version>4.5.1</version>", meta_content_client)
+        self.assertIn("<version>4.5.6</version>", meta_content_client)
+        self.assertIn("<version>4.5.9</version>", meta_content_client)
+
+    def test_discover_versions(self):
+        ga = "org/foo/foo-lib/"
+        self.test_bucket.put_object(Key=f"{ga}1.0/foo-lib-1.0.pom", Body="pom")
+        self.test_bucket.put_object(Key=f"{ga}2.0/foo-lib-2.0.jar", Body="jar")
+        self.test_bucket.put_object(
+            Key=f"{ga}3.0-SNAPSHOT/foo-lib-3.0-20240101.120000-1.pom", Body="pom"
+        )
+        # The GAs under another GA, which are not versions of it
+        for nested in ["plugin", "foo-lib2", "bar-v2", "3scale-lib"]:
+            self.test_bucket.put_object(
+                Key=f"{ga}{nested}/1.0/{nested}-1.0.pom", Body="pom"
+            )
+        s3 = S3Client()
+        results = {}
+
+        def handle(ga_prefix, versions, success):
+            results[ga_prefix] = (sorted(versions), success)
+
+        maven._discover_versions(s3, TEST_BUCKET, [ga, "org/bar/"], handle)
+        self.assertEqual(
+            {ga: (["1.0", "2.0", "3.0-SNAPSHOT"], True), "org/bar/": ([], True)}, results
+        )
+        results.clear()
+        maven._discover_versions(s3, TEST_BUCKET, [ga], handle, validate=True)
+        self.assertEqual({ga: (["1.0", "3.0-SNAPSHOT"], True)}, results)
+
+    def __prepare_metadata_merge(self):
+        handle_maven_uploading(
+            [os.path.join(INPUTS, "commons-client-4.5.6.zip")], "commons-client-4.5.6",
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False
+        )
+        # A version which only exists in the metadata, and an invalid metadata
+        meta_content_client = self.__read(COMMONS_CLIENT_METAS[0]).replace(
+            "<version>4.5.6</version>",
+            "<version>4.5.1</version>\n      <version>4.5.6</version>"
+        )
+        self.test_bucket.put_object(Key=COMMONS_CLIENT_METAS[0], Body=meta_content_client)
+        self.test_bucket.put_object(Key=COMMONS_LOGGING_METAS[0], Body="<metadata><versio")
+
+    def __read(self, key: str) -> str:
+        return str(self.test_bucket.Object(key).get()["Body"].read(), "utf-8")
+
     def test_multi_zips_upload(self):
         mvn_tarballs = [
             os.path.join(INPUTS, "commons-client-4.5.6.zip"),
@@ -202,14 +332,15 @@ class MavenUploadTest(PackageBaseTest):
         for f in ignored_files:
             self.assertNotIn(f, actual_files)
 
-    def __test_prefix_upload(self, prefix: str):
+    def __test_prefix_upload(self, prefix: str, transfer_config=None):
         test_zip = os.path.join(INPUTS, "commons-client-4.5.6.zip")
         product = "commons-client-4.5.6"
         handle_maven_uploading(
             [test_zip], product,
             targets=[('', TEST_BUCKET, prefix, '')],
             dir_=self.tempdir,
-            do_index=False
+            do_index=False,
+            transfer_config=transfer_config
         )
 
         objs = list(self.test_bucket.objects.all())
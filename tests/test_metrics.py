@@ -0,0 +1,74 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.utils.metrics import RequestMetrics, SERVICE_S3, SERVICE_CLOUDFRONT
+import json
+import os
+import tempfile
+import shutil
+import unittest
+
+
+class RequestMetricsTest(unittest.TestCase):
+    def test_summary(self):
+        metrics = RequestMetrics()
+        metrics.record(SERVICE_S3, "HEAD", "bucket", 0.005)
+        metrics.record(SERVICE_S3, "HEAD", "bucket", 0.2, error=True)
+        metrics.set_phase("metadata")
+        metrics.record(SERVICE_S3, "PUT", "bucket", 30, requests=5, sent=1024)
+        with metrics.timed(SERVICE_CLOUDFRONT, "INVALIDATE", "dist") as m:
+            m["received"] = 10
+        with self.assertRaises(ValueError):
+            with metrics.timed(SERVICE_S3, "GET", "bucket"):
+                raise ValueError("failed")
+
+        summary = metrics.summary()
+        self.assertEqual(9, summary["requests"])
+        self.assertEqual(2, summary["errors"])
+        self.assertEqual(1024, summary["bytes_sent"])
+        self.assertEqual(10, summary["bytes_received"])
+        self.assertEqual(
+            {"requests": 2, "errors": 1, "bytes_sent": 0, "bytes_received": 0},
+            summary["totals"][SERVICE_S3]["HEAD"]
+        )
+        self.assertEqual(1, summary["totals"][SERVICE_CLOUDFRONT]["INVALIDATE"]["requests"])
+
+        details = {(d["operation"], d["phase"]): d for d in summary["operations"]}
+        head = details[("HEAD", "default")]
+        self.assertEqual(1, head["latency"]["histogram"]["0.01"])
+        self.assertEqual(1, head["latency"]["histogram"]["0.25"])
+        self.assertAlmostEqual(0.1025, head["latency"]["avg"])
+        put = details[("PUT", "metadata")]
+        self.assertEqual(5, put["requests"])
+        self.assertEqual(1, put["latency"]["histogram"]["+Inf"])
+        self.assertIn(("GET", "metadata"), details)
+
+        metrics.reset()
+        self.assertEqual(0, metrics.summary()["requests"])
+        self.assertEqual("default", metrics.get_phase())
+
+    def test_write_report(self):
+        metrics = RequestMetrics()
+        metrics.record(SERVICE_S3, "LIST", "bucket", 0.1, requests=3)
+        temp_root = tempfile.mkdtemp(prefix="charon-metrics-")
+        try:
+            report = os.path.join(temp_root, "reports", "metrics.json")
+            metrics.write_report(report)
+            with open(report, encoding="utf-8") as f:
+                content = json.load(f)
+            self.assertEqual(3, content["totals"][SERVICE_S3]["LIST"]["requests"])
+            self.assertEqual("bucket", content["operations"][0]["bucket"])
+        finally:
+            shutil.rmtree(temp_root)
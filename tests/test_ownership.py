@@ -0,0 +1,204 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.pkgs.maven import handle_maven_uploading, handle_maven_del
+from charon.pkgs.ownership import migrate_ownership
+from charon.storage import S3Client
+from charon.storage_ownership import DirectoryOwnershipStore
+from charon.constants import PROD_INFO_SUFFIX, OWNERSHIP_INDEX_FILE
+from tests.base import PackageBaseTest
+from tests.commons import TEST_BUCKET, COMMONS_CLIENT_456_FILES, COMMONS_CLIENT_459_FILES
+from botocore.exceptions import ParamValidationError
+from moto import mock_aws
+from flexmock import flexmock
+import asyncio
+import json
+import os
+
+from tests.constants import INPUTS
+
+HTTPCLIENT_456_DIR = "org/apache/httpcomponents/httpclient/4.5.6"
+HTTPCLIENT_456_JAR = "httpclient-4.5.6.jar"
+
+
+@mock_aws
+class OwnershipStoreTest(PackageBaseTest):
+    def test_directory_ownership(self):
+        product_456 = "commons-client-4.5.6"
+        self.__upload("commons-client-4.5.6.zip", product_456, "directory")
+        keys = [obj.key for obj in self.test_bucket.objects.all()]
+        self.assertEqual([], [k for k in keys if k.endswith("jar" + PROD_INFO_SUFFIX)])
+        self.assertEqual(
+            [product_456],
+            self.__read_index(HTTPCLIENT_456_DIR)[HTTPCLIENT_456_JAR]
+        )
+
+        # Re-uploading with another product will add the product to index
+        product_mix = "commons-client-4.5.6-mix"
+        self.__upload("commons-client-4.5.6.zip", product_mix, "directory")
+        self.assertEqual(
+            [product_456, product_mix],
+            self.__read_index(HTTPCLIENT_456_DIR)[HTTPCLIENT_456_JAR]
+        )
+
+        test_zip = os.path.join(INPUTS, "commons-client-4.5.6.zip")
+        handle_maven_del(
+            test_zip, product_mix, targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False, ownership_store="directory"
+        )
+        keys = [obj.key for obj in self.test_bucket.objects.all()]
+        for f in COMMONS_CLIENT_456_FILES:
+            self.assertIn(f, keys)
+        self.assertEqual(
+            [product_456],
+            self.__read_index(HTTPCLIENT_456_DIR)[HTTPCLIENT_456_JAR]
+        )
+
+        handle_maven_del(
+            test_zip, product_456, targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False, ownership_store="directory"
+        )
+        keys = [obj.key for obj in self.test_bucket.objects.all()]
+        for f in COMMONS_CLIENT_456_FILES:
+            self.assertNotIn(f, keys)
+        self.assertNotIn(os.path.join(HTTPCLIENT_456_DIR, OWNERSHIP_INDEX_FILE), keys)
+
+    def test_migrate_ownership(self):
+        product_456 = "commons-client-4.5.6"
+        product_459 = "commons-client-4.5.9"
+        self.__upload("commons-client-4.5.6.zip", product_456, "sidecar")
+        self.__upload("commons-client-4.5.9.zip", product_459, "sidecar")
+
+        failed = migrate_ownership(
+            {"bucket": TEST_BUCKET, "prefix": ""}, "org/apache/httpcomponents",
+            delete_sidecars=True
+        )
+        self.assertEqual([], failed)
+        keys = [obj.key for obj in self.test_bucket.objects.all()]
+        self.assertEqual(
+            [],
+            [k for k in keys if k.startswith("org/apache/httpcomponents")
+             and k.endswith(PROD_INFO_SUFFIX) and not k.endswith(OWNERSHIP_INDEX_FILE)]
+        )
+        # Files out of the migrated path are not touched
+        self.assertIn("commons-logging/commons-logging/1.2/commons-logging-1.2.jar"
+                      + PROD_INFO_SUFFIX, keys)
+        self.assertEqual(
+            [product_456],
+            self.__read_index(HTTPCLIENT_456_DIR)[HTTPCLIENT_456_JAR]
+        )
+
+        test_zip = os.path.join(INPUTS, "commons-client-4.5.6.zip")
+        handle_maven_del(
+            test_zip, product_456, targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False, ownership_store="directory"
+        )
+        keys = [obj.key for obj in self.test_bucket.objects.all()]
+        for f in COMMONS_CLIENT_459_FILES:
+            self.assertIn(f, keys)
+        self.assertNotIn(os.path.join(HTTPCLIENT_456_DIR, HTTPCLIENT_456_JAR), keys)
+
+    def test_sidecar_write_coalescing(self):
+        client = S3Client()
+        store = client._S3Client__ownership
+        flexmock(client._S3Client__backend).should_call("put_object").once()
+        key = "org/foo/bar/1.0/foo-bar-1.0.jar"
+
+        async def update():
+            await store.set_products(TEST_BUCKET, key, ["p1"], source="foo-bar-1.0.jar")
+            await store.set_products(TEST_BUCKET, key, ["p1", "p2"], source="foo-bar-1.0.jar")
+            self.assertEqual((["p1", "p2"], True), await store.get_products(TEST_BUCKET, key))
+            self.assertEqual([], await store.flush())
+
+        asyncio.get_event_loop().run_until_complete(update())
+        self.check_product(key, ["p1", "p2"])
+
+    def test_directory_index_conflict(self):
+        client = S3Client()
+        store = self.__directory_store(client)
+        index_key = os.path.join(HTTPCLIENT_456_DIR, OWNERSHIP_INDEX_FILE)
+        self.__write_index(index_key, {"a.jar": ["p1"], "b.jar": ["p1"]})
+        backend = client._S3Client__backend
+        flexmock(backend).should_call("put_object").twice()
+
+        async def update():
+            await store.set_products(TEST_BUCKET, HTTPCLIENT_456_DIR + "/a.jar", ["p1", "p2"])
+            await store.set_products(TEST_BUCKET, HTTPCLIENT_456_DIR + "/b.jar", [])
+            # Another process changes the index after it is loaded
+            self.__write_index(
+                index_key, {"a.jar": ["p1", "p3"], "b.jar": ["p1", "p3"], "c.jar": ["p4"]}
+            )
+            self.assertEqual([], await store.flush())
+
+        asyncio.get_event_loop().run_until_complete(update())
+        self.assertEqual(
+            {"a.jar": ["p1", "p3", "p2"], "b.jar": ["p3"], "c.jar": ["p4"]},
+            self.__read_index(HTTPCLIENT_456_DIR)
+        )
+
+    def test_directory_index_unsupported_botocore(self):
+        client = S3Client()
+        store = self.__directory_store(client)
+        key = os.path.join(HTTPCLIENT_456_DIR, HTTPCLIENT_456_JAR)
+        # An old botocore does not know the conditional write parameters
+        flexmock(client._S3Client__backend).should_receive("put_object").and_raise(
+            ParamValidationError(report="Unknown parameter in input: \"IfNoneMatch\"")
+        ).once()
+
+        async def update():
+            self.assertTrue(await store.set_products(TEST_BUCKET, key, ["p1"], source=key))
+            self.assertEqual([key], await store.flush())
+
+        asyncio.get_event_loop().run_until_complete(update())
+
+    def test_corrupted_directory_index(self):
+        client = S3Client()
+        store = self.__directory_store(client)
+        index_key = os.path.join(HTTPCLIENT_456_DIR, OWNERSHIP_INDEX_FILE)
+        self.test_bucket.put_object(Key=index_key, Body=b'{"a.jar": ["p1"')
+        key = os.path.join(HTTPCLIENT_456_DIR, HTTPCLIENT_456_JAR)
+
+        async def update():
+            self.assertEqual(([], False), await store.get_products(TEST_BUCKET, key))
+            self.assertFalse(await store.set_products(TEST_BUCKET, key, ["p2"]))
+            self.assertFalse(store.need_flush())
+
+        asyncio.get_event_loop().run_until_complete(update())
+        content = self.test_bucket.Object(index_key).get()['Body'].read()
+        self.assertEqual(b'{"a.jar": ["p1"', content)
+
+    def __directory_store(self, client: S3Client) -> DirectoryOwnershipStore:
+        return DirectoryOwnershipStore(
+            client._S3Client__backend, client._S3Client__call,
+            client._S3Client__get_limiter
+        )
+
+    def __write_index(self, index_key: str, index):
+        self.test_bucket.put_object(
+            Key=index_key, Body=json.dumps(index).encode("utf-8")
+        )
+
+    def __upload(self, zip_name: str, product: str, ownership_store: str):
+        test_zip = os.path.join(INPUTS, zip_name)
+        handle_maven_uploading(
+            [test_zip], product,
+            targets=[('', TEST_BUCKET, '', '')],
+            dir_=self.tempdir, do_index=False,
+            ownership_store=ownership_store
+        )
+
+    def __read_index(self, folder: str):
+        index_obj = self.test_bucket.Object(os.path.join(folder, OWNERSHIP_INDEX_FILE))
+        return json.loads(str(index_obj.get()['Body'].read(), 'utf-8'))
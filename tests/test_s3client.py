@@ -15,13 +15,21 @@ limitations under the License.
 """
 from typing import List
 from charon.storage import S3Client, CHECKSUM_META_KEY
-from charon.utils.archive import extract_zip_all
+from botocore.errorfactory import ClientError
+from botocore.exceptions import ReadTimeoutError
+from boto3.exceptions import S3UploadFailedError
+import charon.storage as storage
+from charon.storage_backend import ThreadedS3Backend
+from charon.utils.archive import extract_zip_all, ZipMemberReader
 from charon.utils.files import overwrite_file, read_sha1
+from charon.utils.metrics import get_metrics
 from charon.constants import PROD_INFO_SUFFIX
 from tests.base import BaseTest, SHORT_TEST_PREFIX
 from moto import mock_aws
+from flexmock import flexmock
 import boto3
 import os
+import posixpath
 import sys
 import zipfile
 import shutil
@@ -98,6 +106,134 @@ class S3ClientTest(BaseTest):
         self.assertNotIn("org/x/y/1.0/x-y-1.0.pom", files)
         self.assertNotIn("org/x/y/1.0/x-y-1.0.jar", files)
 
+    def test_iter_files(self):
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        keys = [
+            "pkg/package.json", "pkg/1.0.0/package.json", "pkg/2.0.0/package.json",
+            "pkg/-/pkg-1.0.0.tgz", "pkg/-/package.json", "pkgx/package.json"
+        ]
+        for key in keys:
+            bucket.put_object(Key=key, Body="test content")
+
+        client = S3Client()
+        self.assertEqual(
+            ["pkg/-/package.json", "pkg/1.0.0/package.json",
+             "pkg/2.0.0/package.json", "pkg/package.json"],
+            list(client.iter_files(MY_BUCKET, "pkg/", "package.json"))
+        )
+        pruned = [
+            "pkg/1.0.0/package.json", "pkg/2.0.0/package.json", "pkg/package.json"
+        ]
+        self.assertEqual(pruned, sorted(client.iter_files(
+            MY_BUCKET, "pkg/", "package.json", prune=lambda f: f.endswith("/-/")
+        )))
+        # Stop at the first key
+        files = client.iter_files(MY_BUCKET)
+        self.assertEqual("pkg/-/package.json", next(files))
+        files.close()
+
+        # The same result is served from the snapshot
+        client = S3Client(tree_snapshot=True)
+        client.get_files(MY_BUCKET, "pkg/")
+        flexmock(client._S3Client__client.meta.client).should_receive(
+            "get_paginator"
+        ).never()
+        self.assertEqual(pruned, sorted(client.iter_files(
+            MY_BUCKET, "pkg/", "package.json", prune=lambda f: f.endswith("/-/")
+        )))
+
+    def test_partitioned_listing(self):
+        flexmock(storage, LIST_PAGE_SIZE=3)
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        keys = ["org/index.html", "org/zzz.txt"]
+        for g in ["apache", "bar", "foo", "jboss", "xyz", "0a", "Abc"]:
+            for v in ["1.0", "2.0"]:
+                keys.append(f"org/{g}/{g}-lib/{v}/{g}-lib-{v}.pom")
+                keys.append(f"org/{g}/{g}-lib/{v}/{g}-lib-{v}.jar")
+            keys.append(f"org/{g}/{g}-lib/maven-metadata.xml")
+        for key in keys:
+            bucket.put_object(Key=key, Body="test content")
+
+        client = S3Client()
+        backend = client._S3Client__backend
+        list_objects_page = backend.list_objects_page
+        requests = []
+
+        async def record_list_objects_page(**kwargs):
+            requests.append(kwargs)
+            return await list_objects_page(**kwargs)
+
+        flexmock(backend).should_receive("list_objects_page").replace_with(
+            record_list_objects_page
+        )
+        (files, success) = client.get_files(MY_BUCKET, "org/")
+        # The sub folders and key ranges are listed separately
+        self.assertTrue(any("StartAfter" in r for r in requests))
+        self.assertTrue(any(r["Prefix"] == "org/foo/" for r in requests))
+        # The first page of a prefix is requested only once
+        first_pages = [
+            r for r in requests if r["Prefix"] == "org/"
+            and "StartAfter" not in r and "ContinuationToken" not in r
+        ]
+        self.assertEqual(1, len(first_pages))
+        self.assertTrue(success)
+        self.assertEqual(sorted(keys), files)
+        (files, _) = client.get_files(MY_BUCKET, suffix=".pom")
+        self.assertEqual(sorted(k for k in keys if k.endswith(".pom")), files)
+
+        contents = client.list_folder_content(MY_BUCKET, "org")
+        self.assertEqual(
+            ["org/0a/", "org/Abc/", "org/apache/", "org/bar/", "org/foo/",
+             "org/jboss/", "org/xyz/", "org/index.html", "org/zzz.txt"],
+            contents
+        )
+
+    def test_get_files_concurrently(self):
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        for g in ["foo", "bar", "baz"]:
+            for v in ["1.0", "2.0"]:
+                bucket.put_object(Key=f"org/{g}/{g}-lib/{v}/{g}-lib-{v}.pom", Body="pom")
+                bucket.put_object(Key=f"org/{g}/{g}-lib/{v}/{g}-lib-{v}.jar", Body="jar")
+
+        client = S3Client()
+        backend = client._S3Client__backend
+        list_objects_page = backend.list_objects_page
+
+        async def failing_list_objects_page(**kwargs):
+            if kwargs["Prefix"].startswith("org/baz/"):
+                raise ClientError(
+                    {"Error": {"Code": "AccessDenied"},
+                     "ResponseMetadata": {"HTTPStatusCode": 403}},
+                    "ListObjectsV2"
+                )
+            return await list_objects_page(**kwargs)
+
+        flexmock(backend).should_receive("list_objects_page").replace_with(
+            failing_list_objects_page
+        )
+        results = {}
+
+        def handle(prefix: str, files: List[str], success: bool):
+            results[prefix] = (files, success)
+
+        prefixes = ["org/foo/foo-lib/", "org/bar/bar-lib/", "org/baz/baz-lib/", "org/x/"]
+        client.get_files_concurrently(MY_BUCKET, prefixes, handle, suffix=".pom")
+        self.assertEqual(
+            {
+                "org/foo/foo-lib/": ([
+                    "org/foo/foo-lib/1.0/foo-lib-1.0.pom",
+                    "org/foo/foo-lib/2.0/foo-lib-2.0.pom"
+                ], True),
+                "org/bar/bar-lib/": ([
+                    "org/bar/bar-lib/1.0/bar-lib-1.0.pom",
+                    "org/bar/bar-lib/2.0/bar-lib-2.0.pom"
+                ], True),
+                "org/baz/baz-lib/": ([], False),
+                "org/x/": ([], True)
+            },
+            results
+        )
+
     def test_list_folder_content(self):
         bucket = self.mock_s3.Bucket(MY_BUCKET)
         bucket.put_object(
@@ -192,6 +328,38 @@ class S3ClientTest(BaseTest):
 
         shutil.rmtree(temp_root)
 
+    def test_upload_with_listing_index(self):
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        s3_client = S3Client(listing_index=True)
+
+        failed_paths = s3_client.upload_files(
+            test_files, targets=[(MY_BUCKET, SHORT_TEST_PREFIX)],
+            product="apache-commons", root=root
+        )
+        self.assertEqual(0, len(failed_paths))
+        objects = list(bucket.objects.all())
+        self.assertEqual(COMMONS_LANG3_ZIP_MVN_ENTRY * 2, len(objects))
+
+        # Existed files will be found in the index, and the new product will be added
+        failed_paths = S3Client(listing_index=True).upload_files(
+            test_files, targets=[(MY_BUCKET, SHORT_TEST_PREFIX)],
+            product="commons-lang3", root=root
+        )
+        self.assertEqual(0, len(failed_paths))
+        objects = list(bucket.objects.all())
+        self.assertEqual(COMMONS_LANG3_ZIP_MVN_ENTRY * 2, len(objects))
+        for obj in objects:
+            if obj.key.endswith(PROD_INFO_SUFFIX):
+                content = str(obj.get()['Body'].read(), 'utf-8')
+                self.assertEqual(
+                    set(["apache-commons", "commons-lang3"]),
+                    set([f for f in content.split("\n") if f.strip() != ""])
+                )
+
+        shutil.rmtree(temp_root)
+
     def test_upload_and_delete_with_prefix(self):
         (temp_root, root, all_files) = self.__prepare_files()
         test_files = list(filter(lambda f: f.startswith(root), all_files))
@@ -219,6 +387,343 @@ class S3ClientTest(BaseTest):
 
         shutil.rmtree(temp_root)
 
+    def test_delete_files_batch_errors(self):
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        self.s3_client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')],
+            product="apache-commons", root=root
+        )
+        failed_file = test_files[0]
+        failed_key = failed_file[len(root) + 1:]
+        bucket = self.s3_client._S3Client__get_bucket(MY_BUCKET)
+        flexmock(bucket.meta.client).should_receive("delete_objects").and_return(
+            {"Errors": [{"Key": failed_key, "Code": "AccessDenied", "Message": "denied"}]}
+        ).once()
+        failed_paths = self.s3_client.delete_files(
+            test_files, target=(MY_BUCKET, ''), product="apache-commons", root=root
+        )
+        self.assertEqual([failed_file], failed_paths)
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_large_file_multipart(self):
+        temp_root = os.path.join(self.tempdir, "tmp_multipart")
+        os.mkdir(temp_root)
+        path = "org/foo/bar/1.0"
+        os.makedirs(os.path.join(temp_root, path))
+        file = os.path.join(temp_root, path, "foo-bar-1.0.zip")
+        with open(file, "wb") as f:
+            f.write(os.urandom(6 * 1024 * 1024))
+        sha1 = read_sha1(file)
+
+        client = S3Client(transfer_config={
+            "multipart_threshold_mb": 5, "multipart_chunksize_mb": 5
+        })
+        failed_paths = client.upload_files(
+            [file], targets=[(MY_BUCKET, '')],
+            product="foo-bar-1.0", root=temp_root
+        )
+        self.assertEqual([], failed_paths)
+
+        file_obj = self.mock_s3.Bucket(MY_BUCKET).Object(os.path.join(path, "foo-bar-1.0.zip"))
+        # ETag of multipart uploaded object ends with the number of parts
+        self.assertTrue(file_obj.e_tag.strip('"').endswith("-2"))
+        self.assertEqual(sha1, file_obj.metadata[CHECKSUM_META_KEY])
+        self.assertEqual(6 * 1024 * 1024, file_obj.content_length)
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_large_zip_member_multipart(self):
+        temp_root = os.path.join(self.tempdir, "tmp_zip_member")
+        os.mkdir(temp_root)
+        name = "org/foo/bar/1.0/foo-bar-1.0.zip"
+        content = os.urandom(6 * 1024 * 1024)
+        zip_path = os.path.join(self.tempdir, "foo-bar.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr(name, content)
+            zf.writestr(name + ".sha1", "abcdef")
+        file = os.path.join(temp_root, name)
+
+        client = S3Client(transfer_config={
+            "multipart_threshold_mb": 5, "multipart_chunksize_mb": 5
+        })
+        flexmock(client._S3Client__backend).should_receive("upload_file").never()
+        with zipfile.ZipFile(zip_path) as zf:
+            failed_paths = client.upload_files(
+                [file], targets=[(MY_BUCKET, '')],
+                product="foo-bar-1.0", root=temp_root,
+                reader=ZipMemberReader(zf, temp_root)
+            )
+        self.assertEqual([], failed_paths)
+        self.assertFalse(os.path.exists(file))
+
+        file_obj = self.mock_s3.Bucket(MY_BUCKET).Object(name)
+        self.assertTrue(file_obj.e_tag.strip('"').endswith("-2"))
+        # The checksum is read from the .sha1 member
+        self.assertEqual("abcdef", file_obj.metadata[CHECKSUM_META_KEY])
+        self.assertEqual(content, file_obj.get()["Body"].read())
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_small_files_without_transfer(self):
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        flexmock(self.s3_client._S3Client__backend).should_receive("upload_file").never()
+        failed_paths = self.s3_client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')],
+            product="apache-commons", root=root
+        )
+        self.assertEqual([], failed_paths)
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        self.assertEqual(len(test_files) * 2, len(list(bucket.objects.all())))
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_extra_targets_directly(self):
+        client = S3Client(transfer_config={"extra_target_mode": "upload"})
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        flexmock(client._S3Client__backend).should_receive("copy").never()
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, 'ga'), (MY_BUCKET, 'ea'), (MY_BUCKET, 'all')],
+            product="apache-commons", root=root
+        )
+        self.assertEqual([], failed_paths)
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        for prefix in ['ga', 'ea', 'all']:
+            objs = list(bucket.objects.filter(Prefix=prefix + "/"))
+            self.assertEqual(len(test_files) * 2, len(objs))
+            for obj in objs:
+                if not obj.key.endswith(PROD_INFO_SUFFIX):
+                    self.assertIn(CHECKSUM_META_KEY, obj.Object().metadata)
+
+        shutil.rmtree(temp_root)
+
+    def test_tree_snapshot(self):
+        self.s3_client = S3Client(tree_snapshot=True)
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        ga = "org/apache/commons/commons-lang3/"
+        self.s3_client.get_files(MY_BUCKET, ga)
+        self.s3_client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')], product="apache-commons", root=root
+        )
+        (files, _) = self.s3_client.get_files(MY_BUCKET, ga, ".pom")
+        self.assertTrue(len(files) > 1)
+        self.assertEqual(files, sorted(S3Client().get_files(MY_BUCKET, ga, ".pom")[0]))
+
+        # The listings are served from the snapshot, so the changes made
+        # out of this client are not seen
+        self.mock_s3.Object(MY_BUCKET, files[0]).delete()
+        self.assertIn(files[0], self.s3_client.list_folder_content(
+            MY_BUCKET, posixpath.dirname(files[0])
+        ))
+        self.assertTrue(self.s3_client.file_exists_in_bucket(MY_BUCKET, files[0]))
+        self.assertFalse(S3Client().file_exists_in_bucket(MY_BUCKET, files[0]))
+
+        # The deletions of this client are recorded
+        self.s3_client.delete_files(
+            [os.path.join(root, files[1])], target=(MY_BUCKET, ''),
+            product="apache-commons", root=root
+        )
+        self.assertNotIn(files[1], self.s3_client.get_files(MY_BUCKET, ga)[0])
+        self.assertFalse(self.s3_client.file_exists_in_bucket(MY_BUCKET, files[1]))
+
+        shutil.rmtree(temp_root)
+
+    def test_request_metrics(self):
+        metrics = get_metrics()
+        metrics.reset()
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        self.s3_client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')], product="apache-commons", root=root
+        )
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        objects = list(bucket.objects.all())
+        key = test_files[0][len(root) + 1:]
+        content = self.s3_client.read_file_content(MY_BUCKET, key)
+
+        totals = metrics.summary()["totals"]["s3"]
+        # Each file and its product info file are put with a single request
+        self.assertEqual(len(objects), totals["PUT"]["requests"])
+        self.assertEqual(
+            sum(o.size for o in objects), totals["PUT"]["bytes_sent"]
+        )
+        self.assertTrue(totals["HEAD"]["requests"] >= len(test_files))
+        self.assertEqual(1, totals["GET"]["requests"])
+        self.assertEqual(len(content.encode("utf-8")), totals["GET"]["bytes_received"])
+        for detail in metrics.summary()["operations"]:
+            self.assertEqual(MY_BUCKET, detail["bucket"])
+        metrics.reset()
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_retry_transient_errors(self):
+        flexmock(storage, RETRY_BACKOFF_BASE=0)
+        client = S3Client()
+        backend = client._S3Client__backend
+        put_object = backend.put_object
+        calls = []
+
+        async def flaky_put_object(**kwargs):
+            calls.append(kwargs["Key"])
+            if len(calls) <= 2:
+                raise ClientError(
+                    {"Error": {"Code": "SlowDown"}, "ResponseMetadata": {"HTTPStatusCode": 503}},
+                    "PutObject"
+                )
+            return await put_object(**kwargs)
+
+        flexmock(backend).should_receive("put_object").replace_with(flaky_put_object)
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')], product="apache-commons", root=root
+        )
+        self.assertEqual([], failed_paths)
+        self.assertEqual(
+            {"retries": 2, "redriven": 0, "recovered": 0}, client.get_retry_stats()
+        )
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        self.assertEqual(len(test_files) * 2, len(list(bucket.objects.all())))
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_redrive_failed_files(self):
+        client = S3Client(transfer_config={"retry_attempts": 0})
+        backend = client._S3Client__backend
+        put_object = backend.put_object
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        failing = {test_files[0][len(root) + 1:], test_files[1][len(root) + 1:]}
+
+        async def flaky_put_object(**kwargs):
+            if kwargs["Key"] in failing:
+                failing.remove(kwargs["Key"])
+                raise ClientError(
+                    {"Error": {"Code": "InternalError"},
+                     "ResponseMetadata": {"HTTPStatusCode": 500}},
+                    "PutObject"
+                )
+            return await put_object(**kwargs)
+
+        flexmock(backend).should_receive("put_object").replace_with(flaky_put_object)
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')], product="apache-commons", root=root
+        )
+        self.assertEqual([], failed_paths)
+        self.assertEqual(
+            {"retries": 0, "redriven": 2, "recovered": 2}, client.get_retry_stats()
+        )
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        self.assertEqual(len(test_files) * 2, len(list(bucket.objects.all())))
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_not_redrive_permanent_errors(self):
+        flexmock(storage, RETRY_BACKOFF_BASE=0)
+        client = S3Client()
+        backend = client._S3Client__backend
+        put_object = backend.put_object
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        denied = test_files[0][len(root) + 1:]
+        wrapped = test_files[1][len(root) + 1:]
+        lost = test_files[2][len(root) + 1:]
+        calls = []
+
+        async def failing_put_object(**kwargs):
+            calls.append(kwargs["Key"])
+            error = ClientError(
+                {"Error": {"Code": "AccessDenied"}, "ResponseMetadata": {"HTTPStatusCode": 403}},
+                "PutObject"
+            )
+            if kwargs["Key"] == denied:
+                raise error
+            if kwargs["Key"] == wrapped:
+                # Like the transfer manager, which raises it when handling the error
+                try:
+                    raise error
+                except ClientError:
+                    raise S3UploadFailedError("Failed to upload: AccessDenied")
+            if kwargs["Key"] == lost:
+                raise ReadTimeoutError(endpoint_url="http://localhost")
+            return await put_object(**kwargs)
+
+        flexmock(backend).should_receive("put_object").replace_with(failing_put_object)
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')], product="apache-commons", root=root
+        )
+        self.assertEqual(sorted(test_files[:3]), sorted(failed_paths))
+        # Only the read timeouts are retried and re-driven
+        self.assertEqual(1, calls.count(denied))
+        self.assertEqual(1, calls.count(wrapped))
+        self.assertEqual(8, calls.count(lost))
+        self.assertEqual(
+            {"retries": 6, "redriven": 1, "recovered": 0}, client.get_retry_stats()
+        )
+
+        shutil.rmtree(temp_root)
+
+    def test_upload_with_preflight_check(self):
+        client = S3Client(preflight=True)
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')],
+            product="apache-commons", root=root
+        )
+        self.assertEqual([], failed_paths)
+
+        # Unchanged files are verified by ETag without HEAD requests
+        client = S3Client(preflight=True)
+        backend = client._S3Client__backend
+        flexmock(backend).should_call("head_object").never()
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')],
+            product="commons-lang3", root=root
+        )
+        self.assertEqual([], failed_paths)
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        prod_info = bucket.Object(
+            "org/apache/commons/commons-lang3/3.5/commons-lang3-3.5.pom" + PROD_INFO_SUFFIX
+        )
+        content = str(prod_info.get()["Body"].read(), "utf-8")
+        self.assertIn("commons-lang3", content)
+
+        # All conflicts are reported before anything is uploaded
+        changed = os.path.join(
+            root, "org/apache/commons/commons-lang3/3.5/commons-lang3-3.5.pom"
+        )
+        overwrite_file(changed, "changed pom content")
+        client = S3Client(preflight=True)
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')],
+            product="commons-lang3-changed", root=root
+        )
+        self.assertEqual([changed], failed_paths)
+        content = str(prod_info.get()["Body"].read(), "utf-8")
+        self.assertNotIn("commons-lang3-changed", content)
+
+        shutil.rmtree(temp_root)
+
+    def test_unknown_backend(self):
+        client = S3Client(backend="unknown")
+        self.assertIsInstance(client._S3Client__backend, ThreadedS3Backend)
+        (temp_root, root, all_files) = self.__prepare_files()
+        test_files = list(filter(lambda f: f.startswith(root), all_files))
+        failed_paths = client.upload_files(
+            test_files, targets=[(MY_BUCKET, '')],
+            product="apache-commons", root=root
+        )
+        self.assertEqual([], failed_paths)
+        bucket = self.mock_s3.Bucket(MY_BUCKET)
+        self.assertEqual(len(test_files) * 2, len(list(bucket.objects.all())))
+
+        shutil.rmtree(temp_root)
+
     def test_upload_file_with_checksum(self):
         temp_root = os.path.join(self.tempdir, "tmp_upd")
         os.mkdir(temp_root)
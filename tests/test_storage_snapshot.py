@@ -0,0 +1,71 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.storage_snapshot import RemoteTreeSnapshot
+import unittest
+
+BUCKET = "test-bucket"
+
+
+class RemoteTreeSnapshotTest(unittest.TestCase):
+    def test_tree_serves_listings(self):
+        snapshot = RemoteTreeSnapshot()
+        self.assertIsNone(snapshot.get_files(BUCKET, "org/foo/"))
+        snapshot.add_tree(BUCKET, "org/foo/", [
+            "org/foo/1.0/foo-1.0.pom", "org/foo/1.0/foo-1.0.jar",
+            "org/foo/maven-metadata.xml"
+        ])
+        self.assertEqual(
+            ["org/foo/1.0/foo-1.0.jar", "org/foo/1.0/foo-1.0.pom"],
+            snapshot.get_files(BUCKET, "org/foo/1.0/")
+        )
+        self.assertEqual(
+            ["org/foo/1.0/", "org/foo/maven-metadata.xml"],
+            snapshot.list_folder(BUCKET, "org/foo")
+        )
+        self.assertTrue(snapshot.exists(BUCKET, "org/foo/maven-metadata.xml"))
+        self.assertFalse(snapshot.exists(BUCKET, "org/foo/2.0/foo-2.0.pom"))
+        # Parent folders and not "/" ended prefixes are not covered
+        self.assertIsNone(snapshot.list_folder(BUCKET, "org"))
+        self.assertIsNone(snapshot.exists(BUCKET, "org/bar/1.0/bar-1.0.pom"))
+        snapshot.add_tree(BUCKET, "org/ba", ["org/bar/1.0/bar-1.0.pom"])
+        self.assertIsNone(snapshot.get_files(BUCKET, "org/ba"))
+
+    def test_writes_update_snapshot(self):
+        snapshot = RemoteTreeSnapshot()
+        snapshot.add_tree(BUCKET, "org/foo/", ["org/foo/1.0/foo-1.0.pom"])
+        snapshot.add_folder(BUCKET, "org", ["org/foo/"])
+        snapshot.add_folder(BUCKET, "/", ["org/", "index.html"])
+
+        snapshot.put(BUCKET, "org/foo/2.0/foo-2.0.pom")
+        snapshot.put(BUCKET, "org/bar/1.0/bar-1.0.pom")
+        self.assertEqual(
+            ["org/foo/1.0/foo-1.0.pom", "org/foo/2.0/foo-2.0.pom"],
+            snapshot.get_files(BUCKET, "org/foo/")
+        )
+        self.assertEqual(["org/bar/", "org/foo/"], snapshot.list_folder(BUCKET, "org/"))
+
+        # The folder still has files, so it is kept in the parent folder
+        snapshot.delete(BUCKET, "org/foo/1.0/foo-1.0.pom")
+        self.assertEqual(["org/bar/", "org/foo/"], snapshot.list_folder(BUCKET, "org"))
+        self.assertEqual(["org/foo/2.0/"], snapshot.list_folder(BUCKET, "org/foo"))
+        snapshot.delete(BUCKET, "org/foo/2.0/foo-2.0.pom")
+        self.assertEqual(["org/bar/"], snapshot.list_folder(BUCKET, "org"))
+        self.assertEqual(["org/", "index.html"], snapshot.list_folder(BUCKET, ""))
+
+        # The content of org/bar/ is unknown, so the parent listing is dropped
+        snapshot.delete(BUCKET, "org/bar/1.0/bar-1.0.pom")
+        self.assertIsNone(snapshot.list_folder(BUCKET, "org"))
+        self.assertIsNone(snapshot.list_folder(BUCKET, ""))
@@ -0,0 +1,70 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from charon.utils.tracing import Tracer, get_tracer, traced, start_profiling, stop_profiling
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+
+
+@traced("work")
+def _work(value: int) -> int:
+    return value * 2
+
+
+class TracerTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp(prefix="charon-tracing-")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_nested_spans(self):
+        tracer = Tracer()
+        with tracer.span("target", bucket="test-bucket"):
+            with tracer.span("metadata"):
+                pass
+            with self.assertRaises(ValueError):
+                with tracer.span("index"):
+                    raise ValueError("failed")
+        events = tracer.get_events()
+        self.assertEqual(["target", "metadata", "index"], [e["name"] for e in events])
+        target = events[0]
+        self.assertEqual({"bucket": "test-bucket"}, target["args"])
+        for e in events[1:]:
+            self.assertEqual("X", e["ph"])
+            self.assertTrue(e["ts"] >= target["ts"])
+            self.assertTrue(e["ts"] + e["dur"] <= target["ts"] + target["dur"])
+
+        trace_file = os.path.join(self.tempdir, "traces", "trace.json")
+        tracer.write(trace_file)
+        with open(trace_file, encoding="utf-8") as f:
+            self.assertEqual(events, json.load(f)["traceEvents"])
+
+    def test_traced_and_profile(self):
+        get_tracer().reset()
+        profiler = start_profiling()
+        self.assertEqual(4, _work(2))
+        stats_file = os.path.join(self.tempdir, "charon.prof")
+        stop_profiling(profiler, stats_file)
+        events = get_tracer().get_events()
+        self.assertEqual("work", events[-1]["name"])
+        self.assertEqual("_work", events[-1]["args"]["function"])
+        self.assertTrue(os.path.getsize(stats_file) > 0)
+        pstats.Stats(stats_file)
+        get_tracer().reset()
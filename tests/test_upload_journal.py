@@ -0,0 +1,169 @@
+"""
+Copyright (C) 2022 Red Hat, Inc. (https://github.com/Commonjava/charon)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+         http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import os
+import zipfile
+from unittest import mock
+
+from flexmock import flexmock
+from moto import mock_aws
+
+from charon.cmd.internal import _safe_delete
+from charon.constants import PROD_INFO_SUFFIX
+from charon.pkgs.maven import handle_maven_uploading
+from charon.storage import S3Client
+from charon.storage_journal import UploadJournal, get_journal_path, PHASE_FILES
+from charon.utils.archive import extract_zip_all
+from tests.base import PackageBaseTest
+from tests.commons import TEST_BUCKET, COMMONS_CLIENT_456_FILES, COMMONS_CLIENT_METAS
+from tests.constants import INPUTS
+
+PRODUCT = "commons-lang3-3.5"
+
+
+@mock_aws
+class UploadJournalTest(PackageBaseTest):
+    def setUp(self):
+        super().setUp()
+        test_zip = zipfile.ZipFile(os.path.join(INPUTS, "commons-lang3.zip"))
+        extract_zip_all(test_zip, self.tempdir)
+        self.root = os.path.join(
+            self.tempdir, "apache-commons-maven-repository/maven-repository"
+        )
+        self.files = []
+        for (directory, _, names) in os.walk(self.root):
+            self.files.extend([os.path.join(directory, n) for n in names])
+        self.journal_path = get_journal_path(PRODUCT)
+
+    def test_resume_finished_upload(self):
+        journal = UploadJournal(self.journal_path)
+        failed = S3Client(journal=journal).upload_files(
+            self.files, targets=[(TEST_BUCKET, "ga")], product=PRODUCT, root=self.root
+        )
+        journal.close()
+        self.assertEqual([], failed)
+        self.assertTrue(os.path.isfile(self.journal_path))
+
+        journal = UploadJournal(self.journal_path, resume=True)
+        self.assertTrue(journal.is_phase_done(PHASE_FILES, TEST_BUCKET))
+        client = S3Client(journal=journal)
+        backend = client._S3Client__backend
+        flexmock(backend).should_call("head_object").never()
+        flexmock(backend).should_call("put_object").never()
+        failed = client.upload_files(
+            self.files, targets=[(TEST_BUCKET, "ga")], product=PRODUCT, root=self.root
+        )
+        self.assertEqual([], failed)
+        journal.clear()
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_resume_interrupted_upload(self):
+        journal = UploadJournal(self.journal_path)
+        S3Client(journal=journal).upload_files(
+            self.files, targets=[(TEST_BUCKET, "ga")], product=PRODUCT, root=self.root
+        )
+        journal.close()
+
+        # Simulate an interruption: the phase is not finished, the last
+        # recorded files are lost, and the last line is broken
+        with open(self.journal_path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        key_entries = [e for e in entries if not e.get("done")]
+        lost = key_entries[-5:]
+        bucket = self.mock_s3.Bucket(TEST_BUCKET)
+        for e in lost:
+            bucket.Object(e["key"]).delete()
+            bucket.Object(e["key"] + PROD_INFO_SUFFIX).delete()
+        with open(self.journal_path, "w", encoding="utf-8") as f:
+            for e in key_entries[:-5]:
+                f.write(json.dumps(e) + "\n")
+            f.write('{"phase": "files", "bu')
+
+        journal = UploadJournal(self.journal_path, resume=True)
+        client = S3Client(journal=journal)
+        backend = client._S3Client__backend
+        flexmock(backend).should_call("head_object").times(len(lost))
+        failed = client.upload_files(
+            self.files, targets=[(TEST_BUCKET, "ga")], product=PRODUCT, root=self.root
+        )
+        journal.close()
+        self.assertEqual([], failed)
+        # The broken line is dropped, so the entries after it are kept
+        with open(self.journal_path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual(
+            set(e["key"] for e in lost),
+            set(e["key"] for e in entries[len(key_entries) - 5:] if not e.get("done"))
+        )
+        for e in lost:
+            obj = bucket.Object(e["key"] + PROD_INFO_SUFFIX)
+            self.assertEqual(PRODUCT, str(obj.get()["Body"].read(), "utf-8").strip())
+        self.assertTrue(UploadJournal(self.journal_path, resume=True).is_phase_done(
+            PHASE_FILES, TEST_BUCKET
+        ))
+
+    def test_resume_after_interruption(self):
+        product = "commons-client-4.5.6"
+        work_dir = os.path.join(self.tempdir, "work")
+        upload_metadatas = S3Client.upload_metadatas
+        interrupted = []
+
+        def interrupt_once(client, *args, **kwargs):
+            if not interrupted:
+                interrupted.append(True)
+                raise KeyboardInterrupt()
+            return upload_metadatas(client, *args, **kwargs)
+
+        os.makedirs(work_dir)
+        with mock.patch.object(
+            S3Client, "upload_metadatas", autospec=True, side_effect=interrupt_once
+        ), self.assertRaises(KeyboardInterrupt):
+            handle_maven_uploading(
+                [os.path.join(INPUTS, "commons-client-4.5.6.zip")], product,
+                targets=[('', TEST_BUCKET, '', '')], dir_=work_dir, do_index=False
+            )
+        # The work dir is cleaned up when the upload command exits
+        _safe_delete(work_dir)
+        journal_path = get_journal_path(product)
+        self.assertTrue(os.path.isfile(journal_path))
+        self.assertTrue(
+            UploadJournal(journal_path, resume=True).is_phase_done(PHASE_FILES, TEST_BUCKET)
+        )
+
+        put_file = S3Client._S3Client__put_file
+        put_keys = []
+
+        async def record_put(client, bucket_name, key, *args, **kwargs):
+            put_keys.append(key)
+            return await put_file(client, bucket_name, key, *args, **kwargs)
+
+        os.makedirs(work_dir)
+        with mock.patch.object(
+            S3Client, "_S3Client__put_file", autospec=True, side_effect=record_put
+        ):
+            (_, succeeded) = handle_maven_uploading(
+                [os.path.join(INPUTS, "commons-client-4.5.6.zip")], product,
+                targets=[('', TEST_BUCKET, '', '')], dir_=work_dir, do_index=False,
+                resume=True
+            )
+        # Only the metadata files are uploaded again
+        self.assertIn(COMMONS_CLIENT_METAS[0], put_keys)
+        self.assertFalse(set(put_keys) & set(COMMONS_CLIENT_456_FILES))
+        self.assertTrue(succeeded)
+        actual_files = [obj.key for obj in self.mock_s3.Bucket(TEST_BUCKET).objects.all()]
+        for f in COMMONS_CLIENT_456_FILES + COMMONS_CLIENT_METAS:
+            self.assertIn(f, actual_files)
+        self.assertFalse(os.path.exists(journal_path))
@@ -13,7 +13,9 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from charon.utils.files import digest, digest_content, read_sha1, HashType
+from charon.utils.files import (
+    digest, digest_content, digest_multi, digest_content_multi, read_sha1, HashType
+)
 import os
 import unittest
 
@@ -37,6 +39,26 @@ class UtilTest(unittest.TestCase):
             digest_content(test_content, HashType.SHA256),
         )
 
+    def test_digest_multi(self):
+        test_file = os.path.join(INPUTS, "commons-lang3.zip")
+        checksums = digest_multi(test_file, [HashType.SHA1, HashType.SHA256, HashType.MD5])
+        self.assertEqual("bd4fe0a8111df64430b6b419a91e4218ddf44734", checksums[HashType.SHA1])
+        self.assertEqual(
+            "61ff1d38cfeb281b05fcd6b9a2318ed47cd62c7f99b8a9d3e819591c03fe6804",
+            checksums[HashType.SHA256],
+        )
+        self.assertEqual(digest(test_file, HashType.MD5), checksums[HashType.MD5])
+        with open(test_file, "rb") as f:
+            self.assertEqual(checksums, digest_multi(f.read(), list(checksums.keys())))
+
+        test_content = "test common content"
+        checksums = digest_content_multi(test_content, [HashType.SHA1, HashType.SHA256])
+        self.assertEqual("8c7b70f25fb88bc6a0372f70f6805132e90e2029", checksums[HashType.SHA1])
+        self.assertEqual(
+            "1a1c26da1f6830614ed0388bb30d9e849e05bba5de4031e2a2fa6b48032f5354",
+            checksums[HashType.SHA256],
+        )
+
     def test_read_sha1(self):
         test_file = os.path.join(INPUTS, "commons-lang3.zip")
         # read the real sha1 hash